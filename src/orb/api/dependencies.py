@@ -27,6 +27,7 @@ from orb.application.services.orchestration.refresh_templates import RefreshTemp
 from orb.application.services.orchestration.return_machines import ReturnMachinesOrchestrator
 from orb.application.services.orchestration.update_template import UpdateTemplateOrchestrator
 from orb.application.services.orchestration.validate_template import ValidateTemplateOrchestrator
+from orb.application.services.request_status_hub import RequestStatusHub
 from orb.config.schemas.server_schema import ServerConfig
 from orb.domain.base.ports.configuration_port import ConfigurationPort
 from orb.infrastructure.di.buses import CommandBus, QueryBus
@@ -88,6 +89,11 @@ def get_request_status_orchestrator() -> GetRequestStatusOrchestrator:
     return get_di_container().get(GetRequestStatusOrchestrator)
 
 
+def get_request_status_hub() -> RequestStatusHub:
+    """Get RequestStatusHub from DI container."""
+    return get_di_container().get(RequestStatusHub)
+
+
 def get_list_requests_orchestrator() -> ListRequestsOrchestrator:
     """Get ListRequestsOrchestrator from DI container."""
     return get_di_container().get(ListRequestsOrchestrator)
@@ -14,6 +14,7 @@ from orb.api.dependencies import (
     get_cancel_request_orchestrator,
     get_list_requests_orchestrator,
     get_list_return_requests_orchestrator,
+    get_request_status_hub,
     get_request_status_orchestrator,
     get_response_formatting_service,
 )
@@ -24,6 +25,7 @@ from orb.application.services.orchestration.dtos import (
     ListRequestsInput,
     ListReturnRequestsInput,
 )
+from orb.application.services.request_status_hub import RequestStatusHub
 from orb.infrastructure.error.decorators import handle_rest_exceptions
 
 router = APIRouter(prefix="/requests", tags=["Requests"])
@@ -34,11 +36,52 @@ LIST_ORCHESTRATOR = Depends(get_list_requests_orchestrator)
 RETURN_LIST_ORCHESTRATOR = Depends(get_list_return_requests_orchestrator)
 CANCEL_ORCHESTRATOR = Depends(get_cancel_request_orchestrator)
 FORMATTER = Depends(get_response_formatting_service)
+STATUS_HUB = Depends(get_request_status_hub)
 STATUS_QUERY = Query(None, description="Filter by request status")
 LIMIT_QUERY = Query(50, description="Limit number of results")
 OFFSET_QUERY = Query(0, ge=0, description="Number of results to skip")
+STREAM_REQUEST_IDS_QUERY = Query(
+    ..., description="Request identifiers to stream (repeated or comma-separated)"
+)
+STREAM_INTERVAL_QUERY = Query(
+    2.0, ge=0.5, le=60, description="Keep-alive interval in seconds while nothing changes"
+)
+STREAM_TIMEOUT_QUERY = Query(300.0, ge=1, le=3600, description="Max stream duration in seconds")
+
+
+def _status_event_stream(
+    hub: RequestStatusHub, request_ids: list[str], interval: float, timeout: float
+) -> StreamingResponse:
+    """
+    Stream hub updates for requests as Server-Sent Events.
+
+    The first event per request carries its full status, later events only the
+    changed fields. The stream ends with an empty event once every request is
+    terminal (or could not be fetched), or silently at the timeout.
+    """
 
-_TERMINAL_STATUSES = {"complete", "completed", "failed", "error", "cancelled", "canceled"}
+    async def event_generator():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        async with hub.subscribe(request_ids) as subscription:
+            while not subscription.done:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                updates = await subscription.next(min(interval, remaining))
+                if not updates:
+                    yield ": keep-alive\n\n"
+                    continue
+                for update in updates:
+                    if update.error is None:
+                        yield f"data: {json.dumps(update.to_dict(), default=str)}\n\n"
+        yield "data: {}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
@@ -112,6 +155,22 @@ async def get_request_status(
     return JSONResponse(content=formatter.format_request_status(result.requests).data)
 
 
+@router.get(
+    "/stream",
+    summary="Stream Multiple Request Statuses",
+    description="Stream status changes of several requests as Server-Sent Events",
+)
+async def stream_request_statuses(
+    request_ids: list[str] = STREAM_REQUEST_IDS_QUERY,
+    hub=STATUS_HUB,
+    interval: float = STREAM_INTERVAL_QUERY,
+    timeout: float = STREAM_TIMEOUT_QUERY,
+) -> StreamingResponse:
+    """Stream status changes of several requests until all are terminal or timeout."""
+    ids = [rid.strip() for value in request_ids for rid in value.split(",") if rid.strip()]
+    return _status_event_stream(hub, ids, interval, timeout)
+
+
 @router.get(
     "/{request_id}/stream",
     summary="Stream Request Status",
@@ -119,39 +178,12 @@ async def get_request_status(
 )
 async def stream_request_status(
     request_id: str,
-    orchestrator=STATUS_ORCHESTRATOR,
-    formatter=FORMATTER,
-    interval: float = Query(2.0, ge=0.5, le=60, description="Poll interval in seconds"),
-    timeout: float = Query(300.0, ge=1, le=3600, description="Max stream duration in seconds"),
+    hub=STATUS_HUB,
+    interval: float = STREAM_INTERVAL_QUERY,
+    timeout: float = STREAM_TIMEOUT_QUERY,
 ) -> StreamingResponse:
-    """Stream request status as SSE until terminal state or timeout."""
-
-    async def event_generator():
-        elapsed = 0.0
-        while elapsed < timeout:
-            try:
-                result = await orchestrator.execute(
-                    GetRequestStatusInput(request_ids=[request_id], verbose=False)
-                )
-                formatted = formatter.format_request_status(result.requests).data
-                yield f"data: {json.dumps(formatted)}\n\n"
-                requests_list = formatted.get("requests", [])
-                if requests_list:
-                    status = requests_list[0].get("status", "")
-                    if status.lower() in _TERMINAL_STATUSES:
-                        yield "data: {}\n\n"
-                        return
-            except Exception:
-                yield "data: {}\n\n"
-                return
-            await asyncio.sleep(interval)
-            elapsed += interval
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
-    )
+    """Stream request status changes as SSE until terminal state or timeout."""
+    return _status_event_stream(hub, [request_id], interval, timeout)
 
 
 @router.delete(
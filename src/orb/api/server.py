@@ -262,6 +262,7 @@ def _create_auth_strategy(auth_config: Any) -> Any:
                 secret_key=secret_key,
                 algorithm=bearer_config.get("algorithm", "HS256"),
                 token_expiry=bearer_config.get("token_expiry", 3600),
+                token_cache_size=bearer_config.get("token_cache_size", 10000),
                 enabled=True,
             )
 
@@ -300,6 +301,8 @@ def _create_auth_strategy(auth_config: Any) -> Any:
                 user_pool_id=cognito_config.get("user_pool_id", ""),
                 client_id=cognito_config.get("client_id", ""),
                 region=cognito_config.get("region", "us-east-1"),
+                jwks_cache_ttl=cognito_config.get("jwks_cache_ttl", 3600),
+                token_cache_size=cognito_config.get("token_cache_size", 10000),
                 enabled=True,
             )
 
@@ -54,7 +54,8 @@ creates duplicate registrations and architectural confusion.
 
 from __future__ import annotations
 
-from typing import TypeVar
+import importlib
+from typing import Callable, Optional, TypeVar
 
 from orb.application.interfaces.command_query import (
     Command,
@@ -73,6 +74,22 @@ TCommandHandler = TypeVar("TCommandHandler", bound=CommandHandler)
 _query_handler_registry: dict[type[Query], type[QueryHandler]] = {}
 _command_handler_registry: dict[type[Command], type[CommandHandler]] = {}
 
+# Lazy handler import map (restored from the startup snapshot): fully qualified
+# query/command type name -> module defining its handler. The module is only
+# imported when that type is dispatched, so a command imports just the handlers
+# it uses instead of the whole application package.
+_lazy_query_handler_modules: dict[str, str] = {}
+_lazy_command_handler_modules: dict[str, str] = {}
+
+# Full discovery to run once if the lazy map is out of date (a type with no
+# entry, or an entry whose module no longer imports)
+_handler_discovery_fallback: Optional[Callable[[], None]] = None
+
+
+def handled_type_key(handled_type: type) -> str:
+    """Return the fully qualified name used as the lazy import map key."""
+    return f"{handled_type.__module__}.{handled_type.__qualname__}"
+
 
 def query_handler(query_type: type[TQuery]):
     """
@@ -158,19 +175,89 @@ def command_handler(command_type: type[TCommand]):
     return decorator
 
 
+def register_lazy_handler_modules(
+    query_modules: dict[str, str], command_modules: dict[str, str]
+) -> None:
+    """
+    Register handler modules to import on first dispatch.
+
+    Args:
+        query_modules: Fully qualified query type name -> handler module
+        command_modules: Fully qualified command type name -> handler module
+    """
+    registered = {handled_type_key(t) for t in _query_handler_registry}
+    registered.update(handled_type_key(t) for t in _command_handler_registry)
+    _lazy_query_handler_modules.update(
+        {key: module for key, module in query_modules.items() if key not in registered}
+    )
+    _lazy_command_handler_modules.update(
+        {key: module for key, module in command_modules.items() if key not in registered}
+    )
+
+
+def set_handler_discovery_fallback(fallback: Optional[Callable[[], None]]) -> None:
+    """
+    Set the discovery to run when a dispatched type is missing from the lazy map.
+
+    Args:
+        fallback: Callable importing every handler module, or None to clear it
+    """
+    global _handler_discovery_fallback
+    _handler_discovery_fallback = fallback
+
+
+def _import_lazy_handler_module(handled_type: type, lazy_modules: dict[str, str]) -> None:
+    """Import the module registering the handler for ``handled_type``, if mapped."""
+    module_name = lazy_modules.pop(handled_type_key(handled_type), None)
+    if module_name is not None:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            if _handler_discovery_fallback is None:
+                raise
+
+
+def _run_handler_discovery_fallback() -> None:
+    """Run the discovery fallback once, clearing it first so it cannot recurse."""
+    global _handler_discovery_fallback
+    fallback, _handler_discovery_fallback = _handler_discovery_fallback, None
+    if fallback is not None:
+        # Full discovery supersedes the map, which may name stale modules
+        _lazy_query_handler_modules.clear()
+        _lazy_command_handler_modules.clear()
+        fallback()
+
+
+def _import_all_lazy_handler_modules() -> None:
+    """Import every pending handler module so the registries are complete."""
+    pending = set(_lazy_query_handler_modules.values()) | set(
+        _lazy_command_handler_modules.values()
+    )
+    _lazy_query_handler_modules.clear()
+    _lazy_command_handler_modules.clear()
+    for module_name in sorted(pending):
+        importlib.import_module(module_name)
+
+
 # Application-layer registry access (for infrastructure to consume)
 def get_registered_query_handlers() -> dict[type[Query], type[QueryHandler]]:
     """Get all registered query handlers (for infrastructure consumption)."""
+    _import_all_lazy_handler_modules()
     return _query_handler_registry.copy()
 
 
 def get_registered_command_handlers() -> dict[type[Command], type[CommandHandler]]:
     """Get all registered command handlers (for infrastructure consumption)."""
+    _import_all_lazy_handler_modules()
     return _command_handler_registry.copy()
 
 
 def get_query_handler_for_type(query_type: type[Query]) -> type[QueryHandler]:
     """Get handler for specific query type."""
+    if query_type not in _query_handler_registry:
+        _import_lazy_handler_module(query_type, _lazy_query_handler_modules)
+    if query_type not in _query_handler_registry:
+        _run_handler_discovery_fallback()
     if query_type not in _query_handler_registry:
         raise KeyError(f"No handler registered for query type: {query_type.__name__}")
     return _query_handler_registry[query_type]
@@ -178,6 +265,10 @@ def get_query_handler_for_type(query_type: type[Query]) -> type[QueryHandler]:
 
 def get_command_handler_for_type(command_type: type[Command]) -> type[CommandHandler]:
     """Get handler for specific command type."""
+    if command_type not in _command_handler_registry:
+        _import_lazy_handler_module(command_type, _lazy_command_handler_modules)
+    if command_type not in _command_handler_registry:
+        _run_handler_discovery_fallback()
     if command_type not in _command_handler_registry:
         raise KeyError(f"No handler registered for command type: {command_type.__name__}")
     return _command_handler_registry[command_type]
@@ -185,8 +276,12 @@ def get_command_handler_for_type(command_type: type[Command]) -> type[CommandHan
 
 def get_handler_registry_stats() -> dict[str, int]:
     """Get statistics about registered handlers."""
+    lazy_handlers = len(_lazy_query_handler_modules) + len(_lazy_command_handler_modules)
     return {
         "query_handlers": len(_query_handler_registry),
         "command_handlers": len(_command_handler_registry),
-        "total_handlers": len(_query_handler_registry) + len(_command_handler_registry),
+        "lazy_handlers": lazy_handlers,
+        "total_handlers": len(_query_handler_registry)
+        + len(_command_handler_registry)
+        + lazy_handlers,
     }
@@ -21,6 +21,16 @@ class GetRequestQuery(Query, BaseModel):
     skip_cache: bool = False
 
 
+class GetRequestBatchQuery(Query, BaseModel):
+    """Query to get the details of several requests with shared provider calls."""
+
+    model_config = ConfigDict(frozen=True)
+
+    request_ids: list[str]
+    verbose: bool = False
+    skip_cache: bool = False
+
+
 class ListActiveRequestsQuery(Query, BaseModel):
     """Query to list active requests."""
 
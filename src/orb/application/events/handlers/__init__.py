@@ -15,17 +15,21 @@ from . import (
     machine_handlers,
     metrics_event_handler,
     request_handlers,
+    request_status_hub_event_handler,
     system_handlers,
     template_handlers,
 )
 from .metrics_event_handler import MetricsEventHandler
+from .request_status_hub_event_handler import RequestStatusHubEventHandler
 
 __all__: list[str] = [
     "infrastructure_handlers",
     "machine_handlers",
     "metrics_event_handler",
     "request_handlers",
+    "request_status_hub_event_handler",
     "system_handlers",
     "template_handlers",
     "MetricsEventHandler",
+    "RequestStatusHubEventHandler",
 ]
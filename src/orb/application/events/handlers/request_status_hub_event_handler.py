@@ -0,0 +1,34 @@
+"""Request status hub event handler — wakes status watchers on request domain events."""
+
+from typing import TYPE_CHECKING, Optional
+
+from orb.application.events.base.event_handler import EventHandler
+from orb.domain.base.events import DomainEvent
+from orb.domain.base.ports import LoggingPort
+
+if TYPE_CHECKING:
+    from orb.application.services.request_status_hub import RequestStatusHub
+
+
+class RequestStatusHubEventHandler(EventHandler):
+    """
+    Subscribes to request domain events and wakes the matching hub watcher.
+
+    A watched request is re-fetched right after its status changes instead
+    of at the next poll; unwatched requests are ignored.
+    """
+
+    EVENT_TYPES = (
+        "RequestStatusChangedEvent",
+        "RequestCompletedEvent",
+        "RequestFailedEvent",
+        "RequestTimeoutEvent",
+    )
+
+    def __init__(self, hub: "RequestStatusHub", logger: Optional[LoggingPort] = None) -> None:
+        super().__init__(logger)
+        self._hub = hub
+
+    async def process_event(self, event: DomainEvent) -> None:
+        """Notify the hub that the event's request changed."""
+        self._hub.notify(getattr(event, "request_id", event.aggregate_id))
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from orb.application.services.provider_registry_service import ProviderRegistryService
@@ -21,7 +22,40 @@ from orb.application.services.machine_sync_service import MachineSyncService
 from orb.domain.base import UnitOfWorkFactory
 from orb.domain.base.exceptions import EntityNotFoundError
 from orb.domain.base.ports import ContainerPort, ErrorHandlingPort, LoggingPort
-from orb.domain.services.generic_filter_service import GenericFilterService
+from orb.domain.base.query_spec import QuerySpec
+from orb.domain.machine.aggregate import Machine
+from orb.domain.services.filter_service import FilterOperator
+from orb.domain.services.generic_filter_service import GenericFilter, GenericFilterService
+
+# Machine fields stored with the same value the MachineDTO field of that name holds,
+# so generic filters on them can be evaluated by the storage backend
+_STORED_MACHINE_FIELDS = frozenset(
+    {
+        "machine_id",
+        "status",
+        "instance_type",
+        "image_id",
+        "subnet_id",
+        "template_id",
+        "request_id",
+        "return_request_id",
+        "resource_id",
+        "provider_api",
+        "provider_name",
+        "provider_type",
+        "price_type",
+        "private_dns_name",
+        "public_dns_name",
+        "status_reason",
+        "version",
+        "metadata",
+        "provider_data",
+    }
+)
+
+# Live refresh defaults used when no request sync engine is registered
+_DEFAULT_REFRESH_STALENESS_SECONDS = 30.0
+_DEFAULT_REFRESH_CONCURRENCY = 8
 
 
 @query_handler(GetMachineQuery)
@@ -80,78 +114,79 @@ class ListMachinesHandler(BaseQueryHandler[ListMachinesQuery, list[MachineDTO]])
         self.command_bus = command_bus
         self._generic_filter_service = generic_filter_service
         self._machine_sync_service = machine_sync_service
+        self._sync_engine = self._get_sync_engine()
 
     async def execute_query(self, query: ListMachinesQuery) -> list[MachineDTO]:
         """Execute list machines query."""
         self.logger.info("Listing machines")
 
         try:
-            with self.uow_factory.create_unit_of_work() as uow:
-                if query.all_resources:
-                    machines = uow.machines.find_active_machines()
-                elif query.status:
-                    from orb.domain.machine.value_objects import MachineStatus
-
-                    status_enum = MachineStatus(query.status)
-                    machines = uow.machines.find_by_status(status_enum)
-                elif query.request_id:
-                    machines = uow.machines.find_by_request_id(query.request_id)
-                else:
-                    machines = uow.machines.get_all()
+            from orb.domain.machine.value_objects import MachineStatus
+
+            criteria: dict[str, Any] = {}
+            if query.all_resources:
+                active_statuses = [
+                    MachineStatus.PENDING,
+                    MachineStatus.RUNNING,
+                    MachineStatus.LAUNCHING,
+                ]
+                criteria["status"] = {"$in": [status.value for status in active_statuses]}
+            elif query.status:
+                criteria["status"] = MachineStatus(query.status).value
+            elif query.request_id:
+                criteria["request_id"] = query.request_id
+
+            filters: list[GenericFilter] = []
+            if query.provider_name:
+                filters.append(
+                    GenericFilter("provider_name", FilterOperator.CONTAINS, query.provider_name)
+                )
+            dto_filters: list[GenericFilter] = []
+            if query.filter_expressions:
+                stored_filters, dto_filters = self._generic_filter_service.partition_by_fields(
+                    self._generic_filter_service.parse_filters(query.filter_expressions),
+                    _STORED_MACHINE_FIELDS,
+                )
+                filters.extend(stored_filters)
 
-                if query.provider_name:
-                    machines = [
-                        m
-                        for m in machines
-                        if m.provider_name and query.provider_name in m.provider_name
-                    ]
+            limit = min(query.limit or 50, 1000)
+            offset = query.offset or 0
+            timestamp_format = query.timestamp_format or "auto"
 
-                total_count = len(machines)
-                limit = min(query.limit or 50, 1000)
-                offset = query.offset or 0
-                machines = machines[offset : offset + limit]
-
-                machine_dtos = []
-                for machine in machines:
-                    # Refresh running machines with live AWS state before building DTOs
-                    if machine.status.value == "running" and machine.request_id:
-                        try:
-                            request = uow.requests.get_by_id(machine.request_id)
-                            if request:
-                                (
-                                    provider_machines,
-                                    _,
-                                ) = await self._machine_sync_service.fetch_provider_machines(
-                                    request, [machine]
-                                )
-                                if provider_machines:
-                                    (
-                                        synced_machines,
-                                        _,
-                                    ) = await self._machine_sync_service.sync_machines_with_provider(
-                                        request, [machine], provider_machines
-                                    )
-                                    if synced_machines:
-                                        for sm in synced_machines:
-                                            if sm.machine_id == machine.machine_id:
-                                                machine = sm
-                                                break
-                        except Exception as e:
-                            self.logger.debug(f"Sync failed for machine {machine.machine_id}: {e}")
-
-                    machine_dto = MachineDTO.from_domain(
-                        machine, timestamp_format=query.timestamp_format or "auto"
-                    )
-                    machine_dtos.append(machine_dto)
-
-                if query.filter_expressions:
-                    machine_dtos = cast(
-                        list[MachineDTO],
-                        self._generic_filter_service.apply_filters(
-                            machine_dtos,
-                            query.filter_expressions,  # type: ignore[arg-type]
-                        ),
+            with self.uow_factory.create_unit_of_work() as uow:
+                if dto_filters:
+                    # Filters on derived DTO fields run over every candidate before paginating
+                    candidates = uow.machines.query(
+                        QuerySpec(criteria=criteria, filters=tuple(filters), sort_by="created_at")
+                    ).items
+                    matching = [
+                        machine
+                        for machine in candidates
+                        if all(
+                            f.matches(MachineDTO.from_domain(machine, timestamp_format))  # type: ignore[arg-type]
+                            for f in dto_filters
+                        )
+                    ]
+                    total_count = len(matching)
+                    machines = matching[offset : offset + limit]
+                else:
+                    page = uow.machines.query(
+                        QuerySpec(
+                            criteria=criteria,
+                            filters=tuple(filters),
+                            sort_by="created_at",
+                            limit=limit,
+                            offset=offset,
+                        )
                     )
+                    total_count = page.total_count
+                    machines = page.items
+
+                machines = await self._refresh_machines(uow, machines)
+                machine_dtos = [
+                    MachineDTO.from_domain(machine, timestamp_format=timestamp_format)
+                    for machine in machines
+                ]
 
                 self.logger.info(
                     "Found %s machines (total: %s, limit: %s, offset: %s)",
@@ -166,6 +201,98 @@ class ListMachinesHandler(BaseQueryHandler[ListMachinesQuery, list[MachineDTO]])
             self.logger.error("Failed to list machines: %s", e)
             raise
 
+    def _get_sync_engine(self):
+        try:
+            from orb.application.services.request_sync_engine import RequestSyncEngine
+
+            return self.container.get(RequestSyncEngine)
+        except Exception as e:
+            self.logger.debug("Request sync engine not available: %s", e)
+            return None
+
+    async def _refresh_machines(self, uow: Any, machines: list[Machine]) -> list[Machine]:
+        """
+        Refresh running machines of the page with live provider state.
+
+        Machines are grouped by request and the stale requests are fetched with
+        one batched provider call per provider and API, under the sync
+        engine's concurrency limit. Requests checked within the staleness
+        window are served from storage. Changes are saved with one batch write
+        on ``uow``; machines keep their stored state when a fetch fails.
+        """
+        by_request: dict[str, list[Machine]] = {}
+        for machine in machines:
+            if machine.status.value == "running" and machine.request_id:
+                by_request.setdefault(str(machine.request_id), []).append(machine)
+        if not by_request:
+            return machines
+
+        try:
+            now = datetime.now(timezone.utc)
+            stale = [
+                request
+                for request in uow.requests.find_by_ids(list(by_request))
+                if not self._is_fresh(request, now)
+            ]
+            if not stale:
+                return machines
+
+            results = await self._machine_sync_service.fetch_provider_machines_batch(
+                [(request, by_request[str(request.request_id)]) for request in stale],
+                max_concurrency=self._refresh_concurrency(),
+            )
+
+            refreshed: dict[str, Machine] = {}
+            changed: list[Machine] = []
+            checked = []
+            for request in stale:
+                request_id = str(request.request_id)
+                page_machines = by_request[request_id]
+                provider_machines, _ = results.get(request_id, (page_machines, {}))
+                if provider_machines is page_machines:
+                    # Fetch failed; keep the stored state and retry on the next list
+                    continue
+                # Instances missing from the page are left to the request sync
+                page_ids = {str(m.machine_id.value) for m in page_machines}
+                merged, to_save = self._machine_sync_service.merge_provider_machines(
+                    page_machines,
+                    [m for m in provider_machines if str(m.machine_id.value) in page_ids],
+                )
+                refreshed.update((str(m.machine_id.value), m) for m in merged)
+                changed.extend(to_save)
+                checked.append(request.record_status_check(now=now))
+
+            if changed:
+                uow.machines.save_batch(changed)
+            for request in checked:
+                uow.requests.save(request)
+        except Exception as e:
+            self.logger.debug("Live refresh of listed machines failed: %s", e)
+            return machines
+
+        return [refreshed.get(str(m.machine_id.value), m) for m in machines]
+
+    def _is_fresh(self, request: Any, now: datetime) -> bool:
+        """Whether a request was checked against the provider within the staleness window."""
+        if self._sync_engine is not None and self._sync_engine.is_fresh(str(request.request_id)):
+            return True
+        last_check = request.last_status_check
+        if last_check is None:
+            return False
+        if last_check.tzinfo is None:
+            last_check = last_check.replace(tzinfo=timezone.utc)
+        return (now - last_check).total_seconds() <= self._refresh_staleness_seconds()
+
+    def _refresh_staleness_seconds(self) -> float:
+        if self._sync_engine is not None:
+            return self._sync_engine.max_staleness_seconds
+        return _DEFAULT_REFRESH_STALENESS_SECONDS
+
+    def _refresh_concurrency(self) -> int:
+        if self._sync_engine is not None:
+            return self._sync_engine.max_concurrency
+        return _DEFAULT_REFRESH_CONCURRENCY
+
 
 @query_handler(ConvertMachineStatusQuery)  # type: ignore[arg-type]
 class ConvertMachineStatusQueryHandler(BaseQueryHandler[ConvertMachineStatusQuery, dict[str, str]]):
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Any
 
 from orb.application.base.handlers import BaseQueryHandler
 from orb.application.decorators import query_handler
 from orb.application.dto.queries import (
+    GetRequestBatchQuery,
     GetRequestQuery,
     ListActiveRequestsQuery,
     ListReturnRequestsQuery,
@@ -19,7 +21,34 @@ from orb.application.services.request_status_service import RequestStatusService
 from orb.domain.base import UnitOfWorkFactory
 from orb.domain.base.exceptions import EntityNotFoundError
 from orb.domain.base.ports import ContainerPort, ErrorHandlingPort, LoggingPort
-from orb.domain.services.generic_filter_service import GenericFilterService
+from orb.domain.base.query_spec import QuerySpec
+from orb.domain.machine.aggregate import Machine
+from orb.domain.request.aggregate import Request
+from orb.domain.request.request_types import RequestType
+from orb.domain.services.filter_service import FilterOperator
+from orb.domain.services.generic_filter_service import GenericFilter, GenericFilterService
+
+# Request fields stored with the same value the RequestDTO field of that name holds,
+# so generic filters on them can be evaluated by the storage backend
+_STORED_REQUEST_FIELDS = frozenset(
+    {
+        "request_id",
+        "status",
+        "template_id",
+        "request_type",
+        "provider_api",
+        "provider_name",
+        "provider_type",
+        "requested_count",
+        "desired_capacity",
+        "successful_count",
+        "failed_count",
+        "version",
+        "metadata",
+        "error_details",
+        "provider_data",
+    }
+)
 
 
 @query_handler(GetRequestQuery)
@@ -42,6 +71,7 @@ class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
         self._provider_registry_service = provider_registry_service
         self._machine_sync_service = machine_sync_service
         self._cache_service = self._get_cache_service()
+        self._sync_engine = self._get_sync_engine()
         self.event_publisher = self._get_event_publisher()
 
         from orb.application.factories.request_dto_factory import RequestDTOFactory
@@ -78,33 +108,21 @@ class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
             # status queries must reflect reality. Do NOT remove this in the name of
             # "CQRS purity". A query refreshing its own read model is not a domain command;
             # no domain invariants are enforced here, no domain events are raised.
-            # The alternative (background polling) requires infrastructure that doesn't
-            # exist yet. If you want to remove this, implement a background sync first.
-            try:
-                await self._machine_sync_service.populate_missing_machine_ids(request)
-                db_machines = await self._query_service.get_machines_for_request(request)
-                (
-                    provider_machines,
-                    provider_metadata,
-                ) = await self._machine_sync_service.fetch_provider_machines(request, db_machines)
-                synced_machines, _ = await self._machine_sync_service.sync_machines_with_provider(
-                    request, db_machines, provider_machines
-                )
-                new_status, status_message = self._status_service.determine_status_from_machines(
-                    db_machines, synced_machines, request, provider_metadata
-                )
-                if new_status:
-                    await self._status_service.update_request_status(
-                        request, new_status, status_message or ""
+            # Long-running servers run a RequestSyncEngine that refreshes active requests
+            # in the background; while it reports the request as fresh, storage already
+            # reflects provider state within the staleness bound and the sync is skipped.
+            if self._sync_engine is not None and self._sync_engine.is_fresh(query.request_id):
+                self.logger.debug("Serving request %s from synced storage", query.request_id)
+            else:
+                try:
+                    request = await self._read_through_sync(request, query.request_id)
+                except Exception as sync_err:
+                    self.logger.warning(
+                        "Error syncing request %s, returning stored state: %s",
+                        query.request_id,
+                        sync_err,
                     )
-                request = await self._query_service.get_request(query.request_id)
-            except Exception as sync_err:
-                self.logger.warning(
-                    "Error syncing request %s, returning stored state: %s",
-                    query.request_id,
-                    sync_err,
-                )
-                return self._dto_factory.create_from_domain(request, [])
+                    return self._dto_factory.create_from_domain(request, [])
 
             # Deliberate query-time mutation: record when this request was polled for status.
             # first_status_check is set once; last_status_check is updated on every poll.
@@ -138,6 +156,37 @@ class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
             self.logger.warning("Failed to initialize cache service: %s", e)
             return None
 
+    def _get_sync_engine(self):
+        try:
+            from orb.application.services.request_sync_engine import RequestSyncEngine
+
+            return self._container.get(RequestSyncEngine)
+        except Exception as e:
+            self.logger.debug("Request sync engine not available: %s", e)
+            return None
+
+    async def _read_through_sync(self, request, request_id: str):
+        """Refresh a request and its machines from the provider, returning the stored result."""
+        await self._machine_sync_service.populate_missing_machine_ids(request)
+        db_machines = await self._query_service.get_machines_for_request(request)
+        (
+            provider_machines,
+            provider_metadata,
+        ) = await self._machine_sync_service.fetch_provider_machines(request, db_machines)
+        synced_machines, _ = await self._machine_sync_service.sync_machines_with_provider(
+            request, db_machines, provider_machines
+        )
+        new_status, status_message = self._status_service.determine_status_from_machines(
+            db_machines, synced_machines, request, provider_metadata
+        )
+        if new_status:
+            await self._status_service.update_request_status(
+                request, new_status, status_message or ""
+            )
+        if self._sync_engine is not None:
+            self._sync_engine.record_sync(request_id, changed=bool(new_status))
+        return await self._query_service.get_request(request_id)
+
     def _get_event_publisher(self):
         try:
             from orb.domain.base.ports import EventPublisherPort
@@ -155,6 +204,122 @@ class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
             return NoOpEventPublisher()
 
 
+@query_handler(GetRequestBatchQuery)
+class GetRequestBatchHandler(GetRequestHandler):
+    """
+    Handler for getting several requests at once.
+
+    Applies the same read-through sync as GetRequestHandler, but loads all
+    requests and their machines in one unit of work and refreshes the stale
+    ones through MachineSyncService.fetch_provider_machines_batch, so the
+    provider calls grow with the number of provider resources rather than
+    with the number of requests.
+    """
+
+    async def execute_query(self, query: GetRequestBatchQuery) -> dict[str, RequestDTO]:  # type: ignore[override]
+        """Execute batch get request query; unknown request IDs are left out."""
+        request_ids = list(dict.fromkeys(query.request_ids))
+        self.logger.info("Getting request details for %d requests", len(request_ids))
+
+        results: dict[str, RequestDTO] = {}
+        caching = bool(self._cache_service and self._cache_service.is_caching_enabled())
+        if caching and not query.skip_cache:
+            for request_id in request_ids:
+                cached_result = self._cache_service.get_cached_request(request_id)  # type: ignore[union-attr]
+                if cached_result:
+                    results[request_id] = cached_result
+        pending = [request_id for request_id in request_ids if request_id not in results]
+        if not pending:
+            return results
+
+        requests, machines = self._load_requests_and_machines(pending)
+        # Read-through sync, see GetRequestHandler — do NOT remove in the name of CQRS purity.
+        stale = [
+            request
+            for request in requests
+            if self._sync_engine is None
+            or not self._sync_engine.is_fresh(str(request.request_id.value))
+        ]
+        failed: set[str] = set()
+        if stale:
+            failed = await self._sync_batch(stale, machines)
+
+        now = datetime.now(timezone.utc)
+        found = [str(request.request_id.value) for request in requests]
+        requests, machines = self._load_requests_and_machines(found)
+        with self.uow_factory.create_unit_of_work() as uow:
+            for request in requests:
+                request_id = str(request.request_id.value)
+                if request_id in failed:
+                    results[request_id] = self._dto_factory.create_from_domain(request, [])
+                    continue
+                # Deliberate query-time mutation, as in GetRequestHandler.
+                updated = request.record_status_check(now=now)
+                uow.requests.save(updated)
+                request_dto = self._dto_factory.create_from_domain(updated, machines[request_id])
+                if caching:
+                    self._cache_service.cache_request(request_id, request_dto)  # type: ignore[union-attr]
+                results[request_id] = request_dto
+
+        self.logger.info("Retrieved %d of %d requests", len(results), len(request_ids))
+        return results
+
+    def _load_requests_and_machines(
+        self, request_ids: list[str]
+    ) -> tuple[list[Request], dict[str, list[Machine]]]:
+        """Load requests and their machines in a single unit of work."""
+        with self.uow_factory.create_unit_of_work() as uow:
+            requests = uow.requests.find_by_ids(request_ids)
+            machines: dict[str, list[Machine]] = {}
+            for request in requests:
+                request_id = str(request.request_id.value)
+                if request.request_type == RequestType.RETURN:
+                    machines[request_id] = uow.machines.find_by_return_request_id(request_id)
+                else:
+                    machines[request_id] = uow.machines.find_by_request_id(request_id)
+        return requests, machines
+
+    async def _sync_batch(
+        self, requests: list[Request], machines: dict[str, list[Machine]]
+    ) -> set[str]:
+        """Refresh requests from their providers with grouped calls; returns failed IDs."""
+        for request in requests:
+            if request.needs_machine_id_population():
+                await self._machine_sync_service.populate_missing_machine_ids(request)
+                machines[
+                    str(request.request_id.value)
+                ] = await self._query_service.get_machines_for_request(request)
+
+        fetched = await self._machine_sync_service.fetch_provider_machines_batch(
+            [(request, machines[str(request.request_id.value)]) for request in requests]
+        )
+
+        failed: set[str] = set()
+        for request in requests:
+            request_id = str(request.request_id.value)
+            try:
+                db_machines = machines[request_id]
+                provider_machines, provider_metadata = fetched[str(request.request_id)]
+                synced_machines, _ = await self._machine_sync_service.sync_machines_with_provider(
+                    request, db_machines, provider_machines
+                )
+                new_status, status_message = self._status_service.determine_status_from_machines(
+                    db_machines, synced_machines, request, provider_metadata
+                )
+                if new_status:
+                    await self._status_service.update_request_status(
+                        request, new_status, status_message or ""
+                    )
+                if self._sync_engine is not None:
+                    self._sync_engine.record_sync(request_id, changed=bool(new_status))
+            except Exception as sync_err:
+                self.logger.warning(
+                    "Error syncing request %s, returning stored state: %s", request_id, sync_err
+                )
+                failed.add(request_id)
+        return failed
+
+
 @query_handler(ListRequestsQuery)  # type: ignore[arg-type]
 class ListRequestsHandler(BaseQueryHandler[ListRequestsQuery, list[RequestDTO]]):
     """Handler for listing requests with filtering."""
@@ -175,55 +340,57 @@ class ListRequestsHandler(BaseQueryHandler[ListRequestsQuery, list[RequestDTO]])
         self.logger.info("Listing requests with filters")
 
         try:
-            with self.uow_factory.create_unit_of_work() as uow:
-                requests = uow.requests.find_all()
-
-                if query.provider_name:
-                    requests = [
-                        r
-                        for r in requests
-                        if r.provider_api and query.provider_name in r.provider_api
-                    ]
-
-                if query.status:
-                    from orb.domain.request.value_objects import RequestStatus
-
-                    status_filter = RequestStatus(query.status)
-                    requests = [r for r in requests if r.status == status_filter]
+            criteria: dict[str, Any] = {}
+            if query.status:
+                from orb.domain.request.value_objects import RequestStatus
+
+                criteria["status"] = RequestStatus(query.status).value
+            if query.template_id:
+                criteria["template_id"] = query.template_id
+            if query.request_type:
+                criteria["request_type"] = query.request_type
+
+            filters: list[GenericFilter] = []
+            if query.provider_name:
+                filters.append(
+                    GenericFilter("provider_api", FilterOperator.CONTAINS, query.provider_name)
+                )
+            dto_filters: list[GenericFilter] = []
+            if query.filter_expressions:
+                stored_filters, dto_filters = self._generic_filter_service.partition_by_fields(
+                    self._generic_filter_service.parse_filters(query.filter_expressions),
+                    _STORED_REQUEST_FIELDS,
+                )
+                filters.extend(stored_filters)
 
-                if query.template_id:
-                    requests = [r for r in requests if r.template_id == query.template_id]
+            limit = query.limit or 50
+            offset = query.offset or 0
 
-                if query.request_type:
-                    requests = [
-                        r
-                        for r in requests
-                        if getattr(r, "request_type", None) == query.request_type
+            with self.uow_factory.create_unit_of_work() as uow:
+                if dto_filters:
+                    # Filters on derived DTO fields run over every candidate before paginating
+                    candidates = uow.requests.query(
+                        QuerySpec(criteria=criteria, filters=tuple(filters), sort_by="created_at")
+                    ).items
+                    request_dtos = [
+                        dto
+                        for dto in self._to_dtos(uow, candidates)
+                        if all(f.matches(dto.model_dump()) for f in dto_filters)
                     ]
-
-                total_count = len(requests)
-                start_idx = query.offset or 0
-                end_idx = start_idx + (query.limit or 50)
-                requests = requests[start_idx:end_idx]
-
-                request_dtos = []
-                for request in requests:
-                    machines = []
-                    if request.machine_ids:
-                        machines = uow.machines.find_by_ids(request.machine_ids)
-
-                    from orb.application.factories.request_dto_factory import RequestDTOFactory
-
-                    dto_factory = RequestDTOFactory()
-                    request_dto = dto_factory.create_from_domain(request, machines)
-                    request_dtos.append(request_dto)
-
-                if query.filter_expressions:
-                    request_dicts = [dto.model_dump() for dto in request_dtos]
-                    filtered_dicts = self._generic_filter_service.apply_filters(
-                        request_dicts, query.filter_expressions
+                    total_count = len(request_dtos)
+                    request_dtos = request_dtos[offset : offset + limit]
+                else:
+                    page = uow.requests.query(
+                        QuerySpec(
+                            criteria=criteria,
+                            filters=tuple(filters),
+                            sort_by="created_at",
+                            limit=limit,
+                            offset=offset,
+                        )
                     )
-                    request_dtos = [RequestDTO.model_validate(d) for d in filtered_dicts]
+                    total_count = page.total_count
+                    request_dtos = self._to_dtos(uow, page.items)
 
                 self.logger.info("Found %s requests (total: %s)", len(request_dtos), total_count)
                 return request_dtos
@@ -232,6 +399,29 @@ class ListRequestsHandler(BaseQueryHandler[ListRequestsQuery, list[RequestDTO]])
             self.logger.error("Failed to list requests: %s", e)
             raise
 
+    @staticmethod
+    def _to_dtos(uow: Any, requests: list[Request]) -> list[RequestDTO]:
+        """Build DTOs, loading the machines of all requests with one batched lookup."""
+        from orb.application.factories.request_dto_factory import RequestDTOFactory
+
+        machine_ids = list(
+            dict.fromkeys(mid for request in requests for mid in request.machine_ids or [])
+        )
+        machines_by_id = (
+            {str(m.machine_id.value): m for m in uow.machines.find_by_ids(machine_ids)}
+            if machine_ids
+            else {}
+        )
+
+        dto_factory = RequestDTOFactory()
+        return [
+            dto_factory.create_from_domain(
+                request,
+                [machines_by_id[mid] for mid in request.machine_ids or [] if mid in machines_by_id],
+            )
+            for request in requests
+        ]
+
 
 @query_handler(ListReturnRequestsQuery)
 class ListReturnRequestsHandler(BaseQueryHandler[ListReturnRequestsQuery, list[RequestDTO]]):
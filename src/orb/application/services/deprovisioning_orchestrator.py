@@ -13,6 +13,8 @@ from orb.application.ports.query_bus_port import QueryBusPort
 from orb.domain.base import UnitOfWorkFactory
 from orb.domain.base.ports import ContainerPort, LoggingPort, ProviderSelectionPort
 
+_DEFAULT_MAX_CONCURRENCY = 10
+
 
 class DeprovisioningOrchestrator:
     """Orchestrates parallel deprovisioning operations across providers."""
@@ -24,6 +26,8 @@ class DeprovisioningOrchestrator:
         container: ContainerPort,
         query_bus: QueryBusPort,
         provider_selection_port: ProviderSelectionPort,
+        *,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         """Initialize the orchestrator.
 
@@ -33,12 +37,14 @@ class DeprovisioningOrchestrator:
             container: DI container for service resolution
             query_bus: Query bus for CQRS queries
             provider_selection_port: Port for provider operations
+            max_concurrency: Maximum resource groups terminated at once
         """
         self.uow_factory = uow_factory
         self.logger = logger
         self._container = container
         self._query_bus = query_bus
         self._provider_selection_port = provider_selection_port
+        self.max_concurrency = max(1, max_concurrency)
 
     async def execute_deprovisioning(
         self, resource_groups: dict[tuple[str, str, str], list[Any]], request: Any
@@ -53,20 +59,29 @@ class DeprovisioningOrchestrator:
             Dictionary with success status, counts, and errors
         """
         try:
-            # Create tasks for parallel execution
+            # Create tasks for parallel execution, bounded so a large return
+            # does not burst provider API calls all at once
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def bounded(*args: Any) -> dict[str, Any]:
+                async with semaphore:
+                    return await self._process_resource_group(*args)
+
             tasks = []
 
             for (provider_name, provider_api, resource_id), machines in resource_groups.items():
                 task = asyncio.create_task(
-                    self._process_resource_group(
-                        provider_name, provider_api, resource_id, machines, request
-                    ),
+                    bounded(provider_name, provider_api, resource_id, machines, request),
                     name=f"terminate-{provider_name}-{provider_api}-{resource_id}",
                 )
                 tasks.append(task)
 
             # Execute all tasks in parallel
-            self.logger.info("Executing %d termination operations in parallel", len(tasks))
+            self.logger.info(
+                "Executing %d termination operations in parallel (max %d at once)",
+                len(tasks),
+                self.max_concurrency,
+            )
 
             # Wait for all tasks to complete
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,6 +1,7 @@
 """Machine sync service for provider integration."""
 
-from typing import TYPE_CHECKING, Optional, Tuple
+import asyncio
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 if TYPE_CHECKING:
     from orb.application.services.provider_registry_service import ProviderRegistryService
@@ -59,38 +60,12 @@ class MachineSyncService:
     ) -> Tuple[list[Machine], dict]:
         """Fetch machines from provider."""
         try:
-            from orb.domain.base.operations import (
-                Operation as ProviderOperation,
-                OperationType as ProviderOperationType,
-            )
+            from orb.domain.base.operations import Operation as ProviderOperation
 
-            # For return requests, always use instance-level status for the specific
-            # machines being returned — not resource-level discovery which returns all
-            # ASG/fleet instances including unrelated ones.
-            if request.request_type.value == "return" and request.machine_ids:
-                operation_type = ProviderOperationType.GET_INSTANCE_STATUS
-                parameters = {
-                    "instance_ids": request.machine_ids,
-                    "template_id": request.template_id,
-                }
-            # Use resource-level discovery for acquire requests (handles scaling/replacement)
-            elif request.resource_ids:
-                operation_type = ProviderOperationType.DESCRIBE_RESOURCE_INSTANCES
-                parameters = {
-                    "resource_ids": request.resource_ids,
-                    "provider_api": request.provider_api,
-                    "template_id": request.template_id,
-                }
-            # Fallback to instance-level discovery for requests without resource tracking
-            elif db_machines:
-                operation_type = ProviderOperationType.GET_INSTANCE_STATUS
-                instance_ids = [m.machine_id.value for m in db_machines]
-                parameters = {
-                    "instance_ids": instance_ids,
-                    "template_id": request.template_id,
-                }
-            else:
+            plan = self._plan_provider_fetch(request, db_machines)
+            if plan is None:
                 return [], {}
+            operation_type, parameters = plan
 
             operation = ProviderOperation(
                 operation_type=operation_type,
@@ -114,51 +89,9 @@ class MachineSyncService:
             if result.success and result.data:
                 instances = result.data.get("instances", [])
                 self.logger.debug(f"Provider returned {len(instances)} instances")
-
-                # instances are already snake_case domain dicts from check_hosts_status
-                # via _get_instance_details → machine_adapter (PascalCase→snake_case conversion
-                # happens once in the infrastructure layer). No re-conversion needed here.
-                domain_machines = []
-                returned_ids = set()
-                db_machines_by_id = {str(m.machine_id.value): m for m in db_machines}
-                for instance_data in instances:
-                    try:
-                        processed_data = {
-                            **instance_data,
-                            "request_id": str(request.request_id),
-                            "resource_id": request.resource_ids[0] if request.resource_ids else "",
-                        }
-                        terminal_states = {"shutting-down", "terminated", "stopping", "stopped"}
-                        instance_status = processed_data.get("status", "")
-                        existing = db_machines_by_id.get(processed_data.get("instance_id", ""))
-                        if instance_status in terminal_states and existing:
-                            machine = self._create_machine_with_status(
-                                existing, MachineStatus(instance_status)
-                            )
-                        else:
-                            machine = self._create_machine_from_processed_data(
-                                processed_data, request
-                            )
-                        domain_machines.append(machine)
-                        returned_ids.add(processed_data["instance_id"])
-                    except Exception as e:
-                        self.logger.warning(f"Failed to create machine from instance data: {e}")
-
-                # For return requests: instances missing from AWS response have been
-                # terminated and purged (~1hr window). Treat them as terminated.
-                if request.request_type.value == "return":
-                    queried_ids = set(parameters.get("instance_ids", []))
-                    missing_ids = queried_ids - returned_ids
-                    for missing_id in missing_ids:
-                        self.logger.info(
-                            f"Instance {missing_id} not found in AWS — treating as terminated"
-                        )
-                        existing = next(
-                            (m for m in db_machines if m.machine_id.value == missing_id), None
-                        )
-                        if existing:
-                            domain_machines.append(self._create_terminated_machine(existing))
-
+                domain_machines = self._machines_from_instances(
+                    request, db_machines, instances, parameters.get("instance_ids", [])
+                )
                 return domain_machines, result.metadata or {}
             else:
                 self.logger.warning(f"Provider operation failed: {result.error_message}")
@@ -168,6 +101,283 @@ class MachineSyncService:
             self.logger.error(f"Failed to fetch provider machines: {e}")
             return db_machines, {}
 
+    async def fetch_provider_machines_batch(
+        self,
+        items: list[Tuple[Request, list[Machine]]],
+        max_concurrency: Optional[int] = None,
+    ) -> dict[str, Tuple[list[Machine], dict]]:
+        """
+        Fetch machines of many requests from their providers with shared calls.
+
+        Requests are grouped the way :meth:`fetch_provider_machines` would query
+        them: instance-level lookups are merged into one ``GET_INSTANCE_STATUS``
+        per provider instance, and resource-level lookups into one batched
+        ``DESCRIBE_RESOURCE_INSTANCES`` per provider instance and API in which
+        requests on the same resource IDs share a single lookup. Groups run
+        concurrently and their results are fanned back to each request. A group
+        whose batched call fails, or whose provider does not return per-request
+        results, falls back to fetching its requests one by one.
+
+        Args:
+            items: Requests paired with their stored machines
+            max_concurrency: Maximum grouped operations in flight (default: unbounded)
+
+        Returns:
+            Provider machines and metadata keyed by request ID, as
+            :meth:`fetch_provider_machines` returns them
+        """
+        from orb.domain.base.operations import OperationType as ProviderOperationType
+
+        results: dict[str, Tuple[list[Machine], dict]] = {}
+        groups: dict[tuple, list[Tuple[Request, list[Machine], dict]]] = {}
+        for request, db_machines in items:
+            plan = self._plan_provider_fetch(request, db_machines)
+            if plan is None:
+                results[str(request.request_id)] = ([], {})
+                continue
+            operation_type, parameters = plan
+            provider_name = request.provider_name or ""
+            if operation_type == ProviderOperationType.DESCRIBE_RESOURCE_INSTANCES:
+                provider_api = parameters.get("provider_api")
+                key: tuple = (
+                    provider_name,
+                    operation_type,
+                    getattr(provider_api, "value", provider_api),
+                )
+            else:
+                key = (provider_name, operation_type)
+            groups.setdefault(key, []).append((request, db_machines, parameters))
+
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def _bounded(key: tuple, members: list) -> dict[str, Tuple[list[Machine], dict]]:
+            if semaphore is None:
+                return await self._fetch_group(key[0], key[1], members)
+            async with semaphore:
+                return await self._fetch_group(key[0], key[1], members)
+
+        group_results = await asyncio.gather(
+            *(_bounded(key, members) for key, members in groups.items())
+        )
+        for group_result in group_results:
+            results.update(group_result)
+
+        self.logger.debug(
+            "Fetched provider machines of %d requests in %d grouped operations",
+            len(items),
+            len(groups),
+        )
+        return results
+
+    async def _fetch_group(
+        self,
+        provider_name: str,
+        operation_type: Any,
+        members: list[Tuple[Request, list[Machine], dict]],
+    ) -> dict[str, Tuple[list[Machine], dict]]:
+        """Run one grouped provider operation and split its result per request."""
+        from orb.domain.base.operations import (
+            Operation as ProviderOperation,
+            OperationType as ProviderOperationType,
+        )
+
+        if len(members) > 1:
+            try:
+                if self.provider_registry_service is None:
+                    raise RuntimeError("ProviderRegistryService is required for this operation")
+                self._config_port.get_provider_instance_config(provider_name)
+
+                resource_level = operation_type == ProviderOperationType.DESCRIBE_RESOURCE_INSTANCES
+                lookup_ids: dict[str, str] = {}
+                if resource_level:
+                    # Requests on the same fleets share one lookup, answered under
+                    # the ID of the first of them
+                    entries: dict[tuple, dict[str, Any]] = {}
+                    for request, _, params in members:
+                        resource_key = (tuple(params["resource_ids"]), params.get("template_id"))
+                        entry = entries.setdefault(
+                            resource_key,
+                            {
+                                "request_id": str(request.request_id),
+                                "resource_ids": params["resource_ids"],
+                                "template_id": params.get("template_id"),
+                            },
+                        )
+                        lookup_ids[str(request.request_id)] = entry["request_id"]
+                    parameters: dict[str, Any] = {
+                        "provider_api": members[0][2].get("provider_api"),
+                        "requests": list(entries.values()),
+                    }
+                else:
+                    parameters = {
+                        "instance_ids": list(
+                            dict.fromkeys(
+                                i for _, _, params in members for i in params["instance_ids"]
+                            )
+                        ),
+                    }
+                operation = ProviderOperation(
+                    operation_type=operation_type,
+                    parameters=parameters,
+                    context={"correlation_id": f"batch-{len(members)}-requests"},
+                )
+                result = await self.provider_registry_service.execute_operation(
+                    provider_name, operation
+                )
+                if result.success and result.data:
+                    if resource_level and "results" in result.data:
+                        return self._split_resource_results(
+                            members, result.data["results"], lookup_ids
+                        )
+                    if not resource_level:
+                        return self._split_instance_results(
+                            members, result.data.get("instances", []), result.metadata or {}
+                        )
+                self.logger.warning(
+                    "Grouped %s for %d requests returned no per-request results (%s), "
+                    "fetching them one by one",
+                    operation_type,
+                    len(members),
+                    result.error_message,
+                )
+            except Exception as e:
+                self.logger.warning(
+                    "Grouped %s for %d requests failed, fetching them one by one: %s",
+                    operation_type,
+                    len(members),
+                    e,
+                )
+
+        fetched = await asyncio.gather(
+            *(
+                self.fetch_provider_machines(request, db_machines)
+                for request, db_machines, _ in members
+            )
+        )
+        return {
+            str(request.request_id): outcome for (request, _, _), outcome in zip(members, fetched)
+        }
+
+    def _split_instance_results(
+        self,
+        members: list[Tuple[Request, list[Machine], dict]],
+        instances: list[dict],
+        metadata: dict,
+    ) -> dict[str, Tuple[list[Machine], dict]]:
+        """Hand each request the instances it asked for from a merged status lookup."""
+        by_id = {instance.get("instance_id"): instance for instance in instances}
+        split: dict[str, Tuple[list[Machine], dict]] = {}
+        for request, db_machines, params in members:
+            requested = params["instance_ids"]
+            own = [by_id[i] for i in requested if i in by_id]
+            split[str(request.request_id)] = (
+                self._machines_from_instances(request, db_machines, own, requested),
+                metadata,
+            )
+        return split
+
+    def _split_resource_results(
+        self,
+        members: list[Tuple[Request, list[Machine], dict]],
+        results: dict[str, dict],
+        lookup_ids: dict[str, str],
+    ) -> dict[str, Tuple[list[Machine], dict]]:
+        """Hand each request the entry of the lookup that covered its resources."""
+        split: dict[str, Tuple[list[Machine], dict]] = {}
+        for request, db_machines, _ in members:
+            request_id = str(request.request_id)
+            entry = results.get(lookup_ids.get(request_id, request_id)) or {
+                "error": "missing from provider response"
+            }
+            if "error" in entry:
+                self.logger.warning(
+                    f"Provider operation failed for request {request_id}: {entry['error']}"
+                )
+                split[request_id] = (db_machines, {})
+                continue
+            split[request_id] = (
+                self._machines_from_instances(request, db_machines, entry.get("instances", []), []),
+                entry.get("metadata") or {},
+            )
+        return split
+
+    @staticmethod
+    def _plan_provider_fetch(
+        request: Request, db_machines: list[Machine]
+    ) -> Optional[Tuple[Any, dict]]:
+        """Choose the provider operation and parameters that refresh a request's machines."""
+        from orb.domain.base.operations import OperationType as ProviderOperationType
+
+        # For return requests, always use instance-level status for the specific
+        # machines being returned — not resource-level discovery which returns all
+        # ASG/fleet instances including unrelated ones.
+        if request.request_type.value == "return" and request.machine_ids:
+            return ProviderOperationType.GET_INSTANCE_STATUS, {
+                "instance_ids": request.machine_ids,
+                "template_id": request.template_id,
+            }
+        # Use resource-level discovery for acquire requests (handles scaling/replacement)
+        if request.resource_ids:
+            return ProviderOperationType.DESCRIBE_RESOURCE_INSTANCES, {
+                "resource_ids": request.resource_ids,
+                "provider_api": request.provider_api,
+                "template_id": request.template_id,
+            }
+        # Fallback to instance-level discovery for requests without resource tracking
+        if db_machines:
+            return ProviderOperationType.GET_INSTANCE_STATUS, {
+                "instance_ids": [m.machine_id.value for m in db_machines],
+                "template_id": request.template_id,
+            }
+        return None
+
+    def _machines_from_instances(
+        self,
+        request: Request,
+        db_machines: list[Machine],
+        instances: list[dict],
+        queried_ids: list[str],
+    ) -> list[Machine]:
+        """Convert provider instance dicts of a request into domain machines."""
+        # instances are already snake_case domain dicts from check_hosts_status
+        # via _get_instance_details → machine_adapter (PascalCase→snake_case conversion
+        # happens once in the infrastructure layer). No re-conversion needed here.
+        domain_machines = []
+        returned_ids = set()
+        db_machines_by_id = {str(m.machine_id.value): m for m in db_machines}
+        for instance_data in instances:
+            try:
+                processed_data = {
+                    **instance_data,
+                    "request_id": str(request.request_id),
+                    "resource_id": request.resource_ids[0] if request.resource_ids else "",
+                }
+                terminal_states = {"shutting-down", "terminated", "stopping", "stopped"}
+                instance_status = processed_data.get("status", "")
+                existing = db_machines_by_id.get(processed_data.get("instance_id", ""))
+                if instance_status in terminal_states and existing:
+                    machine = self._create_machine_with_status(
+                        existing, MachineStatus(instance_status)
+                    )
+                else:
+                    machine = self._create_machine_from_processed_data(processed_data, request)
+                domain_machines.append(machine)
+                returned_ids.add(processed_data["instance_id"])
+            except Exception as e:
+                self.logger.warning(f"Failed to create machine from instance data: {e}")
+
+        # For return requests: instances missing from AWS response have been
+        # terminated and purged (~1hr window). Treat them as terminated.
+        if request.request_type.value == "return":
+            missing_ids = set(queried_ids) - returned_ids
+            for missing_id in missing_ids:
+                self.logger.info(f"Instance {missing_id} not found in AWS — treating as terminated")
+                existing = next((m for m in db_machines if m.machine_id.value == missing_id), None)
+                if existing:
+                    domain_machines.append(self._create_terminated_machine(existing))
+
+        return domain_machines
+
     def _create_machine_from_processed_data(
         self, processed_data: dict, request: Request
     ) -> Machine:
@@ -236,73 +446,9 @@ class MachineSyncService:
         self, request: Request, db_machines: list[Machine], provider_machines: list[Machine]
     ) -> Tuple[list[Machine], dict]:
         try:
-            existing_by_id = {str(m.machine_id.value): m for m in db_machines}
-            updated_machines = []
-            to_upsert = []
-
-            # Update existing machines and add new ones discovered from provider
-            for provider_machine in provider_machines:
-                machine_id = str(provider_machine.machine_id.value)
-                existing = existing_by_id.get(machine_id)
-
-                if existing:
-                    # Check if machine needs update (including DNS, name, and price_type fields)
-                    needs_update = (
-                        existing.status != provider_machine.status
-                        or existing.private_ip != provider_machine.private_ip
-                        or existing.public_ip != provider_machine.public_ip
-                        or existing.name != provider_machine.name
-                        or existing.private_dns_name != provider_machine.private_dns_name
-                        or existing.public_dns_name != provider_machine.public_dns_name
-                        or existing.price_type != provider_machine.price_type
-                        or existing.tags != provider_machine.tags
-                        or existing.subnet_id != provider_machine.subnet_id
-                        or existing.security_group_ids != provider_machine.security_group_ids
-                        or existing.vpc_id != provider_machine.vpc_id
-                        or existing.status_reason != provider_machine.status_reason
-                        or existing.provider_data != provider_machine.provider_data
-                    )
-
-                    # Debug logging
-                    self.logger.info(
-                        f"Machine {machine_id} sync check: existing.name='{existing.name}' vs provider.name='{provider_machine.name}', needs_update={needs_update}"
-                    )
-
-                    if needs_update:
-                        # Create updated machine with all provider data
-                        machine_data = existing.model_dump()
-                        machine_data["status"] = provider_machine.status
-                        machine_data["private_ip"] = provider_machine.private_ip
-                        machine_data["public_ip"] = provider_machine.public_ip
-                        machine_data["name"] = provider_machine.name
-                        machine_data["private_dns_name"] = provider_machine.private_dns_name
-                        machine_data["public_dns_name"] = provider_machine.public_dns_name
-                        machine_data["price_type"] = provider_machine.price_type
-                        machine_data["status_reason"] = provider_machine.status_reason
-                        machine_data["provider_data"] = provider_machine.provider_data
-                        machine_data["launch_time"] = (
-                            provider_machine.launch_time or existing.launch_time
-                        )
-                        machine_data["subnet_id"] = provider_machine.subnet_id
-                        machine_data["security_group_ids"] = provider_machine.security_group_ids
-                        machine_data["vpc_id"] = provider_machine.vpc_id
-                        machine_data["version"] = existing.version + 1
-                        machine_data["tags"] = provider_machine.tags
-
-                        updated_machine = Machine.model_validate(machine_data)
-                        to_upsert.append(updated_machine)
-                        updated_machines.append(updated_machine)
-
-                        self.logger.debug(
-                            f"Updated machine {machine_id} status: {existing.status} -> {provider_machine.status}"
-                        )
-                    else:
-                        updated_machines.append(existing)
-                else:
-                    # New machine discovered from provider
-                    to_upsert.append(provider_machine)
-                    updated_machines.append(provider_machine)
-                    self.logger.debug(f"Added new machine {machine_id} from provider")
+            updated_machines, to_upsert = self.merge_provider_machines(
+                db_machines, provider_machines
+            )
 
             # Persist changes
             if to_upsert:
@@ -317,3 +463,87 @@ class MachineSyncService:
         except Exception as e:
             self.logger.error(f"Failed to sync machines with provider: {e}")
             return db_machines, {}
+
+    def merge_provider_machines(
+        self, db_machines: list[Machine], provider_machines: list[Machine]
+    ) -> Tuple[list[Machine], list[Machine]]:
+        """
+        Apply provider state to stored machines without persisting it.
+
+        Args:
+            db_machines: Stored machines
+            provider_machines: Machines as reported by the provider
+
+        Returns:
+            Tuple of (machines with provider state applied, machines that changed
+            or are new and need saving)
+        """
+        existing_by_id = {str(m.machine_id.value): m for m in db_machines}
+        updated_machines = []
+        to_upsert = []
+
+        # Update existing machines and add new ones discovered from provider
+        for provider_machine in provider_machines:
+            machine_id = str(provider_machine.machine_id.value)
+            existing = existing_by_id.get(machine_id)
+
+            if existing:
+                # Check if machine needs update (including DNS, name, and price_type fields)
+                needs_update = (
+                    existing.status != provider_machine.status
+                    or existing.private_ip != provider_machine.private_ip
+                    or existing.public_ip != provider_machine.public_ip
+                    or existing.name != provider_machine.name
+                    or existing.private_dns_name != provider_machine.private_dns_name
+                    or existing.public_dns_name != provider_machine.public_dns_name
+                    or existing.price_type != provider_machine.price_type
+                    or existing.tags != provider_machine.tags
+                    or existing.subnet_id != provider_machine.subnet_id
+                    or existing.security_group_ids != provider_machine.security_group_ids
+                    or existing.vpc_id != provider_machine.vpc_id
+                    or existing.status_reason != provider_machine.status_reason
+                    or existing.provider_data != provider_machine.provider_data
+                )
+
+                # Debug logging
+                self.logger.info(
+                    f"Machine {machine_id} sync check: existing.name='{existing.name}' vs provider.name='{provider_machine.name}', needs_update={needs_update}"
+                )
+
+                if needs_update:
+                    # Create updated machine with all provider data
+                    machine_data = existing.model_dump()
+                    machine_data["status"] = provider_machine.status
+                    machine_data["private_ip"] = provider_machine.private_ip
+                    machine_data["public_ip"] = provider_machine.public_ip
+                    machine_data["name"] = provider_machine.name
+                    machine_data["private_dns_name"] = provider_machine.private_dns_name
+                    machine_data["public_dns_name"] = provider_machine.public_dns_name
+                    machine_data["price_type"] = provider_machine.price_type
+                    machine_data["status_reason"] = provider_machine.status_reason
+                    machine_data["provider_data"] = provider_machine.provider_data
+                    machine_data["launch_time"] = (
+                        provider_machine.launch_time or existing.launch_time
+                    )
+                    machine_data["subnet_id"] = provider_machine.subnet_id
+                    machine_data["security_group_ids"] = provider_machine.security_group_ids
+                    machine_data["vpc_id"] = provider_machine.vpc_id
+                    machine_data["version"] = existing.version + 1
+                    machine_data["tags"] = provider_machine.tags
+
+                    updated_machine = Machine.model_validate(machine_data)
+                    to_upsert.append(updated_machine)
+                    updated_machines.append(updated_machine)
+
+                    self.logger.debug(
+                        f"Updated machine {machine_id} status: {existing.status} -> {provider_machine.status}"
+                    )
+                else:
+                    updated_machines.append(existing)
+            else:
+                # New machine discovered from provider
+                to_upsert.append(provider_machine)
+                updated_machines.append(provider_machine)
+                self.logger.debug(f"Added new machine {machine_id} from provider")
+
+        return updated_machines, to_upsert
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from orb.application.dto.queries import GetRequestQuery, ListActiveRequestsQuery
+from orb.application.dto.queries import (
+    GetRequestBatchQuery,
+    GetRequestQuery,
+    ListActiveRequestsQuery,
+)
 from orb.application.ports.command_bus_port import CommandBusPort
 from orb.application.ports.query_bus_port import QueryBusPort
 from orb.application.services.orchestration.base import OrchestratorBase
@@ -11,6 +15,7 @@ from orb.application.services.orchestration.dtos import (
     GetRequestStatusOutput,
 )
 from orb.domain.base.ports.logging_port import LoggingPort
+from orb.domain.request.exceptions import RequestNotFoundError
 
 
 class GetRequestStatusOrchestrator(OrchestratorBase[GetRequestStatusInput, GetRequestStatusOutput]):
@@ -31,6 +36,9 @@ class GetRequestStatusOrchestrator(OrchestratorBase[GetRequestStatusInput, GetRe
             results = await self._query_bus.execute(query)
             return GetRequestStatusOutput(requests=[self._to_dict(r) for r in (results or [])])
 
+        if len(set(input.request_ids)) > 1:
+            return await self._execute_batch(input)
+
         request_dicts = []
         for request_id in input.request_ids:
             try:
@@ -46,6 +54,31 @@ class GetRequestStatusOrchestrator(OrchestratorBase[GetRequestStatusInput, GetRe
 
         return GetRequestStatusOutput(requests=request_dicts)
 
+    async def _execute_batch(self, input: GetRequestStatusInput) -> GetRequestStatusOutput:
+        """Fetch several requests through one batch query sharing provider calls."""
+        query = GetRequestBatchQuery(request_ids=input.request_ids, verbose=input.verbose)
+        try:
+            results = await self._query_bus.execute(query)
+        except Exception as exc:
+            self._logger.error("Failed to get status for %s: %s", input.request_ids, exc)
+            return GetRequestStatusOutput(
+                requests=[
+                    {"request_id": request_id, "error": str(exc)}
+                    for request_id in input.request_ids
+                ]
+            )
+
+        request_dicts = []
+        for request_id in input.request_ids:
+            result = results.get(request_id)
+            if result is None:
+                exc = RequestNotFoundError(request_id)
+                self._logger.error("Failed to get status for %s: %s", request_id, exc)
+                request_dicts.append({"request_id": request_id, "error": str(exc)})
+            else:
+                request_dicts.append(self._to_dict(result))
+        return GetRequestStatusOutput(requests=request_dicts)
+
     @staticmethod
     def _to_dict(obj: object) -> dict:
         if hasattr(obj, "to_dict"):
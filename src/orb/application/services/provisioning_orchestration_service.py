@@ -1,5 +1,7 @@
 """Service for orchestrating provider provisioning operations."""
 
+import asyncio
+import math
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Callable
@@ -53,147 +55,226 @@ class ProvisioningOrchestrationService:
     async def execute_provisioning(
         self, template: Template, request: Request, selection_result: ProviderSelectionResult
     ) -> ProvisioningResult:
-        """Execute provisioning with capacity top-up retry loop."""
+        """Execute provisioning, dispatching capacity batches concurrently.
+
+        The requested count is split into batches of ``batch_size`` with up to
+        ``max_parallel_batches`` of them in flight at once. Every completed
+        batch tops up whatever is still missing, until the request is
+        satisfied, a batch fails or reports a final shortfall, retries run out
+        or the timeout passes. Batches not yet dispatched at that point are
+        dropped; batches already in flight are awaited so the instances they
+        create are tracked. As before, the result fails when a batch failed.
+        """
         request_config = self._config_port.get_request_config()
         default_config: dict[str, Any] = {
             "max_retries": request_config.get("fulfillment_max_retries", 3),
             "timeout_seconds": request_config.get("fulfillment_timeout_seconds", 300),
             "batch_size": request_config.get("fulfillment_batch_size", 1000),
+            "max_parallel_batches": request_config.get("fulfillment_max_parallel_batches", 4),
             "fallback_template_id": request_config.get("fulfillment_fallback_template_id"),
         }
         config = {**default_config, **request.metadata.get("fulfillment_config", {})}
         max_retries: int = int(config["max_retries"])
         timeout_seconds: float = float(config["timeout_seconds"])
-        batch_size: int = int(config["batch_size"])
+        batch_size: int = max(1, int(config["batch_size"]))
+        max_parallel_batches: int = max(1, int(config["max_parallel_batches"]))
+        # Batches the request splits into, plus top-up retries after shortfalls
+        max_attempts = math.ceil(request.requested_count / batch_size) + max_retries
 
         started_at = datetime.now(timezone.utc)
         remaining = request.requested_count
         attempt_number = 0
         consecutive_zero_fulfillments = 0
+        stopped = False
 
         accumulated_resource_ids: list[str] = []
         accumulated_machine_ids: list[str] = []
         accumulated_instances: list[dict[str, Any]] = []
         accumulated_provider_data: dict[str, Any] = {}
         last_result: ProvisioningResult | None = None
+        last_failure: ProvisioningResult | None = None
 
-        while remaining > 0 and attempt_number <= max_retries:
-            elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
-            if elapsed >= timeout_seconds:
-                self._logger.warning(
-                    "Provisioning timeout after %.1fs for request %s",
-                    elapsed,
-                    request.request_id,
-                )
-                break
-
-            attempt_number += 1
-            attempt_count = min(remaining, batch_size)
-            attempt_started = datetime.now(timezone.utc)
-
-            self._logger.info(
-                "Provisioning attempt %d/%d: requesting %d of %d remaining instances",
-                attempt_number,
-                max_retries + 1,
-                attempt_count,
-                remaining,
-            )
-
-            # Stamp attempt number so provider-level idempotency tokens are unique per attempt
-            request = request.update_metadata({"provisioning_attempt": attempt_number})
+        # Dispatched batches: task -> (attempt number, requested count, start time)
+        in_flight: dict[asyncio.Task, tuple[int, int, datetime]] = {}
+        try:
+            while True:
+                while (
+                    not stopped
+                    and len(in_flight) < max_parallel_batches
+                    and attempt_number < max_attempts
+                ):
+                    outstanding = remaining - sum(count for _, count, _ in in_flight.values())
+                    if outstanding <= 0:
+                        break
+                    elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
+                    if elapsed >= timeout_seconds:
+                        self._logger.warning(
+                            "Provisioning timeout after %.1fs for request %s",
+                            elapsed,
+                            request.request_id,
+                        )
+                        stopped = True
+                        break
+
+                    attempt_number += 1
+                    attempt_count = min(outstanding, batch_size)
+                    self._logger.info(
+                        "Provisioning attempt %d/%d: requesting %d of %d remaining instances",
+                        attempt_number,
+                        max_attempts,
+                        attempt_count,
+                        remaining,
+                    )
 
-            try:
-                last_result = await self._dispatch_single_attempt(
-                    template, request, selection_result, attempt_count
-                )
-            except Exception as e:
-                if not isinstance(e, CircuitBreakerOpenError):
-                    raise
-                self._logger.warning(
-                    "Circuit breaker open for provider %s — aborting retry loop: %s",
-                    selection_result.provider_name,
-                    e,
-                )
-                self._record_provider_failure(selection_result.provider_name)
-                break
-
-            attempt_completed = datetime.now(timezone.utc)
-
-            # Accumulate results
-            accumulated_resource_ids.extend(last_result.resource_ids)
-            accumulated_machine_ids.extend(last_result.machine_ids)
-            accumulated_instances.extend(last_result.instances)
-            accumulated_provider_data.update(last_result.provider_data)
-
-            fulfilled_this_attempt = last_result.fulfilled_count
-            remaining -= fulfilled_this_attempt
-
-            if fulfilled_this_attempt == 0 and last_result.success:
-                consecutive_zero_fulfillments += 1
-                if consecutive_zero_fulfillments >= 3:
-                    self._logger.warning(
-                        "Breaking retry loop after %d consecutive zero-fulfillment attempts",
-                        consecutive_zero_fulfillments,
+                    # Stamp attempt number so provider-level idempotency tokens are unique per batch
+                    batch_request = request.update_metadata(
+                        {"provisioning_attempt": attempt_number}
                     )
-                    break
-            else:
-                consecutive_zero_fulfillments = 0
-
-            # Append to fulfillment_attempts audit trail
-            attempt_record = {
-                "attempt": attempt_number,
-                "requested": attempt_count,
-                "fulfilled": fulfilled_this_attempt,
-                "resource_ids": last_result.resource_ids,
-                "started_at": attempt_started.isoformat(),
-                "completed_at": attempt_completed.isoformat(),
-            }
-            existing_attempts = list(request.metadata.get("fulfillment_attempts", []))
-            existing_attempts.append(attempt_record)
-            request = request.update_metadata({"fulfillment_attempts": existing_attempts})
-
-            if not last_result.success:
-                self._logger.warning(
-                    "Attempt %d failed: %s", attempt_number, last_result.error_message
-                )
-                self._record_provider_failure(selection_result.provider_name)
-                break
-
-            if remaining > 0 and not last_result.is_final:
-                # Partial fulfillment, retry may help — persist ACQUIRING status
-                self._logger.info(
-                    "Attempt %d: %d/%d fulfilled, %d remaining — retrying",
-                    attempt_number,
-                    request.requested_count - remaining,
-                    request.requested_count,
-                    remaining,
-                )
-                request, persist_ok = self._persist_acquiring(request)
-                if not persist_ok:
-                    self._logger.warning(
-                        "ACQUIRING persist failed for request %s on attempt %d — "
-                        "continuing retry loop with in-memory state",
-                        request.request_id,
+                    task = asyncio.ensure_future(
+                        self._dispatch_single_attempt(
+                            template, batch_request, selection_result, attempt_count
+                        )
+                    )
+                    in_flight[task] = (
                         attempt_number,
+                        attempt_count,
+                        datetime.now(timezone.utc),
                     )
-            elif last_result.is_final:
-                # No point retrying
-                break
 
-        total_fulfilled = len(accumulated_instances)
-        success = last_result.success if last_result else False
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: in_flight[t][0]):
+                    attempt, attempt_count, attempt_started = in_flight.pop(task)
+                    try:
+                        result = task.result()
+                    except CircuitBreakerOpenError as e:
+                        self._logger.warning(
+                            "Circuit breaker open for provider %s — aborting retry loop: %s",
+                            selection_result.provider_name,
+                            e,
+                        )
+                        self._record_provider_failure(selection_result.provider_name)
+                        stopped = True
+                        continue
+
+                    last_result = result
+                    attempt_completed = datetime.now(timezone.utc)
+
+                    # Accumulate results
+                    accumulated_resource_ids.extend(result.resource_ids)
+                    accumulated_machine_ids.extend(result.machine_ids)
+                    accumulated_instances.extend(result.instances)
+                    accumulated_provider_data.update(result.provider_data)
+                    remaining -= result.fulfilled_count
+
+                    # Append to fulfillment_attempts audit trail
+                    attempt_record = {
+                        "attempt": attempt,
+                        "requested": attempt_count,
+                        "fulfilled": result.fulfilled_count,
+                        "resource_ids": result.resource_ids,
+                        "started_at": attempt_started.isoformat(),
+                        "completed_at": attempt_completed.isoformat(),
+                    }
+                    existing_attempts = list(request.metadata.get("fulfillment_attempts", []))
+                    existing_attempts.append(attempt_record)
+                    request = request.update_metadata({"fulfillment_attempts": existing_attempts})
+
+                    if not result.success:
+                        self._logger.warning("Attempt %d failed: %s", attempt, result.error_message)
+                        self._record_provider_failure(selection_result.provider_name)
+                        last_failure = result
+                        stopped = True
+                        continue
+
+                    if result.fulfilled_count == 0:
+                        consecutive_zero_fulfillments += 1
+                        if consecutive_zero_fulfillments >= 3:
+                            self._logger.warning(
+                                "Breaking retry loop after %d consecutive zero-fulfillment attempts",
+                                consecutive_zero_fulfillments,
+                            )
+                            stopped = True
+                    else:
+                        consecutive_zero_fulfillments = 0
+
+                    if result.fulfilled_count >= attempt_count or remaining <= 0:
+                        continue
+                    if result.is_final:
+                        # Provider reports no more capacity — no point retrying
+                        stopped = True
+                    elif not stopped:
+                        # Partial fulfillment, retry may help — persist ACQUIRING status
+                        self._logger.info(
+                            "Attempt %d: %d/%d fulfilled, %d remaining — retrying",
+                            attempt,
+                            request.requested_count - remaining,
+                            request.requested_count,
+                            remaining,
+                        )
+                        request, persist_ok = self._persist_acquiring(request)
+                        if not persist_ok:
+                            self._logger.warning(
+                                "ACQUIRING persist failed for request %s on attempt %d — "
+                                "continuing retry loop with in-memory state",
+                                request.request_id,
+                                attempt,
+                            )
+        except asyncio.CancelledError:
+            for task in in_flight:
+                task.cancel()
+            raise
+        except Exception:
+            # Let batches already in flight finish so the instances they launch are logged
+            if in_flight:
+                outcomes = await asyncio.gather(*in_flight, return_exceptions=True)
+                self._log_abandoned_batches(request, list(in_flight.values()), outcomes)
+            raise
+
+        if last_failure is not None:
+            # A failed batch ends dispatch, as it did when batches ran one at a time
+            last_result = last_failure
 
         return ProvisioningResult(
-            success=success,
+            success=last_result.success if last_result else False,
             resource_ids=accumulated_resource_ids,
             machine_ids=accumulated_machine_ids,
             instances=accumulated_instances,
             provider_data=accumulated_provider_data,
             error_message=last_result.error_message if last_result else "No provisioning attempted",
-            fulfilled_count=total_fulfilled,
+            fulfilled_count=len(accumulated_instances),
             is_final=last_result.is_final if last_result else True,
         )
 
+    def _log_abandoned_batches(
+        self,
+        request: Request,
+        batches: list[tuple[int, int, datetime]],
+        outcomes: list[Any],
+    ) -> None:
+        """Log what batches still in flight created before provisioning raised."""
+        for (attempt, attempt_count, _), outcome in zip(batches, outcomes):
+            if isinstance(outcome, ProvisioningResult):
+                self._logger.warning(
+                    "Attempt %d for request %s created %d/%d instances after provisioning "
+                    "failed: resource_ids=%s machine_ids=%s",
+                    attempt,
+                    request.request_id,
+                    outcome.fulfilled_count,
+                    attempt_count,
+                    outcome.resource_ids,
+                    outcome.machine_ids,
+                )
+            else:
+                self._logger.warning(
+                    "Attempt %d for request %s raised after provisioning failed: %s",
+                    attempt,
+                    request.request_id,
+                    outcome,
+                )
+
     def _persist_acquiring(self, request: Request) -> tuple[Request, bool]:
         """Persist request with ACQUIRING status between retry attempts.
 
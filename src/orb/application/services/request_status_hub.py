@@ -0,0 +1,387 @@
+"""Shared request status watchers that fan out changes to many subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+from orb.application.ports.scheduler_port import SchedulerPort
+from orb.application.services.orchestration.dtos import GetRequestStatusInput
+from orb.application.services.orchestration.get_request_status import (
+    GetRequestStatusOrchestrator,
+)
+from orb.domain.base.ports.logging_port import LoggingPort
+
+# Statuses as reported by the scheduler formatters, after which a request no longer changes
+TERMINAL_STATUSES = frozenset(
+    {
+        "complete",
+        "completed",
+        "complete_with_error",
+        "partial",
+        "failed",
+        "error",
+        "cancelled",
+        "canceled",
+        "timeout",
+    }
+)
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class RequestStatusUpdate:
+    """
+    Change of one request's formatted status.
+
+    A ``full`` update carries the whole status in ``changes``; any other
+    update carries only the fields that changed (``removed`` lists fields
+    that disappeared). ``error`` is set when the status could not be fetched,
+    which ends the watch of that request.
+    """
+
+    request_id: str
+    version: int
+    changes: dict[str, Any] = field(default_factory=dict)
+    removed: list[str] = field(default_factory=list)
+    full: bool = False
+    terminal: bool = False
+    error: Optional[str] = None
+
+    def merge(self, newer: RequestStatusUpdate) -> RequestStatusUpdate:
+        """Combine with a newer update into one covering both changes."""
+        if newer.full:
+            return newer
+        changes = {k: v for k, v in self.changes.items() if k not in newer.removed}
+        changes.update(newer.changes)
+        removed = (
+            []
+            if self.full
+            else sorted((set(self.removed) - set(newer.changes)) | set(newer.removed))
+        )
+        return RequestStatusUpdate(
+            request_id=self.request_id,
+            version=newer.version,
+            changes=changes,
+            removed=removed,
+            full=self.full,
+            terminal=newer.terminal,
+            error=newer.error,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-friendly dictionary."""
+        return asdict(self)
+
+
+class RequestStatusSubscription:
+    """
+    Pending status updates of a set of requests for one subscriber.
+
+    Updates that arrive while the subscriber is busy are coalesced per
+    request, so a slow consumer holds at most one pending update per request
+    and never sees intermediate states it could not keep up with.
+    """
+
+    def __init__(
+        self, hub: RequestStatusHub, request_ids: list[str], loop: asyncio.AbstractEventLoop
+    ) -> None:
+        self.request_ids = tuple(dict.fromkeys(request_ids))
+        self.closed = False
+        self._hub = hub
+        self._loop = loop
+        self._pending: dict[str, RequestStatusUpdate] = {}
+        self._finished: set[str] = set()
+        self._ready = asyncio.Event()
+
+    @property
+    def done(self) -> bool:
+        """Whether every request finished and its last update was consumed."""
+        return not self._pending and self._finished.issuperset(self.request_ids)
+
+    async def next(self, timeout: Optional[float] = None) -> list[RequestStatusUpdate]:
+        """
+        Wait for the next batch of updates.
+
+        Args:
+            timeout: Seconds to wait (default: until an update arrives)
+
+        Returns:
+            Pending updates, one per changed request; empty on timeout or when done
+        """
+        if not self._pending and not self.done and not self.closed:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        self._ready.clear()
+        updates = list(self._pending.values())
+        self._pending.clear()
+        for update in updates:
+            if update.terminal or update.error is not None:
+                self._finished.add(update.request_id)
+        return updates
+
+    def close(self) -> None:
+        """Stop receiving updates."""
+        if not self.closed:
+            self.closed = True
+            self._hub._unsubscribe(self)
+            self._ready.set()
+
+    def _deliver(self, update: RequestStatusUpdate) -> None:
+        """Queue an update; must run on the subscriber's event loop."""
+        if self.closed:
+            return
+        previous = self._pending.get(update.request_id)
+        self._pending[update.request_id] = previous.merge(update) if previous else update
+        self._ready.set()
+
+    def __aiter__(self) -> RequestStatusSubscription:
+        return self
+
+    async def __anext__(self) -> list[RequestStatusUpdate]:
+        while not (self.done or self.closed):
+            updates = await self.next()
+            if updates:
+                return updates
+        raise StopAsyncIteration
+
+    async def __aenter__(self) -> RequestStatusSubscription:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class _Watcher:
+    """Polling state shared by every subscriber of one request."""
+
+    def __init__(self, request_id: str, loop: asyncio.AbstractEventLoop) -> None:
+        self.request_id = request_id
+        self.loop = loop
+        self.subscribers: set[RequestStatusSubscription] = set()
+        self.snapshot: Optional[dict[str, Any]] = None
+        self.version = 0
+        self.terminal = False
+        self.closed = False
+        self.wake = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+
+class RequestStatusHub:
+    """
+    Fans out request status changes to any number of subscribers.
+
+    Each watched request has a single watcher that fetches its status every
+    ``poll_interval_seconds``, however many streams, SDK clients or MCP
+    sessions subscribe to it. The watcher is also woken early by
+    :meth:`notify` (wired to request domain events on the ``EventBus``);
+    after a wake-up it waits ``coalesce_seconds`` so a burst of events costs
+    one fetch. Only changed fields are pushed, and a watcher stops once the
+    request is terminal or its last subscriber leaves.
+    """
+
+    def __init__(
+        self,
+        orchestrator: GetRequestStatusOrchestrator,
+        scheduler: SchedulerPort,
+        logger: LoggingPort,
+        *,
+        poll_interval_seconds: float = 2.0,
+        coalesce_seconds: float = 0.25,
+    ) -> None:
+        """
+        Initialize the hub.
+
+        Args:
+            orchestrator: Orchestrator used to fetch request status
+            scheduler: Scheduler whose response format subscribers receive
+            logger: Logger
+            poll_interval_seconds: Interval between status fetches of a watched request
+            coalesce_seconds: Delay after a wake-up that absorbs further events
+        """
+        self._orchestrator = orchestrator
+        self._scheduler = scheduler
+        self._logger = logger
+        self.poll_interval_seconds = poll_interval_seconds
+        self.coalesce_seconds = coalesce_seconds
+
+        self._watchers: dict[str, _Watcher] = {}
+        self._lock = threading.Lock()
+        self._stats = {"fetches": 0, "updates": 0, "subscriptions": 0}
+
+    def subscribe(self, request_ids: list[str]) -> RequestStatusSubscription:
+        """
+        Subscribe to status updates of requests.
+
+        Must be called from a running event loop. Requests that are already
+        watched deliver their current status immediately as a full update.
+
+        Args:
+            request_ids: Requests to watch
+
+        Returns:
+            Subscription to read updates from; close it when done
+        """
+        loop = asyncio.get_running_loop()
+        subscription = RequestStatusSubscription(self, request_ids, loop)
+        with self._lock:
+            self._stats["subscriptions"] += 1
+            for request_id in subscription.request_ids:
+                watcher = self._watchers.get(request_id)
+                if watcher is None or watcher.closed or watcher.loop.is_closed():
+                    watcher = _Watcher(request_id, loop)
+                    self._watchers[request_id] = watcher
+                    watcher.task = loop.create_task(self._watch(watcher))
+                watcher.subscribers.add(subscription)
+                if watcher.snapshot is not None:
+                    subscription._deliver(
+                        RequestStatusUpdate(
+                            request_id=request_id,
+                            version=watcher.version,
+                            changes=dict(watcher.snapshot),
+                            full=True,
+                            terminal=watcher.terminal,
+                        )
+                    )
+        return subscription
+
+    def notify(self, request_id: str) -> None:
+        """
+        Fetch a watched request's status now instead of at the next poll.
+
+        Safe to call from any thread; unwatched requests are ignored.
+
+        Args:
+            request_id: Request whose state changed
+        """
+        with self._lock:
+            watcher = self._watchers.get(request_id)
+        if watcher is not None:
+            with suppress(RuntimeError):  # watcher loop already closed
+                watcher.loop.call_soon_threadsafe(watcher.wake.set)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return watcher and fan-out counters."""
+        with self._lock:
+            return {
+                **self._stats,
+                "watched_requests": len(self._watchers),
+                "subscribers": sum(len(w.subscribers) for w in self._watchers.values()),
+            }
+
+    def _unsubscribe(self, subscription: RequestStatusSubscription) -> None:
+        for request_id in subscription.request_ids:
+            with self._lock:
+                watcher = self._watchers.get(request_id)
+                if watcher is None:
+                    continue
+                watcher.subscribers.discard(subscription)
+                idle = not watcher.subscribers
+            if idle:
+                self.notify(request_id)
+
+    async def _watch(self, watcher: _Watcher) -> None:
+        while True:
+            try:
+                snapshot = await self._fetch(watcher.request_id)
+            except Exception as e:
+                self._logger.warning("Status watch of request %s failed: %s", watcher.request_id, e)
+                self._finish(
+                    watcher,
+                    RequestStatusUpdate(watcher.request_id, watcher.version, error=str(e)),
+                )
+                return
+
+            update = self._diff(watcher, snapshot)
+            if watcher.terminal:
+                self._finish(watcher, update)
+                return
+            if update is not None:
+                self._publish(watcher, update)
+
+            watcher.wake.clear()
+            woken = False
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(watcher.wake.wait(), self.poll_interval_seconds)
+                woken = True
+            if self._finish_if_idle(watcher):
+                return
+            if woken and self.coalesce_seconds > 0:
+                await asyncio.sleep(self.coalesce_seconds)
+
+    async def _fetch(self, request_id: str) -> dict[str, Any]:
+        self._stats["fetches"] += 1
+        result = await self._orchestrator.execute(
+            GetRequestStatusInput(request_ids=[request_id], verbose=False)
+        )
+        formatted = self._scheduler.format_request_status_response(result.requests)
+        requests = formatted.get("requests") if isinstance(formatted, dict) else None
+        if requests:
+            return dict(requests[0])
+        return dict(formatted) if isinstance(formatted, dict) else {}
+
+    @staticmethod
+    def _diff(watcher: _Watcher, snapshot: dict[str, Any]) -> Optional[RequestStatusUpdate]:
+        previous = watcher.snapshot
+        if previous is None:
+            changes, removed, full = dict(snapshot), [], True
+        else:
+            changes = {k: v for k, v in snapshot.items() if previous.get(k, _MISSING) != v}
+            removed = sorted(k for k in previous if k not in snapshot)
+            full = False
+            if not changes and not removed:
+                return None
+
+        watcher.snapshot = snapshot
+        watcher.version += 1
+        watcher.terminal = str(snapshot.get("status", "")).lower() in TERMINAL_STATUSES
+        return RequestStatusUpdate(
+            request_id=watcher.request_id,
+            version=watcher.version,
+            changes=changes,
+            removed=removed,
+            full=full,
+            terminal=watcher.terminal,
+        )
+
+    def _publish(self, watcher: _Watcher, update: RequestStatusUpdate) -> None:
+        with self._lock:
+            subscribers = list(watcher.subscribers)
+        self._deliver(subscribers, update)
+
+    def _finish(self, watcher: _Watcher, update: Optional[RequestStatusUpdate]) -> None:
+        """Retire the watcher, then send its final update."""
+        with self._lock:
+            watcher.closed = True
+            if self._watchers.get(watcher.request_id) is watcher:
+                del self._watchers[watcher.request_id]
+            subscribers = list(watcher.subscribers)
+        if update is not None:
+            self._deliver(subscribers, update)
+
+    def _finish_if_idle(self, watcher: _Watcher) -> bool:
+        with self._lock:
+            if watcher.subscribers:
+                return False
+            watcher.closed = True
+            if self._watchers.get(watcher.request_id) is watcher:
+                del self._watchers[watcher.request_id]
+            return True
+
+    def _deliver(
+        self, subscribers: list[RequestStatusSubscription], update: RequestStatusUpdate
+    ) -> None:
+        self._stats["updates"] += 1
+        current_loop = asyncio.get_running_loop()
+        for subscription in subscribers:
+            if subscription._loop is current_loop:
+                subscription._deliver(update)
+            else:
+                with suppress(RuntimeError):  # subscriber loop already closed
+                    subscription._loop.call_soon_threadsafe(subscription._deliver, update)
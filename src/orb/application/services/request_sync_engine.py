@@ -0,0 +1,348 @@
+"""Background engine that keeps active requests in storage in sync with their provider."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from orb.application.services.machine_sync_service import MachineSyncService
+from orb.application.services.request_query_service import RequestQueryService
+from orb.application.services.request_status_service import RequestStatusService
+from orb.domain.base import UnitOfWorkFactory
+from orb.domain.base.ports.logging_port import LoggingPort
+from orb.domain.machine.aggregate import Machine
+from orb.domain.request.aggregate import Request
+
+
+@dataclass
+class _SyncState:
+    interval: float
+    next_due: float
+    last_synced: Optional[float] = None
+
+
+class RequestSyncEngine:
+    """
+    Refreshes active requests from their provider on an adaptive cadence.
+
+    Every tick the engine loads the active (pending/in-progress) requests,
+    picks the ones that are due and groups them by provider instance and API.
+    Each group is refreshed with one batched provider fetch in which requests
+    on the same resource (fleet, ASG) IDs share a single lookup, and up to
+    ``max_concurrency`` groups are refreshed in parallel. A request whose
+    machines or status changed is polled again after ``min_interval_seconds``;
+    each refresh that changes nothing doubles its interval up to
+    ``max_interval_seconds``.
+
+    Status queries use :meth:`is_fresh` to answer from storage while the
+    request was refreshed within ``max_staleness_seconds``, and report their
+    own read-through syncs with :meth:`record_sync` so the engine does not
+    repeat them.
+    """
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        logger: LoggingPort,
+        machine_sync_service: MachineSyncService,
+        *,
+        enabled: bool = True,
+        tick_seconds: float = 1.0,
+        min_interval_seconds: float = 5.0,
+        max_interval_seconds: float = 60.0,
+        max_staleness_seconds: float = 30.0,
+        max_concurrency: int = 8,
+    ) -> None:
+        """
+        Initialize the sync engine.
+
+        Args:
+            uow_factory: Unit of work factory for the read model
+            logger: Logger
+            machine_sync_service: Service that fetches and stores provider machine state
+            enabled: Whether :meth:`start` launches the background thread
+            tick_seconds: How often due requests are checked
+            min_interval_seconds: Refresh interval for requests whose state is changing
+            max_interval_seconds: Upper bound the refresh interval backs off to
+            max_staleness_seconds: Age up to which a refresh counts as fresh
+            max_concurrency: Maximum provider groups refreshed in parallel
+        """
+        self.uow_factory = uow_factory
+        self.logger = logger
+        self._machine_sync_service = machine_sync_service
+        self._query_service = RequestQueryService(uow_factory, logger)
+        self._status_service = RequestStatusService(uow_factory, logger)
+        self.enabled = enabled
+        self.tick_seconds = tick_seconds
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+        self.max_concurrency = max_concurrency
+
+        self._states: dict[str, _SyncState] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"cycles": 0, "syncs": 0, "changes": 0, "failures": 0}
+        self._last_cycle_seconds = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start refreshing in a background thread with its own event loop."""
+        if not self.enabled:
+            self.logger.info("Request sync engine disabled by configuration")
+            return
+        with self._lock:
+            if self.is_running:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="orb-request-sync", daemon=True)
+            self._thread.start()
+        self.logger.info(
+            "Request sync engine started (interval %.0f-%.0fs, staleness %.0fs)",
+            self.min_interval_seconds,
+            self.max_interval_seconds,
+            self.max_staleness_seconds,
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop the background thread.
+
+        Args:
+            timeout: Seconds to wait for an in-flight cycle to finish
+        """
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def is_fresh(self, request_id: str) -> bool:
+        """
+        Check whether a request was refreshed recently enough to serve from storage.
+
+        Always False while the engine is not running, so callers fall back to
+        their own read-through sync.
+
+        Args:
+            request_id: Request identifier
+
+        Returns:
+            True if the last refresh is within ``max_staleness_seconds``
+        """
+        if not self.is_running:
+            return False
+        with self._lock:
+            state = self._states.get(request_id)
+            last_synced = state.last_synced if state else None
+        return (
+            last_synced is not None and time.monotonic() - last_synced <= self.max_staleness_seconds
+        )
+
+    def record_sync(self, request_id: str, changed: bool = False) -> None:
+        """
+        Record a completed refresh of a request and schedule the next one.
+
+        Args:
+            request_id: Request identifier
+            changed: Whether the refresh changed stored state
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._states.get(request_id)
+            if state is None:
+                state = _SyncState(interval=self.min_interval_seconds, next_due=now)
+                self._states[request_id] = state
+            elif changed:
+                state.interval = self.min_interval_seconds
+            else:
+                state.interval = min(state.interval * 2, self.max_interval_seconds)
+            state.last_synced = now
+            state.next_due = now + state.interval
+
+    async def run_cycle(self) -> int:
+        """
+        Refresh every active request that is due.
+
+        Returns:
+            Number of requests refreshed
+        """
+        started = time.monotonic()
+        with self.uow_factory.create_unit_of_work() as uow:
+            active = uow.requests.find_active_requests()
+
+        due = self._select_due(active, started)
+        groups: dict[tuple[str, str], list[Request]] = defaultdict(list)
+        for request in due:
+            groups[(request.provider_name or "", request.provider_api or "")].append(request)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded_sync(group: list[Request]) -> None:
+            async with semaphore:
+                await self._sync_group(group)
+
+        await asyncio.gather(*(bounded_sync(group) for group in groups.values()))
+
+        with self._lock:
+            self._stats["cycles"] += 1
+            self._last_cycle_seconds = time.monotonic() - started
+        return len(due)
+
+    async def sync_request(self, request: Request) -> bool:
+        """
+        Refresh one request from its provider and store the result.
+
+        Args:
+            request: Request to refresh
+
+        Returns:
+            True if the request status or any of its machines changed
+        """
+        request, db_machines = await self._load(request)
+        (
+            provider_machines,
+            provider_metadata,
+        ) = await self._machine_sync_service.fetch_provider_machines(request, db_machines)
+        return await self._apply(request, db_machines, provider_machines, provider_metadata)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get engine statistics."""
+        with self._lock:
+            return {
+                **self._stats,
+                "running": self.is_running,
+                "tracked_requests": len(self._states),
+                "last_cycle_seconds": self._last_cycle_seconds,
+            }
+
+    def _select_due(self, active: list[Request], now: float) -> list[Request]:
+        """Pick due requests and forget the ones that are no longer active."""
+        active_ids = {str(request.request_id.value) for request in active}
+        due = []
+        with self._lock:
+            for request_id in set(self._states) - active_ids:
+                del self._states[request_id]
+            for request in active:
+                state = self._states.get(str(request.request_id.value))
+                if state is None or state.next_due <= now:
+                    due.append(request)
+        return due
+
+    async def _sync_group(self, group: list[Request]) -> None:
+        """
+        Refresh requests of one provider API with a single batched provider fetch.
+
+        Requests are ordered by resource IDs so requests on the same fleet sit
+        together; the fetch looks each distinct set of resource IDs up once
+        and hands the result to every request on it. A request that fails to load or apply is retried later on its own
+        backoff; a failed fetch backs off the whole group.
+        """
+        ordered = sorted(group, key=lambda r: r.resource_ids)
+        loaded = await asyncio.gather(
+            *(self._load(request) for request in ordered), return_exceptions=True
+        )
+        items: list[tuple[Request, list[Machine]]] = []
+        for request, result in zip(ordered, loaded):
+            if isinstance(result, Exception):
+                self._record_failure(request, result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                items.append(result)
+        if not items:
+            return
+
+        try:
+            fetched = await self._machine_sync_service.fetch_provider_machines_batch(items)
+        except Exception as e:
+            for request, _ in items:
+                self._record_failure(request, e)
+            return
+
+        for request, db_machines in items:
+            provider_machines, provider_metadata = fetched.get(str(request.request_id), ([], {}))
+            try:
+                changed = await self._apply(
+                    request, db_machines, provider_machines, provider_metadata
+                )
+            except Exception as e:
+                self._record_failure(request, e)
+                continue
+            self._record_success(request, changed)
+
+    async def _load(self, request: Request) -> tuple[Request, list[Machine]]:
+        """Reload a request with its stored machines, filling in missing machine IDs first."""
+        await self._machine_sync_service.populate_missing_machine_ids(request)
+        request = await self._query_service.get_request(str(request.request_id.value))
+        db_machines = await self._query_service.get_machines_for_request(request)
+        return request, db_machines
+
+    async def _apply(
+        self,
+        request: Request,
+        db_machines: list[Machine],
+        provider_machines: list[Machine],
+        provider_metadata: dict,
+    ) -> bool:
+        """Store fetched provider state; True if the status or any machine changed."""
+        synced_machines, _ = await self._machine_sync_service.sync_machines_with_provider(
+            request, db_machines, provider_machines
+        )
+        new_status, status_message = self._status_service.determine_status_from_machines(
+            db_machines, synced_machines, request, provider_metadata
+        )
+        if new_status:
+            await self._status_service.update_request_status(
+                request, new_status, status_message or ""
+            )
+        return bool(new_status) or self._fingerprint(db_machines) != self._fingerprint(
+            synced_machines
+        )
+
+    def _record_success(self, request: Request, changed: bool) -> None:
+        self.record_sync(str(request.request_id.value), changed=changed)
+        with self._lock:
+            self._stats["syncs"] += 1
+            if changed:
+                self._stats["changes"] += 1
+
+    def _record_failure(self, request: Request, error: Exception) -> None:
+        request_id = str(request.request_id.value)
+        self.logger.warning("Background sync failed for request %s: %s", request_id, error)
+        with self._lock:
+            self._stats["failures"] += 1
+            state = self._states.get(request_id)
+            if state is not None:
+                state.interval = min(state.interval * 2, self.max_interval_seconds)
+                state.next_due = time.monotonic() + state.interval
+            else:
+                self._states[request_id] = _SyncState(
+                    interval=self.min_interval_seconds,
+                    next_due=time.monotonic() + self.min_interval_seconds,
+                )
+
+    @staticmethod
+    def _fingerprint(machines: list[Machine]) -> set[tuple[str, str]]:
+        return {(str(m.machine_id.value), str(m.status.value)) for m in machines}
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    loop.run_until_complete(self.run_cycle())
+                except Exception as e:
+                    self.logger.error("Request sync cycle failed: %s", e)
+                self._stop_event.wait(self.tick_seconds)
+        finally:
+            loop.close()
@@ -13,6 +13,7 @@ from typing import Any, Optional
 # This must happen before any call to get_container().
 from orb.bootstrap.services import register_all_services
 from orb.infrastructure.di.container import set_container_factory
+from orb.infrastructure.di.startup_profile import startup_phase
 
 set_container_factory(register_all_services)
 
@@ -44,8 +45,9 @@ class Application:
             from orb.infrastructure.adapters.console_adapter import RichConsoleAdapter
             from orb.infrastructure.validation.startup_validator import StartupValidator
 
-            validator = StartupValidator(config_path, console=RichConsoleAdapter())
-            validator.validate_startup()
+            with startup_phase("startup validation"):
+                validator = StartupValidator(config_path, console=RichConsoleAdapter())
+                validator.validate_startup()
 
         # Defer heavy initialization until first use
         self._container: Any = None
@@ -110,10 +112,12 @@ class Application:
         """Initialize the application with DI container."""
         try:
             # Ensure container is available first (services already registered in get_container)
-            self._ensure_container()
+            with startup_phase("container"):
+                self._ensure_container()
 
             # Now we can ensure config manager is available
-            self._ensure_config_manager()
+            with startup_phase("configuration"):
+                self._ensure_config_manager()
 
             self.logger.info("Initializing application with provider: %s", self.provider_type)
 
@@ -121,8 +125,9 @@ class Application:
             self._log_provider_configuration(self._config_manager)
 
             # Setup logging
-            app_config = self._config_manager.get_typed(AppConfig)
-            setup_logging(app_config.logging)
+            with startup_phase("logging setup"):
+                app_config = self._config_manager.get_typed(AppConfig)
+                setup_logging(app_config.logging)
 
             # Activate dry-run context if requested
             if dry_run:
@@ -138,17 +143,19 @@ class Application:
             self._provider_registry = self._container.get(ProviderRegistryPort)
 
             # Initialize provider registry based on loading mode
-            if not self._container.is_lazy_loading_enabled():
-                # Eager loading - ensure providers are registered
-                self.logger.info("Eager loading - registering providers immediately")
-                self._register_configured_providers()
-            else:
-                # Lazy loading - still need to register providers for discovery
-                self.logger.info("Lazy loading enabled - registering providers for discovery")
-                self._register_configured_providers()
+            with startup_phase("provider registration"):
+                if not self._container.is_lazy_loading_enabled():
+                    # Eager loading - ensure providers are registered
+                    self.logger.info("Eager loading - registering providers immediately")
+                    self._register_configured_providers()
+                else:
+                    # Lazy loading - still need to register providers for discovery
+                    self.logger.info("Lazy loading enabled - registering providers for discovery")
+                    self._register_configured_providers()
 
             # Pre-load templates into cache during initialization
-            await self._preload_templates()
+            with startup_phase("template preload"):
+                await self._preload_templates()
 
             # Log final provider information
             self._log_final_provider_info()
@@ -371,6 +378,13 @@ class Application:
         self.logger.info("Shutting down application")
         self._initialized = False
 
+        try:
+            from orb.infrastructure.storage.sql.runtime import reset_sql_runtime_pool
+
+            reset_sql_runtime_pool()
+        except Exception as e:
+            self.logger.debug("Could not dispose storage runtimes: %s", str(e))
+
     async def cleanup(self) -> None:
         """Async cleanup — delegates to synchronous shutdown."""
         self.shutdown()
@@ -56,14 +56,19 @@ def register_domain_services(container: DIContainer) -> None:
 
     # Deprovisioning orchestrator (SRP refactoring)
     def create_deprovisioning_orchestrator(c):
+        from orb.config.managers.configuration_manager import ConfigurationManager
+        from orb.config.schemas.performance_schema import PerformanceConfig
         from orb.infrastructure.di.buses import QueryBus
 
+        performance_config = c.get(ConfigurationManager).get_typed_with_defaults(PerformanceConfig)
+
         return DeprovisioningOrchestrator(
             uow_factory=c.get(UnitOfWorkFactory),
             logger=c.get(LoggingPort),
             container=c.get(ContainerPort),
             query_bus=c.get(QueryBus),
             provider_selection_port=c.get(ProviderSelectionPort),
+            max_concurrency=performance_config.max_workers,
         )
 
     container.register_singleton(DeprovisioningOrchestrator, create_deprovisioning_orchestrator)
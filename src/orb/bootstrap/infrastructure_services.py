@@ -19,6 +19,9 @@ def register_infrastructure_services(container: DIContainer) -> None:
     # Register repository services
     _register_repository_services(container)
 
+    # Register circuit breaker state store
+    _register_circuit_state_store(container)
+
     # Register provisioning orchestration service
     _register_provisioning_orchestration_service(container)
 
@@ -101,6 +104,7 @@ def _register_template_services(container: DIContainer):
         from orb.application.services.provider_registry_service import ProviderRegistryService
         from orb.config.managers.configuration_manager import ConfigurationManager
         from orb.domain.base.ports.provider_registry_port import ProviderRegistryPort
+        from orb.domain.base.ports.spec_rendering_port import SpecRenderingPort
         from orb.domain.template.factory import TemplateFactory
         from orb.domain.template.ports.template_defaults_port import TemplateDefaultsPort
 
@@ -113,6 +117,7 @@ def _register_template_services(container: DIContainer):
             provider_registry_service=c.get(ProviderRegistryService),
             template_factory=c.get(TemplateFactory),
             registry=c.get(ProviderRegistryPort),
+            spec_renderer=c.get(SpecRenderingPort),
         )
 
     container.register_singleton(
@@ -177,6 +182,38 @@ def _register_repository_services(container: DIContainer) -> None:
     container.register_singleton(TemplateRepository, create_template_repository)
 
 
+def _register_circuit_state_store(container: DIContainer) -> None:
+    """Register the store that shares circuit breaker state between processes."""
+    from orb.infrastructure.resilience.state_store import (
+        CIRCUIT_STATE_COLLECTION,
+        CIRCUIT_STATE_COLUMNS,
+        CircuitStateStore,
+        create_circuit_state_store,
+    )
+
+    def create_state_store(c: DIContainer) -> CircuitStateStore:
+        config_manager = c.get(ConfigurationManager)
+        cb_config = config_manager.app_config.circuit_breaker
+
+        def create_storage_strategy():
+            from orb.infrastructure.storage.registry import get_storage_registry
+
+            return get_storage_registry().create_collection_strategy(
+                config_manager.get_storage_strategy(),
+                config_manager,
+                CIRCUIT_STATE_COLLECTION,
+                CIRCUIT_STATE_COLUMNS,
+            )
+
+        return create_circuit_state_store(
+            cb_config.state_backend,
+            state_dir=cb_config.state_dir,
+            storage_strategy_factory=create_storage_strategy,
+        )
+
+    container.register_singleton(CircuitStateStore, create_state_store)
+
+
 def _register_provisioning_orchestration_service(container: DIContainer) -> None:
     """Register ProvisioningOrchestrationService with CircuitBreakerStrategy wired in."""
     from orb.application.services.provisioning_orchestration_service import (
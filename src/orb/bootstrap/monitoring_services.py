@@ -14,11 +14,15 @@ def register_monitoring_services(container) -> None:
     """
 
     def _create_health_check(c) -> HealthCheck:
+        from orb.infrastructure.storage.sql.health import register_sql_storage_health_checks
+
         config = HealthCheckConfig(health_dir=get_health_location())
-        return HealthCheck(
+        health_check = HealthCheck(
             config=config,
             logger=c.get(LoggingPort),
         )
+        register_sql_storage_health_checks(health_check)
+        return health_check
 
     container.register_singleton(HealthCheckPort, _create_health_check)
     # Also register the concrete class so existing callers using HealthCheck directly still work
@@ -77,10 +77,16 @@ def register_port_adapters(container):
 
     # Register spec rendering port
     def create_spec_renderer(c):
-        """Create Jinja spec renderer."""
+        """Create Jinja spec renderer with on-disk bytecode cache."""
+        import os
+
         from orb.infrastructure.template.jinja_spec_renderer import JinjaSpecRenderer
 
-        return JinjaSpecRenderer(logger=c.get(LoggingPort))
+        try:
+            bytecode_cache_dir = os.path.join(c.get(ConfigurationPort).get_cache_dir(), "jinja")
+        except Exception:
+            bytecode_cache_dir = None
+        return JinjaSpecRenderer(logger=c.get(LoggingPort), bytecode_cache_dir=bytecode_cache_dir)
 
     container.register_singleton(SpecRenderingPort, create_spec_renderer)
 
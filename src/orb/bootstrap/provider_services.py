@@ -18,6 +18,8 @@ def _register_application_services(container: DIContainer) -> None:
     """Register enhanced application services with proper dependencies."""
     from orb.application.services.machine_sync_service import MachineSyncService
     from orb.application.services.provider_registry_service import ProviderRegistryService
+    from orb.application.services.request_status_hub import RequestStatusHub
+    from orb.application.services.request_sync_engine import RequestSyncEngine
     from orb.domain.base.ports.logging_port import LoggingPort
     from orb.domain.base.ports.provider_registry_port import ProviderRegistryPort
     from orb.domain.services.template_validation_domain_service import (
@@ -60,6 +62,59 @@ def _register_application_services(container: DIContainer) -> None:
 
     container.register_singleton(MachineSyncService, create_machine_sync_service)
 
+    # Background request sync engine - started by long-running servers only
+    def create_request_sync_engine(c):
+        from orb.config.managers.configuration_manager import ConfigurationManager
+        from orb.config.schemas.performance_schema import PerformanceConfig
+        from orb.domain.base import UnitOfWorkFactory
+
+        config_manager = c.get(ConfigurationManager)
+        sync_config = config_manager.get_typed_with_defaults(PerformanceConfig).request_sync
+        return RequestSyncEngine(
+            c.get(UnitOfWorkFactory),
+            c.get(LoggingPort),
+            c.get(MachineSyncService),
+            enabled=sync_config.enabled,
+            tick_seconds=sync_config.tick_seconds,
+            min_interval_seconds=sync_config.min_interval_seconds,
+            max_interval_seconds=sync_config.max_interval_seconds,
+            max_staleness_seconds=sync_config.max_staleness_seconds,
+            max_concurrency=sync_config.max_concurrency,
+        )
+
+    container.register_singleton(RequestSyncEngine, create_request_sync_engine)
+
+    # Shared request status watchers behind status streams and subscriptions
+    def create_request_status_hub(c):
+        from orb.application.events.bus.event_bus import EventBus
+        from orb.application.events.handlers.request_status_hub_event_handler import (
+            RequestStatusHubEventHandler,
+        )
+        from orb.application.ports.scheduler_port import SchedulerPort
+        from orb.application.services.orchestration.get_request_status import (
+            GetRequestStatusOrchestrator,
+        )
+        from orb.config.managers.configuration_manager import ConfigurationManager
+        from orb.config.schemas.performance_schema import PerformanceConfig
+
+        config_manager = c.get(ConfigurationManager)
+        hub_config = config_manager.get_typed_with_defaults(PerformanceConfig).request_status_hub
+        hub = RequestStatusHub(
+            c.get(GetRequestStatusOrchestrator),
+            c.get(SchedulerPort),
+            c.get(LoggingPort),
+            poll_interval_seconds=hub_config.poll_interval_seconds,
+            coalesce_seconds=hub_config.coalesce_seconds,
+        )
+        event_bus = c.get_optional(EventBus)
+        if event_bus is not None:
+            handler = RequestStatusHubEventHandler(hub, c.get(LoggingPort))
+            for event_type in RequestStatusHubEventHandler.EVENT_TYPES:
+                event_bus.register_handler(event_type, handler)
+        return hub
+
+    container.register_singleton(RequestStatusHub, create_request_status_hub)
+
 
 def _register_provider_utility_services(container: DIContainer) -> None:
     """Register provider-specific utility services only (not provider instances)."""
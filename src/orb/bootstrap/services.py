@@ -99,6 +99,7 @@ def _ensure_infrastructure_services(container: "DIContainer") -> None:
 
 def _register_services_lazy(container: "DIContainer") -> "DIContainer":
     """Register services using lazy loading approach."""
+    from orb.infrastructure.di.startup_profile import startup_phase
     from orb.infrastructure.logging.logger import get_logger
 
     logger = get_logger(__name__)
@@ -109,9 +110,12 @@ def _register_services_lazy(container: "DIContainer") -> "DIContainer":
     from orb.infrastructure.storage.registration import register_all_storage_types
     from orb.providers.registration import register_all_provider_types
 
-    register_all_scheduler_types()
-    register_all_storage_types()
-    register_all_provider_types()
+    with startup_phase("register scheduler types"):
+        register_all_scheduler_types()
+    with startup_phase("register storage types"):
+        register_all_storage_types()
+    with startup_phase("register provider types"):
+        register_all_provider_types()
 
     # 1. Register ConfigurationManager FIRST (port adapters depend on it)
     from orb.config.managers.configuration_manager import ConfigurationManager
@@ -121,38 +125,48 @@ def _register_services_lazy(container: "DIContainer") -> "DIContainer":
     # 2. Register port adapters (now ConfigurationManager is available)
     from orb.bootstrap.port_registrations import register_port_adapters
 
-    register_port_adapters(container)
+    with startup_phase("register port adapters"):
+        register_port_adapters(container)
 
     # 3. Register remaining core services
-    register_core_services(container)
+    with startup_phase("register core services"):
+        register_core_services(container)
 
     # 4. Register domain services
-    register_domain_services(container)
+    with startup_phase("register domain services"):
+        register_domain_services(container)
 
     # 5. Register configured storage strategy only
-    register_storage_services(container)
+    with startup_phase("register storage services"):
+        register_storage_services(container)
 
     # 6. Register registry services
     from orb.bootstrap.registry_services import register_registry_services
 
-    register_registry_services(container)
+    with startup_phase("register registry services"):
+        register_registry_services(container)
 
     # 8. Register provider services immediately (fix for provider context errors)
-    register_provider_services(container)
+    with startup_phase("register provider services"):
+        register_provider_services(container)
 
     # 9. Register infrastructure services immediately (needed for template system)
-    register_infrastructure_services(container)
+    with startup_phase("register infrastructure services"):
+        register_infrastructure_services(container)
 
     # 9b. Register orchestrators
     from orb.bootstrap.orchestrator_registry import register_orchestrators
 
-    register_orchestrators(container)
+    with startup_phase("register orchestrators"):
+        register_orchestrators(container)
 
     # 9a. Register monitoring services (cross-cutting concern, not provider-specific)
-    register_monitoring_services(container)
+    with startup_phase("register monitoring services"):
+        register_monitoring_services(container)
 
     # 10. Setup CQRS infrastructure (handlers must be registered before buses are used)
-    setup_cqrs_infrastructure(container)
+    with startup_phase("setup CQRS infrastructure"):
+        setup_cqrs_infrastructure(container)
 
     # 11. Register lazy factories for non-essential services
     _register_lazy_service_factories(container)
@@ -281,6 +281,17 @@ def add_infrastructure_actions(subparsers):
     )
     add_global_arguments(infra_validate)
 
+    infra_warm_cache = subparsers.add_parser(
+        "warm-cache",
+        help="Pre-load provider data cached on disk (EC2 instance type specs)",
+        description="Fetch provider data once and store it on disk so that every ORB process reads it instead of calling the provider API.",
+    )
+    add_global_arguments(infra_warm_cache)
+    add_multi_provider_arguments(infra_warm_cache)
+    infra_warm_cache.add_argument(
+        "--force", action="store_true", help="Refresh caches that are still fresh"
+    )
+
 
 def add_provider_actions(subparsers):
     """Add provider actions to a subparser."""
@@ -540,6 +551,38 @@ For more information, visit: {DOCS_URL}
         help="Unix domain socket path for IPC (alternative to --host/--port, used by programmatic callers like orb-go)",
     )
 
+    system_daemon = system_subparsers.add_parser(
+        "daemon", help="Serve CLI commands from a resident process over a Unix socket"
+    )
+    add_global_arguments(system_daemon)
+    system_daemon.add_argument(
+        "--socket-path",
+        dest="socket_path",
+        default=None,
+        help="Unix domain socket path (default: $ORB_DAEMON_SOCKET or orb-daemon.sock in the work directory)",
+    )
+
+    # Debug
+    debug_parser = subparsers.add_parser("debug", help="Diagnostics")
+    resource_parsers["debug"] = debug_parser
+    debug_subparsers = debug_parser.add_subparsers(
+        dest="action", help="Debug actions", required=True
+    )
+
+    debug_startup_profile = debug_subparsers.add_parser(
+        "startup-profile", help="Report per-phase import and init times of a cold start"
+    )
+    add_global_arguments(debug_startup_profile)
+    debug_startup_profile.add_argument(
+        "--runs",
+        type=int,
+        default=2,
+        help="Fresh processes to profile; the first may rebuild the startup snapshot (default: 2)",
+    )
+    debug_startup_profile.add_argument(
+        "--top", type=int, default=15, help="Slowest imports to list per run (default: 15)"
+    )
+
     # Infrastructure
     infrastructure_parser = subparsers.add_parser("infrastructure", help="Infrastructure discovery")
     resource_parsers["infrastructure"] = infrastructure_parser
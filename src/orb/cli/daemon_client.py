@@ -0,0 +1,138 @@
+"""
+Thin client for the resident ORB daemon.
+
+Forwards argv, stdin and the working directory to ``orb system daemon``
+over its Unix socket and reproduces the command's stdout, stderr and exit
+code. Exits with ``FALLBACK_EXIT_CODE`` without printing anything when no
+daemon is reachable or the daemon declines the command, so the calling
+script can run the command in a fresh process instead.
+
+Stdin is only read once the daemon has accepted the command. When the
+client falls back, stdin is left untouched for the fresh process.
+
+This module only uses the standard library and is executed by file path
+from the HostFactory scripts, so it must not import anything from ``orb``.
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import Callable, Optional
+
+# Exit code telling the caller to run the command itself (EX_TEMPFAIL)
+FALLBACK_EXIT_CODE = 75
+
+# Environment variable naming the daemon socket
+DAEMON_SOCKET_ENV = "ORB_DAEMON_SOCKET"
+
+# Commands may call the provider; only the connection itself is kept short
+_CONNECT_TIMEOUT_SECONDS = 2.0
+_RESPONSE_TIMEOUT_SECONDS = 900.0
+
+
+def _read_stdin() -> str:
+    """Read piped or redirected stdin to the end; a terminal is not read."""
+    stream = sys.stdin
+    if stream is None or stream.isatty():
+        return ""
+    try:
+        return stream.read()
+    except (OSError, ValueError):
+        return ""
+
+
+def _no_stdin() -> str:
+    return ""
+
+
+def send(
+    socket_path: str,
+    argv: list[str],
+    cwd: str,
+    read_stdin: Callable[[], str] = _no_stdin,
+) -> Optional[dict]:
+    """
+    Send one invocation to the daemon.
+
+    The daemon first answers whether it serves the command; ``read_stdin``
+    is only called after it has accepted.
+
+    Args:
+        socket_path: Daemon socket
+        argv: Command-line arguments without the program name
+        cwd: Working directory to resolve relative paths against
+        read_stdin: Returns the standard input to forward
+
+    Returns:
+        Daemon response, None if the daemon is not reachable
+
+    Raises:
+        OSError: If the daemon accepted the command but no complete response arrived
+    """
+    try:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except (AttributeError, OSError):
+        return None
+    stream = conn.makefile("rwb")
+    try:
+        conn.settimeout(_CONNECT_TIMEOUT_SECONDS)
+        try:
+            conn.connect(socket_path)
+            conn.settimeout(_RESPONSE_TIMEOUT_SECONDS)
+            _write_line(stream, {"argv": argv, "cwd": cwd})
+            answer = json.loads(stream.readline())
+        except (OSError, ValueError):
+            # Nothing has run yet, so the command can safely run elsewhere
+            return None
+        if not answer.get("ready"):
+            return answer
+
+        _write_line(stream, {"stdin": read_stdin()})
+        try:
+            return json.loads(stream.readline())
+        except ValueError as e:
+            raise OSError(f"Incomplete response from ORB daemon: {e}") from e
+    finally:
+        stream.close()
+        conn.close()
+
+
+def _write_line(stream, message: dict) -> None:
+    stream.write(json.dumps(message).encode() + b"\n")
+    stream.flush()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Run a command through the daemon.
+
+    Args:
+        argv: Command-line arguments, defaults to ``sys.argv[1:]``
+
+    Returns:
+        Exit code of the command, ``FALLBACK_EXIT_CODE`` if it was not run
+    """
+    socket_path = os.environ.get(DAEMON_SOCKET_ENV)
+    if not socket_path or not os.path.exists(socket_path):
+        return FALLBACK_EXIT_CODE
+
+    args = sys.argv[1:] if argv is None else argv
+    try:
+        response = send(socket_path, args, os.getcwd(), _read_stdin)
+    except OSError as e:
+        # The command may already have run, so it must not be repeated locally
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    if response is None or response.get("fallback"):
+        return FALLBACK_EXIT_CODE
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stderr.flush()
+    return int(response.get("exit_code", 1))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
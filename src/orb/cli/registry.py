@@ -121,11 +121,13 @@ def build_registry() -> None:
         handle_infrastructure_discover,
         handle_infrastructure_show,
         handle_infrastructure_validate,
+        handle_infrastructure_warm_cache,
     )
 
     register("infrastructure", "discover", handle_infrastructure_discover)
     register("infrastructure", "show", handle_infrastructure_show)
     register("infrastructure", "validate", handle_infrastructure_validate)
+    register("infrastructure", "warm-cache", handle_infrastructure_warm_cache)
 
     # --- providers ---
     from orb.interface.provider_config_handler import (
@@ -159,7 +161,13 @@ def build_registry() -> None:
     register("providers", "exec", handle_execute_provider_operation)
     register("providers", "select", handle_select_provider_strategy)
 
+    # --- debug ---
+    from orb.interface.debug_command_handlers import handle_startup_profile
+
+    register("debug", "startup-profile", handle_startup_profile)
+
     # --- system ---
+    from orb.interface.daemon_command_handler import handle_daemon
     from orb.interface.serve_command_handler import handle_serve_api
     from orb.interface.system_command_handlers import (
         handle_reload_provider_config,
@@ -169,6 +177,7 @@ def build_registry() -> None:
     )
 
     register("system", "serve", handle_serve_api)
+    register("system", "daemon", handle_daemon)
     register("system", "status", handle_system_status)
     register("system", "health", handle_system_health)
     register("system", "metrics", handle_system_metrics)
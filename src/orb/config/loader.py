@@ -192,11 +192,12 @@ class ConfigurationLoader:
     def _load_strategy_defaults(cls, config_manager=None) -> dict[str, Any]:
         merged: dict[str, Any] = {}
         try:
+            from orb.infrastructure.di.startup_snapshot import get_provider_snapshot
             from orb.providers.registry import get_provider_registry
 
             registry = get_provider_registry()
             registry.ensure_provider_type_registered("aws")
-            cls._merge_config(merged, registry.collect_defaults())
+            cls._merge_config(merged, registry.collect_defaults(get_provider_snapshot()))
         except Exception as e:
             get_config_logger().warning("Failed to load provider defaults: %s", e)
         try:
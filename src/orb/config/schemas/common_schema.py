@@ -158,6 +158,9 @@ class RequestConfig(BaseModel):
     fulfillment_batch_size: int = Field(
         1000, description="Maximum instances per provisioning attempt"
     )
+    fulfillment_max_parallel_batches: int = Field(
+        4, ge=1, description="Maximum provisioning batches dispatched concurrently"
+    )
     fulfillment_fallback_template_id: Optional[str] = Field(
         None, description="Fallback template ID for provisioning"
     )
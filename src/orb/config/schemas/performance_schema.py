@@ -1,5 +1,7 @@
 """Performance configuration schemas."""
 
+from typing import Optional
+
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from .base_config import BaseCircuitBreakerConfig
@@ -83,10 +85,10 @@ class AMIResolutionCacheConfig(BaseModel):
 
 
 class HandlerDiscoveryCacheConfig(BaseModel):
-    """Handler discovery caching configuration."""
+    """Startup snapshot (handler discovery cache) configuration."""
 
-    enabled: bool = Field(True, description="Enable handler discovery caching")
-    file: str = Field("handler_discovery.json", description="Handler discovery cache filename")
+    enabled: bool = Field(True, description="Enable the persistent startup snapshot")
+    file: str = Field("startup_snapshot.json", description="Startup snapshot filename")
 
 
 class RequestStatusCacheConfig(BaseModel):
@@ -118,6 +120,45 @@ class CachingConfig(BaseModel):
     )
 
 
+class RequestSyncConfig(BaseModel):
+    """Background request sync configuration."""
+
+    enabled: bool = Field(
+        True, description="Refresh active requests from providers in long-running processes"
+    )
+    tick_seconds: float = Field(1.0, ge=0.1, description="How often due requests are checked")
+    min_interval_seconds: float = Field(
+        5.0, gt=0, description="Refresh interval for requests whose state is changing"
+    )
+    max_interval_seconds: float = Field(
+        60.0, gt=0, description="Upper bound the refresh interval backs off to when idle"
+    )
+    max_staleness_seconds: float = Field(
+        30.0,
+        ge=0,
+        description="Age up to which status queries answer from storage without a provider call",
+    )
+    max_concurrency: int = Field(8, ge=1, description="Maximum requests refreshed in parallel")
+
+    @model_validator(mode="after")
+    def validate_intervals(self) -> "RequestSyncConfig":
+        """Validate interval relationships."""
+        if self.min_interval_seconds > self.max_interval_seconds:
+            raise ValueError("Minimum sync interval cannot be greater than maximum sync interval")
+        return self
+
+
+class RequestStatusHubConfig(BaseModel):
+    """Shared request status watcher configuration."""
+
+    poll_interval_seconds: float = Field(
+        2.0, ge=0.1, description="Interval between status fetches of a watched request"
+    )
+    coalesce_seconds: float = Field(
+        0.25, ge=0, description="Delay after a status change event that absorbs further events"
+    )
+
+
 class LazyLoadingConfig(BaseModel):
     """Lazy loading configuration for the DI container."""
 
@@ -150,6 +191,12 @@ class PerformanceConfig(BaseModel):
         default_factory=lambda: AdaptiveBatchSizingConfig()  # type: ignore[call-arg]
     )
     caching: CachingConfig = Field(default_factory=lambda: CachingConfig())  # type: ignore[call-arg]
+    request_sync: RequestSyncConfig = Field(
+        default_factory=lambda: RequestSyncConfig()  # type: ignore[call-arg]
+    )
+    request_status_hub: RequestStatusHubConfig = Field(
+        default_factory=lambda: RequestStatusHubConfig()  # type: ignore[call-arg]
+    )
 
     @field_validator("max_workers")
     @classmethod
@@ -162,3 +209,18 @@ class PerformanceConfig(BaseModel):
 
 class CircuitBreakerConfig(BaseCircuitBreakerConfig):
     """Performance-focused circuit breaker configuration."""
+
+    state_backend: str = Field(
+        "file", description="Where circuit state is shared: file, storage or memory"
+    )
+    state_dir: Optional[str] = Field(
+        None, description="Directory of the file backend (default: ORB cache directory)"
+    )
+
+    @field_validator("state_backend")
+    @classmethod
+    def validate_state_backend(cls, v: str) -> str:
+        """Validate state backend."""
+        if v not in ("file", "storage", "memory"):
+            raise ValueError("State backend must be one of: file, storage, memory")
+        return v
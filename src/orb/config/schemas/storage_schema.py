@@ -26,6 +26,13 @@ class JsonStrategyConfig(BaseModel):
     backup_enabled: bool = Field(True, description="Enable automatic backups")
     backup_count: int = Field(5, description="Number of backup files to keep")
     pretty_print: bool = Field(True, description="Pretty print JSON files")
+    write_mode: str = Field(
+        "snapshot",
+        description="Write mode (snapshot rewrites the file per change, journal appends change records)",
+    )
+    journal_compact_threshold: int = Field(
+        1000, description="Journal records accumulated before compaction into the snapshot"
+    )
 
     @field_validator("storage_type")
     @classmethod
@@ -36,6 +43,23 @@ class JsonStrategyConfig(BaseModel):
             raise ValueError(f"Storage type must be one of {valid_types}")
         return v
 
+    @field_validator("write_mode")
+    @classmethod
+    def validate_write_mode(cls, v: str) -> str:
+        """Validate write mode."""
+        valid_modes = ["snapshot", "journal"]
+        if v not in valid_modes:
+            raise ValueError(f"Write mode must be one of {valid_modes}")
+        return v
+
+    @field_validator("journal_compact_threshold")
+    @classmethod
+    def validate_journal_compact_threshold(cls, v: int) -> int:
+        """Validate journal compaction threshold."""
+        if v < 1:
+            raise ValueError("Journal compaction threshold must be at least 1")
+        return v
+
 
 class SqlStrategyConfig(BaseModel):
     """Generic SQL storage strategy configuration (sqlite, postgresql, mysql)."""
@@ -45,3 +45,15 @@ class ProviderDiscoveryPort(ABC):
         Returns:
             Dictionary containing validation results
         """
+
+    @abstractmethod
+    def warm_caches(self, provider_config: dict[str, Any], force: bool = False) -> dict[str, Any]:
+        """Populate provider data cached on disk and shared between processes.
+
+        Args:
+            provider_config: Provider configuration
+            force: Refresh caches that are still fresh
+
+        Returns:
+            Dictionary describing the warmed caches
+        """
@@ -10,3 +10,11 @@ class SpecRenderingPort(ABC):
     @abstractmethod
     def render_spec(self, spec: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
         """Render spec with template variables."""
+
+    def precompile_spec(self, spec: Any) -> int:
+        """Prepare the templates in a spec ahead of rendering.
+
+        Returns:
+            Number of templates prepared (0 when the renderer has no cache)
+        """
+        return 0
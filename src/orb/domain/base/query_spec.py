@@ -0,0 +1,72 @@
+"""Storage-level query specification shared by repositories."""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Generic, Optional, TypeVar
+
+from orb.domain.services.generic_filter_service import GenericFilter
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """
+    Predicates, ordering and page of a repository query.
+
+    ``criteria`` uses the storage criteria format (equality, ``$in`` and
+    range operators) and ``filters`` are generic filters ANDed with it, both
+    evaluated against stored fields. Results are ordered by ``sort_by`` with
+    the entity ID as tie-breaker. A page starts ``offset`` entries after the
+    ``after`` cursor returned with the previous page, or after the first
+    entry when no cursor is given.
+    """
+
+    criteria: dict[str, Any] = field(default_factory=dict)
+    filters: tuple[GenericFilter, ...] = ()
+    sort_by: Optional[str] = None
+    descending: bool = False
+    limit: Optional[int] = None
+    offset: int = 0
+    after: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class QueryResult(Generic[T]):
+    """One page of query results."""
+
+    items: list[T]
+    total_count: int
+    next_cursor: Optional[str] = None
+
+    def map(self, convert: Callable[[T], U]) -> "QueryResult[U]":
+        """Return the same page with every item converted."""
+        return QueryResult(
+            items=[convert(item) for item in self.items],
+            total_count=self.total_count,
+            next_cursor=self.next_cursor,
+        )
+
+
+def encode_cursor(sort_value: Any, entity_id: str) -> str:
+    """Encode the position of an entry as an opaque keyset cursor."""
+    payload = json.dumps([sort_value, entity_id], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        sort_value, entity_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid query cursor: {cursor!r}") from e
+    return sort_value, str(entity_id)
@@ -4,6 +4,7 @@ from abc import abstractmethod
 from typing import Any, Optional
 
 from orb.domain.base.domain_interfaces import AggregateRepository
+from orb.domain.base.query_spec import QueryResult, QuerySpec
 from orb.domain.machine.machine_identifiers import MachineId
 
 from .aggregate import Machine
@@ -49,6 +50,10 @@ class MachineRepository(AggregateRepository[Machine]):
     def find_by_ids(self, machine_ids: list[str]) -> list[Machine]:
         """Find machines by list of machine IDs."""
 
+    @abstractmethod
+    def query(self, spec: QuerySpec) -> QueryResult[Machine]:
+        """Find one page of machines matching a query spec."""
+
     @abstractmethod
     def find_by_return_request_id(self, return_request_id: str) -> list[Machine]:
         """Find machines by return request ID."""
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 from orb.domain.base.domain_interfaces import AggregateRepository
+from orb.domain.base.query_spec import QueryResult, QuerySpec
 
 from .aggregate import Request, RequestStatus, RequestType
 
@@ -32,6 +33,10 @@ class RequestRepository(AggregateRepository[Request]):
     def find_by_ids(self, request_ids: list[str]) -> list[Request]:
         """Find requests by multiple request IDs."""
 
+    @abstractmethod
+    def query(self, spec: QuerySpec) -> QueryResult[Request]:
+        """Find one page of requests matching a query spec."""
+
     @abstractmethod
     def find_active_requests(self) -> list[Request]:
         """Find all active (non-completed/failed) requests."""
@@ -1,6 +1,7 @@
 """Generic filter service for any object type using internal snake_case fields."""
 
 import re
+from collections.abc import Collection
 from dataclasses import dataclass
 from typing import Any, Tuple
 
@@ -56,6 +57,17 @@ class GenericFilterService:
         filters = self.parse_filters(filter_expressions)
         return [obj for obj in objects if self._matches_all_filters(obj, filters)]
 
+    def partition_by_fields(
+        self, filters: list[GenericFilter], fields: Collection[str]
+    ) -> tuple[list[GenericFilter], list[GenericFilter]]:
+        """Split filters into those on ``fields`` (or nested under them) and the rest."""
+        selected: list[GenericFilter] = []
+        remaining: list[GenericFilter] = []
+        for filter_obj in filters:
+            root = filter_obj.field.split(".", 1)[0]
+            (selected if root in fields else remaining).append(filter_obj)
+        return selected, remaining
+
     def _matches_all_filters(self, obj: dict, filters: list[GenericFilter]) -> bool:
         """Check if object matches all filters (AND logic)."""
         return all(filter_obj.matches(obj) for filter_obj in filters)
@@ -1,6 +1,7 @@
 """Provider-agnostic image resolution cache interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Optional
 
 
@@ -17,6 +18,11 @@ class ImageCache(ABC):
         """Cache resolved image ID."""
         pass
 
+    def set_many(self, image_ids: Mapping[str, str]) -> None:
+        """Cache several resolved image IDs."""
+        for image_specification, image_id in image_ids.items():
+            self.set(image_specification, image_id)
+
     @abstractmethod
     def clear_expired(self) -> None:
         """Remove expired cache entries."""
@@ -29,6 +29,24 @@ class ImageResolutionService(ABC):
         """
         pass
 
+    def resolve_image_ids(self, image_specifications: list[str]) -> dict[str, str]:
+        """
+        Resolve several image specifications.
+
+        Providers whose APIs accept several lookups per call override this to
+        batch them; the default resolves each specification in turn.
+
+        Args:
+            image_specifications: Image specifications to resolve
+
+        Returns:
+            Resolved image ID of each specification
+
+        Raises:
+            ImageResolutionError: If any image cannot be resolved
+        """
+        return {spec: self.resolve_image_id(spec) for spec in dict.fromkeys(image_specifications)}
+
     @abstractmethod
     def is_resolution_needed(self, image_specification: str) -> bool:
         """
@@ -98,6 +98,7 @@ class ConfigurationAdapter(ConfigurationPort):
                 "fulfillment_max_retries": request_config.fulfillment_max_retries,
                 "fulfillment_timeout_seconds": request_config.fulfillment_timeout_seconds,
                 "fulfillment_batch_size": request_config.fulfillment_batch_size,
+                "fulfillment_max_parallel_batches": request_config.fulfillment_max_parallel_batches,
                 "fulfillment_fallback_template_id": request_config.fulfillment_fallback_template_id,
             }
         except Exception as e:
@@ -111,6 +112,7 @@ class ConfigurationAdapter(ConfigurationPort):
                 "fulfillment_max_retries": 3,
                 "fulfillment_timeout_seconds": 300,
                 "fulfillment_batch_size": 1000,
+                "fulfillment_max_parallel_batches": 4,
                 "fulfillment_fallback_template_id": None,
             }
 
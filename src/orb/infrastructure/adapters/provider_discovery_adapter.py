@@ -79,3 +79,15 @@ class ProviderDiscoveryAdapter(ProviderDiscoveryPort):
         if strategy is None or not hasattr(strategy, "validate_infrastructure"):
             return {}
         return strategy.validate_infrastructure(provider_config)
+
+    def warm_caches(self, provider_config: dict[str, Any], force: bool = False) -> dict[str, Any]:
+        """Warm provider caches by delegating to the provider strategy."""
+        provider_type = provider_config.get("type", "")
+        if not provider_type:
+            return {}
+        if not self.registry.ensure_provider_type_registered(provider_type):
+            return {}
+        strategy = self.registry.get_or_create_strategy(provider_type, {})
+        if strategy is None or not hasattr(strategy, "warm_caches"):
+            return {}
+        return strategy.warm_caches(provider_config, force=force)
@@ -0,0 +1,124 @@
+"""Cached JSON Web Key Set with key rotation support."""
+
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+import jwt
+
+from orb.infrastructure.logging.logger import get_logger
+
+_DEFAULT_TTL_SECONDS = 3600.0
+_DEFAULT_MIN_REFRESH_INTERVAL = 30.0
+_DEFAULT_FETCH_TIMEOUT = 10.0
+
+
+class JWKSKeyCache:
+    """
+    Signing keys of a JWKS endpoint, fetched off the event loop and cached.
+
+    Keys are reused for ``ttl_seconds``; after that the cached keys keep
+    serving while a background task refreshes them. A token signed with an
+    unknown ``kid`` triggers an immediate refresh so rotated keys are picked
+    up, at most once per ``min_refresh_interval`` so that tokens with bogus
+    key IDs cannot hammer the endpoint. Concurrent refreshes share one
+    fetch, and a failed fetch keeps the previous keys.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        *,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        min_refresh_interval: float = _DEFAULT_MIN_REFRESH_INTERVAL,
+        timeout: float = _DEFAULT_FETCH_TIMEOUT,
+        fetcher: Optional[Callable[[str, float], dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Initialize the key cache.
+
+        Args:
+            jwks_url: URL of the JWKS document
+            ttl_seconds: Seconds fetched keys are used before a background refresh
+            min_refresh_interval: Minimum seconds between refreshes for unknown key IDs
+            timeout: HTTP timeout of a fetch in seconds
+            fetcher: Blocking ``(url, timeout) -> JWKS dict`` function (default: requests)
+        """
+        self.jwks_url = jwks_url
+        self.ttl_seconds = ttl_seconds
+        self.min_refresh_interval = min_refresh_interval
+        self._timeout = timeout
+        self._fetcher = fetcher or _fetch_jwks
+        self._keys: dict[str, Any] = {}
+        self._fetched_at: Optional[float] = None
+        self._attempted_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._logger = get_logger(__name__)
+
+    async def get_key(self, kid: str) -> Optional[Any]:
+        """
+        Return the verification key for a key ID.
+
+        Args:
+            kid: Key ID from the token header
+
+        Returns:
+            Public key usable with ``jwt.decode``, or None if the JWKS has no such key
+        """
+        now = time.monotonic()
+        if self._fetched_at is None:
+            if self._may_refresh(now):
+                await self.refresh()
+        elif now - self._fetched_at >= self.ttl_seconds:
+            self._start_refresh()
+
+        key = self._keys.get(kid)
+        if key is None and self._fetched_at is not None and self._may_refresh(now):
+            self._logger.info("Unknown JWKS key ID %s, refreshing keys", kid)
+            await self.refresh()
+            key = self._keys.get(kid)
+        return key
+
+    async def refresh(self) -> None:
+        """Fetch the keys now, joining a refresh that is already running."""
+        await asyncio.shield(self._start_refresh())
+
+    def _may_refresh(self, now: float) -> bool:
+        return self._attempted_at is None or now - self._attempted_at >= self.min_refresh_interval
+
+    def _start_refresh(self) -> asyncio.Task:
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._refresh())
+            self._refresh_task = task
+        return task
+
+    async def _refresh(self) -> None:
+        self._attempted_at = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            jwks = await loop.run_in_executor(None, self._fetcher, self.jwks_url, self._timeout)
+        except Exception as e:
+            self._logger.error("Failed to fetch JWKS from %s: %s", self.jwks_url, e)
+            return
+
+        keys: dict[str, Any] = {}
+        for jwk in jwks.get("keys", []):
+            kid = jwk.get("kid")
+            if not kid:
+                continue
+            try:
+                keys[kid] = jwt.PyJWK(jwk).key
+            except jwt.PyJWKError as e:
+                self._logger.warning("Ignoring unusable JWKS key %s: %s", kid, e)
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        self._logger.debug("Loaded %d JWKS keys from %s", len(keys), self.jwks_url)
+
+
+def _fetch_jwks(url: str, timeout: float) -> dict[str, Any]:
+    import requests
+
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
@@ -10,6 +10,7 @@ from orb.infrastructure.adapters.ports.auth import (
     AuthResult,
     AuthStatus,
 )
+from orb.infrastructure.auth.token_cache import ValidatedTokenCache
 from orb.infrastructure.logging.logger import get_logger
 
 
@@ -22,6 +23,7 @@ class BearerTokenStrategy(AuthPort):
         algorithm: str = "HS256",
         token_expiry: int = 3600,  # 1 hour
         enabled: bool = True,
+        token_cache_size: int = 10000,
     ) -> None:
         """
         Initialize bearer token strategy.
@@ -31,6 +33,7 @@ class BearerTokenStrategy(AuthPort):
             algorithm: JWT algorithm to use
             token_expiry: Token expiry time in seconds
             enabled: Whether this strategy is enabled
+            token_cache_size: Validated tokens kept in memory (0 disables the cache)
         """
         if len(secret_key.encode()) < 32:
             raise ValueError("Bearer token secret_key must be at least 32 bytes for security.")
@@ -38,6 +41,7 @@ class BearerTokenStrategy(AuthPort):
         self.algorithm = algorithm
         self.token_expiry = token_expiry
         self.enabled = enabled
+        self.token_cache = ValidatedTokenCache(token_cache_size)
         self.logger = get_logger(__name__)
 
     async def authenticate(self, context: AuthContext) -> AuthResult:
@@ -88,6 +92,10 @@ class BearerTokenStrategy(AuthPort):
         Returns:
             Authentication result with user information
         """
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            return cached
+
         try:
             # Decode and verify JWT token
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
@@ -107,7 +115,7 @@ class BearerTokenStrategy(AuthPort):
 
             self.logger.debug("Auth validated for user: %s", user_id)
 
-            return AuthResult(
+            result = AuthResult(
                 status=AuthStatus.SUCCESS,
                 user_id=user_id,
                 user_roles=user_roles,
@@ -121,6 +129,8 @@ class BearerTokenStrategy(AuthPort):
                     "issuer": payload.get("iss"),
                 },
             )
+            self.token_cache.put(token, result)
+            return result
 
         except jwt.ExpiredSignatureError:
             return AuthResult(status=AuthStatus.EXPIRED, error_message="Token has expired")
@@ -4,6 +4,7 @@ import base64
 import json
 import time
 from collections import defaultdict
+from typing import Optional
 
 import jwt
 
@@ -14,6 +15,7 @@ from orb.infrastructure.adapters.ports.auth import (
     AuthStatus,
 )
 from orb.infrastructure.auth.token_blacklist import TokenBlacklistPort
+from orb.infrastructure.auth.token_cache import ValidatedTokenCache
 from orb.infrastructure.logging.logger import get_logger
 
 
@@ -80,6 +82,8 @@ class EnhancedBearerTokenStrategy(AuthPort):
         rate_limit_enabled: bool = True,
         max_attempts: int = 10,
         rate_window: int = 60,
+        token_cache_size: int = 10000,
+        token_cache_max_age: Optional[float] = 30,
     ) -> None:
         """
         Initialize enhanced bearer token strategy.
@@ -93,6 +97,9 @@ class EnhancedBearerTokenStrategy(AuthPort):
             rate_limit_enabled: Whether rate limiting is enabled
             max_attempts: Maximum validation attempts per window
             rate_window: Rate limit window in seconds
+            token_cache_size: Validated tokens kept in memory (0 disables the cache)
+            token_cache_max_age: Seconds a cached signature verification is reused
+                before the token is decoded and verified again
         """
         self.secret_key = secret_key
         self.blacklist = blacklist
@@ -101,6 +108,7 @@ class EnhancedBearerTokenStrategy(AuthPort):
         self.enabled = enabled
         self.rate_limit_enabled = rate_limit_enabled
         self.rate_limiter = RateLimiter(max_attempts, rate_window)
+        self.token_cache = ValidatedTokenCache(token_cache_size, token_cache_max_age)
         self.logger = get_logger(__name__)
 
         # Validate secret key strength (minimum 256 bits = 32 bytes)
@@ -159,6 +167,10 @@ class EnhancedBearerTokenStrategy(AuthPort):
         """
         Validate JWT token with blacklist check.
 
+        The blacklist is consulted on every call, so a token revoked by any
+        path or worker is rejected at once; only the signature verification
+        of recently validated tokens is served from the token cache.
+
         Args:
             token: JWT token to validate
 
@@ -168,12 +180,17 @@ class EnhancedBearerTokenStrategy(AuthPort):
         try:
             # Check blacklist first (fail fast)
             if await self.blacklist.is_blacklisted(token):
+                self.token_cache.invalidate(token)
                 self.logger.warning("Attempted use of revoked JWT")
                 return AuthResult(
                     status=AuthStatus.INVALID,
                     error_message="Token has been revoked",
                 )
 
+            cached = self.token_cache.get(token)
+            if cached is not None:
+                return cached
+
             # Decode and verify JWT token
             payload = jwt.decode(
                 token,
@@ -198,7 +215,7 @@ class EnhancedBearerTokenStrategy(AuthPort):
 
             self.logger.debug("Auth validated for user: %s", user_id)
 
-            return AuthResult(
+            result = AuthResult(
                 status=AuthStatus.SUCCESS,
                 user_id=user_id,
                 user_roles=user_roles,
@@ -212,6 +229,8 @@ class EnhancedBearerTokenStrategy(AuthPort):
                     "issuer": payload.get("iss"),
                 },
             )
+            self.token_cache.put(token, result)
+            return result
 
         except jwt.ExpiredSignatureError:
             return AuthResult(status=AuthStatus.EXPIRED, error_message="Token has expired")
@@ -289,6 +308,7 @@ class EnhancedBearerTokenStrategy(AuthPort):
         Returns:
             True if token was revoked
         """
+        self.token_cache.invalidate(token)
         try:
             # Extract expiration from JWT payload without verification
             # (token is being revoked, we only need exp for blacklist TTL)
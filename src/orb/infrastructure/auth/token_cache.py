@@ -0,0 +1,125 @@
+"""Bounded cache of already-validated authentication tokens."""
+
+import dataclasses
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from orb.infrastructure.adapters.ports.auth import AuthResult
+
+_DEFAULT_MAX_SIZE = 10000
+
+
+class ValidatedTokenCache:
+    """
+    LRU of tokens whose signature and claims were already verified.
+
+    Entries are keyed by the SHA-256 digest of the token and expire at the
+    token's ``exp`` claim, or after ``max_age_seconds`` when that comes
+    first. Only successful results are cached. Strategies invalidate an
+    entry when they revoke its token, and ``max_age_seconds`` bounds how
+    long a revocation made elsewhere (another worker sharing the
+    blacklist) can go unnoticed.
+    """
+
+    def __init__(
+        self,
+        max_size: int = _DEFAULT_MAX_SIZE,
+        max_age_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum cached tokens; 0 disables caching
+            max_age_seconds: Upper bound on how long a validation is reused
+            clock: Wall-clock source, comparable with the ``exp`` claim
+        """
+        self.max_size = max(0, max_size)
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, AuthResult]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, token: str) -> Optional[AuthResult]:
+        """
+        Return the cached validation of a token.
+
+        Args:
+            token: Raw token
+
+        Returns:
+            Copy of the cached successful result, or None if absent or expired
+        """
+        if not self.max_size:
+            return None
+        key = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            result = entry[1]
+        return dataclasses.replace(
+            result,
+            user_roles=list(result.user_roles),
+            permissions=list(result.permissions),
+            metadata=dict(result.metadata),
+        )
+
+    def put(self, token: str, result: AuthResult) -> None:
+        """
+        Cache a successful validation until the token expires.
+
+        Results that are not successful, or that would never expire, are ignored.
+
+        Args:
+            token: Raw token
+            result: Validation result of the token
+        """
+        if not self.max_size or not result.is_authenticated:
+            return
+        now = self._clock()
+        expiries = [float(result.expires_at)] if result.expires_at else []
+        if self.max_age_seconds is not None:
+            expiries.append(now + self.max_age_seconds)
+        if not expiries or min(expiries) <= now:
+            return
+
+        key = self._digest(token)
+        with self._lock:
+            self._entries[key] = (min(expiries), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        """Drop a token, e.g. after it was revoked."""
+        with self._lock:
+            self._entries.pop(self._digest(token), None)
+
+    def clear(self) -> None:
+        """Drop every cached token."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return size and hit counters."""
+        with self._lock:
+            return {"size": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
@@ -26,6 +26,13 @@ from orb.domain.base.ports.logging_port import LoggingPort
 from orb.infrastructure.di.container import DIContainer
 
 
+def _get_handler(container: DIContainer, handler_class: type) -> Any:
+    """Resolve a handler, registering it first if it was imported lazily on dispatch."""
+    if not container.is_registered(handler_class):
+        container.register_singleton(handler_class)
+    return container.get(handler_class)
+
+
 class QueryBus(QueryBusPort):
     """
     Pure CQRS Query Bus - Thin routing layer only.
@@ -64,7 +71,7 @@ class QueryBus(QueryBusPort):
         try:
             # Pure routing - get handler and delegate
             handler_class = get_query_handler_for_type(type(query))
-            handler = self.container.get(handler_class)
+            handler = _get_handler(self.container, handler_class)
             return await handler.handle(query)
 
         except KeyError:
@@ -79,7 +86,7 @@ class QueryBus(QueryBusPort):
                 # Try again after lazy setup
                 try:
                     handler_class = get_query_handler_for_type(type(query))
-                    handler = self.container.get(handler_class)
+                    handler = _get_handler(self.container, handler_class)
                     return await handler.handle(query)
                 except KeyError:
                     self.logger.error(
@@ -168,7 +175,7 @@ class CommandBus(CommandBusPort):
         try:
             # Pure routing - get handler and delegate
             handler_class = get_command_handler_for_type(type(command))
-            handler = self.container.get(handler_class)
+            handler = _get_handler(self.container, handler_class)
             return await handler.handle(command)
 
         except KeyError:
@@ -183,7 +190,7 @@ class CommandBus(CommandBusPort):
                 # Try again after lazy setup
                 try:
                     handler_class = get_command_handler_for_type(type(command))
-                    handler = self.container.get(handler_class)
+                    handler = _get_handler(self.container, handler_class)
                     return await handler.handle(command)
                 except KeyError:
                     self.logger.error(
@@ -2,8 +2,10 @@
 
 import inspect
 import threading
+import time
 import typing
 from contextlib import suppress
+from dataclasses import dataclass
 from typing import Any, Callable, Optional, TypeVar, get_type_hints
 
 from orb.domain.base.dependency_injection import get_injectable_metadata, is_injectable
@@ -22,6 +24,23 @@ T = TypeVar("T")
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class ParameterPlan:
+    """A constructor parameter the resolver injects."""
+
+    name: str
+    dependency_type: Any
+    required: bool
+
+
+@dataclass(frozen=True)
+class ConstructorPlan:
+    """Injectable constructor parameters of a class, compiled once per type."""
+
+    cls: type
+    parameters: tuple[ParameterPlan, ...]
+
+
 class DependencyResolver:
     """Handles dependency resolution and instance creation."""
 
@@ -31,7 +50,14 @@ class DependencyResolver:
         self._cqrs_registry = cqrs_registry
         self._container = container
         self._lock = threading.RLock()
-        self._resolution_cache: dict[type, Any] = {}
+        # Compiled constructor plans - signatures and type hints are inspected once per type
+        self._resolution_cache: dict[type, ConstructorPlan] = {}
+        self._resolution_counts: dict[str, int] = {}
+        self._singleton_hits = 0
+        self._instances_created = 0
+        self._plans_compiled = 0
+        self._resolution_time = 0.0
+        self._depth = 0
 
     def resolve(
         self,
@@ -66,21 +92,20 @@ class DependencyResolver:
 
         try:
             with self._lock:
-                # Check if it's a singleton and already cached
-                registration = self._service_registry.get_registration(cls)
-                if registration and registration.scope == DIScope.SINGLETON:
-                    cached_instance = self._service_registry.get_singleton_instance(cls)
-                    if cached_instance is not None:
-                        return cached_instance
-
-                # Create new instance
-                instance = self._create_instance(cls, new_chain)
-
-                # Cache singleton instances
-                if registration and registration.scope == DIScope.SINGLETON:
-                    self._service_registry.set_singleton_instance(cls, instance)
-
-                return instance
+                # Only the outermost resolution is counted and timed; nested ones
+                # (constructor parameters, factories calling the container) run
+                # on this thread while it holds the lock
+                outermost = self._depth == 0
+                self._depth += 1
+                start = time.perf_counter()
+                try:
+                    return self._resolve_locked(cls, new_chain)
+                finally:
+                    self._depth -= 1
+                    if outermost:
+                        name = getattr(cls, "__name__", str(cls))
+                        self._resolution_counts[name] = self._resolution_counts.get(name, 0) + 1
+                        self._resolution_time += time.perf_counter() - start
 
         except Exception as e:
             if isinstance(e, (DependencyResolutionError, CircularDependencyError)):
@@ -88,6 +113,26 @@ class DependencyResolver:
             else:
                 raise DependencyResolutionError(cls, f"Failed to resolve {cls.__name__}: {e!s}")
 
+    def _resolve_locked(self, cls: type[T], dependency_chain: set[type]) -> T:
+        """Return the cached singleton or create an instance; caller holds the lock."""
+        # Check if it's a singleton and already cached
+        registration = self._service_registry.get_registration(cls)
+        if registration and registration.scope == DIScope.SINGLETON:
+            cached_instance = self._service_registry.get_singleton_instance(cls)
+            if cached_instance is not None:
+                self._singleton_hits += 1
+                return cached_instance
+
+        # Create new instance
+        instance = self._create_instance(cls, dependency_chain)
+        self._instances_created += 1
+
+        # Cache singleton instances
+        if registration and registration.scope == DIScope.SINGLETON:
+            self._service_registry.set_singleton_instance(cls, instance)
+
+        return instance
+
     def _create_instance(self, cls: type[T], dependency_chain: set[type]) -> T:
         """Create an instance of the specified type."""
         try:
@@ -184,10 +229,35 @@ class DependencyResolver:
         self, cls: type, dependency_chain: set[type]
     ) -> dict[str, Any]:
         """Resolve constructor parameters for a class."""
+        plan = self._get_constructor_plan(cls)
+        parameters = {}
+        for param in plan.parameters:
+            if param.required:
+                parameters[param.name] = self.resolve(param.dependency_type, cls, dependency_chain)
+            else:
+                # Optional parameter - try to resolve, use default if not available
+                with suppress(DependencyResolutionError, UnregisteredDependencyError):
+                    parameters[param.name] = self.resolve(
+                        param.dependency_type, cls, dependency_chain
+                    )
+        return parameters
+
+    def _get_constructor_plan(self, cls: type) -> ConstructorPlan:
+        """Return the compiled constructor plan for a class, compiling it on first use."""
+        with self._lock:
+            plan = self._resolution_cache.get(cls)
+            if plan is None:
+                plan = self._compile_constructor_plan(cls)
+                self._resolution_cache[cls] = plan
+                self._plans_compiled += 1
+            return plan
+
+    def _compile_constructor_plan(self, cls: type) -> ConstructorPlan:
+        """Inspect a constructor and record the parameters to inject."""
         try:
             # Get constructor signature
             signature = inspect.signature(cls.__init__)
-            parameters = {}
+            parameters = []
 
             # Get type hints
             type_hints = get_type_hints(cls.__init__)
@@ -231,16 +301,15 @@ class DependencyResolver:
                             f"Primitive types must have default values or be provided explicitly.",
                         )
 
-                # Resolve dependency
-                if param.default == inspect.Parameter.empty:
-                    # Required parameter
-                    parameters[param_name] = self.resolve(param_type, cls, dependency_chain)
-                else:
-                    # Optional parameter - try to resolve, use default if not available
-                    with suppress(DependencyResolutionError, UnregisteredDependencyError):
-                        parameters[param_name] = self.resolve(param_type, cls, dependency_chain)
+                parameters.append(
+                    ParameterPlan(
+                        name=param_name,
+                        dependency_type=param_type,
+                        required=param.default == inspect.Parameter.empty,
+                    )
+                )
 
-            return parameters
+            return ConstructorPlan(cls=cls, parameters=tuple(parameters))
 
         except Exception as e:
             if isinstance(
@@ -411,3 +480,20 @@ class DependencyResolver:
         with self._lock:
             self._resolution_cache.clear()
             logger.debug("Dependency resolution cache cleared")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get resolution statistics."""
+        with self._lock:
+            resolutions = sum(self._resolution_counts.values())
+            return {
+                "resolutions": resolutions,
+                "singleton_hits": self._singleton_hits,
+                "instances_created": self._instances_created,
+                "compiled_plans": len(self._resolution_cache),
+                "plans_compiled": self._plans_compiled,
+                "total_resolution_time_ms": round(self._resolution_time * 1000, 3),
+                "avg_resolution_time_ms": (
+                    round(self._resolution_time * 1000 / resolutions, 3) if resolutions else 0.0
+                ),
+                "resolution_counts": dict(self._resolution_counts),
+            }
@@ -160,19 +160,22 @@ class DIContainer(DIContainerPort, CQRSHandlerRegistrationPort, ContainerPort):
         """Register a command handler."""
         self._cqrs_registry.register_command_handler(command_type, handler_type)
         if not self._service_registry.is_registered(handler_type):
-            self._service_registry.register_type(handler_type, handler_type)
+            # Handlers are stateless, so one instance serves every dispatch
+            self._service_registry.register_type(handler_type, handler_type, DIScope.SINGLETON)
 
     def register_query_handler(self, query_type: type, handler_type: type) -> None:
         """Register a query handler."""
         self._cqrs_registry.register_query_handler(query_type, handler_type)
         if not self._service_registry.is_registered(handler_type):
-            self._service_registry.register_type(handler_type, handler_type)
+            # Handlers are stateless, so one instance serves every dispatch
+            self._service_registry.register_type(handler_type, handler_type, DIScope.SINGLETON)
 
     def register_event_handler(self, event_type: type, handler_type: type) -> None:
         """Register an event handler."""
         self._cqrs_registry.register_event_handler(event_type, handler_type)
         if not self._service_registry.is_registered(handler_type):
-            self._service_registry.register_type(handler_type, handler_type)
+            # Handlers are stateless, so one instance serves every dispatch
+            self._service_registry.register_type(handler_type, handler_type, DIScope.SINGLETON)
 
     def get_command_handler(self, command_type: type) -> Any:
         """Get command handler for a command type."""
@@ -279,6 +282,7 @@ class DIContainer(DIContainerPort, CQRSHandlerRegistrationPort, ContainerPort):
             return {
                 "service_registry": self._service_registry.get_stats(),
                 "cqrs_registry": self._cqrs_registry.get_stats(),
+                "resolver": self._dependency_resolver.get_stats(),
                 "container_type": "modular",
             }
 
@@ -344,7 +348,10 @@ def _create_configured_container() -> DIContainer:
             "No container factory registered. Import orb.bootstrap before calling get_container()."
         )
 
-    _container_factory(container)
+    from orb.infrastructure.di.startup_profile import startup_phase
+
+    with startup_phase("register services"):
+        _container_factory(container)
 
     # Validate required ports are registered at startup
     from orb.application.ports.command_bus_port import CommandBusPort
@@ -16,11 +16,9 @@ Layer Separation:
 """
 
 import importlib
-import json
 import os
 import pkgutil
 import time
-from contextlib import suppress
 from pathlib import Path
 from typing import Any, Optional
 
@@ -28,8 +26,12 @@ from orb.application.decorators import (
     get_handler_registry_stats,
     get_registered_command_handlers,
     get_registered_query_handlers,
+    handled_type_key,
+    register_lazy_handler_modules,
+    set_handler_discovery_fallback,
 )
 from orb.infrastructure.di.container import DIContainer
+from orb.infrastructure.di.startup_snapshot import StartupSnapshot, get_startup_snapshot
 from orb.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -42,13 +44,16 @@ class HandlerDiscoveryService:
     This service scans application modules to trigger decorator registration,
     then registers discovered handlers with the DI container.
 
-    Improved with caching to improve startup performance by avoiding
-    repeated module scanning and handler discovery.
+    The discovered handler map is kept in the persistent startup snapshot.
+    When the snapshot is valid no handler module is imported at startup:
+    the map is handed to the application registry, which imports a handler's
+    module the first time its query or command is dispatched.
     """
 
     def __init__(self, container: DIContainer) -> None:
         """Initialize the instance."""
         self.container = container
+        self.snapshot: Optional[StartupSnapshot] = None
 
         # Get caching configuration from performance settings
         try:
@@ -60,8 +65,14 @@ class HandlerDiscoveryService:
 
             self.cache_enabled = perf_config.caching.handler_discovery.enabled
             self.cache_file = (
-                self._resolve_cache_path(config_manager) if self.cache_enabled else None
+                self._resolve_cache_path(config_manager, perf_config.caching.handler_discovery.file)
+                if self.cache_enabled
+                else None
             )
+            if self.cache_file:
+                self.snapshot = get_startup_snapshot(
+                    self.cache_file, config_manager.get_loaded_config_file()
+                )
 
         except Exception as e:
             logger.warning("Failed to get caching configuration: %s", e, exc_info=True)
@@ -69,23 +80,23 @@ class HandlerDiscoveryService:
             self.cache_enabled = False
             self.cache_file = None
 
-    def _resolve_cache_path(self, config_manager: Any) -> str:
-        """Resolve cache file path from configuration."""
+    def _resolve_cache_path(self, config_manager: Any, file_name: str) -> str:
+        """Resolve snapshot file path from configuration."""
         cache_dir = config_manager.get_cache_dir()
         os.makedirs(cache_dir, exist_ok=True)
-        return os.path.join(cache_dir, "handler_discovery.json")
+        return os.path.join(cache_dir, file_name)
 
     def discover_and_register_handlers(self, base_package: str = "orb.application") -> None:
         """
         Discover all handlers and register them with the DI container.
-        Uses caching to improve performance on subsequent runs.
+        Uses the startup snapshot to skip discovery on subsequent runs.
 
         Args:
             base_package: Base package to scan for handlers
         """
         logger.info("Starting handler discovery in package: %s", base_package)
 
-        # Try to load from cache first
+        # Try to load from the snapshot first
         cached_result = self._try_load_from_cache(base_package)
         if cached_result:
             logger.info(
@@ -93,6 +104,8 @@ class HandlerDiscoveryService:
                 cached_result["total_handlers"],
             )
             self._register_handlers_from_cache(cached_result["handlers"])
+            # A handler map that no longer matches the code is rebuilt on a lazy miss
+            set_handler_discovery_fallback(lambda: self._rediscover(base_package))
             return
 
         # Cache miss - perform full discovery
@@ -112,6 +125,14 @@ class HandlerDiscoveryService:
 
         logger.info("Handler discovery complete: %s (took %.3fs)", stats, discovery_time)
 
+    def _rediscover(self, base_package: str) -> None:
+        """Import every handler module after a lazy miss and refresh the snapshot."""
+        logger.info("Handler missing from the startup snapshot - performing full discovery")
+        start_time = time.time()
+        self._discover_handlers(base_package)
+        discovery_time = time.time() - start_time
+        self._save_to_cache(base_package, get_handler_registry_stats(), discovery_time)
+
     def _discover_handlers(self, base_package: str) -> None:
         """
         Discover handlers by importing all modules in the package.
@@ -192,27 +213,17 @@ class HandlerDiscoveryService:
         logger.info("Handler registration complete. Registered %s handlers", total_registered)
 
     def _try_load_from_cache(self, base_package: str) -> Optional[dict[str, Any]]:
-        """Try to load handler discovery results from cache if valid."""
-        if not self.cache_enabled or not self.cache_file or not os.path.exists(self.cache_file):
+        """Return the cached discovery result if the startup snapshot is valid."""
+        if not self.cache_enabled or self.snapshot is None:
             return None
 
         try:
-            with open(self.cache_file) as f:
-                cache_data = json.load(f)
-
-            # Check if cache is for the same base package
-            if cache_data.get("base_package") != base_package:
+            cache_data = self.snapshot.get("handlers")
+            # The snapshot fingerprint covers source and config changes
+            if not cache_data or cache_data.get("base_package") != base_package:
                 return None
 
-            # Check if source files have changed since cache was created
-            cached_mtimes = cache_data.get("source_mtimes", {})
-            current_mtimes = self._get_source_file_mtimes(base_package)
-
-            if cached_mtimes != current_mtimes:
-                logger.debug("Cache invalid - source files have changed")
-                return None
-
-            logger.debug("Cache is valid - using cached handler discovery")
+            logger.debug("Startup snapshot is valid - using cached handler discovery")
             return cache_data
 
         except Exception as e:
@@ -222,37 +233,29 @@ class HandlerDiscoveryService:
     def _save_to_cache(
         self, base_package: str, stats: dict[str, Any], discovery_time: float
     ) -> None:
-        """Save handler discovery results to cache."""
-        if not self.cache_enabled or not self.cache_file:
+        """Save handler discovery results to the startup snapshot."""
+        if not self.cache_enabled or self.snapshot is None:
             return
 
         try:
-            # Ensure cache directory exists
-            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
-
             # Get current handler information for caching
             query_handlers = get_registered_query_handlers()
             command_handlers = get_registered_command_handlers()
 
-            cache_data = {
-                "version": "1.0",
-                "cached_at": time.time(),
-                "base_package": base_package,
-                "source_mtimes": self._get_source_file_mtimes(base_package),
-                "discovery_time": discovery_time,
-                "stats": stats,
-                "total_handlers": stats.get("total_handlers", 0),
-                "handlers": {
-                    "query_handlers": self._serialize_handlers(query_handlers),
-                    "command_handlers": self._serialize_handlers(command_handlers),
+            self.snapshot.put(
+                "handlers",
+                {
+                    "cached_at": time.time(),
+                    "base_package": base_package,
+                    "discovery_time": discovery_time,
+                    "stats": stats,
+                    "total_handlers": stats.get("total_handlers", 0),
+                    "handlers": {
+                        "query_handlers": self._serialize_handlers(query_handlers),
+                        "command_handlers": self._serialize_handlers(command_handlers),
+                    },
                 },
-            }
-
-            # Atomic write to prevent corruption
-            temp_file = f"{self.cache_file}.tmp"
-            with open(temp_file, "w") as f:
-                json.dump(cache_data, f, indent=2)
-            os.rename(temp_file, self.cache_file)
+            )
 
             logger.debug(
                 "Cached handler discovery results (%s handlers)",
@@ -264,89 +267,21 @@ class HandlerDiscoveryService:
             # Continue without caching - not critical for functionality
 
     def _register_handlers_from_cache(self, cached_handlers: dict[str, Any]) -> None:
-        """Register handlers from cached information."""
-        try:
-            # Import and register query handlers
-            query_handlers_data = cached_handlers.get("query_handlers", {})
-            for _query_type_name, handler_info in query_handlers_data.items():
-                try:
-                    # Import the handler class
-                    module = importlib.import_module(handler_info["module"])
-                    handler_class = getattr(module, handler_info["class_name"])
-                    getattr(module, handler_info["query_type_name"])
-
-                    # Register with DI container
-                    self.container.register_singleton(handler_class)
-                    logger.debug("Registered cached query handler: %s", handler_class.__name__)
-
-                except Exception as e:
-                    logger.warning(
-                        "Failed to register cached query handler %s: %s",
-                        handler_info.get("class_name", "unknown"),
-                        e,
-                    )
-                    # Fall back to full discovery if cache loading fails
-                    self._fallback_to_full_discovery()
-                    return
-
-            # Import and register command handlers
-            command_handlers_data = cached_handlers.get("command_handlers", {})
-            for _command_type_name, handler_info in command_handlers_data.items():
-                try:
-                    # Import the handler class
-                    module = importlib.import_module(handler_info["module"])
-                    handler_class = getattr(module, handler_info["class_name"])
-                    getattr(module, handler_info["command_type_name"])
-
-                    # Register with DI container
-                    self.container.register_singleton(handler_class)
-                    logger.debug("Registered cached command handler: %s", handler_class.__name__)
-
-                except Exception as e:
-                    logger.warning(
-                        "Failed to register cached command handler %s: %s",
-                        handler_info.get("class_name", "unknown"),
-                        e,
-                    )
-                    # Fall back to full discovery if cache loading fails
-                    self._fallback_to_full_discovery()
-                    return
-
-            total_registered = len(query_handlers_data) + len(command_handlers_data)
-            logger.info(
-                "Handler registration from cache complete. Registered %s handlers",
-                total_registered,
-            )
-
-        except Exception as e:
-            logger.warning("Failed to register handlers from cache: %s", e, exc_info=True)
-            self._fallback_to_full_discovery()
-
-    def _fallback_to_full_discovery(self) -> None:
-        """Fall back to full discovery if cache loading fails."""
-        logger.info("Falling back to full handler discovery")
-        self._discover_handlers("orb.application")
-        self._register_handlers()
-
-    def _get_source_file_mtimes(self, base_package: str) -> dict[str, float]:
-        """Get modification times of all source files in the package."""
-        mtimes = {}
-
-        try:
-            # Convert package name to file path
-            package_path = base_package.replace(".", "/")
-
-            # Walk through all Python files in the package
-            for root, _dirs, files in os.walk(package_path):
-                for file in files:
-                    if file.endswith(".py"):
-                        filepath = os.path.join(root, file)
-                        with suppress(OSError):
-                            mtimes[filepath] = os.path.getmtime(filepath)
-        except Exception as e:
-            logger.debug("Failed to get source file modification times: %s", e)
-
-        return mtimes
+        """Hand the cached handler map to the registry for import on first dispatch."""
+        query_modules = {
+            type_key: info["module"]
+            for type_key, info in cached_handlers.get("query_handlers", {}).items()
+        }
+        command_modules = {
+            type_key: info["module"]
+            for type_key, info in cached_handlers.get("command_handlers", {}).items()
+        }
+        register_lazy_handler_modules(query_modules, command_modules)
+
+        logger.info(
+            "Handler registration from cache complete. %s handlers load on first use",
+            len(query_modules) + len(command_modules),
+        )
 
     def _serialize_handlers(self, handlers: dict[type, type]) -> dict[str, dict[str, str]]:
         """Serialize handler information for caching."""
@@ -354,15 +289,9 @@ class HandlerDiscoveryService:
 
         for handled_type, handler_class in handlers.items():
             try:
-                serialized[handled_type.__name__] = {
+                serialized[handled_type_key(handled_type)] = {
                     "class_name": handler_class.__name__,
                     "module": handler_class.__module__,
-                    "query_type_name": (
-                        handled_type.__name__ if "Query" in handled_type.__name__ else None
-                    ),
-                    "command_type_name": (
-                        handled_type.__name__ if "Command" in handled_type.__name__ else None
-                    ),
                 }
             except Exception as e:
                 logger.debug("Failed to serialize handler %s: %s", handler_class, e)
@@ -0,0 +1,63 @@
+"""Startup phase timing for the DI bootstrap.
+
+Bootstrap code wraps its steps in :func:`startup_phase`; the recorded phases
+are reported by ``orb debug startup-profile``. Recording costs two
+``perf_counter`` calls per phase, so it is always on.
+"""
+
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class StartupPhase:
+    """One timed bootstrap step."""
+
+    name: str
+    depth: int
+    started_ms: float
+    duration_ms: float
+    modules_imported: int
+
+
+_phases: list[StartupPhase] = []
+_state = threading.local()
+_origin = time.perf_counter()
+
+
+@contextmanager
+def startup_phase(name: str) -> Iterator[None]:
+    """Time a bootstrap step and the number of modules it imported."""
+    depth = getattr(_state, "depth", 0)
+    _state.depth = depth + 1
+    modules_before = len(sys.modules)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        _state.depth = depth
+        _phases.append(
+            StartupPhase(
+                name=name,
+                depth=depth,
+                started_ms=(start - _origin) * 1000,
+                duration_ms=(end - start) * 1000,
+                modules_imported=len(sys.modules) - modules_before,
+            )
+        )
+
+
+def get_startup_phases() -> list[dict[str, Any]]:
+    """Return the recorded phases in the order they started."""
+    return [asdict(phase) for phase in sorted(_phases, key=lambda p: p.started_ms)]
+
+
+def reset_startup_phases() -> None:
+    """Forget recorded phases (for tests and repeated profiling)."""
+    _phases.clear()
@@ -0,0 +1,299 @@
+"""Persistent startup snapshot.
+
+A snapshot is a JSON file in the cache directory holding bootstrap results
+that are expensive to recompute on every CLI invocation. It is keyed by a
+fingerprint of the installed ORB distribution version and the active
+configuration, so upgrading ORB or changing the config (or any ``ORB_*``
+environment variable) invalidates it. When ORB runs from an editable
+install or a source checkout, whose version does not change with the code,
+the fingerprint also covers the size and mtime of every source file.
+
+Two snapshots are kept:
+
+- the startup snapshot (``startup_snapshot.json``) holds the CQRS handler
+  import map and is keyed by the loaded configuration file;
+- the provider snapshot (``provider_snapshot.json``) holds the defaults
+  contributed by provider strategies. It is read while the configuration is
+  being loaded, so it is keyed by the installed version only.
+
+Validated configuration and loaded templates are not snapshotted.
+Configuration values may expand arbitrary environment variables that the
+fingerprint does not cover, and template loading is dominated by image
+resolution, which ``RuntimeAMICache`` already persists across processes.
+The startup snapshot is off by default and enabled with
+``performance.caching.handler_discovery.enabled``.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Optional
+
+from orb.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 4
+
+DISTRIBUTION_NAME = "orb-py"
+
+PROVIDER_SNAPSHOT_FILENAME = "provider_snapshot.json"
+
+
+def get_distribution_version() -> str:
+    """
+    Return the installed ORB distribution version.
+
+    Reads the installed package metadata, so a regular install is
+    fingerprinted without walking the source tree. Falls back to the version
+    ORB reports for itself when the distribution metadata is unavailable.
+
+    Returns:
+        Version string of the installed distribution
+    """
+    try:
+        from importlib.metadata import version
+
+        return version(DISTRIBUTION_NAME)
+    except Exception:
+        from orb._package import __version__
+
+        return __version__
+
+
+def is_source_install() -> bool:
+    """
+    Check whether ORB runs from an editable install or a source checkout.
+
+    Returns:
+        True when the distribution is installed in editable mode or has no
+        installed metadata at all
+    """
+    try:
+        from importlib.metadata import distribution
+
+        direct_url = distribution(DISTRIBUTION_NAME).read_text("direct_url.json")
+    except Exception:
+        return True
+    if not direct_url:
+        return False
+    try:
+        return bool(json.loads(direct_url).get("dir_info", {}).get("editable", False))
+    except (ValueError, AttributeError):
+        return False
+
+
+def compute_source_fingerprint(package_dir: Optional[str] = None) -> str:
+    """
+    Fingerprint the ORB source files by size and mtime.
+
+    Args:
+        package_dir: Package directory to walk (default: the ``orb`` package)
+
+    Returns:
+        Hex digest of the source file signatures
+    """
+    if package_dir is None:
+        import orb
+
+        package_dir = os.path.dirname(os.path.abspath(orb.__file__))
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            relative = os.path.relpath(path, package_dir)
+            digest.update(f"{relative}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def compute_config_fingerprint(config_file: Optional[str]) -> str:
+    """
+    Fingerprint the active configuration.
+
+    Covers the config file, the other JSON/YAML files next to it (templates,
+    defaults) and every ``ORB_*`` environment variable.
+
+    Args:
+        config_file: Loaded configuration file, if any
+
+    Returns:
+        Hex digest of the configuration inputs
+    """
+    digest = hashlib.sha256()
+    if config_file:
+        config_path = Path(config_file).resolve()
+        digest.update(f"config:{config_path}\n".encode())
+        candidates = [config_path]
+        if config_path.parent.is_dir():
+            candidates.extend(
+                p
+                for p in sorted(config_path.parent.iterdir())
+                if p.suffix in (".json", ".yml", ".yaml") and p != config_path
+            )
+        for path in candidates:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    for key in sorted(k for k in os.environ if k.startswith("ORB_")):
+        digest.update(f"{key}={os.environ[key]}\n".encode())
+    return digest.hexdigest()
+
+
+class StartupSnapshot:
+    """
+    Keyed, atomically written store for bootstrap results.
+
+    Sections are plain JSON values. A snapshot whose fingerprint does not
+    match the current process is ignored and rewritten on the next ``put``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        config_file: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the snapshot.
+
+        Args:
+            path: Snapshot file path
+            config_file: Loaded configuration file, part of the fingerprint
+            fingerprint: Precomputed fingerprint (default: computed from version,
+                sources of a source install and config)
+        """
+        self.path = path
+        self._config_file = config_file
+        self._fingerprint = fingerprint
+        self._sections: Optional[dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self.status = "unloaded"
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the installed version (or sources) and the configuration."""
+        if self._fingerprint is None:
+            parts = [
+                str(SNAPSHOT_FORMAT_VERSION),
+                get_distribution_version(),
+                f"{sys.version_info.major}.{sys.version_info.minor}",
+                compute_config_fingerprint(self._config_file),
+            ]
+            if is_source_install():
+                # The version of an edited checkout stays the same
+                parts.append(compute_source_fingerprint())
+            self._fingerprint = hashlib.sha256("|".join(parts).encode()).hexdigest()
+        return self._fingerprint
+
+    def get(self, section: str) -> Optional[Any]:
+        """Return a section of a valid snapshot, or None on a miss."""
+        with self._lock:
+            return self._load().get(section)
+
+    def put(self, section: str, value: Any) -> None:
+        """Store a section and rewrite the snapshot file."""
+        with self._lock:
+            sections = self._load()
+            sections[section] = value
+            self._write(sections)
+
+    def _load(self) -> dict[str, Any]:
+        if self._sections is not None:
+            return self._sections
+
+        self._sections = {}
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self.status = "miss"
+            return self._sections
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable startup snapshot %s: %s", self.path, e)
+            self.status = "miss"
+            return self._sections
+
+        if data.get("fingerprint") != self.fingerprint:
+            logger.debug("Startup snapshot is stale - source or configuration changed")
+            self.status = "stale"
+            return self._sections
+
+        sections = data.get("sections")
+        self._sections = sections if isinstance(sections, dict) else {}
+        self.status = "hit"
+        return self._sections
+
+    def _write(self, sections: dict[str, Any]) -> None:
+        data = {
+            "fingerprint": self.fingerprint,
+            "created_at": time.time(),
+            "sections": sections,
+        }
+        temp_file = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(temp_file, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_file, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Failed to write startup snapshot %s: %s", self.path, e)
+            with suppress(OSError):
+                os.remove(temp_file)
+
+
+_snapshots: dict[str, StartupSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def get_startup_snapshot(path: str, config_file: Optional[str] = None) -> StartupSnapshot:
+    """
+    Return the process-wide snapshot for ``path``.
+
+    Args:
+        path: Snapshot file path
+        config_file: Loaded configuration file, part of the fingerprint
+
+    Returns:
+        Shared StartupSnapshot instance
+    """
+    with _snapshots_lock:
+        snapshot = _snapshots.get(path)
+        if snapshot is None:
+            snapshot = StartupSnapshot(path, config_file)
+            _snapshots[path] = snapshot
+        return snapshot
+
+
+def get_provider_snapshot() -> StartupSnapshot:
+    """
+    Return the snapshot for provider registration results.
+
+    Lives in the cache directory and is independent of the configuration file,
+    because provider defaults are collected before any configuration is read.
+
+    Returns:
+        Shared StartupSnapshot instance
+    """
+    from orb.config.platform_dirs import get_cache_location
+
+    return get_startup_snapshot(str(get_cache_location() / PROVIDER_SNAPSHOT_FILENAME))
+
+
+def get_loaded_startup_snapshots() -> list[StartupSnapshot]:
+    """Return the snapshots used by this process (for diagnostics)."""
+    with _snapshots_lock:
+        return list(_snapshots.values())
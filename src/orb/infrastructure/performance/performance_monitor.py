@@ -6,6 +6,8 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
+from orb.monitoring.histogram import Histogram
+
 if TYPE_CHECKING:
     from orb.domain.base.ports import LoggingPort
 
@@ -16,7 +18,7 @@ class PerformanceMonitor:
     def __init__(self, logger: Optional["LoggingPort"] = None) -> None:
         """Initialize performance monitor."""
         self.logger = logger
-        self._metrics: dict[str, dict[str, Any]] = {}
+        self._histograms: dict[str, Histogram] = {}
 
     @contextmanager
     def measure(self, operation_name: str) -> Iterator[None]:
@@ -31,37 +33,47 @@ class PerformanceMonitor:
 
     def _record_metric(self, operation_name: str, duration: float) -> None:
         """Record performance metric."""
-        if operation_name not in self._metrics:
-            self._metrics[operation_name] = {
-                "count": 0,
-                "total_time": 0.0,
-                "min_time": float("inf"),
-                "max_time": 0.0,
-                "avg_time": 0.0,
-            }
-
-        metric = self._metrics[operation_name]
-        metric["count"] += 1
-        metric["total_time"] += duration
-        metric["min_time"] = min(metric["min_time"], duration)
-        metric["max_time"] = max(metric["max_time"], duration)
-        metric["avg_time"] = metric["total_time"] / metric["count"]
+        histogram = self._histograms.get(operation_name)
+        if histogram is None:
+            histogram = self._histograms.setdefault(operation_name, Histogram())
+        histogram.observe(duration)
 
         if self.logger and duration > 1.0:  # Log slow operations (>1 second)
             self.logger.warning("Slow operation detected: %s took %.2fs", operation_name, duration)
 
     def get_metrics(self) -> dict[str, dict[str, Any]]:
         """Get all recorded metrics."""
-        return self._metrics.copy()
+        return {
+            name: self._summarise(histogram) for name, histogram in list(self._histograms.items())
+        }
+
+    def get_histograms(self) -> dict[str, Histogram]:
+        """Get the duration histogram of every operation."""
+        return dict(self._histograms)
 
     def get_slowest_operations(self, limit: int = 10) -> dict[str, dict[str, Any]]:
         """Get the slowest operations by average time."""
-        sorted_ops = sorted(self._metrics.items(), key=lambda x: x[1]["avg_time"], reverse=True)
+        sorted_ops = sorted(
+            self.get_metrics().items(), key=lambda x: x[1]["avg_time"], reverse=True
+        )
         return dict(sorted_ops[:limit])
 
     def reset_metrics(self) -> None:
         """Reset all metrics."""
-        self._metrics.clear()
+        self._histograms.clear()
+
+    @staticmethod
+    def _summarise(histogram: Histogram) -> dict[str, Any]:
+        return {
+            "count": histogram.count,
+            "total_time": histogram.sum,
+            "min_time": histogram.min,
+            "max_time": histogram.max,
+            "avg_time": histogram.mean,
+            "p50_time": histogram.quantile(0.5),
+            "p95_time": histogram.quantile(0.95),
+            "p99_time": histogram.quantile(0.99),
+        }
 
 
 def performance_monitor(operation_name: Optional[str] = None):
@@ -83,6 +83,10 @@ def retry(
             attempt = 0
 
             while True:
+                # Fail fast while the circuit breaker is open
+                if hasattr(retry_strategy, "allow_request"):
+                    retry_strategy.allow_request()  # type: ignore[attr-defined]
+
                 try:
                     result = func(*args, **kwargs)
 
@@ -0,0 +1,385 @@
+"""Circuit breaker state stores shared between processes.
+
+HostFactory starts a fresh ``orb`` process for every call, so circuit state
+kept in process memory starts closed on every invocation and a failing
+dependency is called again by each poll. The stores here keep the state of
+every circuit where all processes on the host (file store) or all hosts
+sharing the configured storage backend (storage store) see it.
+"""
+
+import copy
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Optional
+
+from filelock import FileLock, Timeout
+
+from orb.config.platform_dirs import get_cache_location
+from orb.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+CircuitStateData = dict[str, Any]
+
+_STATE_FILE = "circuit_breakers.json"
+_LOCK_TIMEOUT_SECONDS = 5
+_ENTITY_PREFIX = "circuit_breaker:"
+# Conditional writes a storage store update retries after losing a race
+_MAX_UPDATE_ATTEMPTS = 5
+
+# Dedicated collection (file, table or DynamoDB table suffix) of the storage store
+CIRCUIT_STATE_COLLECTION = "circuit_breakers"
+CIRCUIT_STATE_COLUMNS: dict[str, str] = {
+    "id": "VARCHAR(255) PRIMARY KEY",
+    "state": "VARCHAR(20)",
+    "failure_count": "INTEGER",
+    "last_failure_time": "FLOAT",
+    "half_open_start_time": "FLOAT",
+    "probe_owner": "VARCHAR(255)",
+    "probe_expires_at": "FLOAT",
+    "version": "INTEGER",
+}
+
+
+def default_circuit_state() -> CircuitStateData:
+    """Return the state of a circuit that has not seen any failure."""
+    return {
+        "state": "closed",
+        "failure_count": 0,
+        "last_failure_time": None,
+        "half_open_start_time": None,
+        "probe_owner": None,
+        "probe_expires_at": None,
+    }
+
+
+class CircuitStateStore(ABC):
+    """
+    Persistence of circuit breaker state, keyed by service name.
+
+    ``update`` is the only write path: it applies a mutation to the current
+    state as one read-modify-write, so the transition logic of the breaker
+    runs against the latest state written by any process.
+    """
+
+    @abstractmethod
+    def get(self, service_name: str) -> Optional[CircuitStateData]:
+        """Return a copy of the stored state, or None if the circuit was never recorded."""
+
+    @abstractmethod
+    def update(
+        self, service_name: str, mutate: Callable[[CircuitStateData], None]
+    ) -> CircuitStateData:
+        """
+        Apply ``mutate`` to the current state and store the result.
+
+        Args:
+            service_name: Circuit identifier
+            mutate: Function changing the state in place; it receives the
+                default state when the circuit was never recorded
+
+        Returns:
+            The state after the mutation
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove the state of every circuit."""
+
+    def try_acquire_probe(
+        self, service_name: str, owner: str, lease_seconds: float, now: float
+    ) -> bool:
+        """
+        Claim the half-open probe of a circuit.
+
+        The lease is granted when nobody holds it, ``owner`` already holds it
+        or the previous lease expired, so a prober that dies does not keep the
+        circuit half-open forever.
+
+        Returns:
+            True if ``owner`` holds the lease
+        """
+        acquired = False
+
+        def claim(state: CircuitStateData) -> None:
+            # Stores may apply the mutation again after losing a race, so decide afresh
+            nonlocal acquired
+            holder = state.get("probe_owner")
+            expires_at = state.get("probe_expires_at")
+            acquired = holder in (None, owner) or expires_at is None or expires_at <= now
+            if acquired:
+                state["probe_owner"] = owner
+                state["probe_expires_at"] = now + lease_seconds
+
+        self.update(service_name, claim)
+        return acquired
+
+    def release_probe(self, service_name: str, owner: str) -> None:
+        """Give up the probe lease of a circuit if ``owner`` holds it."""
+
+        def release(state: CircuitStateData) -> None:
+            if state.get("probe_owner") == owner:
+                state["probe_owner"] = None
+                state["probe_expires_at"] = None
+
+        self.update(service_name, release)
+
+
+class InMemoryCircuitStateStore(CircuitStateStore):
+    """Process-local store; circuits start closed in every process."""
+
+    def __init__(self) -> None:
+        self._states: dict[str, CircuitStateData] = {}
+        self._lock = threading.Lock()
+
+    def get(self, service_name: str) -> Optional[CircuitStateData]:
+        with self._lock:
+            state = self._states.get(service_name)
+            return copy.deepcopy(state) if state is not None else None
+
+    def update(
+        self, service_name: str, mutate: Callable[[CircuitStateData], None]
+    ) -> CircuitStateData:
+        with self._lock:
+            state = self._states.setdefault(service_name, default_circuit_state())
+            mutate(state)
+            return copy.deepcopy(state)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+
+class FileCircuitStateStore(CircuitStateStore):
+    """
+    Store in one JSON file shared by every process on the host.
+
+    Updates run under a cross-process file lock and replace the file
+    atomically (temp file + ``os.replace``), so readers never see a partial
+    write and probe leases are granted to exactly one process. Reads are
+    lock-free and memoized until the file is replaced; updates always read
+    the file under the lock.
+    """
+
+    def __init__(self, state_dir: Optional[str] = None) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            state_dir: Directory holding the state file (default: ORB cache directory)
+        """
+        directory = Path(state_dir) if state_dir else get_cache_location()
+        self.path = directory / _STATE_FILE
+        self._file_lock = FileLock(f"{self.path}.lock", timeout=_LOCK_TIMEOUT_SECONDS)
+        self._memo: Optional[tuple[tuple[int, int, int], dict[str, CircuitStateData]]] = None
+        self._lock = threading.Lock()
+
+    def get(self, service_name: str) -> Optional[CircuitStateData]:
+        state = self._read().get(service_name)
+        return copy.deepcopy(state) if state is not None else None
+
+    def update(
+        self, service_name: str, mutate: Callable[[CircuitStateData], None]
+    ) -> CircuitStateData:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._file_lock:
+                states = copy.deepcopy(self._read(fresh=True))
+                state = states.get(service_name) or default_circuit_state()
+                before = copy.deepcopy(state)
+                mutate(state)
+                if state != before:
+                    states[service_name] = state
+                    self._write(states)
+                return copy.deepcopy(state)
+        except (OSError, Timeout) as e:
+            # Graceful degradation: decide on the state without persisting it
+            logger.debug("Failed to update circuit state file %s: %s", self.path, e)
+            state = self.get(service_name) or default_circuit_state()
+            mutate(state)
+            return state
+
+    def clear(self) -> None:
+        with suppress(OSError), self._file_lock:
+            os.remove(self.path)
+        with self._lock:
+            self._memo = None
+
+    def _read(self, *, fresh: bool = False) -> dict[str, CircuitStateData]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return {}
+        # Every write replaces the file, so the inode changes along with mtime and size
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if not fresh and self._memo is not None and self._memo[0] == identity:
+                return self._memo[1]
+        try:
+            with open(self.path) as f:
+                states = json.load(f)
+            if not isinstance(states, dict):
+                raise ValueError("circuit state file is not a JSON object")
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable circuit state file %s: %s", self.path, e)
+            return {}
+        with self._lock:
+            self._memo = (identity, states)
+        return states
+
+    def _write(self, states: dict[str, CircuitStateData]) -> None:
+        """Atomically replace the state file. Callers must hold the file lock."""
+        temp_file = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_file, "w") as f:
+                json.dump(states, f, separators=(",", ":"))
+            os.replace(temp_file, self.path)
+        finally:
+            with suppress(OSError):
+                os.remove(temp_file)
+
+
+class StorageCircuitStateStore(CircuitStateStore):
+    """
+    Store on a storage strategy (SQL, DynamoDB or JSON), shared across hosts.
+
+    Each circuit is one entity of the dedicated ``circuit_breakers``
+    collection (see ``CIRCUIT_STATE_COLUMNS`` for its SQL schema). Every
+    entity carries a version, and updates are conditional writes on the
+    version that was read: a process that loses the race re-reads the state
+    and applies its mutation again. A probe lease is therefore granted to one
+    process only.
+    """
+
+    def __init__(self, strategy: Any) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            strategy: Storage strategy holding the circuit entities; it must
+                support conditional writes (``save_if``)
+        """
+        self._strategy = strategy
+        self._lock = threading.Lock()
+
+    def get(self, service_name: str) -> Optional[CircuitStateData]:
+        stored = self._read(service_name)
+        return stored[0] if stored is not None else None
+
+    def update(
+        self, service_name: str, mutate: Callable[[CircuitStateData], None]
+    ) -> CircuitStateData:
+        entity_id = self._entity_id(service_name)
+        with self._lock:
+            for _ in range(_MAX_UPDATE_ATTEMPTS):
+                stored = self._read(service_name)
+                current, version = stored if stored is not None else (None, 0)
+                state = copy.deepcopy(current) if current is not None else default_circuit_state()
+                mutate(state)
+                if state == current:
+                    return state
+                try:
+                    if self._strategy.save_if(
+                        entity_id,
+                        {"id": entity_id, **state, "version": version + 1},
+                        None if stored is None else {"version": version or None},
+                    ):
+                        return state
+                except Exception as e:
+                    logger.debug("Failed to save circuit state for %s: %s", service_name, e)
+                    return state
+            logger.debug("Circuit state for %s kept changing, not saving this update", service_name)
+            return state
+
+    def clear(self) -> None:
+        try:
+            entities = self._strategy.find_all()
+            ids = entities.keys() if isinstance(entities, dict) else [e.get("id") for e in entities]
+            for entity_id in ids:
+                if isinstance(entity_id, str) and entity_id.startswith(_ENTITY_PREFIX):
+                    self._strategy.delete(entity_id)
+        except Exception as e:
+            logger.debug("Failed to clear circuit states: %s", e)
+
+    def _read(self, service_name: str) -> Optional[tuple[CircuitStateData, int]]:
+        """Return the stored state and its version, or None if the circuit was never recorded."""
+        try:
+            data = self._strategy.find_by_id(self._entity_id(service_name))
+        except Exception as e:
+            logger.debug("Failed to read circuit state for %s: %s", service_name, e)
+            return None
+        if not data:
+            return None
+        state = default_circuit_state()
+        state.update({key: data[key] for key in state if key in data})
+        return state, int(data.get("version") or 0)
+
+    @staticmethod
+    def _entity_id(service_name: str) -> str:
+        return f"{_ENTITY_PREFIX}{service_name}"
+
+
+_state_store: Optional[CircuitStateStore] = None
+_state_store_lock = threading.Lock()
+
+
+def create_circuit_state_store(
+    backend: str = "file",
+    *,
+    state_dir: Optional[str] = None,
+    storage_strategy_factory: Optional[Callable[[], Any]] = None,
+) -> CircuitStateStore:
+    """
+    Create the circuit state store of a configured backend.
+
+    Args:
+        backend: ``file``, ``storage`` or ``memory``
+        state_dir: Directory of the file store (default: ORB cache directory)
+        storage_strategy_factory: Builds the storage strategy of the storage store
+
+    Raises:
+        ValueError: If the backend is unknown or ``storage`` lacks a strategy factory
+    """
+    if backend == "file":
+        return FileCircuitStateStore(state_dir)
+    if backend == "memory":
+        return InMemoryCircuitStateStore()
+    if backend == "storage":
+        if storage_strategy_factory is None:
+            raise ValueError("The storage circuit state backend needs a storage strategy")
+        return StorageCircuitStateStore(storage_strategy_factory())
+    raise ValueError(f"Unknown circuit state backend: {backend}")
+
+
+def set_circuit_state_store(store: CircuitStateStore) -> None:
+    """Make ``store`` the process-wide circuit state store."""
+    global _state_store
+    with _state_store_lock:
+        _state_store = store
+
+
+def get_circuit_state_store() -> CircuitStateStore:
+    """
+    Return the process-wide circuit state store.
+
+    The store configured in the DI container is used when available,
+    otherwise the file store in the ORB cache directory.
+    """
+    global _state_store
+    if _state_store is None:
+        store: Optional[CircuitStateStore] = None
+        try:
+            from orb.infrastructure.di.container import get_container
+
+            store = get_container().get(CircuitStateStore)
+        except Exception as e:
+            logger.debug("Circuit state store not configured, using file store: %s", e)
+        with _state_store_lock:
+            if _state_store is None:
+                _state_store = store or FileCircuitStateStore()
+    return _state_store
@@ -1,16 +1,21 @@
 """Circuit breaker retry strategy."""
 
+import os
 import secrets
+import socket
 import time
 from enum import Enum
-from typing import TYPE_CHECKING, Any
-
-if TYPE_CHECKING:
-    pass
+from typing import Any, Optional
 
 from orb.domain.base.exceptions import QuotaError
 from orb.infrastructure.logging.logger import get_logger
 from orb.infrastructure.resilience.exceptions import CircuitBreakerOpenError
+from orb.infrastructure.resilience.state_store import (
+    CircuitStateData,
+    CircuitStateStore,
+    default_circuit_state,
+    get_circuit_state_store,
+)
 from orb.infrastructure.resilience.strategy.base import RetryStrategy
 
 logger = get_logger(__name__)
@@ -32,10 +37,15 @@ class CircuitBreakerStrategy(RetryStrategy):
     - CLOSED: Normal operation, allows all requests
     - OPEN: Fails fast, blocks all requests for a timeout period
     - HALF_OPEN: Allows limited requests to test if service recovered
+
+    State lives in a :class:`CircuitStateStore` (by default a file shared by
+    every process on the host), so an open circuit stays open for later CLI
+    invocations. In HALF_OPEN only the holder of the probe lease may call the
+    service; the lease expires after ``half_open_timeout``.
     """
 
-    # Class-level storage for circuit states (shared across instances)
-    _circuit_states: dict[str, dict[str, Any]] = {}
+    # Circuits created in this process, reported by has_state before any failure
+    _known_services: set[str] = set()
 
     def __init__(
         self,
@@ -47,6 +57,8 @@ class CircuitBreakerStrategy(RetryStrategy):
         base_delay: float = 1.0,
         max_delay: float = 30.0,
         jitter: bool = True,
+        *,
+        state_store: Optional[CircuitStateStore] = None,
         **kwargs,
     ) -> None:
         """
@@ -61,6 +73,7 @@ class CircuitBreakerStrategy(RetryStrategy):
             base_delay: Base delay in seconds
             max_delay: Maximum delay in seconds
             jitter: Whether to add jitter to delays
+            state_store: Store of the circuit state (default: the process-wide store)
             **kwargs: Additional retry strategy parameters
         """
         # Initialize base attributes since we don't have a concrete base class
@@ -74,15 +87,11 @@ class CircuitBreakerStrategy(RetryStrategy):
         self.reset_timeout = reset_timeout
         self.half_open_timeout = half_open_timeout
 
-        # Initialize circuit state if not exists
-        if service_name not in self._circuit_states:
-            self._circuit_states[service_name] = {
-                "state": CircuitState.CLOSED,
-                "failure_count": 0,
-                "last_failure_time": None,
-                "last_success_time": None,
-                "half_open_start_time": None,
-            }
+        self._state_store = state_store
+        self._probe_owner = f"{socket.gethostname()}:{os.getpid()}"
+        # Successes are frequent, so their time is only tracked per process
+        self._last_success_time: Optional[float] = None
+        self._known_services.add(service_name)
 
         logger.debug(
             "Initialized circuit breaker for %s",
@@ -98,13 +107,31 @@ class CircuitBreakerStrategy(RetryStrategy):
     @classmethod
     def has_state(cls, service_name: str) -> bool:
         """Return True if a circuit state entry exists for service_name."""
-        return service_name in cls._circuit_states
+        return (
+            service_name in cls._known_services
+            or get_circuit_state_store().get(service_name) is not None
+        )
+
+    @property
+    def state_store(self) -> CircuitStateStore:
+        """Store holding the state of this circuit."""
+        return self._state_store or get_circuit_state_store()
+
+    def _load_state(self) -> CircuitStateData:
+        return self.state_store.get(self.service_name) or default_circuit_state()
 
     def _force_open(self, service_name: str) -> None:
         """Force the circuit to OPEN immediately, bypassing the failure threshold."""
-        circuit_state = self._circuit_states[service_name]
-        circuit_state["state"] = CircuitState.OPEN
-        circuit_state["last_failure_time"] = time.time()
+        now = time.time()
+
+        def force_open(state: CircuitStateData) -> None:
+            state["state"] = CircuitState.OPEN.value
+            state["last_failure_time"] = now
+            state["half_open_start_time"] = None
+            state["probe_owner"] = None
+            state["probe_expires_at"] = None
+
+        self.state_store.update(service_name, force_open)
         logger.error(
             "Circuit breaker force-opened for %s due to quota error",
             service_name,
@@ -128,13 +155,13 @@ class CircuitBreakerStrategy(RetryStrategy):
             return False
 
         current_time = time.time()
-        circuit_state = self._circuit_states[self.service_name]
 
         # Update failure count and state
         self.record_failure(current_time)
 
         # Check circuit state
         state = self._get_current_state(current_time)
+        circuit_state = self._load_state()
 
         if state == CircuitState.OPEN:
             logger.warning(
@@ -155,8 +182,8 @@ class CircuitBreakerStrategy(RetryStrategy):
             )
 
         elif state == CircuitState.HALF_OPEN:
-            # Allow limited retries in half-open state
-            if attempt < 1:  # Only allow one retry attempt in half-open
+            # Allow one test request, made by the holder of the probe lease
+            if attempt < 1 and self._acquire_probe(current_time):
                 logger.info(
                     "Circuit breaker HALF_OPEN for %s - allowing test request",
                     self.service_name,
@@ -222,21 +249,61 @@ class CircuitBreakerStrategy(RetryStrategy):
             },
         )
 
+    def allow_request(self) -> None:
+        """
+        Check the circuit before calling the protected service.
+
+        Raises:
+            CircuitBreakerOpenError: If the circuit is OPEN, or HALF_OPEN while
+                another process holds the probe lease
+        """
+        current_time = time.time()
+        state = self._get_current_state(current_time)
+        if state == CircuitState.CLOSED:
+            return
+        if state == CircuitState.HALF_OPEN and self._acquire_probe(current_time):
+            logger.info(
+                "Circuit breaker HALF_OPEN for %s - probing recovery",
+                self.service_name,
+                extra={"service_name": self.service_name, "state": state.value},
+            )
+            return
+
+        circuit_state = self._load_state()
+        raise CircuitBreakerOpenError(
+            service_name=self.service_name,
+            failure_count=circuit_state["failure_count"],
+            last_failure_time=circuit_state["last_failure_time"],
+        )
+
     def record_success(self) -> None:
         """
         Record a successful operation to potentially close the circuit.
         """
-        current_time = time.time()
-        circuit_state = self._circuit_states[self.service_name]
+        self._last_success_time = time.time()
+        stored = self.state_store.get(self.service_name)
+        if stored is None or (
+            stored["failure_count"] == 0 and stored["state"] == CircuitState.CLOSED.value
+        ):
+            # Nothing to reset; skip the locked write on the hot path
+            return
+        recovered = False
+
+        def succeed(state: CircuitStateData) -> None:
+            nonlocal recovered
+            state["failure_count"] = 0  # Reset failure count on success
 
-        circuit_state["last_success_time"] = current_time
-        circuit_state["failure_count"] = 0  # Reset failure count on success
+            # If we were in half-open state, close the circuit
+            if state["state"] == CircuitState.HALF_OPEN.value:
+                state["state"] = CircuitState.CLOSED.value
+                state["half_open_start_time"] = None
+                state["probe_owner"] = None
+                state["probe_expires_at"] = None
+                recovered = True
 
-        # If we were in half-open state, close the circuit
-        if circuit_state["state"] == CircuitState.HALF_OPEN:
-            circuit_state["state"] = CircuitState.CLOSED
-            circuit_state["half_open_start_time"] = None
+        self.state_store.update(self.service_name, succeed)
 
+        if recovered:
             logger.info(
                 "Circuit breaker CLOSED for %s after successful recovery",
                 self.service_name,
@@ -248,18 +315,34 @@ class CircuitBreakerStrategy(RetryStrategy):
 
     def record_failure(self, current_time: float) -> None:
         """Record a failure and update circuit state."""
-        circuit_state = self._circuit_states[self.service_name]
+        opened = False
 
-        circuit_state["failure_count"] += 1
-        circuit_state["last_failure_time"] = current_time
+        def fail(state: CircuitStateData) -> None:
+            nonlocal opened
+            state["failure_count"] += 1
+            state["last_failure_time"] = current_time
 
-        # Check if we should open the circuit
-        if (
-            circuit_state["state"] == CircuitState.CLOSED
-            and circuit_state["failure_count"] >= self.failure_threshold
-        ):
-            circuit_state["state"] = CircuitState.OPEN
+            # Check if we should open the circuit
+            if (
+                state["state"] == CircuitState.CLOSED.value
+                and state["failure_count"] >= self.failure_threshold
+            ):
+                state["state"] = CircuitState.OPEN.value
+                opened = True
+            elif state["state"] == CircuitState.HALF_OPEN.value and state["probe_owner"] in (
+                None,
+                self._probe_owner,
+            ):
+                # The recovery probe failed
+                state["state"] = CircuitState.OPEN.value
+                state["half_open_start_time"] = None
+                state["probe_owner"] = None
+                state["probe_expires_at"] = None
+                opened = True
+
+        circuit_state = self.state_store.update(self.service_name, fail)
 
+        if opened:
             logger.error(
                 "Circuit breaker OPENED for %s after %s failures",
                 self.service_name,
@@ -272,10 +355,16 @@ class CircuitBreakerStrategy(RetryStrategy):
                 },
             )
 
+    def _acquire_probe(self, current_time: float) -> bool:
+        """Claim the probe lease of a HALF_OPEN circuit."""
+        return self.state_store.try_acquire_probe(
+            self.service_name, self._probe_owner, self.half_open_timeout, current_time
+        )
+
     def _get_current_state(self, current_time: float) -> CircuitState:
         """Get the current circuit state, handling state transitions."""
-        circuit_state = self._circuit_states[self.service_name]
-        current_state = circuit_state["state"]
+        circuit_state = self._load_state()
+        current_state = CircuitState(circuit_state["state"])
 
         if current_state == CircuitState.OPEN:
             # Check if we should transition to half-open
@@ -283,20 +372,28 @@ class CircuitBreakerStrategy(RetryStrategy):
                 circuit_state["last_failure_time"]
                 and current_time - circuit_state["last_failure_time"] >= self.reset_timeout
             ):
-                circuit_state["state"] = CircuitState.HALF_OPEN
-                circuit_state["half_open_start_time"] = current_time
 
-                logger.info(
-                    "Circuit breaker transitioning to HALF_OPEN for %s",
-                    self.service_name,
-                    extra={
-                        "service_name": self.service_name,
-                        "state": CircuitState.HALF_OPEN.value,
-                        "reset_timeout": self.reset_timeout,
-                    },
-                )
-
-                return CircuitState.HALF_OPEN
+                def half_open(state: CircuitStateData) -> None:
+                    # Another process may have moved the circuit on since it was read
+                    if state["state"] == CircuitState.OPEN.value:
+                        state["state"] = CircuitState.HALF_OPEN.value
+                        state["half_open_start_time"] = current_time
+                        state["probe_owner"] = None
+                        state["probe_expires_at"] = None
+
+                circuit_state = self.state_store.update(self.service_name, half_open)
+
+                if circuit_state["state"] == CircuitState.HALF_OPEN.value:
+                    logger.info(
+                        "Circuit breaker transitioning to HALF_OPEN for %s",
+                        self.service_name,
+                        extra={
+                            "service_name": self.service_name,
+                            "state": CircuitState.HALF_OPEN.value,
+                            "reset_timeout": self.reset_timeout,
+                        },
+                    )
+                return CircuitState(circuit_state["state"])
 
         elif current_state == CircuitState.HALF_OPEN:
             # Check if we should timeout back to open
@@ -304,8 +401,15 @@ class CircuitBreakerStrategy(RetryStrategy):
                 circuit_state["half_open_start_time"]
                 and current_time - circuit_state["half_open_start_time"] >= self.half_open_timeout
             ):
-                circuit_state["state"] = CircuitState.OPEN
-                circuit_state["half_open_start_time"] = None
+
+                def reopen(state: CircuitStateData) -> None:
+                    if state["state"] == CircuitState.HALF_OPEN.value:
+                        state["state"] = CircuitState.OPEN.value
+                        state["half_open_start_time"] = None
+                        state["probe_owner"] = None
+                        state["probe_expires_at"] = None
+
+                circuit_state = self.state_store.update(self.service_name, reopen)
 
                 logger.warning(
                     "Circuit breaker timeout in HALF_OPEN, returning to OPEN for %s",
@@ -317,7 +421,7 @@ class CircuitBreakerStrategy(RetryStrategy):
                     },
                 )
 
-                return CircuitState.OPEN
+                return CircuitState(circuit_state["state"])
 
         return current_state
 
@@ -382,7 +486,7 @@ class CircuitBreakerStrategy(RetryStrategy):
         """
         current_time = time.time()
         state = self._get_current_state(current_time)
-        circuit_state = self._circuit_states[self.service_name]
+        circuit_state = self._load_state()
 
         return {
             "service_name": self.service_name,
@@ -390,7 +494,7 @@ class CircuitBreakerStrategy(RetryStrategy):
             "failure_count": circuit_state["failure_count"],
             "failure_threshold": self.failure_threshold,
             "last_failure_time": circuit_state["last_failure_time"],
-            "last_success_time": circuit_state["last_success_time"],
+            "last_success_time": self._last_success_time,
             "reset_timeout": self.reset_timeout,
             "half_open_timeout": self.half_open_timeout,
         }
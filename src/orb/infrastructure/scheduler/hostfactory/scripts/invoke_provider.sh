@@ -71,6 +71,25 @@ fi
 HF_LOGGING_CONSOLE_ENABLED=${HF_LOGGING_CONSOLE_ENABLED:-false}
 export HF_LOGGING_CONSOLE_ENABLED
 
+# Resident daemon (opt-in): when ORB_DAEMON_SOCKET points at the socket of a running
+# `orb system daemon`, forward the call to it instead of starting a new orb process.
+# The client only uses the standard library, so any python3 can run it. It exits with
+# 75 without printing anything when the daemon is not reachable or declines the
+# command, in which case the command runs in a fresh process below.
+if [ -n "${ORB_DAEMON_SOCKET}" ] && [ -S "${ORB_DAEMON_SOCKET}" ]; then
+    DAEMON_CLIENT=${ORB_DAEMON_CLIENT:-"${PROJECT_ROOT}/${PACKAGE_ROOT}/cli/daemon_client.py"}
+    if [ ! -f "$DAEMON_CLIENT" ]; then
+        DAEMON_CLIENT=$("$PYTHON_CMD" -c "import importlib.util, os; print(os.path.join(os.path.dirname(importlib.util.find_spec('orb').origin), 'cli', 'daemon_client.py'))" 2>/dev/null)
+    fi
+    if [ -n "$DAEMON_CLIENT" ] && [ -f "$DAEMON_CLIENT" ]; then
+        "$PYTHON_CMD" "$DAEMON_CLIENT" "$@" 2>&1 | tee -a "$SCRIPTS_LOG_FILE"
+        DAEMON_STATUS=${PIPESTATUS[0]}
+        if [ "$DAEMON_STATUS" -ne 75 ]; then
+            exit "$DAEMON_STATUS"
+        fi
+    fi
+fi
+
 # Determine execution mode
 if [ "$USE_LOCAL_DEV" = "true" ] || [ "$USE_LOCAL_DEV" = "1" ]; then
     # Local development mode - use python -m orb from project root
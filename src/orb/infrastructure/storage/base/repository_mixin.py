@@ -2,6 +2,8 @@
 
 from typing import Any, Optional, Protocol, runtime_checkable
 
+from orb.domain.base.query_spec import QueryResult, QuerySpec
+
 
 @runtime_checkable
 class StorageBackend(Protocol):
@@ -48,11 +50,22 @@ class StorageRepositoryMixin:
             return self._deserialize(data)
         return None
 
+    def _load_by_ids(self, entity_ids: list[str]) -> list[Any]:
+        """Fetch several entities by ID and deserialize them, in request order."""
+        found = self._get_storage().find_by_ids(entity_ids)
+        return [
+            self._deserialize(found[entity_id]) for entity_id in entity_ids if entity_id in found
+        ]
+
     def _load_by_criteria(self, criteria: dict[str, Any]) -> list[Any]:
         """Fetch entities matching criteria and deserialize them."""
         data_list = self._get_storage().find_by_criteria(criteria)
         return [self._deserialize(data) for data in data_list]
 
+    def _load_page(self, spec: QuerySpec) -> QueryResult[Any]:
+        """Fetch one page of entities matching a query spec and deserialize them."""
+        return self._get_storage().query(spec).map(self._deserialize)
+
     def _load_all(self) -> list[Any]:
         """Fetch all entities and deserialize them."""
         all_data = self._get_storage().find_all()
@@ -1,15 +1,97 @@
 """Storage strategy interfaces and base implementations."""
 
+import operator
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime, timezone
 from types import TracebackType
 from typing import Any, Generic, Optional, TypeVar, Union
 
 from orb.domain.base.ports.storage_port import StoragePort
+from orb.domain.base.query_spec import QueryResult, QuerySpec, decode_cursor, encode_cursor
 from orb.infrastructure.logging.logger import get_logger
 from orb.infrastructure.storage.exceptions import StorageError
 
 T = TypeVar("T")  # Entity type
 
+logger = get_logger(__name__)
+
+# Range operators accepted in criteria values, e.g. {"created_at": {"$gte": a, "$lte": b}}
+RANGE_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+}
+
+
+def is_range_condition(value: Any) -> bool:
+    """Check whether a criteria value is a range condition."""
+    return isinstance(value, dict) and bool(value) and all(k in RANGE_OPERATORS for k in value)
+
+
+def _to_utc_datetime(value: Any) -> Optional[datetime]:
+    """Convert a datetime or ISO 8601 string to an aware UTC datetime."""
+    if isinstance(value, str):
+        try:
+            # fromisoformat only accepts a "Z" suffix from Python 3.11
+            value = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def matches_range(actual: Any, condition: dict[str, Any]) -> bool:
+    """
+    Check a value against a range condition.
+
+    Values that cannot be compared with the bounds (e.g. None) never match.
+    Against datetime bounds, stored datetimes and ISO 8601 strings are
+    compared as instants, so values written with any UTC offset match exactly.
+    """
+    if any(isinstance(bound, datetime) for bound in condition.values()):
+        instant = _to_utc_datetime(actual)
+        if instant is None:
+            if actual is not None:
+                logger.warning("Ignoring unparseable timestamp %r in range criteria", actual)
+            return False
+        actual = instant
+        condition = {
+            op: _to_utc_datetime(bound) if isinstance(bound, datetime) else bound
+            for op, bound in condition.items()
+        }
+    try:
+        return all(RANGE_OPERATORS[op](actual, bound) for op, bound in condition.items())
+    except TypeError:
+        return False
+
+
+def matches_condition(entity: Optional[dict[str, Any]], condition: dict[str, Any]) -> bool:
+    """
+    Check a stored entity against the condition of a conditional write.
+
+    A None value requires the field to be missing or None, a range condition
+    is checked with ``matches_range`` and any other value must be equal.
+    """
+    if entity is None:
+        return False
+    for field, expected in condition.items():
+        actual = entity.get(field)
+        if expected is None:
+            if actual is not None:
+                return False
+        elif is_range_condition(expected):
+            if not matches_range(actual, expected):
+                return False
+        elif actual != expected:
+            return False
+    return True
+
 
 class StorageStrategy(StoragePort[T], ABC, Generic[T]):
     """Interface for storage strategies implementing StoragePort."""
@@ -363,6 +445,51 @@ class BaseStorageStrategy(StorageStrategy[T], Generic[T]):
         except Exception as e:
             raise StorageError(f"Error deleting batch: {e!s}")
 
+    def find_by_ids(self, entity_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Find several entities by ID.
+
+        Backends able to fetch many keys in one round trip should override
+        this; the default looks entities up one by one.
+
+        Args:
+            entity_ids: Entity identifiers
+
+        Returns:
+            Found entities keyed by ID; missing IDs are omitted
+        """
+        entities = {}
+        for entity_id in dict.fromkeys(entity_ids):
+            entity_data = self.find_by_id(entity_id)
+            if entity_data:
+                entities[entity_id] = entity_data
+        return entities
+
+    def save_if(
+        self, entity_id: str, data: dict[str, Any], condition: Optional[dict[str, Any]]
+    ) -> bool:
+        """
+        Save entity data only if the stored entity still matches ``condition``.
+
+        The check and the write are one atomic step for every process sharing
+        the storage, so concurrent writers cannot both succeed against the
+        same stored state.
+
+        Args:
+            entity_id: Entity ID
+            data: Entity data
+            condition: Field conditions the stored entity must match (see
+                ``matches_condition``), or None to write only if the entity
+                does not exist yet
+
+        Returns:
+            True if the entity was written, False if the condition did not hold
+
+        Raises:
+            StorageError: If the backend has no conditional write or the write fails
+        """
+        raise StorageError(f"{type(self).__name__} does not support conditional writes")
+
     def _get_entity_id_from_dict(self, data: dict[str, Any]) -> str:
         """
         Get entity ID from dictionary.
@@ -398,6 +525,31 @@ class BaseStorageStrategy(StorageStrategy[T], Generic[T]):
             return len(all_entities)
         return len(all_entities)
 
+    def count_by_group(
+        self, group_by: str, criteria: Optional[dict[str, Any]] = None
+    ) -> dict[Any, int]:
+        """
+        Count entities matching criteria, grouped by a field value.
+
+        Backends able to aggregate natively should override this so that
+        entities are not loaded just to be counted.
+
+        Args:
+            group_by: Field whose values form the groups
+            criteria: Optional filter criteria
+
+        Returns:
+            Mapping of field value to number of matching entities
+        """
+        if criteria:
+            entities = self.find_by_criteria(criteria)
+        else:
+            all_entities = self.find_all()
+            entities = (
+                list(all_entities.values()) if isinstance(all_entities, dict) else all_entities
+            )
+        return dict(Counter(entity.get(group_by) for entity in entities))
+
     def find_by_criteria(self, criteria: dict[str, Any]) -> list[dict[str, Any]]:
         """
         Find entities by criteria.
@@ -425,6 +577,75 @@ class BaseStorageStrategy(StorageStrategy[T], Generic[T]):
 
         return matching_entities
 
+    def query(self, spec: QuerySpec) -> QueryResult[dict[str, Any]]:
+        """
+        Find one page of entities matching a query spec.
+
+        The default narrows entities with ``find_by_criteria`` (so backends
+        answering criteria from an index benefit) and applies filters,
+        ordering and pagination in memory. Backends able to evaluate more of
+        the spec natively should override this.
+
+        Args:
+            spec: Predicates, ordering and page to return
+
+        Returns:
+            The requested page and the number of entities matching the spec
+        """
+        if spec.criteria:
+            entities = self.find_by_criteria(spec.criteria)
+        else:
+            all_entities = self.find_all()
+            entities = (
+                list(all_entities.values()) if isinstance(all_entities, dict) else all_entities
+            )
+        return self._paginate(entities, spec)
+
+    def _paginate(
+        self, entities: list[dict[str, Any]], spec: QuerySpec
+    ) -> QueryResult[dict[str, Any]]:
+        """Filter, order and slice entities already matching the spec criteria."""
+        if spec.filters:
+            entities = [e for e in entities if all(f.matches(e) for f in spec.filters)]
+        keyed = sorted(
+            (
+                (self._sort_key(e.get(spec.sort_by) if spec.sort_by else None, e), e)
+                for e in entities
+            ),
+            key=lambda pair: pair[0],
+            reverse=spec.descending,
+        )
+        total_count = len(keyed)
+
+        if spec.after:
+            sort_value, entity_id = decode_cursor(spec.after)
+            boundary = (sort_value is None, "" if sort_value is None else sort_value, entity_id)
+            keyed = [
+                pair
+                for pair in keyed
+                if (pair[0] < boundary if spec.descending else pair[0] > boundary)
+            ]
+
+        end = None if spec.limit is None else spec.offset + spec.limit
+        page = keyed[spec.offset : end]
+        next_cursor = None
+        if end is not None and end < len(keyed) and page:
+            last_key = page[-1][0]
+            next_cursor = encode_cursor(None if last_key[0] else last_key[1], last_key[2])
+        return QueryResult(
+            items=[entity for _, entity in page],
+            total_count=total_count,
+            next_cursor=next_cursor,
+        )
+
+    def _sort_key(self, value: Any, entity_data: dict[str, Any]) -> tuple[bool, Any, str]:
+        # Missing values sort last; the entity ID keeps the order total for cursors
+        return (
+            value is None,
+            "" if value is None else value,
+            self._get_entity_id_from_dict(entity_data),
+        )
+
     def _matches_criteria(self, entity_data: dict[str, Any], criteria: dict[str, Any]) -> bool:
         """
         Check if entity matches criteria.
@@ -448,6 +669,14 @@ class BaseStorageStrategy(StorageStrategy[T], Generic[T]):
 
                 if parts[-1] not in current or current[parts[-1]] != value:
                     return False
+            # Handle membership conditions
+            elif isinstance(value, dict) and "$in" in value:
+                if entity_data.get(field) not in value["$in"]:
+                    return False
+            # Handle range conditions
+            elif is_range_condition(value):
+                if field not in entity_data or not matches_range(entity_data[field], value):
+                    return False
             # Handle list fields
             elif isinstance(entity_data.get(field), list) and not isinstance(value, list):
                 if value not in entity_data.get(field, []):
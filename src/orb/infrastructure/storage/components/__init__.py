@@ -1,7 +1,10 @@
 """Storage strategy components package with consistent naming."""
 
+from typing import TYPE_CHECKING
+
 # Base interfaces
 # Repository components (extracted from repositories)
+from .document_cache import DocumentCache, get_document_cache, reset_document_cache
 from .entity_cache import EntityCache, MemoryEntityCache, NoOpEntityCache
 from .entity_serializer import BaseEntitySerializer, EntitySerializer
 from .event_publisher import (
@@ -11,16 +14,12 @@ from .event_publisher import (
     NoOpEventPublisher,
 )
 from .file_manager import FileManager
+from .journal_manager import JournalManager
 
 # Generic components (truly reusable across storage types)
 from .lock_manager import LockManager, ReaderWriterLock
 from .resource_manager import DataConverter, QueryManager, StorageResourceManager
 from .serialization_manager import JSONSerializer, SerializationManager
-
-# SQL-specific components (clearly prefixed)
-from .sql_connection_manager import SQLConnectionManager
-from .sql_query_builder import SQLQueryBuilder
-from .sql_serializer import SQLSerializer
 from .transaction_manager import (
     MemoryTransactionManager,
     NoOpTransactionManager,
@@ -28,16 +27,31 @@ from .transaction_manager import (
 )
 from .version_manager import MemoryVersionManager, NoOpVersionManager, VersionManager
 
+if TYPE_CHECKING:
+    from .sql_connection_manager import SQLConnectionManager
+    from .sql_query_builder import SQLQueryBuilder
+    from .sql_serializer import SQLSerializer
+
+# SQL-specific components (clearly prefixed) are imported on first access so
+# that JSON and DynamoDB deployments do not load SQLAlchemy.
+_LAZY_EXPORTS = {
+    "SQLConnectionManager": ".sql_connection_manager",
+    "SQLQueryBuilder": ".sql_query_builder",
+    "SQLSerializer": ".sql_serializer",
+}
+
 __all__: list[str] = [
     # Repository components
     "BaseEntitySerializer",
     "DataConverter",
+    "DocumentCache",
     "EntityCache",
     "EntitySerializer",
     "EventPublisher",
     "FileManager",
     "InMemoryEventPublisher",
     "JSONSerializer",
+    "JournalManager",
     # Generic components
     "LockManager",
     "LoggingEventPublisher",
@@ -58,4 +72,18 @@ __all__: list[str] = [
     "StorageResourceManager",
     "TransactionManager",
     "VersionManager",
+    "get_document_cache",
+    "reset_document_cache",
 ]
+
+
+def __getattr__(name: str):
+    """Import SQL components on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
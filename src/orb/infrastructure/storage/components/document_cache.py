@@ -0,0 +1,176 @@
+"""Process-wide cache of parsed storage documents validated against the file on disk."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Optional, TypeVar
+
+from orb.infrastructure.logging.logger import get_logger
+from orb.infrastructure.storage.components.file_manager import FileSignature
+
+D = TypeVar("D")
+
+
+@dataclass
+class _CacheEntry:
+    signature: FileSignature
+    document: Any
+    # name -> (source object the artifact was built from, artifact)
+    derived: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+
+class DocumentCache:
+    """
+    Parsed-document cache keyed by file path.
+
+    Each entry remembers the (mtime_ns, size, inode) signature of the file
+    version it was parsed from and is only served while the file still has
+    that signature. Atomic replaces (ours or another process's) change the
+    inode, so any write to the file invalidates the entry without any
+    cross-process coordination.
+
+    Cached documents are shared between callers and must be treated as
+    read-only; writers build a new document and ``put`` it. Artifacts derived
+    from a document (e.g. secondary indexes) can be cached alongside it and
+    are dropped together with it.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        """
+        Initialize document cache.
+
+        Args:
+            max_entries: Maximum number of files kept (least recently used evicted)
+        """
+        self.max_entries = max_entries
+        self.logger = get_logger(__name__)
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, path: str, signature: Optional[FileSignature]) -> Optional[Any]:
+        """
+        Get the cached document for a file if it is still current.
+
+        Args:
+            path: File path
+            signature: Current signature of the file, None if it doesn't exist
+
+        Returns:
+            Cached document, None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or signature is None:
+                self._misses += 1
+                return None
+            if entry.signature != signature:
+                del self._entries[path]
+                self._misses += 1
+                self._invalidations += 1
+                return None
+            self._entries.move_to_end(path)
+            self._hits += 1
+            return entry.document
+
+    def put(self, path: str, signature: Optional[FileSignature], document: Any) -> None:
+        """
+        Cache a parsed document for a file version.
+
+        Args:
+            path: File path
+            signature: Signature of the file version the document represents
+            document: Parsed document
+        """
+        with self._lock:
+            if signature is None:
+                self._entries.pop(path, None)
+                return
+            self._entries[path] = _CacheEntry(signature, document)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_derived(self, path: str, name: str, source: Any, factory: Callable[[], D]) -> D:
+        """
+        Get an artifact derived from (part of) a cached document.
+
+        The artifact is built once per source object, so it is rebuilt only
+        after the document has been replaced. Nothing is kept for files that
+        are not cached.
+
+        Args:
+            path: File path of the document
+            name: Artifact name
+            source: Object the artifact is derived from (compared by identity)
+            factory: Builds the artifact from ``source``
+
+        Returns:
+            Cached or newly built artifact
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                cached = entry.derived.get(name)
+                if cached is not None and cached[0] is source:
+                    return cached[1]
+
+        artifact = factory()
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                entry.derived[name] = (source, artifact)
+        return artifact
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop one cached file, or all of them.
+
+        Args:
+            path: File path, None to clear the cache
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            elif self._entries.pop(path, None) is not None:
+                self._invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+_document_cache: Optional[DocumentCache] = None
+_document_cache_lock = threading.Lock()
+
+
+def get_document_cache() -> DocumentCache:
+    """Get the process-wide document cache (thread-safe singleton)."""
+    global _document_cache
+
+    if _document_cache is None:
+        with _document_cache_lock:
+            if _document_cache is None:
+                _document_cache = DocumentCache()
+
+    return _document_cache
+
+
+def reset_document_cache() -> None:
+    """Drop the process-wide document cache (for tests)."""
+    global _document_cache
+    with _document_cache_lock:
+        _document_cache = None
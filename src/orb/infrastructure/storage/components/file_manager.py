@@ -10,6 +10,13 @@ from typing import Optional
 
 from orb.infrastructure.logging.logger import get_logger
 
+# (st_mtime_ns, st_size, st_ino) identifying one version of a file on disk
+FileSignature = tuple[int, int, int]
+
+
+def _signature_from_stat(stat: os.stat_result) -> FileSignature:
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
 
 class FileManager:
     """
@@ -71,26 +78,69 @@ class FileManager:
             self.logger.error("Failed to read file %s: %s", self.file_path, e)
             raise
 
-    def write_file(self, content: str) -> None:
+    def read_file_with_signature(self) -> tuple[str, Optional[FileSignature]]:
+        """
+        Read file content together with the signature of the version read.
+
+        The signature is taken from the open file descriptor, so it always
+        describes the content returned even if the file is replaced meanwhile.
+
+        Returns:
+            Tuple of (content, signature); ("", None) if the file doesn't exist
+        """
+        try:
+            with open(self.file_path, encoding="utf-8") as f:
+                signature = _signature_from_stat(os.fstat(f.fileno()))
+                content = f.read()
+        except FileNotFoundError:
+            self.logger.debug("File does not exist: %s", self.file_path)
+            return "", None
+        except Exception as e:
+            self.logger.error("Failed to read file %s: %s", self.file_path, e)
+            raise
+
+        self.logger.debug("Read %s characters from %s", len(content), self.file_path)
+        return content, signature
+
+    def get_signature(self) -> Optional[FileSignature]:
+        """
+        Get the (mtime_ns, size, inode) signature of the file.
+
+        Returns:
+            Signature tuple, None if the file doesn't exist
+        """
+        try:
+            return _signature_from_stat(os.stat(self.file_path))
+        except FileNotFoundError:
+            return None
+
+    def write_file(self, content: str) -> Optional[FileSignature]:
         """
         Write content to file atomically.
 
         Args:
             content: Content to write
+
+        Returns:
+            Signature of the written file version
         """
         try:
-            self._atomic_write(content)
+            signature = self._atomic_write(content)
             self.logger.debug("Wrote %s characters to %s", len(content), self.file_path)
+            return signature
         except Exception as e:
             self.logger.error("Failed to write file %s: %s", self.file_path, e)
             raise
 
-    def _atomic_write(self, content: str) -> None:
+    def _atomic_write(self, content: str) -> Optional[FileSignature]:
         """
         Perform atomic write operation using temporary file.
 
         Args:
             content: Content to write
+
+        Returns:
+            Signature of the written file, None where rename may not preserve it
         """
         # Create temporary file in same directory
         temp_dir = self.file_path.parent
@@ -105,6 +155,8 @@ class FileManager:
             temp_file.write(content)
             temp_file.flush()
             os.fsync(temp_file.fileno())  # Force write to disk
+            # rename() keeps inode and mtime, so this is the published version
+            signature = _signature_from_stat(os.fstat(temp_file.fileno()))
 
         try:
             # Atomic move (rename) on most filesystems
@@ -118,6 +170,8 @@ class FileManager:
                 temp_path.unlink()
             raise
 
+        return signature if os.name != "nt" else None
+
     def create_backup(self) -> Optional[str]:
         """
         Create backup of current file.
@@ -0,0 +1,165 @@
+"""Write-ahead journal component for append-only JSON storage."""
+
+import json
+import os
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+from filelock import FileLock
+
+from orb.infrastructure.logging.logger import get_logger
+
+JOURNAL_OP_PUT = "put"
+JOURNAL_OP_DELETE = "delete"
+
+
+class JournalManager:
+    """
+    Append-only journal of per-entity change records.
+
+    Records are stored as JSON Lines next to the snapshot file. Appends and
+    rotation are serialised across processes with a file lock, and readers
+    consume the journal incrementally from a byte offset. A torn final line
+    (crash mid-append) is ignored until it is completed or rotated away.
+    """
+
+    def __init__(self, journal_path: str) -> None:
+        """
+        Initialize journal manager.
+
+        Args:
+            journal_path: Path to the journal file
+        """
+        self.journal_path = Path(journal_path)
+        self.previous_path = self.journal_path.with_name(f"{self.journal_path.name}.prev")
+        self.lock_path = self.journal_path.with_name(f"{self.journal_path.name}.lock")
+        self.logger = get_logger(__name__)
+        self._file_lock = FileLock(str(self.lock_path))
+
+    @contextmanager
+    def lock(self) -> Generator[None, None, None]:
+        """Hold the cross-process journal lock (re-entrant within a process)."""
+        with self._file_lock:
+            yield
+
+    def identity(self) -> Optional[tuple[int, int]]:
+        """
+        Get the (device, inode) identity of the journal file.
+
+        Returns:
+            Identity tuple, None if the journal does not exist
+        """
+        try:
+            stat = self.journal_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    def size(self) -> int:
+        """Get journal size in bytes (0 if missing)."""
+        try:
+            return self.journal_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def append(self, records: list[dict[str, Any]]) -> int:
+        """
+        Append records durably to the journal.
+
+        Callers are expected to hold ``lock()``.
+
+        Args:
+            records: Change records to append
+
+        Returns:
+            Journal size in bytes after the append
+        """
+        if not records:
+            return self.size()
+
+        payload = "".join(
+            json.dumps(record, default=str, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        )
+        with open(self.journal_path, "a", encoding="utf-8") as journal_file:
+            journal_file.write(payload)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+            end_offset = journal_file.tell()
+
+        self.logger.debug("Appended %s records to %s", len(records), self.journal_path)
+        return end_offset
+
+    def read_from(self, offset: int = 0) -> tuple[list[dict[str, Any]], int]:
+        """
+        Read complete records starting at a byte offset.
+
+        Args:
+            offset: Byte offset to start reading from
+
+        Returns:
+            Tuple of (records, offset just past the last complete record)
+        """
+        return self._read_records(self.journal_path, offset)
+
+    def read_previous(self) -> list[dict[str, Any]]:
+        """Read the journal segment retired by the last rotation (used for recovery)."""
+        records, _ = self._read_records(self.previous_path, 0)
+        return records
+
+    def rotate(self) -> None:
+        """
+        Retire the current journal after its records have been compacted.
+
+        The retired segment is kept as ``<journal>.prev`` so a snapshot
+        restored from backup can be rolled forward. Callers must hold ``lock()``.
+        """
+        if self.journal_path.exists():
+            self.journal_path.replace(self.previous_path)
+        self.journal_path.touch()
+        self.logger.debug("Rotated journal %s", self.journal_path)
+
+    def _read_records(self, path: Path, offset: int) -> tuple[list[dict[str, Any]], int]:
+        try:
+            with open(path, "rb") as journal_file:
+                journal_file.seek(offset)
+                chunk = journal_file.read()
+        except FileNotFoundError:
+            return [], 0
+
+        records: list[dict[str, Any]] = []
+        consumed = 0
+        for line in chunk.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                # Torn write in progress; stop before it
+                break
+            consumed += len(line)
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                records.append(json.loads(stripped))
+            except json.JSONDecodeError as e:
+                self.logger.warning("Skipping corrupt journal record in %s: %s", path, e)
+
+        return records, offset + consumed
+
+
+def apply_journal_records(state: dict[str, Any], records: list[dict[str, Any]]) -> None:
+    """
+    Apply change records to an in-memory entity map.
+
+    Args:
+        state: Entity map keyed by entity id (mutated in place)
+        records: Records produced by ``JournalManager``
+    """
+    for record in records:
+        entity_id = record.get("id")
+        if entity_id is None:
+            continue
+        if record.get("op") == JOURNAL_OP_DELETE:
+            state.pop(entity_id, None)
+        else:
+            state[entity_id] = record.get("data")
@@ -0,0 +1,156 @@
+"""In-memory secondary indexes for criteria lookups in file-based storage."""
+
+from collections.abc import Iterable, Mapping
+from typing import Any, Optional
+
+# Fields the repositories filter on, per entity type (storage section name)
+DEFAULT_INDEXED_FIELDS: dict[str, tuple[str, ...]] = {
+    "machines": ("request_id", "return_request_id", "status", "template_id"),
+    "requests": ("status", "template_id", "request_type"),
+}
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class SecondaryIndex:
+    """
+    Hash indexes from field value to entity IDs.
+
+    Answers equality and ``$in`` criteria on indexed fields with the IDs of
+    candidate entities, so criteria queries cost O(matches) instead of a full
+    scan. Candidates are a superset of the matches for the indexed conditions
+    only; callers still apply the full criteria to each candidate.
+
+    Entities whose value for a field is unhashable cannot be bucketed; they
+    are returned as candidates for every lookup on that field.
+    """
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        """
+        Initialize empty indexes.
+
+        Args:
+            fields: Entity fields to index
+        """
+        self.fields = tuple(fields)
+        # Buckets are dicts used as insertion-ordered sets
+        self._buckets: dict[str, dict[Any, dict[str, None]]] = {f: {} for f in self.fields}
+        self._unhashable: dict[str, dict[str, None]] = {f: {} for f in self.fields}
+
+    @classmethod
+    def build(
+        cls, fields: Iterable[str], entities: Mapping[str, Mapping[str, Any]]
+    ) -> "SecondaryIndex":
+        """
+        Build indexes over existing entities.
+
+        Args:
+            fields: Entity fields to index
+            entities: Entities keyed by ID
+
+        Returns:
+            Populated index
+        """
+        index = cls(fields)
+        for entity_id, data in entities.items():
+            index.add(entity_id, data)
+        return index
+
+    def add(self, entity_id: str, data: Optional[Mapping[str, Any]]) -> None:
+        """Index an entity."""
+        if not data:
+            return
+        for field in self.fields:
+            if field not in data:
+                continue
+            value = data[field]
+            if _is_hashable(value):
+                self._buckets[field].setdefault(value, {})[entity_id] = None
+            else:
+                self._unhashable[field][entity_id] = None
+
+    def remove(self, entity_id: str, data: Optional[Mapping[str, Any]]) -> None:
+        """Remove an entity, given the data it was indexed with."""
+        if not data:
+            return
+        for field in self.fields:
+            if field not in data:
+                continue
+            value = data[field]
+            if not _is_hashable(value):
+                self._unhashable[field].pop(entity_id, None)
+                continue
+            bucket = self._buckets[field].get(value)
+            if bucket is not None:
+                bucket.pop(entity_id, None)
+                if not bucket:
+                    del self._buckets[field][value]
+
+    def update(
+        self,
+        entity_id: str,
+        old_data: Optional[Mapping[str, Any]],
+        new_data: Optional[Mapping[str, Any]],
+    ) -> None:
+        """Re-index an entity after a save (new_data) or delete (new_data None)."""
+        self.remove(entity_id, old_data)
+        self.add(entity_id, new_data)
+
+    def copy(self) -> "SecondaryIndex":
+        """Get an independent copy of the index."""
+        clone = SecondaryIndex(self.fields)
+        clone._buckets = {
+            field: {value: dict(ids) for value, ids in buckets.items()}
+            for field, buckets in self._buckets.items()
+        }
+        clone._unhashable = {field: dict(ids) for field, ids in self._unhashable.items()}
+        return clone
+
+    def candidates(self, criteria: Mapping[str, Any]) -> Optional[list[str]]:
+        """
+        Get candidate entity IDs for criteria.
+
+        Args:
+            criteria: Criteria in the storage strategy format
+
+        Returns:
+            Candidate IDs, None if no condition can be answered from the index
+        """
+        matches: list[dict[str, None]] = []
+        for field, expected in criteria.items():
+            if field not in self._buckets:
+                continue
+            ids = self._lookup(field, expected)
+            if ids is not None:
+                matches.append(ids)
+
+        if not matches:
+            return None
+
+        matches.sort(key=len)
+        smallest, rest = matches[0], matches[1:]
+        return [entity_id for entity_id in smallest if all(entity_id in ids for ids in rest)]
+
+    def _lookup(self, field: str, expected: Any) -> Optional[dict[str, None]]:
+        if isinstance(expected, dict):
+            values = expected.get("$in")
+            if not isinstance(values, (list, tuple, set, frozenset)):
+                return None
+        else:
+            values = [expected]
+
+        if not all(_is_hashable(value) for value in values):
+            return None
+
+        buckets = self._buckets[field]
+        ids: dict[str, None] = {}
+        for value in values:
+            ids.update(buckets.get(value, {}))
+        ids.update(self._unhashable[field])
+        return ids
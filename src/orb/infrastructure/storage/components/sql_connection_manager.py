@@ -17,17 +17,24 @@ class SQLConnectionManager(ResourceManager):
     Handles database connections, connection pooling, and session management.
     """
 
-    def __init__(self, config: dict[str, Any]) -> None:
+    def __init__(self, config: dict[str, Any], engine: Optional[Engine] = None) -> None:
         """
         Initialize SQL connection manager.
 
         Args:
             config: Database configuration
+            engine: Optional pre-built engine to share instead of creating one.
+                A shared engine is owned by its creator and is not disposed
+                by ``cleanup()``.
         """
         super().__init__()
         self.config = config
-        self.engine: Optional[Engine] = None
+        self.engine: Optional[Engine] = engine
         self.session_factory: Optional[sessionmaker] = None
+        self._owns_engine = engine is None
+
+        if engine is not None and "type" not in self.config:
+            self.config = {**config, "type": engine.url.get_backend_name()}
 
         self.initialize()
 
@@ -36,12 +43,15 @@ class SQLConnectionManager(ResourceManager):
         if self._initialized:
             return
 
-        self._initialize_engine()
+        if self.engine is not None:
+            self.session_factory = sessionmaker(bind=self.engine)
+        else:
+            self._initialize_engine()
         self._initialized = True
 
     def cleanup(self) -> None:
-        """Close all connections and dispose engine."""
-        if self.engine:
+        """Close all connections and dispose engine (only if owned)."""
+        if self.engine and self._owns_engine:
             self.engine.dispose()
             self.logger.debug("SQL connection manager cleaned up")
         self._initialized = False
@@ -69,16 +79,42 @@ class SQLConnectionManager(ResourceManager):
         }
 
         if self.engine:
-            info.update(
-                {
-                    "pool_size": getattr(self.engine.pool, "size", "N/A"),
-                    "checked_out_connections": getattr(self.engine.pool, "checkedout", "N/A"),
-                    "overflow_connections": getattr(self.engine.pool, "overflow", "N/A"),
-                }
-            )
+            info.update(self.get_pool_stats())
 
         return info
 
+    def get_pool_stats(self) -> dict[str, Any]:
+        """
+        Get connection pool statistics for monitoring.
+
+        Pool implementations without a given counter (e.g. ``StaticPool`` or
+        ``NullPool``) report ``"N/A"`` for it.
+
+        Returns:
+            Dictionary of pool counters
+        """
+        if not self.engine:
+            return {}
+
+        pool = self.engine.pool
+
+        def _counter(name: str) -> Any:
+            method = getattr(pool, name, None)
+            if not callable(method):
+                return "N/A"
+            try:
+                return method()
+            except Exception:
+                return "N/A"
+
+        return {
+            "pool_class": type(pool).__name__,
+            "pool_size": _counter("size"),
+            "checked_in_connections": _counter("checkedin"),
+            "checked_out_connections": _counter("checkedout"),
+            "overflow_connections": _counter("overflow"),
+        }
+
     def _initialize_engine(self) -> None:
         """Initialize SQLAlchemy engine with connection pooling."""
         try:
@@ -1,11 +1,36 @@
 """SQL query builder components for database operations."""
 
 import re
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+from orb.domain.base.query_spec import QuerySpec, decode_cursor
+from orb.domain.services.filter_service import FilterOperator
+from orb.domain.services.generic_filter_service import GenericFilter
 from orb.infrastructure.logging.logger import get_logger
 from orb.infrastructure.storage.components.resource_manager import QueryManager
+from orb.infrastructure.storage.exceptions import StorageError
+
+if TYPE_CHECKING:
+    from orb.infrastructure.storage.components.sql_connection_manager import (
+        SQLConnectionManager,
+    )
+
+# Columns indexed at table bootstrap when present in the table definition
+DEFAULT_INDEXED_COLUMNS: tuple[str, ...] = (
+    "created_at",
+    "status",
+    "request_id",
+    "template_id",
+    "return_request_id",
+)
+
+_RANGE_SQL_OPERATORS: dict[str, str] = {"$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+# Escape character for LIKE patterns; portable where backslash is itself a string escape
+_LIKE_ESCAPE = "!"
 
 
 class QueryType(str, Enum):
@@ -25,16 +50,23 @@ class SQLQueryBuilder(QueryManager):
     Builds safe, parameterized SQL queries to prevent SQL injection.
     """
 
-    def __init__(self, table_name: str, columns: dict[str, str]) -> None:
+    def __init__(
+        self,
+        table_name: str,
+        columns: dict[str, str],
+        connection_manager: Optional["SQLConnectionManager"] = None,
+    ) -> None:
         """
         Initialize query builder.
 
         Args:
             table_name: Name of the database table
             columns: Dictionary of column names and types
+            connection_manager: Connection manager that executes built queries
         """
         self.table_name = table_name
         self.columns = columns
+        self.connection_manager = connection_manager
         self.logger = get_logger(__name__)
 
         # Validate table name and column names
@@ -42,6 +74,16 @@ class SQLQueryBuilder(QueryManager):
         for column in columns:
             self._validate_identifier(column)
 
+    @property
+    def dialect(self) -> str:
+        """SQLAlchemy dialect name of the bound connection, empty when unbound."""
+        if self.connection_manager is None:
+            return ""
+        engine = self.connection_manager.engine
+        if engine is not None:
+            return engine.dialect.name
+        return str(self.connection_manager.config.get("type", ""))
+
     def _validate_identifier(self, identifier: str) -> None:
         """
         Validate SQL identifier against whitelist pattern.
@@ -55,6 +97,36 @@ class SQLQueryBuilder(QueryManager):
         if not re.match(r"^[a-zA-Z0-9_]+$", identifier):
             raise ValueError(f"Invalid SQL identifier: {identifier}")
 
+    def build_query(self, query_spec: dict[str, Any]) -> str:
+        """Build a query string from specification (implements QueryManager interface)."""
+        query_type = QueryType(query_spec.get("type", QueryType.SELECT))
+        if query_type == QueryType.CREATE_TABLE:
+            return self.build_create_table()
+        if query_type == QueryType.DELETE:
+            return self.build_delete(query_spec.get("id_column", "id"))[0]
+        if query_type == QueryType.INSERT:
+            return self.build_insert(query_spec.get("data", {}))[0]
+        if query_type == QueryType.UPDATE:
+            return self.build_update(
+                query_spec.get("data", {}),
+                query_spec.get("id_column", "id"),
+                query_spec.get("entity_id", ""),
+            )[0]
+        return self.build_select_by_criteria(query_spec.get("criteria", {}))[0]
+
+    def execute_query(self, query: str, parameters: Optional[dict[str, Any]] = None) -> Any:
+        """Execute a query through the connection manager (implements QueryManager interface)."""
+        if self.connection_manager is None:
+            raise StorageError(f"No connection manager bound to query builder of {self.table_name}")
+        return self.connection_manager.execute_query(query, parameters)
+
+    def validate_query(self, query: str) -> bool:
+        """Check that a query targets this table with a supported statement type."""
+        normalized = query.strip().upper()
+        return self.table_name.upper() in normalized and any(
+            normalized.startswith(query_type.value) for query_type in QueryType
+        )
+
     def build_create_query(self, **kwargs) -> str:
         """Build CREATE TABLE query (implements QueryManager interface)."""
         return self.build_create_table()
@@ -207,6 +279,41 @@ class SQLQueryBuilder(QueryManager):
         self.logger.debug("Built UPDATE query for %s", self.table_name)
         return query, parameters
 
+    def build_conditional_update(
+        self, data: dict[str, Any], id_column: str, entity_id: str, condition: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Build an UPDATE query that only changes the row while it matches ``condition``.
+
+        Args:
+            data: Data to update
+            id_column: Name of the ID column
+            entity_id: ID of entity to update
+            condition: Criteria the row must match; None values require NULL
+
+        Returns:
+            Tuple of (query, parameters); the statement updates one row or none
+        """
+        query, parameters = self.build_update(data, id_column, entity_id)
+
+        null_columns = [col for col, value in condition.items() if value is None]
+        for column in null_columns:
+            if column not in self.columns:
+                raise ValueError(f"Unknown column in condition: {column}")
+            self._validate_identifier(column)
+        where_clause, where_parameters = self._build_where_clause(
+            {col: value for col, value in condition.items() if value is not None}
+        )
+        clauses = [f"{col} IS NULL" for col in null_columns]
+        if where_clause:
+            clauses.append(where_clause)
+        if clauses:
+            query = f"{query} AND {' AND '.join(clauses)}"
+            parameters.update(where_parameters)
+
+        self.logger.debug("Built conditional UPDATE query for %s", self.table_name)
+        return query, parameters
+
     def build_delete(self, id_column: str) -> tuple[str, str]:
         """
         Build DELETE query.
@@ -239,6 +346,100 @@ class SQLQueryBuilder(QueryManager):
         self.logger.debug("Built EXISTS query for %s", self.table_name)
         return query, id_column
 
+    def build_select_by_ids(self, id_column: str, count: int) -> tuple[str, list[str]]:
+        """
+        Build SELECT query for several IDs.
+
+        Args:
+            id_column: Name of the ID column
+            count: Number of IDs the query selects
+
+        Returns:
+            Tuple of (query, parameter_names)
+        """
+        self._validate_identifier(id_column)
+        param_names = [f"id_{i}" for i in range(count)]
+        placeholders = ", ".join(f":{name}" for name in param_names)
+        query = f"SELECT * FROM {self.table_name} WHERE {id_column} IN ({placeholders})"  # nosec B608 - table_name and id_column validated via _validate_identifier; values are parameterized
+
+        self.logger.debug("Built SELECT by IDs query for %s", self.table_name)
+        return query, param_names
+
+    def build_delete_by_ids(self, id_column: str, count: int) -> tuple[str, list[str]]:
+        """
+        Build DELETE query for several IDs.
+
+        Args:
+            id_column: Name of the ID column
+            count: Number of IDs the query deletes
+
+        Returns:
+            Tuple of (query, parameter_names)
+        """
+        self._validate_identifier(id_column)
+        param_names = [f"id_{i}" for i in range(count)]
+        placeholders = ", ".join(f":{name}" for name in param_names)
+        query = f"DELETE FROM {self.table_name} WHERE {id_column} IN ({placeholders})"  # nosec B608 - table_name and id_column validated via _validate_identifier; values are parameterized
+
+        self.logger.debug("Built DELETE by IDs query for %s", self.table_name)
+        return query, param_names
+
+    def build_upsert(
+        self,
+        columns: list[str],
+        id_column: str,
+        dialect: str,
+        update_columns: Optional[list[str]] = None,
+    ) -> Optional[str]:
+        """
+        Build an INSERT that updates the existing row on primary key conflict.
+
+        Args:
+            columns: Columns to insert (unknown columns are ignored)
+            id_column: Name of the primary key column
+            dialect: SQLAlchemy dialect name
+            update_columns: Columns to overwrite on conflict; defaults to all
+                inserted columns except the primary key
+
+        Returns:
+            Parameterized UPSERT statement, None if the dialect has no UPSERT syntax
+        """
+        insert_columns = [col for col in columns if col in self.columns]
+        if not insert_columns:
+            raise ValueError("No valid columns found in data")
+        if update_columns is None:
+            update_columns = insert_columns
+        update_columns = [
+            col for col in update_columns if col in insert_columns and col != id_column
+        ]
+
+        for column in [*insert_columns, id_column]:
+            self._validate_identifier(column)
+
+        placeholders = [f":{col}" for col in insert_columns]
+        query = (
+            f"INSERT INTO {self.table_name} "  # nosec B608 - table_name and columns validated via _validate_identifier; values are parameterized
+            f"({', '.join(insert_columns)}) VALUES ({', '.join(placeholders)})"
+        )
+
+        if dialect in ("sqlite", "postgresql"):
+            if update_columns:
+                assignments = ", ".join(f"{col} = excluded.{col}" for col in update_columns)
+                query += f" ON CONFLICT ({id_column}) DO UPDATE SET {assignments}"
+            else:
+                query += f" ON CONFLICT ({id_column}) DO NOTHING"
+        elif dialect in ("mysql", "mariadb"):
+            # Assigning the key to itself makes a key-only row a no-op update
+            assignments = ", ".join(
+                f"{col} = VALUES({col})" for col in update_columns or [id_column]
+            )
+            query += f" ON DUPLICATE KEY UPDATE {assignments}"
+        else:
+            return None
+
+        self.logger.debug("Built %s UPSERT query for %s", dialect, self.table_name)
+        return query
+
     def build_select_by_criteria(self, criteria: dict[str, Any]) -> tuple[str, dict[str, Any]]:
         """
         Build SELECT with WHERE criteria.
@@ -249,15 +450,193 @@ class SQLQueryBuilder(QueryManager):
         Returns:
             Tuple of (query, parameters)
         """
-        if not criteria:
+        where_clause, parameters = self._build_where_clause(criteria)
+        if not where_clause:
             return self.build_select_all(), {}
 
+        query = f"SELECT * FROM {self.table_name} WHERE {where_clause}"  # nosec B608 - table_name and columns validated via _validate_identifier; values are parameterized
+
+        self.logger.debug("Built SELECT with criteria query for %s", self.table_name)
+        return query, parameters
+
+    def build_count_by_criteria(
+        self, criteria: Optional[dict[str, Any]] = None, group_by: Optional[str] = None
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Build COUNT query with optional WHERE criteria and GROUP BY column.
+
+        Args:
+            criteria: Search criteria
+            group_by: Column to group counts by
+
+        Returns:
+            Tuple of (query, parameters); grouped queries select (value, count) rows
+        """
+        where_clause, parameters = self._build_where_clause(criteria or {})
+
+        if group_by is not None:
+            if group_by not in self.columns:
+                raise ValueError(f"Unknown column for GROUP BY: {group_by}")
+            self._validate_identifier(group_by)
+            query = f"SELECT {group_by}, COUNT(*) FROM {self.table_name}"  # nosec B608 - table_name and group_by validated via _validate_identifier
+        else:
+            query = f"SELECT COUNT(*) FROM {self.table_name}"  # nosec B608 - table_name validated via _validate_identifier in constructor
+
+        if where_clause:
+            query += f" WHERE {where_clause}"
+        if group_by is not None:
+            query += f" GROUP BY {group_by}"
+
+        self.logger.debug("Built COUNT with criteria query for %s", self.table_name)
+        return query, parameters
+
+    def supports_query_spec(self, spec: QuerySpec) -> bool:
+        """
+        Check whether a query spec can be answered entirely in SQL.
+
+        Criteria and the sort field must name columns of the table, and
+        filters must compare single-valued string columns with ``=``, ``!=``
+        (optionally with ``*`` wildcards) or ``~``.
+        """
+        return (
+            all(column in self.columns for column in spec.criteria)
+            and all(self._build_filter_condition(f, "p") is not None for f in spec.filters)
+            and (spec.sort_by is None or spec.sort_by in self.columns)
+        )
+
+    def build_select_by_spec(
+        self, spec: QuerySpec, criteria: dict[str, Any], id_column: str
+    ) -> tuple[str, str, dict[str, Any]]:
+        """
+        Build the page and total-count queries of a query spec.
+
+        The page query fetches one row beyond the limit so callers can tell
+        whether another page follows. Without a limit it returns every row
+        after the cursor and the caller skips ``spec.offset`` rows itself.
+        Rows are ordered by the sort column with missing values last and the
+        ID column as tie-breaker, matching in-memory pagination.
+
+        Args:
+            spec: Query spec accepted by ``supports_query_spec``
+            criteria: Spec criteria prepared for SQL
+            id_column: Name of the ID column
+
+        Returns:
+            Tuple of (page query, count query, parameters)
+
+        Raises:
+            ValueError: If part of the spec cannot be expressed in SQL
+        """
+        if not self.supports_query_spec(spec):
+            raise ValueError("Query spec cannot be expressed in SQL")
+        self._validate_identifier(id_column)
+
+        where_clause, parameters = self._build_where_clause(criteria)
+        conditions = [where_clause] if where_clause else []
+        for i, generic_filter in enumerate(spec.filters):
+            condition = self._build_filter_condition(generic_filter, f"qf_{i}")
+            clause, filter_params = condition  # type: ignore[misc]
+            conditions.append(clause)
+            parameters.update(filter_params)
+
+        count_query = f"SELECT COUNT(*) FROM {self.table_name}"  # nosec B608 - table_name validated via _validate_identifier in constructor
+        if conditions:
+            count_query += f" WHERE {' AND '.join(conditions)}"
+
+        direction = " DESC" if spec.descending else ""
+        if spec.sort_by:
+            order_by = (
+                f"{spec.sort_by} IS NULL{direction}, {spec.sort_by}{direction}, "
+                f"{id_column}{direction}"
+            )
+        else:
+            order_by = f"{id_column}{direction}"
+        if spec.after:
+            sort_value, entity_id = decode_cursor(spec.after)
+            conditions.append(
+                self._build_keyset_condition(spec.sort_by, id_column, sort_value, spec.descending)
+            )
+            parameters["qc_value"] = sort_value
+            parameters["qc_id"] = entity_id
+
+        query = f"SELECT * FROM {self.table_name}"  # nosec B608 - table_name and columns validated via _validate_identifier; values are parameterized
+        if conditions:
+            query += f" WHERE {' AND '.join(conditions)}"
+        query += f" ORDER BY {order_by}"
+        if spec.limit is not None:
+            query += " LIMIT :q_limit OFFSET :q_offset"
+            parameters["q_limit"] = spec.limit + 1
+            parameters["q_offset"] = spec.offset
+
+        self.logger.debug("Built SELECT by query spec for %s", self.table_name)
+        return query, count_query, parameters
+
+    def _build_filter_condition(
+        self, generic_filter: GenericFilter, param_name: str
+    ) -> Optional[tuple[str, dict[str, Any]]]:
+        """
+        Translate a generic filter into a case-insensitive SQL condition.
+
+        Returns None when the filter has no exact SQL equivalent (regular
+        expressions, ``?``/``[`` wildcards, non-string or JSON columns).
+        """
+        column_type = self.columns.get(generic_filter.field, "").upper()
+        if "CHAR" not in column_type:
+            return None
+        column = generic_filter.field
+        operator = generic_filter.operator
+        value = str(generic_filter.value).lower()
+
+        if operator == FilterOperator.CONTAINS:
+            comparison = f"LOWER({column}) LIKE :{param_name} ESCAPE '{_LIKE_ESCAPE}'"
+            value = f"%{_escape_like(value)}%"
+        elif operator not in (FilterOperator.EXACT, FilterOperator.NOT_EQUAL):
+            return None
+        elif "?" in value or "[" in value:
+            return None
+        elif "*" in value:
+            comparison = f"LOWER({column}) LIKE :{param_name} ESCAPE '{_LIKE_ESCAPE}'"
+            value = _escape_like(value).replace("*", "%")
+        else:
+            comparison = f"LOWER({column}) = :{param_name}"
+        if operator == FilterOperator.NOT_EQUAL:
+            # A missing value matches no filter, negated or not
+            comparison = f"{column} IS NOT NULL AND NOT ({comparison})"
+        return f"({comparison})", {param_name: value}
+
+    def _build_keyset_condition(
+        self, sort_column: Optional[str], id_column: str, sort_value: Any, descending: bool
+    ) -> str:
+        """Build the condition selecting rows after a keyset cursor."""
+        after = "<" if descending else ">"
+        if sort_column is None:
+            return f"{id_column} {after} :qc_id"
+        if sort_value is None:
+            if descending:
+                return f"({sort_column} IS NOT NULL OR {id_column} < :qc_id)"
+            return f"({sort_column} IS NULL AND {id_column} > :qc_id)"
+        # Rows without a sort value come after every other row
+        after_nulls = "" if descending else f"{sort_column} IS NULL OR "
+        return (
+            f"({after_nulls}{sort_column} {after} :qc_value"
+            f" OR ({sort_column} = :qc_value AND {id_column} {after} :qc_id))"
+        )
+
+    def _build_where_clause(self, criteria: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        """
+        Build a parameterized WHERE clause (without the keyword) from criteria.
+
+        Criteria on unknown columns are ignored.
+
+        Args:
+            criteria: Search criteria
+
+        Returns:
+            Tuple of (clause, parameters); clause is empty when nothing applies
+        """
         # Filter criteria to only include known columns
         filtered_criteria = {k: v for k, v in criteria.items() if k in self.columns}
 
-        if not filtered_criteria:
-            return self.build_select_all(), {}
-
         # Validate all column names
         for column in filtered_criteria.keys():
             self._validate_identifier(column)
@@ -274,11 +653,26 @@ class SQLQueryBuilder(QueryManager):
                         param_name = f"{column}_in_{i}"
                         placeholders.append(f":{param_name}")
                         parameters[param_name] = item
-                    where_clauses.append(f"{column} IN ({', '.join(placeholders)})")
+                    if placeholders:
+                        where_clauses.append(f"{column} IN ({', '.join(placeholders)})")
+                    else:
+                        where_clauses.append("1 = 0")
                 elif "$like" in value:
                     param_name = f"{column}_like"
                     where_clauses.append(f"{column} LIKE :{param_name}")
                     parameters[param_name] = value["$like"]
+                elif value and all(op in _RANGE_SQL_OPERATORS for op in value):
+                    for op, bound in value.items():
+                        param_name = f"{column}_{op[1:]}"
+                        if isinstance(bound, datetime) and self.dialect == "sqlite":
+                            clauses, bound_params = self._build_sqlite_timestamp_bound(
+                                column, op, bound, param_name
+                            )
+                            where_clauses.extend(clauses)
+                            parameters.update(bound_params)
+                            continue
+                        where_clauses.append(f"{column} {_RANGE_SQL_OPERATORS[op]} :{param_name}")
+                        parameters[param_name] = bound
                 else:
                     # Default equality
                     param_name = f"{column}_eq"
@@ -289,10 +683,86 @@ class SQLQueryBuilder(QueryManager):
                 param_name = f"{column}_eq"
                 where_clauses.append(f"{column} = :{param_name}")
                 parameters[param_name] = value
-        query = f"SELECT * FROM {self.table_name} WHERE {' AND '.join(where_clauses)}"  # nosec B608 - table_name and columns validated via _validate_identifier; values are parameterized
 
-        self.logger.debug("Built SELECT with criteria query for %s", self.table_name)
-        return query, parameters
+        return " AND ".join(where_clauses), parameters
+
+    @staticmethod
+    def _build_sqlite_timestamp_bound(
+        column: str, op: str, bound: datetime, param_name: str
+    ) -> tuple[list[str], dict[str, Any]]:
+        """
+        Build conditions comparing a SQLite timestamp column with a datetime bound.
+
+        SQLite keeps timestamps as ISO 8601 text, possibly with differing UTC
+        offsets, so strings do not sort as instants. A day-widened string bound
+        keeps the column index usable; julianday() then compares exactly.
+        """
+        bound = (
+            bound.replace(tzinfo=timezone.utc)
+            if bound.tzinfo is None
+            else bound.astimezone(timezone.utc)
+        )
+        if op in ("$gt", "$gte"):
+            widened = f"{column} >= :{param_name}_day"
+            day = (bound - timedelta(days=1)).date().isoformat()
+        else:
+            widened = f"{column} < :{param_name}_day"
+            day = (bound + timedelta(days=2)).date().isoformat()
+        exact = f"julianday({column}) {_RANGE_SQL_OPERATORS[op]} julianday(:{param_name})"
+        return [widened, exact], {f"{param_name}_day": day, param_name: bound.isoformat()}
+
+    def build_create_indexes(
+        self,
+        columns: Optional[Iterable[str]] = None,
+        dialect: str = "sqlite",
+        existing: Iterable[str] = (),
+    ) -> list[str]:
+        """
+        Build CREATE INDEX statements for frequently filtered columns.
+
+        Primary key columns, columns the table does not have and indexes named
+        in ``existing`` are skipped. MySQL has no ``CREATE INDEX IF NOT EXISTS``,
+        so for MySQL/MariaDB callers pass the existing index names (see
+        ``build_select_index_names``) instead.
+
+        Args:
+            columns: Columns to index; defaults to DEFAULT_INDEXED_COLUMNS
+            dialect: SQLAlchemy dialect name
+            existing: Names of indexes already present on the table
+
+        Returns:
+            List of CREATE INDEX statements
+        """
+        existing_names = set(existing)
+        if_not_exists = "" if dialect in ("mysql", "mariadb") else "IF NOT EXISTS "
+        statements = []
+        for column in columns if columns is not None else DEFAULT_INDEXED_COLUMNS:
+            column_type = self.columns.get(column)
+            if column_type is None or "PRIMARY KEY" in column_type.upper():
+                continue
+            self._validate_identifier(column)
+            index_name = f"idx_{self.table_name}_{column}"
+            if index_name in existing_names:
+                continue
+            statements.append(
+                f"CREATE INDEX {if_not_exists}{index_name} ON {self.table_name} ({column})"
+            )
+
+        self.logger.debug("Built %s CREATE INDEX queries for %s", len(statements), self.table_name)
+        return statements
+
+    def build_select_index_names(self) -> tuple[str, dict[str, Any]]:
+        """
+        Build a MySQL/MariaDB query listing the index names of the table.
+
+        Returns:
+            Tuple of (query, parameters)
+        """
+        query = (
+            "SELECT DISTINCT index_name FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = :table_name"
+        )
+        return query, {"table_name": self.table_name}
 
     def build_count(self) -> str:
         """
@@ -351,3 +821,10 @@ class SQLQueryBuilder(QueryManager):
             len(data_list),
         )
         return query, filtered_data_list
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so they match literally."""
+    for char in (_LIKE_ESCAPE, "%", "_"):
+        value = value.replace(char, _LIKE_ESCAPE + char)
+    return value
@@ -0,0 +1,375 @@
+"""Append-only journal variant of the JSON storage strategy."""
+
+import threading
+from typing import Any, Optional, cast
+
+from filelock import FileLock
+
+from orb.infrastructure.storage.components.file_manager import FileSignature
+from orb.infrastructure.storage.components.journal_manager import (
+    JOURNAL_OP_DELETE,
+    JOURNAL_OP_PUT,
+    JournalManager,
+    apply_journal_records,
+)
+from orb.infrastructure.storage.components.secondary_index import SecondaryIndex
+from orb.infrastructure.storage.exceptions import StorageError
+from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
+from orb.infrastructure.storage.metrics_decorators import instrument_storage
+
+
+class JSONJournalStorageStrategy(JSONStorageStrategy):
+    """
+    JSON storage strategy that journals changes instead of rewriting the file.
+
+    Each save/delete appends one change record per entity to a write-ahead
+    journal (``<file>.<entity_type>.journal``) and updates an in-memory
+    state, so writes cost O(changed entities). Reads are served from that
+    state after replaying any records appended by other processes. Once the
+    journal holds ``compact_threshold`` records it is compacted into the
+    regular JSON snapshot in the background.
+
+    The snapshot keeps the exact format of ``JSONStorageStrategy`` and is
+    backed up through ``FileManager`` before every compaction. The journal
+    segment retired by the last compaction is kept so that a snapshot
+    restored with ``FileManager.recover_from_backup()`` can be rolled forward.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        create_dirs: bool = True,
+        entity_type: str = "entities",
+        metrics: Optional[Any] = None,
+        backup_count: int = 5,
+        backup_enabled: bool = True,
+        compact_threshold: int = 1000,
+        background_compaction: bool = True,
+    ) -> None:
+        """
+        Initialize journaled JSON storage strategy.
+
+        Args:
+            file_path: Path to JSON snapshot file
+            create_dirs: Whether to create parent directories
+            entity_type: Type of entities being stored (snapshot section name)
+            metrics: Optional metrics collector for instrumentation
+            backup_count: Number of snapshot backups to keep
+            backup_enabled: Whether to back up the snapshot before compaction
+            compact_threshold: Journal records that trigger compaction
+            background_compaction: Compact on a background thread instead of inline
+        """
+        super().__init__(
+            file_path=file_path,
+            create_dirs=create_dirs,
+            entity_type=entity_type,
+            metrics=metrics,
+            backup_count=backup_count,
+            backup_enabled=backup_enabled,
+        )
+
+        self.compact_threshold = max(1, compact_threshold)
+        self.background_compaction = background_compaction
+        self.journal = JournalManager(f"{file_path}.{entity_type}.journal")
+        self._snapshot_lock = FileLock(f"{file_path}.lock")
+
+        # In-memory state lives in _data_cache; these track what it reflects.
+        # Lock order is always: journal file lock -> snapshot lock -> _state_lock
+        self._state_lock = threading.RLock()
+        self._snapshot_signature: Optional[FileSignature] = None
+        self._journal_identity: Optional[tuple[int, int]] = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        self._compaction_thread: Optional[threading.Thread] = None
+        # Maintained incrementally alongside the in-memory state
+        self._index = SecondaryIndex(self.indexed_fields)
+
+    @instrument_storage(lambda self: cast("JSONJournalStorageStrategy", self)._metrics, "save")
+    def save(self, entity_id: str, data: dict[str, Any]) -> None:
+        """
+        Journal a single entity write.
+
+        Args:
+            entity_id: Unique identifier for the entity
+            data: Entity data to save
+        """
+        with self.lock_manager.write_lock():
+            try:
+                self._append_records([self._make_record(JOURNAL_OP_PUT, entity_id, data)])
+                self.logger.debug("Journaled %s entity: %s", self.entity_type, entity_id)
+            except Exception as e:
+                self.logger.error("Failed to save %s entity %s: %s", self.entity_type, entity_id, e)
+                raise StorageError(f"Failed to save entity {entity_id}: {e}")
+
+    @instrument_storage(lambda self: cast("JSONJournalStorageStrategy", self)._metrics, "delete")
+    def delete(self, entity_id: str) -> None:
+        """
+        Journal a single entity deletion.
+
+        Args:
+            entity_id: Entity identifier
+        """
+        with self.lock_manager.write_lock():
+            try:
+                if entity_id not in self._load_data():
+                    self.logger.warning(
+                        "%s entity not found for deletion: %s",
+                        self.entity_type,
+                        entity_id,
+                    )
+                    return
+
+                self._append_records([self._make_record(JOURNAL_OP_DELETE, entity_id)])
+                self.logger.debug(
+                    "Journaled deletion of %s entity: %s", self.entity_type, entity_id
+                )
+            except Exception as e:
+                self.logger.error(
+                    "Failed to delete %s entity %s: %s", self.entity_type, entity_id, e
+                )
+                raise StorageError(f"Failed to delete entity {entity_id}: {e}")
+
+    @instrument_storage(
+        lambda self: cast("JSONJournalStorageStrategy", self)._metrics, "save_batch"
+    )
+    def save_batch(self, entities: dict[str, dict[str, Any]]) -> None:
+        """
+        Journal multiple entity writes in one append.
+
+        Args:
+            entities: Dictionary of entities to save
+        """
+        with self.lock_manager.write_lock():
+            try:
+                records = [
+                    self._make_record(JOURNAL_OP_PUT, entity_id, data)
+                    for entity_id, data in entities.items()
+                ]
+                self._append_records(records)
+                self.logger.debug(
+                    "Journaled batch of %s %s entities", len(entities), self.entity_type
+                )
+            except Exception as e:
+                self.logger.error("Failed to save batch of %s entities: %s", self.entity_type, e)
+                raise StorageError(f"Failed to save batch: {e}")
+
+    @instrument_storage(
+        lambda self: cast("JSONJournalStorageStrategy", self)._metrics, "delete_batch"
+    )
+    def delete_batch(self, entity_ids: list[str]) -> None:
+        """
+        Journal multiple entity deletions in one append.
+
+        Args:
+            entity_ids: List of entity IDs to delete
+        """
+        with self.lock_manager.write_lock():
+            try:
+                records = [
+                    self._make_record(JOURNAL_OP_DELETE, entity_id) for entity_id in entity_ids
+                ]
+                self._append_records(records)
+                self.logger.debug(
+                    "Journaled deletion of %s %s entities", len(entity_ids), self.entity_type
+                )
+            except Exception as e:
+                self.logger.error("Failed to delete batch of %s entities: %s", self.entity_type, e)
+                raise StorageError(f"Failed to delete batch: {e}")
+
+    def compact(self) -> None:
+        """
+        Fold the journal into the snapshot and rotate it.
+
+        Appends from every process are blocked for the duration; readers in
+        this process only wait while the in-memory state is copied.
+        """
+        with self.journal.lock(), self._snapshot_lock:
+            with self._state_lock:
+                self._refresh_state()
+                if self._journal_records == 0 and self.journal.size() == 0:
+                    return
+                snapshot = dict(self._data_cache or {})
+
+            self._write_snapshot(snapshot)
+            self.journal.rotate()
+
+            with self._state_lock:
+                self._snapshot_signature = self._stat_signature()
+                self._journal_identity = self.journal.identity()
+                self._journal_offset = 0
+                self._journal_records = 0
+
+        self.logger.info(
+            "Compacted %s journal into snapshot (%s entities)", self.entity_type, len(snapshot)
+        )
+
+    def get_journal_stats(self) -> dict[str, Any]:
+        """Get journal size and pending record counts."""
+        with self._state_lock:
+            return {
+                "entity_type": self.entity_type,
+                "journal_bytes": self.journal.size(),
+                "pending_records": self._journal_records,
+                "compact_threshold": self.compact_threshold,
+                "compaction_running": self._compaction_running(),
+            }
+
+    def cleanup(self) -> None:
+        """Wait for an in-flight compaction, then release cached state."""
+        thread = self._compaction_thread
+        if thread is not None and thread.is_alive():
+            thread.join()
+        with self._state_lock:
+            self._snapshot_signature = None
+            self._journal_identity = None
+            self._journal_offset = 0
+            self._journal_records = 0
+            self._index = SecondaryIndex(self.indexed_fields)
+            super().cleanup()
+
+    def _load_data(self) -> dict[str, dict[str, Any]]:
+        """Return the in-memory state, replaying new journal records first."""
+        with self._state_lock:
+            if not self._needs_reload():
+                self._apply_journal_tail()
+                return cast("dict[str, dict[str, Any]]", self._data_cache)
+
+        # A full reload must not race a compaction in another process
+        with self.journal.lock(), self._state_lock:
+            self._refresh_state()
+            return cast("dict[str, dict[str, Any]]", self._data_cache)
+
+    def _refresh_state(self) -> None:
+        """Bring the in-memory state up to date. Caller holds the journal lock."""
+        if self._needs_reload():
+            self._reload_state()
+        else:
+            self._apply_journal_tail()
+
+    def _needs_reload(self) -> bool:
+        if self._data_cache is None or not self._cache_valid:
+            return True
+        if self._stat_signature() != self._snapshot_signature:
+            return True
+        if self.journal.identity() != self._journal_identity:
+            return True
+        return self.journal.size() < self._journal_offset
+
+    def _reload_state(self) -> None:
+        snapshot_signature = self._stat_signature()
+        journal_identity = self.journal.identity()
+
+        try:
+            state = self._read_snapshot()
+        except Exception as e:
+            self.logger.error("Failed to load %s snapshot: %s", self.entity_type, e)
+            if self.file_manager.recover_from_backup():
+                self.logger.info("Recovered %s snapshot from backup", self.entity_type)
+                state = self._read_snapshot()
+                # Roll the restored snapshot forward over the retired segment
+                apply_journal_records(state, self.journal.read_previous())
+                snapshot_signature = self._stat_signature()
+            else:
+                self.logger.warning("No backup available, starting with empty data")
+                state = {}
+
+        records, offset = self.journal.read_from(0)
+        apply_journal_records(state, records)
+
+        self._data_cache = state
+        self._cache_valid = True
+        self._index = SecondaryIndex.build(self.indexed_fields, state)
+        self._snapshot_signature = snapshot_signature
+        self._journal_identity = journal_identity
+        self._journal_offset = offset
+        self._journal_records = len(records)
+
+    def _apply_journal_tail(self) -> None:
+        if self.journal.size() <= self._journal_offset:
+            return
+        records, offset = self.journal.read_from(self._journal_offset)
+        if records:
+            # Copy-on-write: other readers of this instance may be iterating the current map
+            self._data_cache = dict(cast("dict[str, dict[str, Any]]", self._data_cache))
+            self._index = self._index.copy()
+            self._apply_records(records)
+        self._journal_offset = offset
+        self._journal_records += len(records)
+
+    def _apply_records(self, records: list[dict[str, Any]]) -> None:
+        """Apply records to the in-memory state and keep the index in step."""
+        state = cast("dict[str, dict[str, Any]]", self._data_cache)
+        for record in records:
+            entity_id = record.get("id")
+            previous = state.get(entity_id) if entity_id is not None else None
+            apply_journal_records(state, [record])
+            if entity_id is not None:
+                self._index.update(entity_id, previous, state.get(entity_id))
+
+    def _get_index(self, entity_data: dict[str, dict[str, Any]]) -> Optional[SecondaryIndex]:
+        if not self.indexed_fields:
+            return None
+        with self._state_lock:
+            if entity_data is self._data_cache:
+                return self._index
+        # State moved on since entity_data was loaded; index that version instead
+        return SecondaryIndex.build(self.indexed_fields, entity_data)
+
+    def _read_snapshot(self) -> dict[str, dict[str, Any]]:
+        full_data = self._read_document()
+        if not isinstance(full_data, dict):
+            self.logger.warning("Invalid data format in file, initializing empty data")
+            return {}
+        # Copy: journal records are applied to this map in place
+        return dict(full_data.get(self.entity_type, {}))
+
+    def _append_records(self, records: list[dict[str, Any]]) -> None:
+        if not records:
+            return
+
+        with self.journal.lock(), self._state_lock:
+            self._refresh_state()
+            self._journal_offset = self.journal.append(records)
+            self._journal_identity = self.journal.identity()
+            self._apply_records(records)
+            self._journal_records += len(records)
+            should_compact = self._journal_records >= self.compact_threshold
+
+        if should_compact:
+            self._schedule_compaction()
+
+    def _schedule_compaction(self) -> None:
+        if not self.background_compaction:
+            self.compact()
+            return
+
+        with self._state_lock:
+            if self._compaction_running():
+                return
+            self._compaction_thread = threading.Thread(
+                target=self._run_background_compaction,
+                name=f"orb-json-compaction-{self.entity_type}",
+                daemon=True,
+            )
+            self._compaction_thread.start()
+
+    def _run_background_compaction(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            # The journal is still intact; compaction is retried on the next trigger
+            self.logger.error("Background compaction of %s failed: %s", self.entity_type, e)
+
+    def _compaction_running(self) -> bool:
+        return self._compaction_thread is not None and self._compaction_thread.is_alive()
+
+    def _make_record(
+        self, op: str, entity_id: str, data: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        record: dict[str, Any] = {"op": op, "id": entity_id}
+        if op == JOURNAL_OP_PUT:
+            record["data"] = self.serializer._prepare_for_serialization(data or {})
+        return record
+
+    def _stat_signature(self) -> Optional[FileSignature]:
+        return self.file_manager.get_signature()
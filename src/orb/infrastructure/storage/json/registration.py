@@ -6,6 +6,7 @@ enabling the storage registry pattern for JSON storage.
 CLEAN ARCHITECTURE: Only handles storage strategies, no repository knowledge.
 """
 
+import os
 from typing import Any
 
 from orb.infrastructure.logging.logger import get_logger
@@ -50,6 +51,29 @@ def create_json_strategy(config: Any) -> Any:
     )
 
 
+def create_json_collection_strategy(config: Any, collection: str, columns: dict[str, str]) -> Any:
+    """
+    Create a JSON strategy for a dedicated collection in its own file.
+
+    Args:
+        config: ConfigurationManager holding the JSON storage settings
+        collection: Collection name, used as file name and entity type
+        columns: Unused; JSON documents are schemaless
+
+    Returns:
+        JSONStorageStrategy on ``<base_path>/<collection>.json``
+    """
+    from orb.config.schemas.storage_schema import StorageConfig
+    from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
+
+    json_config = config.get_typed(StorageConfig).json_strategy
+    return JSONStorageStrategy(
+        file_path=os.path.join(json_config.base_path, f"{collection}.json"),
+        create_dirs=True,
+        entity_type=collection,
+    )
+
+
 def create_json_config(data: dict[str, Any]) -> Any:
     """
     Create JSON storage configuration from data.
@@ -110,6 +134,8 @@ def create_json_unit_of_work(config: Any) -> Any:
                 create_dirs=True,
                 backup_count=json_config.backup_count,
                 backup_enabled=json_config.backup_enabled,
+                write_mode=json_config.write_mode,
+                journal_compact_threshold=json_config.journal_compact_threshold,
             )
         else:
             # For split files, use individual file names
@@ -122,6 +148,8 @@ def create_json_unit_of_work(config: Any) -> Any:
                 create_dirs=True,
                 backup_count=json_config.backup_count,
                 backup_enabled=json_config.backup_enabled,
+                write_mode=json_config.write_mode,
+                journal_compact_threshold=json_config.journal_compact_threshold,
             )
     else:
         # For testing or other scenarios - assume it's a dict with file paths
@@ -131,6 +159,7 @@ def create_json_unit_of_work(config: Any) -> Any:
             request_file=config.get("request_file", "requests.json"),
             template_file=config.get("template_file", "templates.json"),
             create_dirs=True,
+            write_mode=config.get("write_mode", "snapshot"),
         )
 
 
@@ -159,6 +188,7 @@ def register_json_storage() -> None:
             strategy_factory=create_json_strategy,
             config_factory=create_json_config,
             unit_of_work_factory=unit_of_work_factory,  # Accepts config parameter
+            collection_strategy_factory=create_json_collection_strategy,
         )
 
         logger.info("Successfully registered JSON storage type")
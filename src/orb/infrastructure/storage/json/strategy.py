@@ -1,9 +1,17 @@
 """JSON storage strategy implementation using componentized architecture."""
 
+from collections.abc import Iterable
 from typing import Any, Optional, cast
 
+from filelock import FileLock
+
 from orb.infrastructure.logging.logger import get_logger
-from orb.infrastructure.storage.base.strategy import BaseStorageStrategy
+from orb.infrastructure.storage.base.strategy import (
+    BaseStorageStrategy,
+    is_range_condition,
+    matches_condition,
+    matches_range,
+)
 
 # Import components
 from orb.infrastructure.storage.components import (
@@ -11,6 +19,11 @@ from orb.infrastructure.storage.components import (
     JSONSerializer,
     LockManager,
     MemoryTransactionManager,
+    get_document_cache,
+)
+from orb.infrastructure.storage.components.secondary_index import (
+    DEFAULT_INDEXED_FIELDS,
+    SecondaryIndex,
 )
 from orb.infrastructure.storage.exceptions import StorageError
 from orb.infrastructure.storage.metrics_decorators import instrument_storage
@@ -53,8 +66,13 @@ class JSONStorageStrategy(BaseStorageStrategy):
             file_path, create_dirs, backup_count=backup_count, backup_enabled=backup_enabled
         )
         self.lock_manager = LockManager("reader_writer")
+        # Serializes conditional writes across processes (see save_if)
+        self._save_if_lock = FileLock(f"{file_path}.save_if.lock")
         self.serializer = JSONSerializer()
         self.transaction_manager = MemoryTransactionManager()
+        # Parsed file shared with every strategy on the same path in this process
+        self.document_cache = get_document_cache()
+        self.indexed_fields: tuple[str, ...] = DEFAULT_INDEXED_FIELDS.get(entity_type, ())
 
         # Cache for loaded data
         self._data_cache: Optional[dict[str, dict[str, Any]]] = None
@@ -73,8 +91,8 @@ class JSONStorageStrategy(BaseStorageStrategy):
         """
         with self.lock_manager.write_lock():
             try:
-                # Load current data
-                all_data = self._load_data()
+                # Copy: the loaded section is shared through the document cache
+                all_data = dict(self._load_data())
 
                 # Update with new data
                 all_data[entity_id] = data
@@ -91,6 +109,32 @@ class JSONStorageStrategy(BaseStorageStrategy):
                 self.logger.error("Failed to save %s entity %s: %s", self.entity_type, entity_id, e)
                 raise StorageError(f"Failed to save entity {entity_id}: {e}")
 
+    def save_if(
+        self, entity_id: str, data: dict[str, Any], condition: Optional[dict[str, Any]]
+    ) -> bool:
+        """
+        Save entity data only if the stored entity still matches ``condition``.
+
+        Conditional writes hold a file lock next to the JSON file while they
+        read and write, so they are atomic against each other across
+        processes. Plain saves and deletes do not take that lock.
+        """
+        try:
+            with self._save_if_lock:
+                current = self.find_by_id(entity_id)
+                if condition is None:
+                    if current is not None:
+                        return False
+                elif not matches_condition(current, condition):
+                    return False
+                self.save(entity_id, data)
+                return True
+        except StorageError:
+            raise
+        except Exception as e:
+            self.logger.error("Failed to save %s entity %s: %s", self.entity_type, entity_id, e)
+            raise StorageError(f"Failed to save entity {entity_id}: {e}")
+
     @instrument_storage(lambda self: cast("JSONStorageStrategy", self)._metrics, "find_by_id")
     def find_by_id(self, entity_id: str) -> Optional[dict[str, Any]]:
         """
@@ -118,6 +162,30 @@ class JSONStorageStrategy(BaseStorageStrategy):
                 self.logger.error("Failed to find %s entity %s: %s", self.entity_type, entity_id, e)
                 raise StorageError(f"Failed to find entity {entity_id}: {e}")
 
+    @instrument_storage(lambda self: cast("JSONStorageStrategy", self)._metrics, "find_by_ids")
+    def find_by_ids(self, entity_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Find several entities by ID from a single load of the data.
+
+        Args:
+            entity_ids: Entity identifiers
+
+        Returns:
+            Found entities keyed by ID; missing IDs are omitted
+        """
+        with self.lock_manager.read_lock():
+            try:
+                all_data = self._load_data()
+                return {
+                    entity_id: all_data[entity_id]
+                    for entity_id in entity_ids
+                    if entity_id in all_data
+                }
+
+            except Exception as e:
+                self.logger.error("Failed to find %s entities by IDs: %s", self.entity_type, e)
+                raise StorageError(f"Failed to find entities by IDs: {e}")
+
     @instrument_storage(lambda self: cast("JSONStorageStrategy", self)._metrics, "find_all")
     def find_all(self) -> dict[str, dict[str, Any]]:
         """
@@ -146,7 +214,7 @@ class JSONStorageStrategy(BaseStorageStrategy):
         """
         with self.lock_manager.write_lock():
             try:
-                all_data = self._load_data()
+                all_data = dict(self._load_data())
 
                 if entity_id not in all_data:
                     self.logger.warning(
@@ -214,11 +282,20 @@ class JSONStorageStrategy(BaseStorageStrategy):
         with self.lock_manager.read_lock():
             try:
                 all_data = self._load_data()
-                matching_entities = []
+                index = self._get_index(all_data)
+                candidate_ids = index.candidates(criteria) if index is not None else None
 
-                for entity_data in all_data.values():
-                    if self._matches_criteria(entity_data, criteria):
-                        matching_entities.append(entity_data)
+                candidates: Iterable[dict[str, Any]]
+                if candidate_ids is None:
+                    candidates = all_data.values()
+                else:
+                    candidates = [all_data[i] for i in candidate_ids if i in all_data]
+
+                matching_entities = [
+                    entity_data
+                    for entity_data in candidates
+                    if self._matches_criteria(entity_data, criteria)
+                ]
 
                 self.logger.debug(
                     "Found %s %s entities matching criteria",
@@ -241,7 +318,7 @@ class JSONStorageStrategy(BaseStorageStrategy):
         """
         with self.lock_manager.write_lock():
             try:
-                all_data = self._load_data()
+                all_data = dict(self._load_data())
                 all_data.update(entities)
                 self._save_data(all_data)
                 self._cache_valid = False
@@ -262,7 +339,7 @@ class JSONStorageStrategy(BaseStorageStrategy):
         """
         with self.lock_manager.write_lock():
             try:
-                all_data = self._load_data()
+                all_data = dict(self._load_data())
 
                 for entity_id in entity_ids:
                     all_data.pop(entity_id, None)
@@ -313,22 +390,15 @@ class JSONStorageStrategy(BaseStorageStrategy):
 
     def _load_data(self) -> dict[str, dict[str, Any]]:
         """Load data from file with hierarchical structure support."""
-        if self._cache_valid and self._data_cache is not None:
-            return self._data_cache
-
         try:
-            content = self.file_manager.read_file()
+            full_data = self._read_document()
 
-            if not content.strip():
+            if not isinstance(full_data, dict):
+                self.logger.warning("Invalid data format in file, initializing empty data")
                 entity_data = {}
             else:
-                full_data = self.serializer.deserialize(content)
-                if not isinstance(full_data, dict):
-                    self.logger.warning("Invalid data format in file, initializing empty data")
-                    entity_data = {}
-                else:
-                    # Extract only the entity type section from hierarchical structure
-                    entity_data = full_data.get(self.entity_type, {})
+                # Extract only the entity type section from hierarchical structure
+                entity_data = full_data.get(self.entity_type, {})
 
             # Cache the entity-specific data
             self._data_cache = entity_data
@@ -346,36 +416,37 @@ class JSONStorageStrategy(BaseStorageStrategy):
                 self.logger.warning("No backup available, starting with empty data")
                 return {}
 
+    def _read_document(self) -> Any:
+        """
+        Get the parsed file, re-reading it only when it changed on disk.
+
+        The result may be shared with other strategies and must not be mutated.
+        """
+        cache_key = str(self.file_manager.file_path)
+        cached = self.document_cache.get(cache_key, self.file_manager.get_signature())
+        if cached is not None:
+            return cached
+
+        content, signature = self.file_manager.read_file_with_signature()
+        full_data = self.serializer.deserialize(content) if content.strip() else {}
+        self.document_cache.put(cache_key, signature, full_data)
+        return full_data
+
+    def _get_index(self, entity_data: dict[str, dict[str, Any]]) -> Optional[SecondaryIndex]:
+        """Get secondary indexes for the loaded data, built once per file version."""
+        if not self.indexed_fields:
+            return None
+        return self.document_cache.get_derived(
+            str(self.file_manager.file_path),
+            f"index:{self.entity_type}",
+            entity_data,
+            lambda: SecondaryIndex.build(self.indexed_fields, entity_data),
+        )
+
     def _save_data(self, entity_data: dict[str, dict[str, Any]]) -> None:
         """Save data to file with hierarchical structure support."""
         try:
-            # Create backup before saving
-            self.file_manager.create_backup()
-
-            # Load full file structure to preserve other entity types
-            try:
-                content = self.file_manager.read_file()
-                if content.strip():
-                    full_data = self.serializer.deserialize(content)
-                else:
-                    full_data = {}
-            except Exception as e:
-                self.logger.error(
-                    "Cannot read existing storage file before save, aborting to prevent data loss: %s",
-                    e,
-                )
-                raise
-
-            # Ensure full_data is a dictionary
-            if not isinstance(full_data, dict):
-                full_data = {}
-
-            # Update only our entity type section in the hierarchical structure
-            full_data[self.entity_type] = entity_data
-
-            # Serialize and save the complete hierarchical structure
-            content = self.serializer.serialize(full_data)
-            self.file_manager.write_file(content)
+            self._write_snapshot(entity_data)
 
             # Update cache with entity-specific data
             self._data_cache = entity_data
@@ -385,6 +456,36 @@ class JSONStorageStrategy(BaseStorageStrategy):
             self.logger.error("Failed to save data: %s", e)
             raise
 
+    def _write_snapshot(self, entity_data: dict[str, dict[str, Any]]) -> None:
+        """Back up the file and rewrite this entity type's section atomically."""
+        # Create backup before saving
+        self.file_manager.create_backup()
+
+        # Load full file structure to preserve other entity types
+        try:
+            full_data = self._read_document()
+        except Exception as e:
+            self.logger.error(
+                "Cannot read existing storage file before save, aborting to prevent data loss: %s",
+                e,
+            )
+            raise
+
+        # Ensure full_data is a dictionary; copy it since it may be shared
+        full_data = dict(full_data) if isinstance(full_data, dict) else {}
+
+        # Update only our entity type section in the hierarchical structure
+        full_data[self.entity_type] = entity_data
+
+        # Serialize and save the complete hierarchical structure
+        content = self.serializer.serialize(full_data)
+        signature = self.file_manager.write_file(content)
+
+        # Publish our own write so other strategies on this file skip the re-read.
+        # Entities reach storage already serialized to JSON values, so the
+        # document we just wrote is what a re-read would return.
+        self.document_cache.put(str(self.file_manager.file_path), signature, full_data)
+
     def _matches_criteria(self, entity_data: dict[str, Any], criteria: dict[str, Any]) -> bool:
         """Check if entity matches search criteria."""
         for key, expected_value in criteria.items():
@@ -397,6 +498,9 @@ class JSONStorageStrategy(BaseStorageStrategy):
             if isinstance(expected_value, dict) and "$in" in expected_value:
                 if actual_value not in expected_value["$in"]:
                     return False
+            elif is_range_condition(expected_value):
+                if not matches_range(actual_value, expected_value):
+                    return False
             elif isinstance(expected_value, dict) and "$regex" in expected_value:
                 import re
 
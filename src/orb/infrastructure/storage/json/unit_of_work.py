@@ -2,12 +2,13 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from orb.infrastructure.logging.logger import get_logger
 from orb.infrastructure.storage.base.unit_of_work import BaseUnitOfWork
 
-# Import JSON storage strategy
+# Import JSON storage strategies
+from orb.infrastructure.storage.json.journal_strategy import JSONJournalStorageStrategy
 from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
 
 # Import new simplified repositories
@@ -35,6 +36,8 @@ class JSONUnitOfWork(BaseUnitOfWork):
         create_dirs: bool = True,
         backup_count: int = 5,
         backup_enabled: bool = True,
+        write_mode: str = "snapshot",
+        journal_compact_threshold: int = 1000,
     ) -> None:
         """
         Initialize JSON unit of work with simplified repositories.
@@ -48,6 +51,9 @@ class JSONUnitOfWork(BaseUnitOfWork):
             create_dirs: Whether to create directories
             backup_count: Number of backup files to keep
             backup_enabled: Whether to create backups
+            write_mode: "snapshot" rewrites the file per change, "journal"
+                appends change records and compacts them in the background
+            journal_compact_threshold: Journal records that trigger compaction
         """
         super().__init__()
 
@@ -64,35 +70,37 @@ class JSONUnitOfWork(BaseUnitOfWork):
         # Don't try to get container during initialization - causes circular dependency
         # Metrics will be injected later if needed
 
+        strategy_options: dict[str, Any] = {
+            "create_dirs": create_dirs,
+            "metrics": metrics,
+            "backup_count": backup_count,
+            "backup_enabled": backup_enabled,
+        }
+        strategy_class: type[JSONStorageStrategy] = JSONStorageStrategy
+        if write_mode == "journal":
+            strategy_class = JSONJournalStorageStrategy
+            strategy_options["compact_threshold"] = journal_compact_threshold
+
         # Create storage strategies for each repository
-        machine_strategy = JSONStorageStrategy(
+        machine_strategy = strategy_class(
             file_path=os.path.join(data_dir, machine_file),
-            create_dirs=create_dirs,
             entity_type="machines",
-            metrics=metrics,
-            backup_count=backup_count,
-            backup_enabled=backup_enabled,
+            **strategy_options,
         )
 
-        request_strategy = JSONStorageStrategy(
+        request_strategy = strategy_class(
             file_path=os.path.join(data_dir, request_file),
-            create_dirs=create_dirs,
             entity_type="requests",
-            metrics=metrics,
-            backup_count=backup_count,
-            backup_enabled=backup_enabled,
+            **strategy_options,
         )
 
         template_path = (
             template_file if os.path.isabs(template_file) else os.path.join(data_dir, template_file)
         )
-        template_strategy = JSONStorageStrategy(
+        template_strategy = strategy_class(
             file_path=template_path,
-            create_dirs=create_dirs,
             entity_type="templates",
-            metrics=metrics,
-            backup_count=backup_count,
-            backup_enabled=backup_enabled,
+            **strategy_options,
         )
 
         # Create repositories using simplified implementations
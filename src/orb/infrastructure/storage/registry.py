@@ -27,7 +27,7 @@ class StorageFactoryInterface(ABC):
 
 
 class StorageRegistration(BaseRegistration):
-    """Storage-specific registration with unit_of_work_factory."""
+    """Storage-specific registration with unit_of_work_factory and collection_strategy_factory."""
 
     def __init__(
         self,
@@ -35,6 +35,7 @@ class StorageRegistration(BaseRegistration):
         strategy_factory: Callable,
         config_factory: Callable,
         unit_of_work_factory: Optional[Callable] = None,
+        collection_strategy_factory: Optional[Callable] = None,
     ) -> None:
         """Initialize the instance."""
         super().__init__(
@@ -42,8 +43,10 @@ class StorageRegistration(BaseRegistration):
             strategy_factory,
             config_factory,
             unit_of_work_factory=unit_of_work_factory,
+            collection_strategy_factory=collection_strategy_factory,
         )
         self.unit_of_work_factory = unit_of_work_factory
+        self.collection_strategy_factory = collection_strategy_factory
 
 
 class StorageRegistry(BaseRegistry):
@@ -64,6 +67,7 @@ class StorageRegistry(BaseRegistry):
         strategy_factory: Callable,
         config_factory: Callable,
         unit_of_work_factory: Optional[Callable] = None,
+        collection_strategy_factory: Optional[Callable] = None,
     ) -> None:
         """Register storage strategy factory - implements abstract method."""
         self.register_type(
@@ -71,6 +75,7 @@ class StorageRegistry(BaseRegistry):
             strategy_factory,
             config_factory,
             unit_of_work_factory=unit_of_work_factory,
+            collection_strategy_factory=collection_strategy_factory,
         )
 
     def register_storage(
@@ -79,6 +84,7 @@ class StorageRegistry(BaseRegistry):
         strategy_factory: Callable,
         config_factory: Callable,
         unit_of_work_factory: Optional[Callable] = None,
+        collection_strategy_factory: Optional[Callable] = None,
     ) -> None:
         """
         Register a storage type with its factories - backward compatibility method.
@@ -88,6 +94,8 @@ class StorageRegistry(BaseRegistry):
             strategy_factory: Factory function to create storage strategy
             config_factory: Factory function to create storage configuration
             unit_of_work_factory: Optional factory function to create unit of work
+            collection_strategy_factory: Optional factory function to create the
+                strategy of a dedicated collection on the configured storage
 
         Raises:
             ConfigurationError: If storage type is already registered
@@ -104,6 +112,7 @@ class StorageRegistry(BaseRegistry):
                 strategy_factory,
                 config_factory,
                 unit_of_work_factory=unit_of_work_factory,
+                collection_strategy_factory=collection_strategy_factory,
             )
         except ValueError as e:
             raise ConfigurationError(str(e))
@@ -170,6 +179,37 @@ class StorageRegistry(BaseRegistry):
             return uow_factory(config)
         return None
 
+    def create_collection_strategy(
+        self, storage_type: str, config: Any, collection: str, columns: dict[str, str]
+    ) -> Any:
+        """
+        Create a strategy for a dedicated collection on the configured storage.
+
+        The collection gets its own file, table or DynamoDB table next to the
+        ones of the unit of work, built from the same typed configuration.
+
+        Args:
+            storage_type: Type of storage
+            config: Configuration for the strategy (ConfigurationManager)
+            collection: Collection name (file, table or table suffix)
+            columns: Column definitions for column-mapped backends (SQL)
+
+        Returns:
+            Storage strategy instance
+
+        Raises:
+            UnsupportedStorageError: If the storage type is not registered or
+                cannot create collection strategies
+        """
+        self.ensure_type_registered(storage_type)
+        registration = self._get_type_registration(storage_type)
+        factory = getattr(registration, "collection_strategy_factory", None)
+        if factory is None:
+            raise UnsupportedStorageError(
+                f"Storage type '{storage_type}' does not support dedicated collections"
+            )
+        return factory(config, collection, columns)
+
     def get_registered_storage_types(self) -> list[str]:
         """Get list of registered storage types - backward compatibility method."""
         return self.get_registered_types()
@@ -196,6 +236,7 @@ class StorageRegistry(BaseRegistry):
             strategy_factory,
             config_factory,
             additional_factories.get("unit_of_work_factory"),
+            additional_factories.get("collection_strategy_factory"),
         )
 
 
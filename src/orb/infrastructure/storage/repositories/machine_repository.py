@@ -2,6 +2,7 @@
 
 from typing import Any, Optional
 
+from orb.domain.base.query_spec import QueryResult, QuerySpec
 from orb.domain.machine.aggregate import Machine
 from orb.domain.machine.machine_identifiers import MachineId
 from orb.domain.machine.repository import MachineRepository as MachineRepositoryInterface
@@ -223,10 +224,9 @@ class MachineRepositoryImpl(StorageRepositoryMixin, MachineRepositoryInterface):
     def find_by_statuses(self, statuses: list[MachineStatus]) -> list[Machine]:
         """Find machines by list of statuses."""
         try:
-            all_machines = []
-            for status in statuses:
-                all_machines.extend(self.find_by_status(status))
-            return all_machines
+            return self._load_by_criteria(  # type: ignore[return-value]
+                {"status": {"$in": [status.value for status in statuses]}}
+            )
         except Exception as e:
             self.logger.error("Failed to find machines by statuses %s: %s", statuses, e)
             raise
@@ -267,10 +267,7 @@ class MachineRepositoryImpl(StorageRepositoryMixin, MachineRepositoryInterface):
                 MachineStatus.RUNNING,
                 MachineStatus.LAUNCHING,
             ]
-            all_machines = []
-            for status in active_statuses:
-                all_machines.extend(self.find_by_status(status))
-            return all_machines
+            return self.find_by_statuses(active_statuses)
         except Exception as e:
             self.logger.error("Failed to find active machines: %s", e)
             raise
@@ -279,16 +276,25 @@ class MachineRepositoryImpl(StorageRepositoryMixin, MachineRepositoryInterface):
     def find_by_ids(self, machine_ids: list[str]) -> list[Machine]:
         """Find machines by list of machine IDs."""
         try:
-            machines = []
-            for machine_id in machine_ids:
-                machine = self.get_by_id(machine_id)
-                if machine:
-                    machines.append(machine)
-            return machines
+            return self._load_by_ids(  # type: ignore[return-value]
+                [
+                    str(machine_id.value) if isinstance(machine_id, MachineId) else str(machine_id)
+                    for machine_id in machine_ids
+                ]
+            )
         except Exception as e:
             self.logger.error("Failed to find machines by IDs %s: %s", machine_ids, e)
             raise
 
+    @handle_infrastructure_exceptions(context="machine_repository_query")
+    def query(self, spec: QuerySpec) -> QueryResult[Machine]:
+        """Find one page of machines matching a query spec."""
+        try:
+            return self._load_page(spec)
+        except Exception as e:
+            self.logger.error("Failed to query machines: %s", e)
+            raise
+
     @handle_infrastructure_exceptions(context="machine_repository_find_all")
     def find_all(self) -> list[Machine]:
         """Find all machines."""
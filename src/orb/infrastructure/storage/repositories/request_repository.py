@@ -1,11 +1,12 @@
 """Single request repository implementation using storage strategy composition."""
 
 import time
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from uuid import uuid4
 
 from orb.domain.base.events import DomainEvent
+from orb.domain.base.query_spec import QueryResult, QuerySpec
 from orb.domain.request.aggregate import Request
 from orb.domain.request.repository import RequestRepository as RequestRepositoryInterface
 from orb.domain.request.value_objects import RequestId, RequestStatus, RequestType
@@ -340,42 +341,60 @@ class RequestRepositoryImpl(StorageRepositoryMixin, RequestRepositoryInterface):
     def find_active_requests(self) -> list[Request]:
         """Find active requests (pending or in_progress)."""
         try:
-            pending = self.find_by_status(RequestStatus.PENDING)
-            in_progress = self.find_by_status(RequestStatus.IN_PROGRESS)
-            seen: set[str] = set()
-            result = []
-            for r in pending + in_progress:
-                if r.request_id not in seen:
-                    seen.add(r.request_id)
-                    result.append(r)
-            return result
+            active_statuses = [RequestStatus.PENDING, RequestStatus.IN_PROGRESS]
+            return self._load_by_criteria(  # type: ignore[return-value]
+                {"status": {"$in": [_id_str(status) for status in active_statuses]}}
+            )
         except Exception as e:
             self.logger.error("Failed to find active requests: %s", e)
             raise
 
+    @staticmethod
+    def _to_utc(value: datetime) -> datetime:
+        """Normalize a datetime to UTC, treating naive values as UTC."""
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    def _count_statuses_in_range(
+        self, start_date: datetime, end_date: datetime, status: Optional[RequestStatus] = None
+    ) -> dict[str, int]:
+        """
+        Count requests per status whose created_at falls within a range.
+
+        The exact bounds are pushed down as datetimes: storage backends compare
+        them as instants, whatever UTC offset a record was written with.
+        """
+        criteria: dict[str, Any] = {
+            "created_at": {"$gte": self._to_utc(start_date), "$lte": self._to_utc(end_date)}
+        }
+        if status is not None:
+            criteria["status"] = _id_str(status)
+        return dict(self._get_storage().count_by_group("status", criteria))
+
     @handle_infrastructure_exceptions(context="request_repository_find_by_date_range")
     def find_by_date_range(self, start_date: datetime, end_date: datetime) -> list[Request]:
         """Find requests within date range."""
-        from datetime import timezone
-
         try:
-            if start_date.tzinfo is None:
-                start_date = start_date.replace(tzinfo=timezone.utc)
-            if end_date.tzinfo is None:
-                end_date = end_date.replace(tzinfo=timezone.utc)
-
-            all_requests = self.find_all()
-            filtered_requests = []
-
-            for request in all_requests:
-                request_date = request.created_at
-                if request_date.tzinfo is None:
-                    request_date = request_date.replace(tzinfo=timezone.utc)
-
-                if start_date <= request_date <= end_date:
-                    filtered_requests.append(request)
+            start_date = self._to_utc(start_date)
+            end_date = self._to_utc(end_date)
+
+            # Storage narrows by day using string bounds wide enough to cover
+            # records written with another offset or without one; the exact
+            # range is then applied to the hydrated requests.
+            window = {
+                "created_at": {
+                    "$gte": (start_date - timedelta(days=1)).date().isoformat(),
+                    "$lt": (end_date + timedelta(days=2)).date().isoformat(),
+                }
+            }
+            candidates = self._load_by_criteria(window)
 
-            return filtered_requests
+            return [
+                request
+                for request in candidates
+                if start_date <= self._to_utc(request.created_at) <= end_date  # type: ignore[union-attr, arg-type]
+            ]
         except Exception as e:
             self.logger.error("Failed to find requests by date range: %s", e)
             raise
@@ -403,16 +422,20 @@ class RequestRepositoryImpl(StorageRepositoryMixin, RequestRepositoryInterface):
     def find_by_ids(self, request_ids: list[str]) -> list[Request]:
         """Find requests by multiple request IDs."""
         try:
-            requests = []
-            for request_id in request_ids:
-                request = self.find_by_request_id(request_id)
-                if request:
-                    requests.append(request)
-            return requests
+            return self._load_by_ids([_id_str(request_id) for request_id in request_ids])  # type: ignore[return-value]
         except Exception as e:
             self.logger.error("Failed to find requests by IDs %s: %s", request_ids, e)
             raise
 
+    @handle_infrastructure_exceptions(context="request_repository_query")
+    def query(self, spec: QuerySpec) -> QueryResult[Request]:
+        """Find one page of requests matching a query spec."""
+        try:
+            return self._load_page(spec)
+        except Exception as e:
+            self.logger.error("Failed to query requests: %s", e)
+            raise
+
     @handle_infrastructure_exceptions(context="request_repository_exists")
     def exists(self, request_id: RequestId) -> bool:
         """Check if request exists."""
@@ -424,35 +447,22 @@ class RequestRepositoryImpl(StorageRepositoryMixin, RequestRepositoryInterface):
 
     def count_by_date_range(self, start_date: datetime, end_date: datetime) -> int:
         """Count requests within date range."""
-        return len(self.find_by_date_range(start_date, end_date))
+        return sum(self._count_statuses_in_range(start_date, end_date).values())
 
     def count_by_status_and_date_range(
         self, status: RequestStatus, start_date: datetime, end_date: datetime
     ) -> int:
         """Count requests by status within date range."""
-        requests = self.find_by_date_range(start_date, end_date)
-        return len([r for r in requests if r.status == status])
+        return sum(self._count_statuses_in_range(start_date, end_date, status).values())
 
     def get_metrics_by_date_range(self, start_date: datetime, end_date: datetime) -> dict[str, int]:
         """Get aggregated metrics within date range."""
-        requests = self.find_by_date_range(start_date, end_date)
-
-        metrics = {
-            "total": len(requests),
-            "completed": 0,
-            "failed": 0,
-            "in_progress": 0,
-            "pending": 0,
+        counts = self._count_statuses_in_range(start_date, end_date)
+
+        return {
+            "total": sum(counts.values()),
+            "completed": counts.get(RequestStatus.COMPLETED.value, 0),
+            "failed": counts.get(RequestStatus.FAILED.value, 0),
+            "in_progress": counts.get(RequestStatus.IN_PROGRESS.value, 0),
+            "pending": counts.get(RequestStatus.PENDING.value, 0),
         }
-
-        for request in requests:
-            if request.status == RequestStatus.COMPLETED:
-                metrics["completed"] += 1
-            elif request.status == RequestStatus.FAILED:
-                metrics["failed"] += 1
-            elif request.status == RequestStatus.IN_PROGRESS:
-                metrics["in_progress"] += 1
-            elif request.status == RequestStatus.PENDING:
-                metrics["pending"] += 1
-
-        return metrics
@@ -1,5 +1,18 @@
 """SQL storage package."""
 
-from orb.infrastructure.storage.sql.unit_of_work import SQLUnitOfWork
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from orb.infrastructure.storage.sql.unit_of_work import SQLUnitOfWork
 
 __all__: list[str] = ["SQLUnitOfWork"]
+
+
+def __getattr__(name: str):
+    """Import SQLUnitOfWork on first access so registering SQL storage does not load SQLAlchemy."""
+    if name != "SQLUnitOfWork":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from orb.infrastructure.storage.sql.unit_of_work import SQLUnitOfWork
+
+    globals()[name] = SQLUnitOfWork
+    return SQLUnitOfWork
@@ -0,0 +1,37 @@
+"""SQL storage health checks — registered with the application HealthCheck instance."""
+
+from orb.domain.base.ports.health_check_port import HealthCheckPort
+from orb.monitoring.health import HealthStatus
+
+
+def register_sql_storage_health_checks(health_check: HealthCheckPort) -> None:
+    """Register SQL storage runtime checks with the given HealthCheck instance.
+
+    The check reports connection pool statistics for every shared SQL
+    storage runtime created in this process. It never opens a runtime itself.
+
+    Args:
+        health_check: The application HealthCheckPort to register checks on.
+    """
+
+    def _check_storage_pool_health() -> HealthStatus:
+        try:
+            # Imported lazily so SQLAlchemy is only loaded when the check runs
+            from orb.infrastructure.storage.sql.runtime import get_sql_runtime_pool
+
+            pools = get_sql_runtime_pool().get_pool_stats()
+            return HealthStatus(
+                name="storage_pool",
+                status="healthy" if pools else "unknown",
+                details={"runtime_count": len(pools), "runtimes": pools},
+                dependencies=["database"],
+            )
+        except Exception as e:
+            return HealthStatus(
+                name="storage_pool",
+                status="unhealthy",
+                details={"error": str(e)},
+                dependencies=["database"],
+            )
+
+    health_check.register_check("storage_pool", _check_storage_pool_health)
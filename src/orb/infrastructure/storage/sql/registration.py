@@ -85,45 +85,84 @@ def _build_connection_string(sql_config: Any) -> str:
         raise ValueError(f"Unsupported database type: {db_type}")
 
 
+def _engine_settings(storage_config: Any) -> tuple[str, dict[str, Any]]:
+    """
+    Build the connection string and engine options of the configured database.
+
+    Args:
+        storage_config: Typed StorageConfig
+
+    Returns:
+        Connection string and ``create_engine`` keyword arguments
+    """
+    sql_config = storage_config.sql_strategy
+    engine_options = {
+        "pool_size": sql_config.pool_size,
+        "max_overflow": sql_config.max_overflow,
+        "pool_timeout": getattr(sql_config, "pool_timeout", 30),
+        "pool_recycle": getattr(sql_config, "pool_recycle", 3600),
+        "echo": getattr(sql_config, "echo", False),
+    }
+    return _build_connection_string(sql_config), engine_options
+
+
+def create_sql_collection_strategy(config: Any, collection: str, columns: dict[str, str]) -> Any:
+    """
+    Create a SQL strategy for a dedicated table in the configured database.
+
+    The strategy shares the engine and connection pool of the units of work.
+
+    Args:
+        config: ConfigurationManager holding the SQL storage settings
+        collection: Table name
+        columns: Column definitions (name -> type)
+
+    Returns:
+        SQLStorageStrategy on the ``collection`` table
+    """
+    from orb.config.schemas.storage_schema import StorageConfig
+    from orb.infrastructure.storage.sql.runtime import get_sql_runtime_pool
+    from orb.infrastructure.storage.sql.strategy import SQLStorageStrategy
+
+    connection_string, engine_options = _engine_settings(config.get_typed(StorageConfig))
+    runtime = get_sql_runtime_pool().acquire(connection_string, engine_options)
+    return SQLStorageStrategy(
+        config=runtime.connection_manager.config,
+        table_name=collection,
+        columns=columns,
+        connection_manager=runtime.connection_manager,
+    )
+
+
 def create_sql_unit_of_work(config: Any) -> Any:
     """
     Create SQL unit of work with correct configuration extraction.
 
+    The engine, connection pool and table strategies come from the
+    process-wide runtime pool, so they are built once per storage config
+    rather than once per unit of work.
+
     Args:
         config: Configuration object (ConfigurationManager or dict)
 
     Returns:
-        SQLUnitOfWork instance with correctly configured engine
+        SQLUnitOfWork instance backed by the shared runtime
     """
-    from sqlalchemy import create_engine
-
     from orb.config.manager import ConfigurationManager
     from orb.config.schemas.storage_schema import StorageConfig
+    from orb.infrastructure.storage.sql.runtime import get_sql_runtime_pool
     from orb.infrastructure.storage.sql.unit_of_work import SQLUnitOfWork
 
     # Handle different config types
     if isinstance(config, ConfigurationManager):
-        # Extract SQL-specific configuration through StorageConfig
-        storage_config = config.get_typed(StorageConfig)
-        sql_config = storage_config.sql_strategy
-
-        # Build connection string and create engine
-        connection_string = _build_connection_string(sql_config)
-        engine = create_engine(
-            connection_string,
-            pool_size=sql_config.pool_size,
-            max_overflow=sql_config.max_overflow,
-            pool_timeout=getattr(sql_config, "pool_timeout", 30),
-            pool_recycle=getattr(sql_config, "pool_recycle", 3600),
-            echo=getattr(sql_config, "echo", False),
-        )
-
-        return SQLUnitOfWork(engine)  # type: ignore[abstract]
+        connection_string, engine_options = _engine_settings(config.get_typed(StorageConfig))
     else:
         # For testing or other scenarios - assume it's a dict with connection info
         connection_string = config.get("connection_string", "sqlite:///data/test.db")
-        engine = create_engine(connection_string)
-        return SQLUnitOfWork(engine)  # type: ignore[abstract]
+        engine_options = {}
+
+    runtime = get_sql_runtime_pool().acquire(connection_string, engine_options)
+    return SQLUnitOfWork.from_runtime(runtime)
 
 
 def register_sql_storage() -> None:
@@ -145,6 +184,7 @@ def register_sql_storage() -> None:
             strategy_factory=create_sql_strategy,
             config_factory=create_sql_config,
             unit_of_work_factory=create_sql_unit_of_work,
+            collection_strategy_factory=create_sql_collection_strategy,
         )
 
         logger.info("Successfully registered SQL storage type")
@@ -0,0 +1,283 @@
+"""Process-wide SQL storage runtime.
+
+Building a SQLAlchemy engine, its connection pool and the per-table storage
+strategies is expensive compared with the work a single unit of work does.
+This module keeps one ``SQLStorageRuntime`` per storage configuration for the
+lifetime of the process, so every unit of work for the same database shares
+the engine, the pool and the already-bootstrapped table strategies.
+"""
+
+import threading
+import time
+from typing import Any, Optional
+
+from sqlalchemy import Engine, create_engine
+
+from orb.infrastructure.logging.logger import get_logger
+from orb.infrastructure.storage.components.sql_connection_manager import SQLConnectionManager
+from orb.infrastructure.storage.sql.strategy import SQLStorageStrategy
+
+MACHINE_COLUMNS: dict[str, str] = {
+    "machine_id": "VARCHAR(255) PRIMARY KEY",
+    "template_id": "VARCHAR(255)",
+    "request_id": "VARCHAR(255)",
+    "return_request_id": "VARCHAR(255)",
+    "status": "VARCHAR(50)",
+    "instance_type": "VARCHAR(50)",
+    "availability_zone": "VARCHAR(50)",
+    "private_ip": "VARCHAR(45)",
+    "public_ip": "VARCHAR(45)",
+    "launch_time": "TIMESTAMP",
+    "termination_time": "TIMESTAMP",
+    "tags": "TEXT",
+    "metadata": "TEXT",
+    "created_at": "TIMESTAMP",
+    "updated_at": "TIMESTAMP",
+}
+
+REQUEST_COLUMNS: dict[str, str] = {
+    "request_id": "VARCHAR(255) PRIMARY KEY",
+    "template_id": "VARCHAR(255)",
+    "machine_count": "INTEGER",
+    "request_type": "VARCHAR(50)",
+    "status": "VARCHAR(50)",
+    "machine_ids": "TEXT",
+    "timeout": "INTEGER",
+    "tags": "TEXT",
+    "metadata": "TEXT",
+    "error_message": "TEXT",
+    "created_at": "TIMESTAMP",
+    "updated_at": "TIMESTAMP",
+    "completed_at": "TIMESTAMP",
+}
+
+TEMPLATE_COLUMNS: dict[str, str] = {
+    "template_id": "VARCHAR(255) PRIMARY KEY",
+    "name": "VARCHAR(255)",
+    "description": "TEXT",
+    "image_id": "VARCHAR(255)",
+    "instance_type": "VARCHAR(50)",
+    "key_name": "VARCHAR(255)",
+    "security_group_ids": "TEXT",
+    "subnet_ids": "TEXT",
+    "user_data": "TEXT",
+    "tags": "TEXT",
+    "metadata": "TEXT",
+    "provider_api": "VARCHAR(255)",
+    "is_active": "BOOLEAN",
+    "created_at": "TIMESTAMP",
+    "updated_at": "TIMESTAMP",
+}
+
+DEFAULT_TABLES: dict[str, dict[str, str]] = {
+    "machines": MACHINE_COLUMNS,
+    "requests": REQUEST_COLUMNS,
+    "templates": TEMPLATE_COLUMNS,
+}
+
+
+class SQLStorageRuntime:
+    """
+    Shared engine, connection pool and table strategies for one database.
+
+    The schema is bootstrapped exactly once when the runtime is created;
+    strategies handed out afterwards skip the per-instance ``table_exists``
+    round trip.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        tables: Optional[dict[str, dict[str, str]]] = None,
+        owns_engine: bool = True,
+    ) -> None:
+        """
+        Initialize the runtime and bootstrap its schema.
+
+        Args:
+            engine: SQLAlchemy engine to share
+            tables: Table definitions (table name -> column definitions)
+            owns_engine: Whether ``dispose()`` should dispose the engine
+        """
+        self.logger = get_logger(__name__)
+        self.engine = engine
+        self.tables = dict(tables if tables is not None else DEFAULT_TABLES)
+        self.connection_manager = SQLConnectionManager({}, engine=engine)
+        self.created_at = time.time()
+
+        self._owns_engine = owns_engine
+        self._lock = threading.RLock()
+        self._strategies: dict[str, SQLStorageStrategy] = {}
+        self._acquisitions = 0
+
+        self.bootstrap_schema()
+
+    def bootstrap_schema(self) -> None:
+        """Create every configured table (idempotent) and its strategy."""
+        with self._lock:
+            for table_name, columns in self.tables.items():
+                if table_name in self._strategies:
+                    continue
+                strategy = SQLStorageStrategy(
+                    config=self.connection_manager.config,
+                    table_name=table_name,
+                    columns=columns,
+                    connection_manager=self.connection_manager,
+                )
+                self._strategies[table_name] = strategy
+
+        self.logger.debug(
+            "Bootstrapped SQL schema for %s: %s",
+            self.connection_manager.config.get("type", "unknown"),
+            ", ".join(self.tables),
+        )
+
+    def get_strategy(self, table_name: str) -> SQLStorageStrategy:
+        """
+        Get the shared strategy for a table.
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            Initialized SQLStorageStrategy
+
+        Raises:
+            KeyError: If the table is not part of this runtime
+        """
+        with self._lock:
+            return self._strategies[table_name]
+
+    def record_acquisition(self) -> None:
+        """Count a unit of work served by this runtime."""
+        with self._lock:
+            self._acquisitions += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get runtime and connection pool statistics."""
+        with self._lock:
+            acquisitions = self._acquisitions
+
+        return {
+            "url": self.engine.url.render_as_string(hide_password=True),
+            "tables": list(self.tables),
+            "acquisitions": acquisitions,
+            "uptime_seconds": round(time.time() - self.created_at, 3),
+            **self.connection_manager.get_pool_stats(),
+        }
+
+    def dispose(self) -> None:
+        """Release pooled connections held by this runtime."""
+        if self._owns_engine:
+            self.engine.dispose()
+        self.logger.debug(
+            "Disposed SQL storage runtime for %s",
+            self.engine.url.render_as_string(hide_password=True),
+        )
+
+
+class SQLStorageRuntimePool:
+    """
+    Process-wide registry of SQL storage runtimes keyed by storage config.
+
+    Units of work for the same connection string and engine options share a
+    single runtime, so engines and pools are created once per process.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty runtime pool."""
+        self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+        self._runtimes: dict[tuple, SQLStorageRuntime] = {}
+
+    @staticmethod
+    def _make_key(connection_string: str, engine_options: dict[str, Any]) -> tuple:
+        return (connection_string, tuple(sorted(engine_options.items())))
+
+    def acquire(
+        self,
+        connection_string: str,
+        engine_options: Optional[dict[str, Any]] = None,
+        tables: Optional[dict[str, dict[str, str]]] = None,
+    ) -> SQLStorageRuntime:
+        """
+        Get the runtime for a storage config, creating it on first use.
+
+        Args:
+            connection_string: SQLAlchemy connection URL
+            engine_options: Keyword arguments for ``create_engine``
+            tables: Table definitions; defaults to machines/requests/templates
+
+        Returns:
+            Shared SQLStorageRuntime
+        """
+        options = dict(engine_options or {})
+        key = self._make_key(connection_string, options)
+
+        with self._lock:
+            runtime = self._runtimes.get(key)
+            if runtime is None:
+                engine = create_engine(connection_string, **options)
+                runtime = SQLStorageRuntime(engine, tables=tables)
+                self._runtimes[key] = runtime
+                self.logger.info(
+                    "Created shared SQL storage runtime for %s",
+                    engine.url.render_as_string(hide_password=True),
+                )
+
+        runtime.record_acquisition()
+        return runtime
+
+    def get_pool_stats(self) -> dict[str, dict[str, Any]]:
+        """Get statistics for every live runtime keyed by masked URL."""
+        with self._lock:
+            runtimes = list(self._runtimes.values())
+
+        stats: dict[str, dict[str, Any]] = {}
+        for runtime in runtimes:
+            runtime_stats = runtime.get_stats()
+            stats[runtime_stats["url"]] = runtime_stats
+        return stats
+
+    def dispose_all(self) -> None:
+        """Dispose every runtime and forget them."""
+        with self._lock:
+            runtimes = list(self._runtimes.values())
+            self._runtimes.clear()
+
+        for runtime in runtimes:
+            try:
+                runtime.dispose()
+            except Exception as e:
+                self.logger.warning("Failed to dispose SQL storage runtime: %s", e)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._runtimes)
+
+
+_runtime_pool: Optional[SQLStorageRuntimePool] = None
+_runtime_pool_lock = threading.Lock()
+
+
+def get_sql_runtime_pool() -> SQLStorageRuntimePool:
+    """Get the process-wide SQL storage runtime pool (thread-safe singleton)."""
+    global _runtime_pool
+
+    if _runtime_pool is None:
+        with _runtime_pool_lock:
+            if _runtime_pool is None:
+                _runtime_pool = SQLStorageRuntimePool()
+
+    return _runtime_pool
+
+
+def reset_sql_runtime_pool() -> None:
+    """Dispose and drop the process-wide runtime pool (for shutdown and tests)."""
+    global _runtime_pool
+    with _runtime_pool_lock:
+        pool = _runtime_pool
+        _runtime_pool = None
+
+    if pool is not None:
+        pool.dispose_all()
@@ -1,10 +1,13 @@
 """SQL storage strategy implementation using componentized architecture."""
 
+from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any, Optional
 
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 
+from orb.domain.base.query_spec import QueryResult, QuerySpec, encode_cursor
 from orb.infrastructure.logging.logger import get_logger
 from orb.infrastructure.storage.base.strategy import BaseStorageStrategy
 
@@ -17,6 +20,15 @@ from orb.infrastructure.storage.components import (
 )
 from orb.infrastructure.storage.exceptions import StorageError
 
+# IDs bound per IN (...) statement; stays below SQLite's historical 999-variable limit
+BATCH_CHUNK_SIZE = 500
+
+
+def _chunks(items: list[str], size: int) -> Iterator[list[str]]:
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
 
 class SQLStorageStrategy(BaseStorageStrategy):
     """
@@ -26,7 +38,14 @@ class SQLStorageStrategy(BaseStorageStrategy):
     serialization, and locking. Reduced from 769 lines to ~200 lines.
     """
 
-    def __init__(self, config: dict[str, Any], table_name: str, columns: dict[str, str]) -> None:
+    def __init__(
+        self,
+        config: dict[str, Any],
+        table_name: str,
+        columns: dict[str, str],
+        connection_manager: Optional[SQLConnectionManager] = None,
+        initialize_table: bool = True,
+    ) -> None:
         """
         Initialize SQL storage strategy with components.
 
@@ -34,6 +53,10 @@ class SQLStorageStrategy(BaseStorageStrategy):
             config: Database configuration
             table_name: Name of the database table
             columns: Column definitions (name -> type)
+            connection_manager: Optional shared connection manager; when omitted
+                a dedicated one (and engine) is created from ``config``
+            initialize_table: Whether to check/create the table on construction.
+                Pass False when the schema has already been bootstrapped.
         """
         super().__init__()
 
@@ -42,13 +65,14 @@ class SQLStorageStrategy(BaseStorageStrategy):
         self.logger = get_logger(__name__)
 
         # Initialize components
-        self.connection_manager = SQLConnectionManager(config)
-        self.query_builder = SQLQueryBuilder(table_name, columns)  # type: ignore[abstract]
+        self.connection_manager = connection_manager or SQLConnectionManager(config)
+        self.query_builder = SQLQueryBuilder(table_name, columns, self.connection_manager)
         self.serializer = SQLSerializer(id_column=self._get_id_column())
         self.lock_manager = LockManager("simple")  # Simple lock for SQL
 
         # Initialize database table
-        self._initialize_table()
+        if initialize_table:
+            self._initialize_table()
 
         self.logger.debug("Initialized SQL storage strategy for table %s", table_name)
 
@@ -60,7 +84,7 @@ class SQLStorageStrategy(BaseStorageStrategy):
         return "id"  # Default fallback
 
     def _initialize_table(self) -> None:
-        """Initialize database table if it doesn't exist."""
+        """Initialize database table if it doesn't exist, then its indexes."""
         try:
             if not self.connection_manager.table_exists(self.table_name):
                 create_table_sql = self.query_builder.build_create_table()
@@ -70,6 +94,33 @@ class SQLStorageStrategy(BaseStorageStrategy):
             self.logger.error("Failed to initialize table %s: %s", self.table_name, e)
             raise
 
+        self._initialize_indexes()
+
+    def _initialize_indexes(self) -> None:
+        """Create secondary indexes; also upgrades tables created before indexes existed."""
+        dialect = self._get_dialect()
+        existing: set[str] = set()
+        if dialect in ("mysql", "mariadb"):
+            # No IF NOT EXISTS for indexes in MySQL: skip the ones already there
+            query, params = self.query_builder.build_select_index_names()
+            try:
+                rows = self.connection_manager.execute_query(query, params) or []
+                existing = {row[0] for row in rows}
+            except Exception as e:
+                self.logger.warning("Failed to list indexes on %s: %s", self.table_name, e)
+                return
+
+        for create_index_sql in self.query_builder.build_create_indexes(
+            dialect=dialect, existing=existing
+        ):
+            try:
+                self.connection_manager.execute_query(create_index_sql)
+            except Exception as e:
+                # Queries still work without the index, only slower
+                self.logger.warning(
+                    "Failed to create index on %s (%s): %s", self.table_name, create_index_sql, e
+                )
+
     def save(self, entity_id: str, data: dict[str, Any]) -> None:
         """
         Save entity data to SQL database.
@@ -80,30 +131,112 @@ class SQLStorageStrategy(BaseStorageStrategy):
         """
         with self.lock_manager.write_lock():
             try:
-                # Check if entity exists
-                if self.exists(entity_id):
-                    # Update existing entity
-                    serialized_data = self.serializer.serialize_for_update(data)
-                    query, params = self.query_builder.build_update(
-                        serialized_data, self._get_id_column(), entity_id
-                    )
-                else:
-                    # Insert new entity
-                    serialized_data = self.serializer.serialize_for_insert(entity_id, data)
-                    query, params = self.query_builder.build_insert(serialized_data)
-
                 with self.connection_manager.get_session() as session:
-                    from sqlalchemy import text
+                    self._upsert_rows(session, {entity_id: data})
+                    session.commit()
+
+                self.logger.debug("Saved entity: %s", entity_id)
+
+            except Exception as e:
+                self.logger.error("Failed to save entity %s: %s", entity_id, e)
+                raise StorageError(f"Failed to save entity {entity_id}: {e}")
+
+    def save_if(
+        self, entity_id: str, data: dict[str, Any], condition: Optional[dict[str, Any]]
+    ) -> bool:
+        """
+        Save entity data only if the stored row still matches ``condition``.
 
-                    session.execute(text(query), params)
+        A new entity is an INSERT that loses to a concurrent insert on the
+        primary key; an existing one is an UPDATE whose WHERE clause carries
+        the condition, so the database checks and writes in one statement.
+        """
+        id_column = self._get_id_column()
+        serialized = self.serializer.serialize_for_insert(entity_id, data)
+        row = {k: v for k, v in serialized.items() if k in self.columns}
+        with self.lock_manager.write_lock():
+            try:
+                with self.connection_manager.get_session() as session:
+                    if condition is None:
+                        query, params = self.query_builder.build_insert(row)
+                        try:
+                            session.execute(text(query), params)
+                        except IntegrityError:
+                            session.rollback()
+                            return False
+                    else:
+                        # created_at is only defaulted for new rows; never overwrite it with "now"
+                        update_data = {
+                            k: v for k, v in row.items() if k != "created_at" or k in data
+                        }
+                        query, params = self.query_builder.build_conditional_update(
+                            update_data, id_column, entity_id, condition
+                        )
+                        if session.execute(text(query), params).rowcount != 1:
+                            session.rollback()
+                            return False
                     session.commit()
 
                 self.logger.debug("Saved entity: %s", entity_id)
+                return True
 
             except Exception as e:
                 self.logger.error("Failed to save entity %s: %s", entity_id, e)
                 raise StorageError(f"Failed to save entity {entity_id}: {e}")
 
+    def _get_dialect(self) -> str:
+        """Get the SQLAlchemy dialect name of the database."""
+        engine = self.connection_manager.engine
+        if engine is not None:
+            return engine.dialect.name
+        return str(self.connection_manager.config.get("type", ""))
+
+    def _upsert_rows(self, session: Any, entities: dict[str, dict[str, Any]]) -> None:
+        """
+        Insert or update entities within a session.
+
+        Rows are grouped by column set and written with one executemany UPSERT
+        per group. Dialects without UPSERT syntax fall back to an existence
+        check followed by INSERT or UPDATE per row.
+
+        Args:
+            session: Open database session
+            entities: Dictionary of entity ID to entity data
+        """
+        id_column = self._get_id_column()
+        dialect = self._get_dialect()
+
+        groups: dict[tuple[tuple[str, ...], tuple[str, ...]], list[dict[str, Any]]] = {}
+        for entity_id, data in entities.items():
+            serialized = self.serializer.serialize_for_insert(entity_id, data)
+            row = {k: v for k, v in serialized.items() if k in self.columns}
+            # created_at is only defaulted for new rows; never overwrite it with "now"
+            update_columns = tuple(
+                col for col in row if col != id_column and (col != "created_at" or col in data)
+            )
+            groups.setdefault((tuple(row), update_columns), []).append(row)
+
+        for (columns, update_columns), rows in groups.items():
+            query = self.query_builder.build_upsert(
+                list(columns), id_column, dialect, list(update_columns)
+            )
+            if query is not None:
+                session.execute(text(query), rows)
+                continue
+
+            for row in rows:
+                exists_query, param_name = self.query_builder.build_exists(id_column)
+                if session.execute(text(exists_query), {param_name: row[id_column]}).fetchone():
+                    update_data = {col: row[col] for col in update_columns}
+                    if not update_data:
+                        continue
+                    query, params = self.query_builder.build_update(
+                        update_data, id_column, row[id_column]
+                    )
+                else:
+                    query, params = self.query_builder.build_insert(row)
+                session.execute(text(query), params)
+
     def find_by_id(self, entity_id: str) -> Optional[dict[str, Any]]:
         """
         Find entity by ID.
@@ -137,6 +270,42 @@ class SQLStorageStrategy(BaseStorageStrategy):
                 self.logger.error("Failed to find entity %s: %s", entity_id, e)
                 raise StorageError(f"Failed to find entity {entity_id}: {e}")
 
+    def find_by_ids(self, entity_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Find several entities with chunked ``IN`` queries.
+
+        Args:
+            entity_ids: Entity identifiers
+
+        Returns:
+            Found entities keyed by ID; missing IDs are omitted
+        """
+        with self.lock_manager.read_lock():
+            try:
+                id_column = self._get_id_column()
+                unique_ids = list(dict.fromkeys(entity_ids))
+                entities: dict[str, dict[str, Any]] = {}
+
+                with self.connection_manager.get_session() as session:
+                    for chunk in _chunks(unique_ids, BATCH_CHUNK_SIZE):
+                        query, param_names = self.query_builder.build_select_by_ids(
+                            id_column, len(chunk)
+                        )
+                        rows = session.execute(
+                            text(query), dict(zip(param_names, chunk))
+                        ).fetchall()
+                        for row in rows:
+                            row_dict = dict(row._mapping) if hasattr(row, "_mapping") else dict(row)
+                            entity_data = self.serializer.deserialize_from_row(row_dict)
+                            entities[str(entity_data.get(id_column))] = entity_data
+
+                self.logger.debug("Found %s of %s entities by ID", len(entities), len(unique_ids))
+                return entities
+
+            except Exception as e:
+                self.logger.error("Failed to find entities by IDs: %s", e)
+                raise StorageError(f"Failed to find entities by IDs: {e}")
+
     def find_all(self) -> dict[str, dict[str, Any]]:
         """
         Find all entities.
@@ -251,6 +420,93 @@ class SQLStorageStrategy(BaseStorageStrategy):
                 self.logger.error("Failed to search entities: %s", e)
                 raise StorageError(f"Failed to search entities: {e}")
 
+    def query(self, spec: QuerySpec) -> QueryResult[dict[str, Any]]:
+        """
+        Find one page of entities with WHERE, ORDER BY and LIMIT/OFFSET.
+
+        When part of the spec cannot be expressed in SQL (criteria or sort on
+        fields that are not columns, regular expression filters), the
+        expressible criteria still narrow the rows and the rest of the spec
+        is applied in memory before paginating.
+
+        Args:
+            spec: Predicates, ordering and page to return
+
+        Returns:
+            The requested page and the number of entities matching the spec
+        """
+        if not self.query_builder.supports_query_spec(spec):
+            entities = self.find_by_criteria(spec.criteria)
+            unpushed = {k: v for k, v in spec.criteria.items() if k not in self.columns}
+            if unpushed:
+                entities = [e for e in entities if self._matches_criteria(e, unpushed)]
+            return self._paginate(entities, spec)
+
+        with self.lock_manager.read_lock():
+            try:
+                id_column = self._get_id_column()
+                query, count_query, params = self.query_builder.build_select_by_spec(
+                    spec, self.serializer.prepare_criteria(spec.criteria), id_column
+                )
+
+                with self.connection_manager.get_session() as session:
+                    rows = session.execute(text(query), params).fetchall()
+                    total_count = int(session.execute(text(count_query), params).scalar() or 0)
+
+                entities = []
+                for row in rows:
+                    row_dict = dict(row._mapping) if hasattr(row, "_mapping") else dict(row)
+                    entities.append(self.serializer.deserialize_from_row(row_dict))
+                next_cursor = None
+                if spec.limit is None:
+                    entities = entities[spec.offset :]
+                elif len(entities) > spec.limit:
+                    entities = entities[: spec.limit]
+                    if entities:
+                        last = entities[-1]
+                        sort_value = last.get(spec.sort_by) if spec.sort_by else None
+                        next_cursor = encode_cursor(sort_value, str(last.get(id_column)))
+
+                self.logger.debug(
+                    "Found %s of %s entities matching query", len(entities), total_count
+                )
+                return QueryResult(items=entities, total_count=total_count, next_cursor=next_cursor)
+
+            except Exception as e:
+                self.logger.error("Failed to query entities: %s", e)
+                raise StorageError(f"Failed to query entities: {e}")
+
+    def count_by_group(
+        self, group_by: str, criteria: Optional[dict[str, Any]] = None
+    ) -> dict[Any, int]:
+        """
+        Count entities matching criteria with a GROUP BY query.
+
+        Args:
+            group_by: Column whose values form the groups
+            criteria: Optional filter criteria
+
+        Returns:
+            Mapping of column value to number of matching rows
+        """
+        with self.lock_manager.read_lock():
+            try:
+                prepared_criteria = self.serializer.prepare_criteria(criteria or {})
+                query, params = self.query_builder.build_count_by_criteria(
+                    prepared_criteria, group_by=group_by
+                )
+
+                with self.connection_manager.get_session() as session:
+                    rows = session.execute(text(query), params).fetchall()
+
+                counts = {row[0]: int(row[1]) for row in rows}
+                self.logger.debug("Counted %s groups by %s", len(counts), group_by)
+                return counts
+
+            except Exception as e:
+                self.logger.error("Failed to count entities by %s: %s", group_by, e)
+                raise StorageError(f"Failed to count entities by {group_by}: {e}")
+
     def save_batch(self, entities: dict[str, dict[str, Any]]) -> None:
         """
         Save multiple entities in batch.
@@ -258,14 +514,13 @@ class SQLStorageStrategy(BaseStorageStrategy):
         Args:
             entities: Dictionary of entities to save
         """
+        if not entities:
+            return
+
         with self.lock_manager.write_lock():
             try:
-                serialized_list = self.serializer.serialize_batch(entities)
-                query, _ = self.query_builder.build_batch_insert(serialized_list)
-
                 with self.connection_manager.get_session() as session:
-                    for serialized_data in serialized_list:
-                        session.execute(query, serialized_data)
+                    self._upsert_rows(session, entities)
                     session.commit()
 
                 self.logger.debug("Saved batch of %s entities", len(entities))
@@ -281,14 +536,19 @@ class SQLStorageStrategy(BaseStorageStrategy):
         Args:
             entity_ids: List of entity IDs to delete
         """
+        if not entity_ids:
+            return
+
         with self.lock_manager.write_lock():
             try:
-                query, param_name = self.query_builder.build_delete(self._get_id_column())
+                id_column = self._get_id_column()
 
                 with self.connection_manager.get_session() as session:
-                    for entity_id in entity_ids:
-                        params = {param_name: entity_id}
-                        session.execute(text(query), params)
+                    for chunk in _chunks(list(dict.fromkeys(entity_ids)), BATCH_CHUNK_SIZE):
+                        query, param_names = self.query_builder.build_delete_by_ids(
+                            id_column, len(chunk)
+                        )
+                        session.execute(text(query), dict(zip(param_names, chunk)))
                     session.commit()
 
                 self.logger.debug("Deleted batch of %s entities", len(entity_ids))
@@ -1,6 +1,6 @@
 """SQL Unit of Work implementation using simplified repositories."""
 
-from typing import Any, Optional
+from typing import Optional
 
 from sqlalchemy import Engine
 from sqlalchemy.orm import Session
@@ -19,19 +19,27 @@ from orb.infrastructure.storage.repositories.template_repository import (
     TemplateRepositoryImpl as TemplateRepository,
 )
 
-# Import SQL storage strategy
-from orb.infrastructure.storage.sql.strategy import SQLStorageStrategy
+# Import shared SQL storage runtime
+from orb.infrastructure.storage.sql.runtime import (
+    MACHINE_COLUMNS,
+    REQUEST_COLUMNS,
+    TEMPLATE_COLUMNS,
+    SQLStorageRuntime,
+)
 
 
 class SQLUnitOfWork(BaseUnitOfWork):
     """SQL-based unit of work implementation using simplified repositories."""
 
-    def __init__(self, engine: Engine) -> None:
+    def __init__(self, engine: Engine, runtime: Optional[SQLStorageRuntime] = None) -> None:
         """
         Initialize SQL unit of work with simplified repositories.
 
         Args:
             engine: SQLAlchemy engine
+            runtime: Shared storage runtime providing the engine's table
+                strategies. When omitted a private runtime is built around
+                ``engine`` (schema is bootstrapped for this instance only).
         """
         super().__init__()
 
@@ -39,28 +47,14 @@ class SQLUnitOfWork(BaseUnitOfWork):
         self.engine = engine
         self.session: Optional[Session] = None
 
-        # Derive config from engine URL so SQLConnectionManager can initialise
-        db_type = engine.url.get_dialect().name  # e.g. "sqlite", "postgresql"
-        db_config: dict[str, Any] = {"type": db_type, "url": str(engine.url)}
-
-        # Create storage strategies for each repository
-        machine_strategy = SQLStorageStrategy(
-            config=db_config,
-            table_name="machines",
-            columns=self._get_machine_columns(),
-        )
-
-        request_strategy = SQLStorageStrategy(
-            config=db_config,
-            table_name="requests",
-            columns=self._get_request_columns(),
-        )
-
-        template_strategy = SQLStorageStrategy(
-            config=db_config,
-            table_name="templates",
-            columns=self._get_template_columns(),
-        )
+        if runtime is None:
+            runtime = SQLStorageRuntime(engine, owns_engine=False)
+        self.runtime = runtime
+
+        # Table strategies are shared through the runtime, never rebuilt here
+        machine_strategy = runtime.get_strategy("machines")
+        request_strategy = runtime.get_strategy("requests")
+        template_strategy = runtime.get_strategy("templates")
 
         # Create repositories using simplified implementations
         self.machine_repository = MachineRepository(machine_strategy)
@@ -74,6 +68,11 @@ class SQLUnitOfWork(BaseUnitOfWork):
 
         self.logger.debug("Initialized SQLUnitOfWork with simplified repositories")
 
+    @classmethod
+    def from_runtime(cls, runtime: SQLStorageRuntime) -> "SQLUnitOfWork":
+        """Create a unit of work backed by a shared storage runtime."""
+        return cls(runtime.engine, runtime=runtime)  # type: ignore[abstract]
+
     @property
     def machines(self):
         """Get machine repository."""
@@ -91,61 +90,15 @@ class SQLUnitOfWork(BaseUnitOfWork):
 
     def _get_machine_columns(self) -> dict[str, str]:
         """Get machine table column definitions."""
-        return {
-            "machine_id": "VARCHAR(255) PRIMARY KEY",
-            "template_id": "VARCHAR(255)",
-            "request_id": "VARCHAR(255)",
-            "return_request_id": "VARCHAR(255)",
-            "status": "VARCHAR(50)",
-            "instance_type": "VARCHAR(50)",
-            "availability_zone": "VARCHAR(50)",
-            "private_ip": "VARCHAR(45)",
-            "public_ip": "VARCHAR(45)",
-            "launch_time": "TIMESTAMP",
-            "termination_time": "TIMESTAMP",
-            "tags": "TEXT",
-            "metadata": "TEXT",
-            "created_at": "TIMESTAMP",
-            "updated_at": "TIMESTAMP",
-        }
+        return dict(MACHINE_COLUMNS)
 
     def _get_request_columns(self) -> dict[str, str]:
         """Get request table column definitions."""
-        return {
-            "request_id": "VARCHAR(255) PRIMARY KEY",
-            "template_id": "VARCHAR(255)",
-            "machine_count": "INTEGER",
-            "request_type": "VARCHAR(50)",
-            "status": "VARCHAR(50)",
-            "machine_ids": "TEXT",
-            "timeout": "INTEGER",
-            "tags": "TEXT",
-            "metadata": "TEXT",
-            "error_message": "TEXT",
-            "created_at": "TIMESTAMP",
-            "updated_at": "TIMESTAMP",
-            "completed_at": "TIMESTAMP",
-        }
+        return dict(REQUEST_COLUMNS)
 
     def _get_template_columns(self) -> dict[str, str]:
         """Get template table column definitions."""
-        return {
-            "template_id": "VARCHAR(255) PRIMARY KEY",
-            "name": "VARCHAR(255)",
-            "description": "TEXT",
-            "image_id": "VARCHAR(255)",
-            "instance_type": "VARCHAR(50)",
-            "key_name": "VARCHAR(255)",
-            "security_group_ids": "TEXT",
-            "subnet_ids": "TEXT",
-            "user_data": "TEXT",
-            "tags": "TEXT",
-            "metadata": "TEXT",
-            "provider_api": "VARCHAR(255)",
-            "is_active": "BOOLEAN",
-            "created_at": "TIMESTAMP",
-            "updated_at": "TIMESTAMP",
-        }
+        return dict(TEMPLATE_COLUMNS)
 
     def _begin_transaction(self) -> None:
         """Begin SQL transaction."""
@@ -22,6 +22,7 @@ from orb.domain.base.dependency_injection import injectable
 from orb.domain.base.exceptions import DomainException, EntityNotFoundError, ValidationError
 from orb.domain.base.ports.event_publisher_port import EventPublisherPort
 from orb.domain.base.ports.logging_port import LoggingPort
+from orb.domain.base.ports.spec_rendering_port import SpecRenderingPort
 
 from .dtos import TemplateDTO
 from .services.template_storage_service import TemplateStorageService
@@ -86,6 +87,7 @@ class TemplateConfigurationManager:
         provider_registry_service: Optional["ProviderRegistryService"] = None,
         template_factory: Optional["TemplateFactoryPort"] = None,
         registry: Optional[Any] = None,
+        spec_renderer: Optional[SpecRenderingPort] = None,
     ) -> None:
         """
         Initialize the template configuration manager.
@@ -101,6 +103,7 @@ class TemplateConfigurationManager:
             provider_registry_service: Optional provider registry service for provider operations
             template_factory: Optional factory for creating provider-specific templates
             registry: Optional provider registry port for template validation
+            spec_renderer: Optional spec renderer used to precompile native specs on load
         """
         self.config_manager = config_manager
         self.scheduler_strategy = scheduler_strategy
@@ -109,6 +112,7 @@ class TemplateConfigurationManager:
         self.template_defaults_service = template_defaults_service
         self.provider_registry_service = provider_registry_service
         self._registry = registry
+        self.spec_renderer = spec_renderer
         if template_factory is None:
             from orb.domain.template.factory import TemplateFactory
 
@@ -174,6 +178,9 @@ class TemplateConfigurationManager:
             # Apply deduplication to remove duplicate templates
             resolved_template_dicts = self._deduplicate_template_dicts(resolved_template_dicts)
 
+            # Compile native spec templates now so provisioning only renders them
+            self._precompile_native_specs(resolved_template_dicts)
+
             # Convert to DTOs with defaults applied
             all_templates = []
             for template_dict in resolved_template_dicts:
@@ -191,6 +198,27 @@ class TemplateConfigurationManager:
             self.logger.error("Failed to load templates from scheduler: %s", e)
             return []
 
+    def _precompile_native_specs(self, template_dicts: list[dict[str, Any]]) -> None:
+        """Compile the Jinja templates of inline native specs (``*_spec`` fields)."""
+        if self.spec_renderer is None:
+            return
+        compiled = 0
+        for template_dict in template_dicts:
+            for key, value in template_dict.items():
+                if not key.endswith("_spec") or not isinstance(value, dict):
+                    continue
+                try:
+                    compiled += self.spec_renderer.precompile_spec(value)
+                except Exception as e:
+                    self.logger.warning(
+                        "Failed to precompile %s of template %s: %s",
+                        key,
+                        template_dict.get("template_id"),
+                        e,
+                    )
+        if compiled:
+            self.logger.debug("Precompiled %d native spec templates", compiled)
+
     def _convert_dict_to_template_dto(
         self, template_dict: dict[str, Any], file_metadata: Optional[TemplateFileMetadata] = None
     ) -> TemplateDTO:
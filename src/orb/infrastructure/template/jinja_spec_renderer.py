@@ -1,23 +1,84 @@
 """Jinja2 implementation of spec rendering."""
 
-from typing import Any
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
 
-from jinja2 import BaseLoader, Environment, select_autoescape
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    TemplateNotFound,
+    select_autoescape,
+)
 
 from orb.domain.base.dependency_injection import injectable
 from orb.domain.base.ports.logging_port import LoggingPort
 from orb.domain.base.ports.spec_rendering_port import SpecRenderingPort
 
+_STRING_TEMPLATE_CACHE_SIZE = 1024
+
+
+class SpecFileLoader(BaseLoader):
+    """Load spec files by path, reloading them when their mtime changes."""
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str, Callable[[], bool]]:
+        try:
+            mtime = os.path.getmtime(template)
+            with open(template, encoding="utf-8") as f:
+                source = f.read()
+        except OSError as e:
+            raise TemplateNotFound(template) from e
+
+        def uptodate() -> bool:
+            try:
+                return os.path.getmtime(template) == mtime
+            except OSError:
+                return False
+
+        return source, template, uptodate
+
 
 @injectable
 class JinjaSpecRenderer(SpecRenderingPort):
-    """Jinja2 implementation of spec rendering."""
+    """Jinja2 implementation of spec rendering.
+
+    Compiled templates are cached: spec files through the environment's
+    template cache (keyed by path and invalidated on mtime change, with
+    optional on-disk bytecode so new processes skip compilation) and inline
+    string values in a bounded LRU keyed by their source.
+    """
 
-    def __init__(self, logger: LoggingPort):
+    def __init__(
+        self,
+        logger: LoggingPort,
+        bytecode_cache_dir: Optional[str] = None,
+        string_cache_size: int = _STRING_TEMPLATE_CACHE_SIZE,
+    ):
         self.logger = logger
+        bytecode_cache = None
+        if bytecode_cache_dir:
+            try:
+                os.makedirs(bytecode_cache_dir, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+            except OSError as e:
+                self.logger.warning(
+                    "Jinja bytecode cache disabled, cannot use %s: %s", bytecode_cache_dir, e
+                )
         self.jinja_env = Environment(
-            loader=BaseLoader(), autoescape=select_autoescape(["json", "yaml", "yml"])
+            loader=SpecFileLoader(),
+            autoescape=select_autoescape(["json", "yaml", "yml"]),
+            bytecode_cache=bytecode_cache,
+            auto_reload=True,
         )
+        self._string_cache_size = string_cache_size
+        self._string_templates: OrderedDict[str, Template] = OrderedDict()
+        self._lock = threading.Lock()
 
     def render_spec_from_file(self, file_path: str, context: dict[str, Any]) -> dict[str, Any]:
         """Render specification from file with Jinja2 templating support.
@@ -30,17 +91,11 @@ class JinjaSpecRenderer(SpecRenderingPort):
             Rendered specification as dictionary
         """
         try:
-            # Read file content
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-
             # Always process through Jinja2 - handles static content automatically
-            template = self.jinja_env.from_string(content)
+            template = self._get_file_template(file_path)
             rendered_content = template.render(**context)
 
             # Parse rendered JSON
-            import json
-
             return json.loads(rendered_content)
 
         except Exception as e:
@@ -56,6 +111,39 @@ class JinjaSpecRenderer(SpecRenderingPort):
         """Render Jinja2 templates in spec values."""
         return self._render_recursive(spec, context)
 
+    def precompile_spec(self, spec: Any) -> int:
+        """Compile every template string in a spec ahead of rendering."""
+        if isinstance(spec, dict):
+            return sum(self.precompile_spec(v) for v in spec.values())
+        if isinstance(spec, list):
+            return sum(self.precompile_spec(item) for item in spec)
+        if isinstance(spec, str) and "{{" in spec:
+            self._get_string_template(spec)
+            return 1
+        return 0
+
+    def precompile_file(self, file_path: str) -> None:
+        """Compile a spec file ahead of rendering."""
+        self._get_file_template(file_path)
+
+    def _get_file_template(self, file_path: str) -> Template:
+        # Normalise so equivalent paths share one cache entry
+        return self.jinja_env.get_template(os.path.abspath(file_path))
+
+    def _get_string_template(self, source: str) -> Template:
+        with self._lock:
+            template = self._string_templates.get(source)
+            if template is not None:
+                self._string_templates.move_to_end(source)
+                return template
+
+        template = self.jinja_env.from_string(source)
+        with self._lock:
+            self._string_templates[source] = template
+            while len(self._string_templates) > self._string_cache_size:
+                self._string_templates.popitem(last=False)
+        return template
+
     def _render_recursive(self, obj: Any, context: dict[str, Any]) -> Any:
         """Recursively render templates in nested structures."""
         if isinstance(obj, dict):
@@ -63,6 +151,5 @@ class JinjaSpecRenderer(SpecRenderingPort):
         elif isinstance(obj, list):
             return [self._render_recursive(item, context) for item in obj]
         elif isinstance(obj, str) and "{{" in obj:
-            template = self.jinja_env.from_string(obj)
-            return template.render(**context)
+            return self._get_string_template(obj).render(**context)
         return obj
@@ -1,5 +1,7 @@
 """Infrastructure utilities - common utilities and factories."""
 
+from typing import TYPE_CHECKING
+
 # Import common utilities
 # Export abstract interface from canonical location
 from orb.domain.base import UnitOfWorkFactory
@@ -31,9 +33,16 @@ from orb.infrastructure.utilities.common.string_utils import (
     extract_provider_type,
 )
 
-# Import factories (removed legacy ProviderFactory)
-from orb.infrastructure.utilities.factories.repository_factory import RepositoryFactory
-from orb.infrastructure.utilities.factories.sql_engine_factory import SQLEngineFactory
+if TYPE_CHECKING:
+    from orb.infrastructure.utilities.factories.repository_factory import RepositoryFactory
+    from orb.infrastructure.utilities.factories.sql_engine_factory import SQLEngineFactory
+
+# Factories are resolved on first access so that importing a utility does not
+# pull in SQLAlchemy for deployments that never use SQL storage.
+_LAZY_EXPORTS = {
+    "RepositoryFactory": "orb.infrastructure.utilities.factories.repository_factory",
+    "SQLEngineFactory": "orb.infrastructure.utilities.factories.sql_engine_factory",
+}
 
 __all__: list[str] = [
     # Factories (legacy ProviderFactory removed)
@@ -62,3 +71,15 @@ __all__: list[str] = [
     "validate_collection",
     "write_json_file",
 ]
+
+
+def __getattr__(name: str):
+    """Import factory exports on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,9 +1,29 @@
 """Factory utilities for infrastructure components."""
 
-from orb.infrastructure.utilities.factories.repository_factory import RepositoryFactory
-from orb.infrastructure.utilities.factories.sql_engine_factory import SQLEngineFactory
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from orb.infrastructure.utilities.factories.repository_factory import RepositoryFactory
+    from orb.infrastructure.utilities.factories.sql_engine_factory import SQLEngineFactory
+
+_LAZY_EXPORTS = {
+    "RepositoryFactory": "orb.infrastructure.utilities.factories.repository_factory",
+    "SQLEngineFactory": "orb.infrastructure.utilities.factories.sql_engine_factory",
+}
 
 __all__: list[str] = [
     "RepositoryFactory",
     "SQLEngineFactory",
 ]
+
+
+def __getattr__(name: str):
+    """Import factory exports on first access (keeps SQLAlchemy off the import path)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -111,22 +111,29 @@ class RepositoryFactory:
 
 @injectable
 class UnitOfWorkFactory(AbstractUnitOfWorkFactory):
-    """Factory for creating unit of work instances."""
+    """Factory for creating unit of work instances.
+
+    Engines, pools and table strategies are owned by the storage backends'
+    process-wide runtimes; this factory only hands out lightweight units of
+    work that share them.
+    """
 
     def __init__(self, config_manager: ConfigurationManager, logger: LoggingPort) -> None:
         """Initialize factory with configuration."""
         self.config_manager = config_manager
         self.logger = logger
+        self._repository_factory: Optional[RepositoryFactory] = None
 
     @property
     def repository_factory(self):
-        """Get repository factory instance."""
-        return RepositoryFactory(self.config_manager, self.logger)
+        """Get repository factory instance (created once and reused)."""
+        if self._repository_factory is None:
+            self._repository_factory = RepositoryFactory(self.config_manager, self.logger)
+        return self._repository_factory
 
     def create(self) -> UnitOfWork:
         """Create unit of work instance."""
-        repository_factory = RepositoryFactory(self.config_manager, self.logger)
-        return repository_factory.create_unit_of_work()
+        return self.repository_factory.create_unit_of_work()
 
     def create_unit_of_work(self) -> UnitOfWork:
         """Create unit of work instance (abstract interface implementation)."""
@@ -0,0 +1,49 @@
+"""CLI command handler for the resident command daemon."""
+
+import asyncio
+import signal
+from typing import Any
+
+from orb.infrastructure.error.decorators import handle_interface_exceptions
+from orb.infrastructure.logging.logger import get_logger
+
+
+@handle_interface_exceptions(context="daemon", interface_type="cli")
+async def handle_daemon(args) -> dict[str, Any]:
+    """
+    Run the resident daemon until SIGINT/SIGTERM.
+
+    The process was already initialized by the CLI entry point; the daemon
+    keeps it warm and serves HostFactory script invocations over a Unix
+    socket. Active requests are refreshed in the background so status
+    polls answer from storage.
+
+    Args:
+        args: Argument namespace with resource/action structure
+
+    Returns:
+        Daemon shutdown results
+    """
+    from orb.application.services.request_sync_engine import RequestSyncEngine
+    from orb.infrastructure.di.container import get_container
+    from orb.interface.daemon_server import CommandDaemon, default_socket_path
+
+    logger = get_logger(__name__)
+    socket_path = getattr(args, "socket_path", None) or default_socket_path()
+    daemon = CommandDaemon(socket_path, config_path=getattr(args, "config", None))
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, daemon.close)
+
+    sync_engine = get_container().get(RequestSyncEngine)
+    sync_engine.start()
+    try:
+        await daemon.serve_forever()
+    finally:
+        sync_engine.stop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(signum)
+
+    logger.info("ORB daemon on %s stopped", socket_path)
+    return {"message": "Daemon stopped"}
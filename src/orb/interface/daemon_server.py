@@ -0,0 +1,306 @@
+"""
+Resident command daemon.
+
+``orb system daemon`` keeps one initialized process (DI container, config,
+providers, storage pools, boto clients, caches) alive and serves CLI
+invocations over a local Unix socket. The HostFactory scripts forward their
+argv/stdin through :mod:`orb.cli.daemon_client` and print the exact output
+the command would have printed in a fresh process.
+
+Wire protocol (one JSON object per line): the client sends
+``{"argv": [...], "cwd": "..."}``. The daemon answers ``{"fallback": true}``
+for commands that must run in their own process, a final response for help
+and version output, or ``{"ready": true}``. Only then does the client read its
+stdin and send ``{"stdin": "..."}``, so a declined command leaves stdin
+untouched for the fresh process. The final response is
+``{"stdout": "...", "stderr": "...", "exit_code": N}``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+from orb.cli.args import build_parser
+from orb.cli.daemon_client import DAEMON_SOCKET_ENV
+from orb.infrastructure.logging.logger import get_logger
+
+# Commands that own the process, stream forever or change it for good
+_UNSERVED_COMMANDS = {
+    ("init", None),
+    ("mcp", None),
+    ("system", "serve"),
+    ("system", "daemon"),
+    ("templates", "generate"),
+    ("template", "generate"),
+    ("requests", "watch"),
+    ("request", "watch"),
+}
+
+# Flags that override process-wide configuration or need a differently initialized process
+_PROCESS_OVERRIDES = ("provider", "region", "profile", "dry_run")
+
+# Path arguments resolved against the caller's working directory
+_PATH_ARGUMENTS = ("file", "hf_file", "output")
+
+_MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+def default_socket_path() -> str:
+    """Socket path from ``ORB_DAEMON_SOCKET``, else ``orb-daemon.sock`` in the work directory."""
+    configured = os.environ.get(DAEMON_SOCKET_ENV)
+    if configured:
+        return configured
+    work_dir = os.environ.get("ORB_WORK_DIR") or os.getcwd()
+    return str(Path(work_dir) / "orb-daemon.sock")
+
+
+class CommandDaemon:
+    """Serves CLI invocations from a warm process over a Unix socket."""
+
+    def __init__(self, socket_path: str, config_path: Optional[str] = None) -> None:
+        """
+        Initialize the daemon.
+
+        Args:
+            socket_path: Unix socket to listen on
+            config_path: Configuration file the process was initialized with
+        """
+        self.socket_path = socket_path
+        self.config_path = config_path
+        self.logger = get_logger(__name__)
+        self._parser, self._resource_parsers = build_parser()
+        # Commands share redirected stdio and the container, so run one at a time
+        self._command_lock = asyncio.Lock()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._closing = False
+        self._commands_served = 0
+
+    async def serve_forever(self) -> None:
+        """Listen on the socket until cancelled, removing it on exit."""
+        self._prepare_socket_path()
+        # Create the socket owner-only from the start instead of chmod after bind
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=self.socket_path, limit=_MAX_REQUEST_BYTES
+            )
+        finally:
+            os.umask(previous_umask)
+        self.logger.info("ORB daemon listening on unix socket %s", self.socket_path)
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        except asyncio.CancelledError:
+            # close() cancels serve_forever(); anything else is a real cancellation
+            if not self._closing:
+                raise
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.socket_path)
+            self.logger.info("ORB daemon stopped after serving %d commands", self._commands_served)
+
+    def close(self) -> None:
+        """Stop accepting connections."""
+        self._closing = True
+        if self._server is not None:
+            self._server.close()
+
+    async def run(self, argv: list[str], cwd: Optional[str] = None, stdin: str = "") -> dict:
+        """
+        Run one CLI invocation in this process.
+
+        Args:
+            argv: Command-line arguments without the program name
+            cwd: Working directory of the caller
+            stdin: Standard input of the caller
+
+        Returns:
+            Response with ``stdout``, ``stderr`` and ``exit_code``, or ``fallback``
+        """
+        args, response = await self._admit(argv)
+        if response is not None:
+            return response
+        return await self._run_admitted(args, cwd, stdin)
+
+    async def _admit(self, argv: list[str]) -> tuple[Any, Optional[dict]]:
+        """
+        Parse an invocation and decide whether this process serves it.
+
+        Returns:
+            Parsed arguments of an accepted command, or the final response
+            (help output or ``fallback``) for one that is not run here
+        """
+        stdout, stderr = io.StringIO(), io.StringIO()
+        async with self._command_lock:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    args = self._parser.parse_args(argv or ["--help"])
+                except SystemExit as e:
+                    # Help and --version print the same here; usage errors get the
+                    # resource help fallback of the standalone CLI
+                    if _exit_code(e) != 0:
+                        return None, {"fallback": True}
+                    return None, _response(stdout, stderr, 0)
+
+        if not self._can_serve(args):
+            return None, {"fallback": True}
+        return args, None
+
+    async def _run_admitted(self, args: Any, cwd: Optional[str], stdin: str) -> dict:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        async with self._command_lock:
+            with (
+                contextlib.redirect_stdout(stdout),
+                contextlib.redirect_stderr(stderr),
+                _swap_stdin(stdin),
+            ):
+                _resolve_paths(args, cwd)
+                exit_code = await self._execute(args)
+                self._commands_served += 1
+        return _response(stdout, stderr, exit_code)
+
+    def _can_serve(self, args) -> bool:
+        resource = getattr(args, "resource", None)
+        action = getattr(args, "action", None)
+        if resource is None or action is None or args.completion:
+            return False
+        if (resource, None) in _UNSERVED_COMMANDS or (resource, action) in _UNSERVED_COMMANDS:
+            return False
+        if any(getattr(args, flag, None) for flag in _PROCESS_OVERRIDES):
+            return False
+        return not args.config or args.config == self.config_path
+
+    async def _execute(self, args) -> int:
+        """Mirror ``orb.cli.main.main`` for an already initialized process."""
+        from orb.cli.console import print_error, print_success
+        from orb.cli.router import execute_command
+
+        config = None
+        if getattr(args, "scheduler", None):
+            from orb.domain.base.ports.configuration_port import ConfigurationPort
+            from orb.infrastructure.di.container import get_container
+
+            config = get_container().get(ConfigurationPort)
+            config.override_scheduler_strategy(args.scheduler)
+
+        try:
+            result = await execute_command(args, None, self._resource_parsers)
+
+            if isinstance(result, tuple) and len(result) == 2:
+                formatted_output, exit_code = result
+            else:
+                formatted_output, exit_code = result, 0
+
+            if args.output:
+                with open(args.output, "w") as f:
+                    f.write(formatted_output)
+                if not args.quiet:
+                    print_success(f"Output written to {args.output}")
+            else:
+                print(formatted_output)
+            return exit_code
+        except SystemExit as e:
+            return _exit_code(e)
+        except Exception as e:
+            from orb.cli.response_formatter import create_cli_formatter
+
+            self.logger.exception("Daemon command failed: %s", e)
+            error_output, exit_code = create_cli_formatter().format_error(
+                e, getattr(args, "format", "json")
+            )
+            if not args.quiet:
+                print_error(error_output)
+            return exit_code
+        finally:
+            if config is not None:
+                config.restore_scheduler_strategy()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            line = await reader.readline()
+            try:
+                request = json.loads(line)
+                argv = [str(arg) for arg in request["argv"]]
+            except (ValueError, KeyError, TypeError) as e:
+                response: Optional[dict[str, Any]] = {
+                    "stdout": "",
+                    "stderr": f"Invalid daemon request: {e}\n",
+                    "exit_code": 2,
+                }
+            else:
+                args, response = await self._admit(argv)
+                if response is None:
+                    await _send(writer, {"ready": True})
+                    stdin_line = await reader.readline()
+                    if not stdin_line:
+                        # Client went away before sending stdin; nothing was run
+                        return
+                    stdin = json.loads(stdin_line).get("stdin") or ""
+                    response = await self._run_admitted(args, request.get("cwd"), stdin)
+            await _send(writer, response)
+        except Exception as e:
+            self.logger.error("Daemon connection failed: %s", e, exc_info=True)
+        finally:
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    def _prepare_socket_path(self) -> None:
+        """Create the socket directory and remove a stale socket left by a dead daemon."""
+        path = Path(self.socket_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            path.unlink()
+        else:
+            raise RuntimeError(f"Another ORB daemon is already listening on {self.socket_path}")
+        finally:
+            probe.close()
+
+
+@contextlib.contextmanager
+def _swap_stdin(data: str):
+    original = sys.stdin
+    sys.stdin = io.StringIO(data)
+    try:
+        yield
+    finally:
+        sys.stdin = original
+
+
+def _resolve_paths(args, cwd: Optional[str]) -> None:
+    if not cwd:
+        return
+    for name in _PATH_ARGUMENTS:
+        value = getattr(args, name, None)
+        if isinstance(value, str) and value and not os.path.isabs(value):
+            setattr(args, name, os.path.join(cwd, value))
+
+
+async def _send(writer: asyncio.StreamWriter, message: dict) -> None:
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+
+
+def _exit_code(exit_exc: SystemExit) -> int:
+    if exit_exc.code is None:
+        return 0
+    return exit_exc.code if isinstance(exit_exc.code, int) else 1
+
+
+def _response(stdout: io.StringIO, stderr: io.StringIO, exit_code: int) -> dict:
+    return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "exit_code": exit_code}
@@ -0,0 +1,159 @@
+"""Diagnostic command handlers for the interface layer."""
+
+import asyncio
+import json
+import os
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+from typing import Any, Optional
+
+from orb.application.dto.interface_response import InterfaceResponse
+from orb.infrastructure.error.decorators import handle_interface_exceptions
+
+# Runs in a fresh interpreter so that imports are measured cold.
+_PROFILE_SCRIPT = """
+import sys, time
+started = time.perf_counter()
+import orb.bootstrap
+import_ms = (time.perf_counter() - started) * 1000
+from orb.interface.debug_command_handlers import run_profiled_startup
+run_profiled_startup(sys.argv[1] or None, import_ms, sys.argv[2])
+"""
+
+
+def run_profiled_startup(config_path: Optional[str], import_ms: float, output_file: str) -> None:
+    """
+    Initialize the application and write the recorded startup phases as JSON.
+
+    Entry point of the child process started by ``orb debug startup-profile``.
+
+    Args:
+        config_path: Configuration file passed to the application
+        import_ms: Time taken to import ``orb.bootstrap``
+        output_file: File receiving the JSON report
+    """
+    from orb.bootstrap import Application
+    from orb.infrastructure.di.startup_profile import get_startup_phases
+    from orb.infrastructure.di.startup_snapshot import get_loaded_startup_snapshots
+
+    started = time.perf_counter()
+
+    async def _initialize() -> bool:
+        app = Application(config_path, skip_validation=False)
+        return await app.initialize()
+
+    initialized = asyncio.run(_initialize())
+    report = {
+        "initialized": initialized,
+        "import_ms": round(import_ms, 1),
+        "init_ms": round((time.perf_counter() - started) * 1000, 1),
+        "modules_loaded": len(sys.modules),
+        "snapshot": [{"path": s.path, "status": s.status} for s in get_loaded_startup_snapshots()],
+        "phases": [
+            {
+                "phase": "  " * phase["depth"] + phase["name"],
+                "duration_ms": round(phase["duration_ms"], 1),
+                "modules_imported": phase["modules_imported"],
+            }
+            for phase in get_startup_phases()
+        ],
+    }
+    with open(output_file, "w") as f:
+        json.dump(report, f)
+
+
+def parse_import_times(importtime_output: str, top: int) -> list[dict[str, Any]]:
+    """
+    Return the slowest imports from ``python -X importtime`` output.
+
+    Args:
+        importtime_output: stderr of a process run with ``-X importtime``
+        top: Number of modules to return
+
+    Returns:
+        Modules sorted by cumulative import time, slowest first
+    """
+    imports = []
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        imports.append(
+            {
+                "module": parts[2].strip(),
+                "cumulative_ms": round(int(parts[1]) / 1000, 1),
+                "self_ms": round(int(parts[0]) / 1000, 1),
+            }
+        )
+    imports.sort(key=lambda i: i["cumulative_ms"], reverse=True)
+    return imports[:top]
+
+
+def _profile_once(config_path: Optional[str], top: int) -> dict[str, Any]:
+    """Profile one cold start in a child interpreter."""
+    fd, output_file = tempfile.mkstemp(prefix="orb-startup-profile-", suffix=".json")
+    os.close(fd)
+    try:
+        started = time.perf_counter()
+        completed = subprocess.run(  # nosec B603
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                _PROFILE_SCRIPT,
+                config_path or "",
+                output_file,
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+        try:
+            with open(output_file) as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            errors = [
+                line
+                for line in completed.stderr.splitlines()
+                if line.strip() and not line.startswith("import time:")
+            ]
+            return {
+                "initialized": False,
+                "wall_ms": round(wall_ms, 1),
+                "error": "\n".join(errors[-5:]),
+            }
+    finally:
+        os.remove(output_file)
+
+    report["wall_ms"] = round(wall_ms, 1)
+    report["slowest_imports"] = parse_import_times(completed.stderr, top)
+    return report
+
+
+@handle_interface_exceptions(context="startup_profile", interface_type="cli")
+async def handle_startup_profile(args) -> InterfaceResponse:
+    """
+    Report per-phase import and initialization times of a cold CLI start.
+
+    Each run starts a fresh interpreter, so the first run also shows the cost
+    of rebuilding a stale startup snapshot and later runs show a warm start.
+    """
+    runs = max(1, getattr(args, "runs", 2) or 2)
+    top = max(0, getattr(args, "top", 15) or 0)
+    config_path = getattr(args, "config", None)
+
+    loop = asyncio.get_running_loop()
+    reports = []
+    for _ in range(runs):
+        reports.append(await loop.run_in_executor(None, _profile_once, config_path, top))
+
+    success = all(report.get("initialized") for report in reports)
+    return InterfaceResponse(
+        data={"python": sys.executable, "runs": reports}, exit_code=0 if success else 1
+    )
@@ -84,6 +84,32 @@ async def handle_infrastructure_validate(args) -> Dict[str, Any]:
         }
 
 
+@handle_interface_exceptions(context="infrastructure_warm_cache", interface_type="cli")
+async def handle_infrastructure_warm_cache(args) -> Dict[str, Any]:
+    """Handle orb infrastructure warm-cache command."""
+    try:
+        if args.provider:
+            providers = [_get_provider_config(args.provider)]
+        else:
+            providers = _get_active_providers_with_overrides()
+
+        results = []
+        for provider in providers:
+            result = await _warm_provider_caches(provider, getattr(args, "force", False))
+            results.append(result)
+
+        return {
+            "status": "success",
+            "providers": results,
+        }
+
+    except Exception as e:
+        return {
+            "error": f"Cache warm-up failed: {e}",
+            "status": "error",
+        }
+
+
 async def _discover_provider_infrastructure(provider: Dict[str, Any], args) -> Dict[str, Any]:
     """Discover infrastructure for a provider using strategy pattern."""
     try:
@@ -164,6 +190,21 @@ async def _validate_provider_infrastructure(provider: Dict[str, Any]) -> Dict[st
         return {"provider": provider["name"], "error": str(e)}
 
 
+async def _warm_provider_caches(provider: Dict[str, Any], force: bool) -> Dict[str, Any]:
+    """Warm the on-disk caches of a provider using strategy pattern."""
+    try:
+        from orb.domain.base.ports.provider_discovery_port import ProviderDiscoveryPort
+
+        container = get_container()
+        provider_strategy = container.get(ProviderDiscoveryPort)
+        result = provider_strategy.warm_caches(provider, force=force)
+        return result or {"provider": provider["name"], "error": "Cache warm-up not supported"}
+
+    except Exception as e:
+        get_container().get(ConsolePort).error(f"Failed to warm caches for {provider['name']}: {e}")
+        return {"provider": provider["name"], "error": str(e)}
+
+
 def _get_active_providers() -> List[Dict[str, Any]]:
     """Get all active providers from configuration."""
     config_dir = get_config_location()
@@ -69,6 +69,7 @@ class OpenResourceBrokerMCPServer:
             handle_list_requests,
             handle_request_machines,
             handle_request_return_machines,
+            handle_subscribe_request_status,
         )
         from orb.interface.system_command_handlers import (
             handle_list_providers,
@@ -95,6 +96,7 @@ class OpenResourceBrokerMCPServer:
 
         # Request tools
         self.tools["get_request_status"] = handle_get_request_status
+        self.tools["subscribe_request_status"] = handle_subscribe_request_status
         self.tools["list_requests"] = handle_list_requests
         self.tools["request_machines"] = handle_request_machines
         self.tools["list_return_requests"] = handle_get_return_requests
@@ -424,6 +426,14 @@ class OpenResourceBrokerMCPServer:
             },
             "required": [],
         },
+        "subscribe_request_status": {
+            "properties": {
+                "request_ids": {"type": "array", "items": {"type": "string"}},
+                "subscription_id": {"type": "string"},
+                "timeout": {"type": "number"},
+            },
+            "required": [],
+        },
         "list_requests": {
             "properties": {
                 "status": {"type": "string"},
@@ -472,3 +472,65 @@ async def handle_watch_request_status(
         }
     except KeyboardInterrupt:
         return {"request_id": str(request_id), "status": "cancelled"}
+
+
+# Open status subscriptions of long-poll callers (MCP sessions), by subscription id
+_status_subscriptions: dict[str, tuple[Any, float]] = {}
+_STATUS_SUBSCRIPTION_IDLE_SECONDS = 300.0
+
+
+@handle_interface_exceptions(context="subscribe_request_status", interface_type="cli")
+async def handle_subscribe_request_status(
+    args: "argparse.Namespace",
+) -> Union[dict[str, Any], "InterfaceResponse"]:
+    """Long-poll request status changes from the shared status hub.
+
+    The first call subscribes and returns each request's full status with a
+    subscription_id; calls passing that subscription_id back return only what
+    changed since the previous call. Subscriptions close once every request
+    is terminal, or after five idle minutes.
+    """
+    import time
+    import uuid
+
+    from orb.application.services.request_status_hub import RequestStatusHub
+
+    now = time.monotonic()
+    for key, (stale, last_used) in list(_status_subscriptions.items()):
+        if now - last_used > _STATUS_SUBSCRIPTION_IDLE_SECONDS:
+            stale.close()
+            _status_subscriptions.pop(key, None)
+
+    timeout = float(getattr(args, "timeout", None) or 30)
+    subscription_id = getattr(args, "subscription_id", None)
+    if subscription_id:
+        entry = _status_subscriptions.get(subscription_id)
+        if entry is None:
+            return {
+                "error": "Unknown subscription",
+                "message": f"Subscription {subscription_id} expired or does not exist",
+            }
+        subscription = entry[0]
+    else:
+        request_ids = list(getattr(args, "request_ids", None) or [])
+        request_id = getattr(args, "request_id", None)
+        if request_id:
+            request_ids.append(request_id)
+        if not request_ids:
+            return {"error": "No request ID provided", "message": "Request ID is required"}
+        subscription = get_container().get(RequestStatusHub).subscribe(request_ids)
+        subscription_id = str(uuid.uuid4())
+
+    updates = await subscription.next(timeout)
+    done = subscription.done
+    if done:
+        subscription.close()
+        _status_subscriptions.pop(subscription_id, None)
+    else:
+        _status_subscriptions[subscription_id] = (subscription, time.monotonic())
+
+    return {
+        "subscription_id": subscription_id,
+        "updates": [update.to_dict() for update in updates],
+        "done": done,
+    }
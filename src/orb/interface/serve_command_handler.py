@@ -136,8 +136,17 @@ async def handle_serve_api(args) -> dict[str, Any]:
                 "ORB REST API listening on http://%s:%s", server_config.host, server_config.port
             )
 
+        # Refresh active requests in the background so status polls answer from storage
+        from orb.application.services.request_sync_engine import RequestSyncEngine
+
+        sync_engine = container.get(RequestSyncEngine)
+        sync_engine.start()
+
         # Start the server (this blocks until shutdown)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            sync_engine.stop()
 
         # Server has shut down — return minimal info for logging
         return {"message": "Server stopped"}
@@ -0,0 +1,240 @@
+"""Streaming histograms with bounded memory."""
+
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any, Optional
+
+# Prometheus client default buckets, in seconds
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+DEFAULT_QUANTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+
+# Values at or below this are counted as zero by the sketch
+_MIN_INDEXABLE_VALUE = 1e-9
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees.
+
+    Values are counted in logarithmically sized bins (as in DDSketch), so any
+    quantile is answered within ``relative_accuracy`` of the true value while
+    memory depends only on the range of the data, not on the sample count.
+    Sketches with the same accuracy merge by adding bin counts.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048) -> None:
+        """
+        Initialize the sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+            max_bins: Bin budget; the lowest bins are collapsed beyond it
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Add one observation; negative values count as zero."""
+        self.count += 1
+        if value <= _MIN_INDEXABLE_VALUE:
+            self._zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._bins[index] = self._bins.get(index, 0) + 1
+        if len(self._bins) > self.max_bins:
+            self._collapse_lowest()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("quantile must be between 0 and 1")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._bins):
+            seen += self._bins[index]
+            if rank < seen:
+                return 2 * self._gamma**index / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._bins) / (self._gamma + 1)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the observations of another sketch with the same accuracy."""
+        if not math.isclose(self._gamma, other._gamma):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, count in other._bins.items():
+            self._bins[index] = self._bins.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        while len(self._bins) > self.max_bins:
+            self._collapse_lowest()
+
+    def clear(self) -> None:
+        """Drop all observations."""
+        self._bins.clear()
+        self._zero_count = 0
+        self.count = 0
+
+    def _collapse_lowest(self) -> None:
+        lowest, second = sorted(self._bins)[:2]
+        self._bins[second] += self._bins.pop(lowest)
+
+
+class Histogram:
+    """
+    Thread-safe streaming histogram.
+
+    Each observation updates fixed cumulative buckets (for Prometheus
+    ``_bucket``/``_sum``/``_count`` export), running count/sum/min/max and a
+    :class:`QuantileSketch` for percentiles, all in constant time and memory
+    per sample.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        relative_accuracy: float = 0.01,
+    ) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets: Upper bounds of the buckets; ``+Inf`` is implied
+            relative_accuracy: Relative error of reported quantiles
+        """
+        self.buckets: tuple[float, ...] = tuple(sorted(b for b in buckets if b != math.inf))
+        self._bucket_counts = [0] * (len(self.buckets) + 1)
+        self._sketch = QuantileSketch(relative_accuracy)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        with self._lock:
+            self._bucket_counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+            self._sketch.add(value)
+
+    @property
+    def mean(self) -> float:
+        """Mean of all observations (0.0 when empty)."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile, clamped to the observed min/max."""
+        with self._lock:
+            value = self._sketch.quantile(q)
+            if value is None or self.min is None or self.max is None:
+                return value
+            return min(max(value, self.min), self.max)
+
+    def merge(self, other: "Histogram") -> None:
+        """Add the observations of another histogram with the same buckets."""
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets")
+        with other._lock:
+            counts = list(other._bucket_counts)
+            count, total = other.count, other.sum
+            low, high = other.min, other.max
+            sketch = QuantileSketch(other._sketch.relative_accuracy, other._sketch.max_bins)
+            sketch.merge(other._sketch)
+        with self._lock:
+            self._bucket_counts = [a + b for a, b in zip(self._bucket_counts, counts)]
+            self.count += count
+            self.sum += total
+            if low is not None:
+                self.min = low if self.min is None else min(self.min, low)
+            if high is not None:
+                self.max = high if self.max is None else max(self.max, high)
+            self._sketch.merge(sketch)
+
+    def reset(self) -> None:
+        """Drop all observations."""
+        with self._lock:
+            self._bucket_counts = [0] * (len(self.buckets) + 1)
+            self._sketch.clear()
+            self.count = 0
+            self.sum = 0.0
+            self.min = None
+            self.max = None
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        """Return ``(upper_bound, cumulative_count)`` pairs ending with ``+Inf``."""
+        with self._lock:
+            counts = list(self._bucket_counts)
+        cumulative = 0
+        result = []
+        for bound, bucket_count in zip((*self.buckets, math.inf), counts):
+            cumulative += bucket_count
+            result.append((bound, cumulative))
+        return result
+
+    def snapshot(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> dict[str, Any]:
+        """Summarise the histogram as a JSON-serialisable dictionary."""
+        summary: dict[str, Any] = {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+        }
+        for q in quantiles:
+            summary[f"p{q * 100:g}"] = self.quantile(q)
+        summary["buckets"] = {
+            _format_bound(bound): count for bound, count in self.cumulative_buckets()
+        }
+        return summary
+
+    def to_prometheus_lines(self, name: str, labels: Optional[dict[str, str]] = None) -> list[str]:
+        """Render the histogram as Prometheus ``_bucket``/``_sum``/``_count`` samples."""
+        base = [f'{k}="{v}"' for k, v in (labels or {}).items()]
+        lines = [f"# TYPE {name} histogram"]
+        for bound, count in self.cumulative_buckets():
+            bucket_labels = ",".join([*base, f'le="{_format_bound(bound)}"'])
+            lines.append(f"{name}_bucket{{{bucket_labels}}} {count}")
+        joined = ",".join(base)
+        lines.append(f"{name}_sum{{{joined}}} {self.sum}")
+        lines.append(f"{name}_count{{{joined}}} {self.count}")
+        return lines
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(float(bound))
@@ -4,12 +4,14 @@ import json
 import threading
 import time
 from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
 
 from orb.domain.base.ports.logging_port import LoggingPort
+from orb.monitoring.histogram import DEFAULT_BUCKETS, Histogram
 
 # Module-level constant to avoid B008 warning
 DEFAULT_MAX_AGE = timedelta(days=7)
@@ -76,7 +78,7 @@ class MetricsCollector:
         self._logger = logger
         self.config = config
         self.metrics: dict[str, Metric] = {}
-        self.timers: dict[str, list[float]] = {}
+        self.timers: dict[str, Histogram] = {}
         self._lock = threading.RLock()  # Same thread can re-acquire the lock
 
         # Create metrics directory with PermissionError fallback
@@ -209,16 +211,25 @@ class MetricsCollector:
             labels = {}
         return Timer(name, labels)
 
+    def observe(
+        self, name: str, value: float, buckets: Optional[Sequence[float]] = None
+    ) -> Histogram:
+        """Record a value in a histogram, creating it with the given buckets if needed."""
+        with self._lock:
+            histogram = self.timers.get(name)
+            if histogram is None:
+                histogram = Histogram(buckets or DEFAULT_BUCKETS)
+                self.timers[name] = histogram
+            histogram.observe(value)
+            return histogram
+
     def record_time(self, name: str, duration: float) -> None:
         """Record a timing duration."""
         with self._lock:
-            if name not in self.timers:
-                self.timers[name] = []
-            self.timers[name].append(duration)
+            histogram = self.observe(name, duration)
 
-            # Calculate and update average response time
-            avg_time = sum(self.timers[name]) / len(self.timers[name])
-            self.set_gauge(f"{name}_seconds", avg_time)
+            # Keep the average gauge for consumers of the flat metrics
+            self.set_gauge(f"{name}_seconds", histogram.mean)
 
             # Add trace entry if tracing is enabled
             if self.trace_enabled and self._trace_buffer is not None:
@@ -271,6 +282,12 @@ class MetricsCollector:
         with self._lock:
             return {name: metric.to_dict() for name, metric in self.metrics.items()}
 
+    def get_histograms(self) -> dict[str, dict[str, Any]]:
+        """Get a summary (count, sum, percentiles, buckets) of every histogram."""
+        with self._lock:
+            histograms = dict(self.timers)
+        return {name: histogram.snapshot() for name, histogram in histograms.items()}
+
     def get_traces(self) -> list[dict]:
         """Return a snapshot of current traces."""
         with self._lock:
@@ -332,12 +349,14 @@ class MetricsCollector:
         with metrics_file.open("w") as f:
             json.dump(metrics, f, indent=2)
 
+        histograms_file = self.metrics_dir / "histograms.json"
+        with histograms_file.open("w") as f:
+            json.dump(self.get_histograms(), f, indent=2)
+
         # Write to Prometheus format
         prom_file = self.metrics_dir / "metrics.prom"
         with prom_file.open("w") as f:
-            for name, metric in metrics.items():
-                labels = ",".join(f'{k}="{v}"' for k, v in metric["labels"].items())
-                f.write(f"{name}{{{labels}}} {metric['value']}\n")
+            f.write(self.to_prometheus_text())
 
         # Flush traces if tracing is enabled
         if self.trace_enabled and self._trace_buffer:
@@ -350,6 +369,10 @@ class MetricsCollector:
         for name, metric in metrics.items():
             labels = ",".join(f'{k}="{v}"' for k, v in metric["labels"].items())
             lines.append(f"{name}{{{labels}}} {metric['value']}")
+        with self._lock:
+            histograms = dict(self.timers)
+        for name, histogram in histograms.items():
+            lines.extend(histogram.to_prometheus_lines(name))
         return "\n".join(lines) + "\n" if lines else ""
 
     def flush(self) -> None:
@@ -407,7 +430,7 @@ class MetricsCollector:
         with self._lock:
             # Clean up timers
             for name in list(self.timers.keys()):
-                if not self.timers[name]:
+                if not self.timers[name].count:
                     del self.timers[name]
 
             # Clean up old metric files
@@ -1,18 +1,36 @@
 """AWS Provider implementation."""
 
-from orb.providers.aws.configuration.config import AWSProviderConfig
-from orb.providers.aws.configuration.template_extension import (
-    AMIResolutionConfig,
-    AWSTemplateExtensionConfig,
-)
-from orb.providers.aws.registration import (
-    get_aws_extension_defaults,
-    initialize_aws_provider,
-    is_aws_provider_registered,
-    register_aws_extensions,
-    register_aws_template_factory,
-)
-from orb.providers.aws.strategy.aws_provider_strategy import AWSProviderStrategy
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from orb.providers.aws.configuration.config import AWSProviderConfig
+    from orb.providers.aws.configuration.template_extension import (
+        AMIResolutionConfig,
+        AWSTemplateExtensionConfig,
+    )
+    from orb.providers.aws.registration import (
+        get_aws_extension_defaults,
+        initialize_aws_provider,
+        is_aws_provider_registered,
+        register_aws_extensions,
+        register_aws_template_factory,
+    )
+    from orb.providers.aws.strategy.aws_provider_strategy import AWSProviderStrategy
+
+# Exports are imported on first access: importing a submodule such as
+# orb.providers.aws.registration must not load the provider strategy and boto3
+# clients for commands that never talk to AWS.
+_LAZY_EXPORTS = {
+    "AMIResolutionConfig": "orb.providers.aws.configuration.template_extension",
+    "AWSProviderConfig": "orb.providers.aws.configuration.config",
+    "AWSProviderStrategy": "orb.providers.aws.strategy.aws_provider_strategy",
+    "AWSTemplateExtensionConfig": "orb.providers.aws.configuration.template_extension",
+    "get_aws_extension_defaults": "orb.providers.aws.registration",
+    "initialize_aws_provider": "orb.providers.aws.registration",
+    "is_aws_provider_registered": "orb.providers.aws.registration",
+    "register_aws_extensions": "orb.providers.aws.registration",
+    "register_aws_template_factory": "orb.providers.aws.registration",
+}
 
 __all__: list[str] = [
     "AMIResolutionConfig",
@@ -25,3 +43,15 @@ __all__: list[str] = [
     "register_aws_extensions",
     "register_aws_template_factory",
 ]
+
+
+def __getattr__(name: str):
+    """Import an export on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -21,6 +21,8 @@ from orb.infrastructure.adapters.ports.auth import (
     AuthResult,
     AuthStatus,
 )
+from orb.infrastructure.auth.jwks_cache import JWKSKeyCache
+from orb.infrastructure.auth.token_cache import ValidatedTokenCache
 
 
 @injectable
@@ -35,6 +37,8 @@ class CognitoAuthStrategy(AuthPort):
         region: str = "us-east-1",
         jwks_url: Optional[str] = None,
         enabled: bool = True,
+        jwks_cache_ttl: float = 3600,
+        token_cache_size: int = 10000,
     ) -> None:
         """
         Initialize Cognito authentication strategy.
@@ -45,6 +49,8 @@ class CognitoAuthStrategy(AuthPort):
             region: AWS region
             jwks_url: JWKS URL for token verification (auto-generated if not provided)
             enabled: Whether this strategy is enabled
+            jwks_cache_ttl: Seconds JWKS keys are used before being refreshed
+            token_cache_size: Validated tokens kept in memory (0 disables the cache)
         """
         self.user_pool_id = user_pool_id
         self.client_id = client_id
@@ -59,6 +65,8 @@ class CognitoAuthStrategy(AuthPort):
             self.jwks_url = (
                 f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}/.well-known/jwks.json"
             )
+        self.jwks_cache = JWKSKeyCache(self.jwks_url, ttl_seconds=jwks_cache_ttl)
+        self.token_cache = ValidatedTokenCache(token_cache_size)
 
         # Initialize Cognito client
         try:
@@ -107,6 +115,10 @@ class CognitoAuthStrategy(AuthPort):
         Returns:
             Authentication result with user information from Cognito
         """
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            return cached
+
         try:
             # Decode token without verification first to get header
             unverified_header = jwt.get_unverified_header(token)
@@ -115,8 +127,7 @@ class CognitoAuthStrategy(AuthPort):
             if not kid:
                 return AuthResult(status=AuthStatus.INVALID, error_message="Token missing key ID")
 
-            # Get public key from JWKS (simplified - in production, cache this)
-            public_key = await self._get_public_key(kid)
+            public_key = await self.jwks_cache.get_key(kid)
             if not public_key:
                 return AuthResult(
                     status=AuthStatus.INVALID,
@@ -144,7 +155,7 @@ class CognitoAuthStrategy(AuthPort):
             # Generate permissions based on roles
             permissions = self._generate_permissions(roles)
 
-            return AuthResult(
+            result = AuthResult(
                 status=AuthStatus.SUCCESS,
                 user_id=user_id,
                 user_roles=roles,
@@ -160,6 +171,8 @@ class CognitoAuthStrategy(AuthPort):
                     "client_id": payload.get("aud"),
                 },
             )
+            self.token_cache.put(token, result)
+            return result
 
         except jwt.ExpiredSignatureError:
             return AuthResult(status=AuthStatus.EXPIRED, error_message="Token has expired")
@@ -215,6 +228,7 @@ class CognitoAuthStrategy(AuthPort):
         Returns:
             True if token was revoked successfully
         """
+        self.token_cache.invalidate(token)
         try:
             # Cognito doesn't have a direct revoke endpoint for access tokens
             # You would typically revoke the refresh token or sign out the user
@@ -246,37 +260,6 @@ class CognitoAuthStrategy(AuthPort):
         """
         return self.enabled
 
-    async def _get_public_key(self, kid: str) -> Optional[str]:
-        """
-        Get public key from Cognito JWKS endpoint.
-
-        Args:
-            kid: Key ID from token header
-
-        Returns:
-            Public key for token verification
-        """
-        try:
-            # In production, you would cache JWKS and implement appropriate key rotation
-            # This is a simplified implementation
-            import requests
-
-            # Add timeout to prevent hanging connections (security best practice)
-            response = requests.get(self.jwks_url, timeout=30)
-            jwks = response.json()
-
-            for key in jwks.get("keys", []):
-                if key.get("kid") == kid:
-                    # Convert JWK to PEM format (simplified)
-                    # In production, use a appropriate JWK library
-                    return key  # Return the key dict for now
-
-            return None
-
-        except Exception as e:
-            self._logger.error("Failed to get public key: %s", e)
-            return None
-
     def _map_groups_to_roles(self, groups: list[str]) -> list[str]:
         """
         Map Cognito groups to application roles.
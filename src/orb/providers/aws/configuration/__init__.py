@@ -9,6 +9,7 @@ from .config import (
     HandlersConfig,
 )
 from .naming_config import AWSNamingConfig
+from .rate_limit_config import AWSRateLimitConfig, AWSTokenBucketConfig
 from .validator import AWSConfigManager, get_aws_config_manager
 
 __all__: list[str] = [
@@ -16,6 +17,8 @@ __all__: list[str] = [
     "AWSConfigManager",
     "AWSNamingConfig",
     "AWSProviderConfig",
+    "AWSRateLimitConfig",
+    "AWSTokenBucketConfig",
     "CleanupConfig",
     "CleanupResourcesConfig",
     "HandlerCapabilityConfig",
@@ -9,6 +9,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from orb.infrastructure.interfaces.provider import BaseProviderConfig
 from orb.providers.aws.configuration.batch_sizes_config import AWSBatchSizesConfig
 from orb.providers.aws.configuration.naming_config import AWSNamingConfig
+from orb.providers.aws.configuration.rate_limit_config import AWSRateLimitConfig
 from orb.providers.aws.domain.template.value_objects import ProviderApi
 from orb.providers.aws.storage.config import AWSStorageConfig
 
@@ -168,6 +169,12 @@ class AWSProviderConfig(BaseSettings, BaseProviderConfig):  # type: ignore[misc]
         description="Batch sizes for AWS EC2 API operations",
     )
 
+    # Client-side rate limiting of AWS API calls
+    rate_limit: AWSRateLimitConfig = Field(
+        default_factory=AWSRateLimitConfig,  # type: ignore[call-arg]
+        description="Adaptive token buckets shaping AWS API calls",
+    )
+
     # AWS-specific naming patterns configuration
     naming: AWSNamingConfig = Field(
         default_factory=AWSNamingConfig,  # type: ignore[call-arg]
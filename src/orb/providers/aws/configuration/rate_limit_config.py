@@ -0,0 +1,48 @@
+"""AWS client-side rate limiting configuration."""
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class AWSTokenBucketConfig(BaseModel):
+    """Size and refill rate of one token bucket."""
+
+    capacity: float = Field(..., gt=0, description="Maximum tokens (burst size)")
+    refill_rate: float = Field(..., gt=0, description="Tokens added per second")
+
+
+class AWSRateLimitConfig(BaseModel):
+    """Client-side token buckets shaping AWS API calls per account, region and action."""
+
+    enabled: bool = Field(True, description="Shape AWS API calls before AWS throttles them")
+    max_wait_seconds: float = Field(
+        30.0, ge=0, description="Longest a single call waits for tokens before proceeding"
+    )
+    decrease_factor: float = Field(
+        0.5, gt=0, lt=1, description="Refill rate multiplier applied on a throttling error"
+    )
+    increase_fraction: float = Field(
+        0.05,
+        gt=0,
+        description="Fraction of the configured refill rate restored per successful call",
+    )
+    min_refill_rate: float = Field(
+        0.5, gt=0, description="Lowest refill rate (tokens/s) reached by backing off"
+    )
+    buckets: dict[str, AWSTokenBucketConfig] = Field(
+        default_factory=dict,
+        description=(
+            "Request bucket overrides keyed by 'service:Action' (e.g. 'ec2:RunInstances', "
+            "'auto-scaling:*') using botocore's hyphenated service id, where '*' sets a "
+            "service-wide default"
+        ),
+    )
+
+    @field_validator("buckets")
+    @classmethod
+    def validate_bucket_keys(cls, v: dict[str, AWSTokenBucketConfig]) -> dict:
+        """Ensure bucket keys name a service and action."""
+        for key in v:
+            service, _, action = key.partition(":")
+            if not service or not action:
+                raise ValueError(f"Rate limit bucket key must be 'service:Action', got {key!r}")
+        return v
@@ -5,6 +5,8 @@ This module provides an adapter for AWS-specific resource provisioning operation
 It implements the ResourceProvisioningPort interface from the domain layer.
 """
 
+import asyncio
+import functools
 from typing import Any, Optional
 
 from orb.domain.base.dependency_injection import injectable
@@ -93,7 +95,12 @@ class AWSProvisioningAdapter(ResourceProvisioningPort):
         # Check if dry-run mode is requested
         is_dry_run = request.metadata.get("dry_run", False)
 
-        return self._provision_via_handlers(request, template, dry_run=is_dry_run)
+        # Handlers make blocking boto3 calls; run them off the event loop so
+        # concurrently dispatched batches overlap instead of running in turn
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self._provision_via_handlers, request, template, is_dry_run)
+        )
 
     async def _provision_via_strategy(
         self, request: Request, template: Template, dry_run: bool = False
@@ -226,7 +233,7 @@ class AWSProvisioningAdapter(ResourceProvisioningPort):
             self._logger.error("Failed to resolve image_id '%s': %s", image_id, e)
             raise InfrastructureError(
                 f"Failed to resolve AMI ID for image_id '{image_id}': {e}. "
-                "Ensure the SSM parameter path is valid and the IAM role has ssm:GetParameter permission."
+                "Ensure the SSM parameter path is valid and the IAM role has ssm:GetParameters permission."
             )
 
         return template
@@ -15,6 +15,7 @@ from orb.providers.aws.exceptions.aws_exceptions import (
     NetworkError,
 )
 from orb.providers.aws.infrastructure.instrumentation.botocore_metrics import BotocoreMetricsHandler
+from orb.providers.aws.resilience.aws_rate_limiter import get_aws_rate_limiter
 
 if TYPE_CHECKING:
     from orb.providers.aws.configuration.config import AWSProviderConfig
@@ -127,6 +128,13 @@ class AWSClient:
                     "AWS API metrics collection disabled - no MetricsCollector provided or AWS_METRICS_ENABLED=false"
                 )
 
+            # Shape API calls through the token buckets shared by every AWS client
+            rate_limit_config = aws_provider_config.rate_limit if aws_provider_config else None
+            if rate_limit_config is None or rate_limit_config.enabled:
+                get_aws_rate_limiter(rate_limit_config, logger).register_events(
+                    self.session, self.profile_name or "default", self.region_name
+                )
+
             # Single comprehensive INFO log with all important details
             self._logger.info(
                 "AWS client initialized with region: %s, profile: %s, retries: %d, timeouts: connect=%ds, read=%ds",
@@ -3,67 +3,171 @@
 import json
 import os
 import time
+from collections.abc import Callable, Mapping
 from typing import Any, Dict, Optional
 
+from filelock import FileLock, Timeout
+
 from orb.domain.services.image_cache import ImageCache
+from orb.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# The log is compacted once it holds this many lines and half of them are dead
+_COMPACT_MIN_LINES = 256
+_LOCK_TIMEOUT_SECONDS = 10
 
 
 class AWSImageCache(ImageCache):
-    """AWS-specific image cache with provider-instance isolation."""
+    """
+    AWS-specific image cache with provider-instance isolation.
 
-    def __init__(self, provider_name: str, cache_dir: str, ttl_seconds: int = 3600):
+    Entries are appended to a JSON Lines log under a cross-process file lock,
+    so a ``set`` costs one short append instead of a full-file rewrite and
+    concurrent processes never lose each other's entries. Every entry carries
+    its own expiry. Once superseded and expired lines outnumber live entries,
+    the log is compacted into a temp file that is renamed over the original.
+    """
+
+    def __init__(
+        self,
+        provider_name: str,
+        cache_dir: str,
+        ttl_seconds: int = 3600,
+        *,
+        clock: Callable[[], float] = time.time,
+    ):
         self._provider_name = provider_name
-        self._cache_file = os.path.join(cache_dir, f"image_cache_{provider_name}.json")
+        self._cache_file = os.path.join(cache_dir, f"image_cache_{provider_name}.jsonl")
         self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._file_lock = FileLock(f"{self._cache_file}.lock", timeout=_LOCK_TIMEOUT_SECONDS)
         self._runtime_cache: Dict[str, Dict[str, Any]] = {}
+        self._identity: Optional[tuple[int, int]] = None
+        self._offset = 0
+        self._line_count = 0
         self._load_cache()
 
     def get(self, image_specification: str) -> Optional[str]:
         """Get cached image ID for specification."""
-        if image_specification in self._runtime_cache:
-            entry = self._runtime_cache[image_specification]
-            if time.time() - entry["timestamp"] < self._ttl_seconds:
-                return entry["image_id"]
-            else:
-                # Expired, remove from cache
-                del self._runtime_cache[image_specification]
-        return None
+        entry = self._live_entry(image_specification)
+        if entry is None:
+            # Another process may have resolved it since the last read
+            self._load_cache()
+            entry = self._live_entry(image_specification)
+        return entry["image_id"] if entry else None
 
     def set(self, image_specification: str, image_id: str) -> None:
         """Cache resolved image ID."""
-        self._runtime_cache[image_specification] = {
-            "image_id": image_id,
-            "timestamp": time.time(),
-        }
-        self._save_cache()
+        self.set_many({image_specification: image_id})
+
+    def set_many(self, image_ids: Mapping[str, str], ttl_seconds: Optional[float] = None) -> None:
+        """
+        Cache several resolved image IDs with a single append.
+
+        Args:
+            image_ids: Resolved image ID of each specification
+            ttl_seconds: Lifetime of these entries (default: the cache TTL)
+        """
+        if not image_ids:
+            return
+        expires_at = self._clock() + (self._ttl_seconds if ttl_seconds is None else ttl_seconds)
+        records = [
+            {"spec": spec, "image_id": image_id, "expires_at": expires_at}
+            for spec, image_id in image_ids.items()
+        ]
+        for record in records:
+            self._runtime_cache[record["spec"]] = record
+
+        try:
+            os.makedirs(os.path.dirname(self._cache_file) or ".", exist_ok=True)
+            with self._file_lock:
+                self._load_cache()
+                self._append(records)
+                if self._needs_compaction():
+                    self._compact()
+        except (OSError, Timeout) as e:
+            # Graceful degradation: entries stay in the runtime cache
+            logger.debug("Failed to persist image cache %s: %s", self._cache_file, e)
 
     def clear_expired(self) -> None:
         """Remove expired cache entries."""
-        current_time = time.time()
+        now = self._clock()
         expired_keys = [
-            key
-            for key, entry in self._runtime_cache.items()
-            if current_time - entry["timestamp"] >= self._ttl_seconds
+            key for key, entry in self._runtime_cache.items() if entry["expires_at"] <= now
         ]
         for key in expired_keys:
             del self._runtime_cache[key]
-        if expired_keys:
-            self._save_cache()
+        if not expired_keys:
+            return
+        try:
+            with self._file_lock:
+                self._load_cache()
+                self._compact()
+        except (OSError, Timeout) as e:
+            logger.debug("Failed to compact image cache %s: %s", self._cache_file, e)
+
+    def _live_entry(self, image_specification: str) -> Optional[Dict[str, Any]]:
+        entry = self._runtime_cache.get(image_specification)
+        if entry is None or entry["expires_at"] <= self._clock():
+            return None
+        return entry
 
     def _load_cache(self) -> None:
-        """Load cache from disk."""
-        if os.path.exists(self._cache_file):
+        """Read entries appended since the last read (everything if the log was replaced)."""
+        try:
+            stat = os.stat(self._cache_file)
+        except OSError:
+            return
+        identity = (stat.st_dev, stat.st_ino)
+        if identity != self._identity or stat.st_size < self._offset:
+            self._runtime_cache = {}
+            self._identity = identity
+            self._offset = 0
+            self._line_count = 0
+        if stat.st_size == self._offset:
+            return
+
+        try:
+            with open(self._cache_file, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read()
+        except OSError:
+            return
+        for line in chunk.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                # Torn append in progress; read it once it is complete
+                break
+            self._offset += len(line)
+            self._line_count += 1
             try:
-                with open(self._cache_file) as f:
-                    self._runtime_cache = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self._runtime_cache = {}
-
-    def _save_cache(self) -> None:
-        """Save cache to disk."""
-        os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+                record = json.loads(line)
+                self._runtime_cache[record["spec"]] = record
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    def _append(self, records: list[Dict[str, Any]]) -> None:
+        payload = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        with open(self._cache_file, "a", encoding="utf-8") as f:
+            f.write(payload)
+        self._load_cache()
+
+    def _needs_compaction(self) -> bool:
+        return self._line_count >= _COMPACT_MIN_LINES and self._line_count > 2 * len(
+            self._runtime_cache
+        )
+
+    def _compact(self) -> None:
+        """Rewrite the log with only live entries. Callers must hold the file lock."""
+        now = self._clock()
+        live = [entry for entry in self._runtime_cache.values() if entry["expires_at"] > now]
+        temp_file = f"{self._cache_file}.{os.getpid()}.tmp"
         try:
-            with open(self._cache_file, "w") as f:
-                json.dump(self._runtime_cache, f, indent=2)
-        except IOError:
-            pass  # Graceful degradation if cache can't be saved
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(entry, separators=(",", ":")) + "\n" for entry in live)
+            os.replace(temp_file, self._cache_file)
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        self._identity = None
+        self._load_cache()
@@ -35,6 +35,9 @@ from orb.providers.aws.exceptions.aws_exceptions import (
     ResourceInUseError,
 )
 from orb.providers.aws.infrastructure.aws_client import AWSClient
+from orb.providers.aws.infrastructure.services.instance_describe_service import (
+    get_instance_describe_service,
+)
 from orb.providers.aws.infrastructure.tags import build_resource_tags
 
 T = TypeVar("T")
@@ -100,6 +103,9 @@ class AWSHandler(ABC):
         self.base_delay = 1  # seconds
         self.max_delay = 10  # seconds
 
+        # Batched describe_instances shared with every handler on this AWS client
+        self._instance_describer = get_instance_describe_service(aws_client, logger)
+
         # Setup required dependencies
         self._setup_aws_operations(aws_ops)
         self._setup_dependencies(request_adapter, machine_adapter)
@@ -605,59 +611,18 @@ class AWSHandler(ABC):
             InfrastructureError: For other AWS API errors
         """
         try:
-            # Use AWS client's EC2 client for describe_instances
-            response = self.aws_client.ec2_client.describe_instances(InstanceIds=instance_ids)
-
-            instances: list[dict[str, Any]] = []
-            reservations = response.get("Reservations", [])
+            raw_instances = self._instance_describer.describe_instances(
+                instance_ids, retry=self._retry_with_backoff
+            )
             self._logger.debug(
-                "Retrieved %d reservations for %d instance IDs",
-                len(reservations),
+                "Retrieved %d instances for %d instance IDs",
+                len(raw_instances),
                 len(instance_ids),
             )
 
-            for reservation in reservations:
-                for instance in reservation.get("Instances", []):
-                    # Use machine adapter if available for proper snake_case formatting
-                    if self._machine_adapter and request_id and resource_id:
-                        try:
-                            # Let machine adapter handle the conversion to proper snake_case format
-                            machine_data = self._machine_adapter.create_machine_from_aws_instance(
-                                instance,
-                                request_id=request_id,
-                                provider_api=provider_api,
-                                resource_id=resource_id,
-                            )
-                            instances.append(machine_data)
-                            self._logger.debug(
-                                "Successfully converted instance %s using machine adapter",
-                                instance.get("InstanceId"),
-                            )
-                        except Exception as e:
-                            self._logger.warning(
-                                "Machine adapter failed for instance %s, using fallback: %s",
-                                instance.get("InstanceId"),
-                                e,
-                            )
-                            # Fallback to existing method
-                            instances.append(
-                                self._build_fallback_machine_payload(
-                                    instance, resource_id or "unknown"
-                                )
-                            )
-                    else:
-                        # Fallback when machine adapter not available or missing context
-                        self._logger.debug(
-                            "Using fallback conversion for instance %s (adapter=%s, request_id=%s, resource_id=%s)",
-                            instance.get("InstanceId"),
-                            bool(self._machine_adapter),
-                            bool(request_id),
-                            bool(resource_id),
-                        )
-                        instances.append(
-                            self._build_fallback_machine_payload(instance, resource_id or "unknown")
-                        )
-
+            instances = self._convert_instances(
+                raw_instances, provider_api, request_id=request_id, resource_id=resource_id
+            )
             self._logger.debug("Converted %d instances to domain format", len(instances))
             return instances
 
@@ -665,10 +630,63 @@ class AWSHandler(ABC):
             error = self._convert_client_error(e)
             self._logger.error("Failed to get instance details: %s", str(error))
             raise error
+        except InfrastructureError as e:
+            # Already converted by _retry_with_backoff
+            self._logger.error("Failed to get instance details: %s", str(e))
+            raise
         except Exception as e:
             self._logger.error("Unexpected error getting instance details: %s", str(e))
             raise InfrastructureError(f"Failed to get instance details: {e!s}")
 
+    def _convert_instances(
+        self,
+        raw_instances: list[dict[str, Any]],
+        provider_api: str,
+        request_id: Optional[str] = None,
+        resource_id: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Convert raw EC2 instance dicts to snake_case domain format."""
+        instances: list[dict[str, Any]] = []
+        for instance in raw_instances:
+            # Use machine adapter if available for proper snake_case formatting
+            if self._machine_adapter and request_id and resource_id:
+                try:
+                    # Let machine adapter handle the conversion to proper snake_case format
+                    machine_data = self._machine_adapter.create_machine_from_aws_instance(
+                        instance,
+                        request_id=request_id,
+                        provider_api=provider_api,
+                        resource_id=resource_id,
+                    )
+                    instances.append(machine_data)
+                    self._logger.debug(
+                        "Successfully converted instance %s using machine adapter",
+                        instance.get("InstanceId"),
+                    )
+                except Exception as e:
+                    self._logger.warning(
+                        "Machine adapter failed for instance %s, using fallback: %s",
+                        instance.get("InstanceId"),
+                        e,
+                    )
+                    # Fallback to existing method
+                    instances.append(
+                        self._build_fallback_machine_payload(instance, resource_id or "unknown")
+                    )
+            else:
+                # Fallback when machine adapter not available or missing context
+                self._logger.debug(
+                    "Using fallback conversion for instance %s (adapter=%s, request_id=%s, resource_id=%s)",
+                    instance.get("InstanceId"),
+                    bool(self._machine_adapter),
+                    bool(request_id),
+                    bool(resource_id),
+                )
+                instances.append(
+                    self._build_fallback_machine_payload(instance, resource_id or "unknown")
+                )
+        return instances
+
     def _validate_prerequisites(self, template: AWSTemplate) -> None:
         """
         Validate AWS template prerequisites.
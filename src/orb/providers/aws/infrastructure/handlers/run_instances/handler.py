@@ -476,12 +476,14 @@ class RunInstancesHandler(AWSHandler, BaseContextMixin):
 
             for resource_id in resource_ids:
                 try:
-                    response = self.aws_client.ec2_client.describe_instances(
-                        Filters=[{"Name": "reservation-id", "Values": [resource_id]}]
+                    reservations = self._collect_with_next_token(
+                        self.aws_client.ec2_client.describe_instances,
+                        "Reservations",
+                        Filters=[{"Name": "reservation-id", "Values": [resource_id]}],
                     )
 
                     instance_ids = []
-                    for reservation in response.get("Reservations", []):
+                    for reservation in reservations:
                         instance_ids.extend(
                             instance["InstanceId"] for instance in reservation.get("Instances", [])
                         )
@@ -537,27 +539,35 @@ class RunInstancesHandler(AWSHandler, BaseContextMixin):
     ) -> list[dict[str, Any]]:
         """Fallback method to find instances by tags when reservation-id filter is not supported."""
         try:
-            response = self.aws_client.ec2_client.describe_instances()
+            # Only this request's instances, every page
+            reservations = self._retry_with_backoff(
+                self._collect_with_next_token,
+                self.aws_client.ec2_client.describe_instances,
+                "Reservations",
+                operation_type="read_only",
+                Filters=[{"Name": "tag:orb:request-id", "Values": [str(request.request_id)]}],
+            )
             formatted_instances: list[dict[str, Any]] = []
 
-            for reservation in response.get("Reservations", []):
+            for reservation in reservations:
                 reservation_id = reservation.get("ReservationId")
                 if reservation_id not in resource_ids:
                     continue
 
-                instance_ids = [
-                    instance.get("InstanceId") for instance in reservation.get("Instances", [])
+                instances = [
+                    instance
+                    for instance in reservation.get("Instances", [])
+                    if instance.get("InstanceId")
                 ]
-                instance_ids = [instance_id for instance_id in instance_ids if instance_id]
-
-                if not instance_ids:
+                if not instances:
                     continue
 
-                detailed_instances = self._get_instance_details(
-                    instance_ids,
+                # The reservation already carries full instance data, no second describe
+                detailed_instances = self._convert_instances(
+                    instances,
+                    "RunInstances",
                     request_id=str(request.request_id),
                     resource_id=reservation_id,
-                    provider_api="RunInstances",
                 )
                 formatted_instances.extend(
                     self._format_instance_data(
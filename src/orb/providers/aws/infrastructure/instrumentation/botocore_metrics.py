@@ -15,6 +15,7 @@ from botocore.exceptions import ClientError
 
 from orb.domain.base.ports import LoggingPort
 from orb.monitoring.metrics import MetricsCollector
+from orb.providers.aws.resilience.aws_retry_errors import COMMON_AWS_THROTTLING_ERRORS
 
 
 @dataclass
@@ -63,14 +64,8 @@ class BotocoreMetricsHandler:
         self._event_pattern = re.compile(r"(before|after)-call\.([^.]+)\.([^.]+)")
         self._event_cache: Dict[str, tuple] = {}
 
-        # Error classification
-        self._throttling_errors = {
-            "Throttling",
-            "ThrottlingException",
-            "RequestLimitExceeded",
-            "TooManyRequestsException",
-            "ProvisionedThroughputExceededException",
-        }
+        # Error classification, shared with the AWS rate limiter
+        self._throttling_errors = set(COMMON_AWS_THROTTLING_ERRORS)
 
     def register_events(self, session) -> None:
         """Register event handlers with boto3 session only if metrics are enabled."""
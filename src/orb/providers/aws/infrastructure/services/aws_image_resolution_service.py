@@ -6,13 +6,17 @@ from orb.domain.services.image_resolution_service import ImageResolutionService
 from orb.providers.aws.infrastructure.aws_client import AWSClient
 from orb.providers.aws.infrastructure.caching.aws_image_cache import AWSImageCache
 
+# Maximum number of names accepted by ssm:GetParameters
+_GET_PARAMETERS_BATCH_SIZE = 10
+
 
 class AWSImageResolutionService(ImageResolutionService):
     """
     AWS implementation of image resolution service.
 
     Resolves SSM parameters and aliases to actual AMI IDs using
-    AWS SSM API with persistent caching for performance.
+    AWS SSM API with persistent caching for performance. Batches of
+    specifications are fetched with ``GetParameters``, ten names per call.
     """
 
     def __init__(
@@ -28,26 +32,39 @@ class AWSImageResolutionService(ImageResolutionService):
 
     def resolve_image_id(self, image_specification: str) -> str:
         """Resolve image specification to AMI ID."""
-        # Check cache first
-        if cached := self._cache.get(image_specification):
-            self._logger.debug(f"Cache hit for image specification: {image_specification}")
-            return cached
-
-        # Resolve using AWS SSM
-        try:
-            resolved_ami = self._resolve_ssm_parameter(image_specification)
+        return self.resolve_image_ids([image_specification])[image_specification]
 
-            # Cache result
-            self._cache.set(image_specification, resolved_ami)
-            self._logger.info(f"Resolved {image_specification} to {resolved_ami}")
+    def resolve_image_ids(self, image_specifications: list[str]) -> dict[str, str]:
+        """Resolve image specifications to AMI IDs, fetching cache misses in batches."""
+        resolved: dict[str, str] = {}
+        unresolved: list[str] = []
+        for spec in dict.fromkeys(image_specifications):
+            if cached := self._cache.get(spec):
+                resolved[spec] = cached
+            else:
+                unresolved.append(spec)
+        if not unresolved:
+            self._logger.debug(f"Cache hit for image specifications: {list(resolved)}")
+            return resolved
 
-            return resolved_ami
+        try:
+            fetched = self._resolve_ssm_parameters(unresolved)
+        except ImageResolutionError:
+            raise
         except Exception as e:
             raise ImageResolutionError(
                 f"Failed to resolve image specification: {e!s}",
-                image_specification=image_specification,
+                image_specification=unresolved[0],
             )
 
+        self._cache.set_many(fetched)
+        self._logger.info(
+            f"Resolved {len(fetched)} image specifications with "
+            f"{-(-len(unresolved) // _GET_PARAMETERS_BATCH_SIZE)} SSM calls: {fetched}"
+        )
+        resolved.update(fetched)
+        return resolved
+
     def is_resolution_needed(self, image_specification: str) -> bool:
         """Check if image specification needs resolution."""
         return self.is_resolution_needed_static(image_specification)
@@ -64,26 +81,41 @@ class AWSImageResolutionService(ImageResolutionService):
         # Assume other formats need resolution
         return True
 
-    def _resolve_ssm_parameter(self, ssm_parameter: str) -> str:
-        """AWS-specific SSM parameter resolution."""
-        try:
-            response = self._ssm_client.get_parameter(Name=ssm_parameter)
-            ami_id = response["Parameter"]["Value"]
+    def _resolve_ssm_parameters(self, ssm_parameters: list[str]) -> dict[str, str]:
+        """AWS-specific SSM parameter resolution, up to ten parameters per call."""
+        resolved: dict[str, str] = {}
+        for start in range(0, len(ssm_parameters), _GET_PARAMETERS_BATCH_SIZE):
+            batch = ssm_parameters[start : start + _GET_PARAMETERS_BATCH_SIZE]
+            try:
+                response = self._ssm_client.get_parameters(Names=batch)
+            except Exception as e:
+                raise ImageResolutionError(
+                    f"Failed to resolve SSM parameters {batch}: {e!s}",
+                    image_specification=batch[0],
+                )
 
-            if not ami_id.startswith("ami-"):
+            invalid = response.get("InvalidParameters") or []
+            if invalid:
                 raise ImageResolutionError(
-                    f"SSM parameter {ssm_parameter} returned invalid AMI ID: {ami_id}",
-                    image_specification=ssm_parameter,
+                    f"SSM parameter not found: {', '.join(invalid)}",
+                    image_specification=invalid[0],
                 )
 
-            return ami_id
-        except self._ssm_client.exceptions.ParameterNotFound:
-            raise ImageResolutionError(
-                f"SSM parameter not found: {ssm_parameter}",
-                image_specification=ssm_parameter,
-            )
-        except Exception as e:
-            raise ImageResolutionError(
-                f"Failed to resolve SSM parameter {ssm_parameter}: {e!s}",
-                image_specification=ssm_parameter,
-            )
+            for parameter in response.get("Parameters", []):
+                # Names requested with a version or label selector come back split
+                name = parameter["Name"] + parameter.get("Selector", "")
+                ami_id = parameter["Value"]
+                if not ami_id.startswith("ami-"):
+                    raise ImageResolutionError(
+                        f"SSM parameter {name} returned invalid AMI ID: {ami_id}",
+                        image_specification=name,
+                    )
+                resolved[name] = ami_id
+
+            missing = [name for name in batch if name not in resolved]
+            if missing:
+                raise ImageResolutionError(
+                    f"SSM parameter not found: {', '.join(missing)}",
+                    image_specification=missing[0],
+                )
+        return resolved
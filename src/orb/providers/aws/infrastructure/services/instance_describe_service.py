@@ -0,0 +1,278 @@
+"""Batched EC2 describe_instances shared by all AWS handlers."""
+
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+from orb.domain.base.ports import LoggingPort
+from orb.providers.aws.infrastructure.aws_client import AWSClient
+
+# Results are reused by callers asking for the same instance within this window
+_COALESCE_WINDOW_SECONDS = 1.0
+
+# Inside batching(), callers wait this long for others before describing together
+_GATHER_WINDOW_SECONDS = 0.05
+
+_DEFAULT_BATCH_SIZE = 25
+_DEFAULT_MAX_WORKERS = 10
+
+
+class AWSInstanceDescribeService:
+    """
+    Describes EC2 instances by ID in chunks, concurrently and de-duplicated.
+
+    Instance IDs are split into ``describe_instances`` batches (from the AWS
+    provider ``batch_sizes`` configuration), each batch follows ``NextToken``
+    and runs under the caller's retry policy, and batches fan out over a
+    bounded thread pool. Concurrent callers asking for the same instance share
+    one in-flight lookup, and results are reused for a short window so that
+    handlers polling the same fleet do not describe it repeatedly.
+
+    Within :meth:`batching`, concurrent callers are additionally gathered
+    for a short window and described together, so handlers checking many
+    resources at once share chunks instead of issuing one call each.
+    """
+
+    def __init__(
+        self,
+        aws_client: AWSClient,
+        logger: LoggingPort,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        coalesce_window: float = _COALESCE_WINDOW_SECONDS,
+        *,
+        gather_window: float = _GATHER_WINDOW_SECONDS,
+    ) -> None:
+        """
+        Initialize the describe service.
+
+        Args:
+            aws_client: AWS client providing the EC2 client and performance settings
+            logger: Logger for logging messages
+            batch_size: Instance IDs per describe_instances call (default: from config)
+            max_workers: Maximum concurrent batches (default: from config)
+            coalesce_window: Seconds a described instance is reused for other callers
+            gather_window: Seconds callers wait for each other inside :meth:`batching`
+        """
+        self._aws_client = aws_client
+        self._logger = logger
+        perf_config = getattr(aws_client, "perf_config", None)
+        if not isinstance(perf_config, dict):
+            perf_config = {}
+        batch_sizes = perf_config.get("batch_sizes") or {}
+        self._batch_size = max(
+            1, batch_size or batch_sizes.get("describe_instances") or _DEFAULT_BATCH_SIZE
+        )
+        if max_workers is None:
+            max_workers = (
+                perf_config.get("max_workers", _DEFAULT_MAX_WORKERS)
+                if perf_config.get("enable_parallel", True)
+                else 1
+            )
+        self._max_workers = max(1, int(max_workers))
+        self._coalesce_window = coalesce_window
+        self._gather_window = gather_window
+
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future] = {}
+        self._recent: dict[str, tuple[float, Optional[dict[str, Any]]]] = {}
+        self._batching = 0
+        self._gathering: Optional[dict[str, Future]] = None
+
+    @property
+    def max_workers(self) -> int:
+        """Maximum number of concurrent describe calls."""
+        return self._max_workers
+
+    @contextmanager
+    def batching(self) -> Iterator[None]:
+        """
+        Gather describe calls made by concurrent callers while the block runs.
+
+        A caller with instances to describe waits ``gather_window`` seconds
+        for other callers, then one describe covers everyone's instances.
+        Blocks may be nested or entered from several threads.
+        """
+        with self._lock:
+            self._batching += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batching -= 1
+
+    def describe_instances(
+        self, instance_ids: list[str], retry: Optional[Callable[..., Any]] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Describe instances by ID.
+
+        Args:
+            instance_ids: Instance IDs to describe, duplicates are ignored
+            retry: Retry wrapper (the handler's ``_retry_with_backoff``) applied to each batch
+
+        Returns:
+            Raw EC2 instance dicts in the order of ``instance_ids``
+
+        Raises:
+            Exception: Whatever the describe call raised after retries, for this
+                caller and every caller waiting on the same instances
+        """
+        unique_ids = list(dict.fromkeys(i for i in instance_ids if i))
+        if not unique_ids:
+            return []
+
+        resolved: dict[str, Optional[dict[str, Any]]] = {}
+        waiting: dict[str, Future] = {}
+        owned: dict[str, Future] = {}
+        with self._lock:
+            gather = self._batching > 0
+            now = time.monotonic()
+            self._prune_recent(now)
+            for instance_id in unique_ids:
+                recent = self._recent.get(instance_id)
+                if recent is not None:
+                    resolved[instance_id] = recent[1]
+                elif instance_id in self._in_flight:
+                    waiting[instance_id] = self._in_flight[instance_id]
+                else:
+                    future: Future = Future()
+                    self._in_flight[instance_id] = future
+                    owned[instance_id] = future
+
+        if resolved or waiting:
+            self._logger.debug(
+                "Reusing %d recent and %d in-flight instance lookups",
+                len(resolved),
+                len(waiting),
+            )
+
+        if owned and gather:
+            self._describe_gathered(owned, retry)
+            waiting.update(owned)
+        elif owned:
+            resolved.update(self._describe_owned(owned, retry))
+        for instance_id, future in waiting.items():
+            resolved[instance_id] = future.result()
+
+        return [resolved[i] for i in unique_ids if resolved.get(i) is not None]  # type: ignore[misc]
+
+    def _describe_gathered(
+        self, owned: dict[str, Future], retry: Optional[Callable[..., Any]]
+    ) -> None:
+        """Add instances to the gathered batch, describing it if this caller opened it."""
+        with self._lock:
+            leader = self._gathering is None
+            if leader:
+                self._gathering = {}
+            self._gathering.update(owned)  # type: ignore[union-attr]
+        if not leader:
+            return
+
+        time.sleep(self._gather_window)
+        with self._lock:
+            batch, self._gathering = self._gathering or {}, None
+        try:
+            self._describe_owned(batch, retry)
+        except Exception:
+            pass  # the error reaches every caller through its future
+
+    def _describe_owned(
+        self, owned: dict[str, Future], retry: Optional[Callable[..., Any]]
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """Describe the instances this caller registered and publish the results."""
+        ids = list(owned)
+        chunks = [ids[i : i + self._batch_size] for i in range(0, len(ids), self._batch_size)]
+        found: dict[str, Optional[dict[str, Any]]] = dict.fromkeys(ids)
+        try:
+            if len(chunks) == 1 or self._max_workers == 1:
+                batches = [self._describe_chunk(chunk, retry) for chunk in chunks]
+            else:
+                workers = min(self._max_workers, len(chunks))
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="describe-instances"
+                ) as executor:
+                    batches = list(executor.map(lambda c: self._describe_chunk(c, retry), chunks))
+            for batch in batches:
+                for instance in batch:
+                    instance_id = instance.get("InstanceId")
+                    if instance_id in found:
+                        found[instance_id] = instance
+        except BaseException as e:
+            with self._lock:
+                for instance_id, future in owned.items():
+                    self._in_flight.pop(instance_id, None)
+                    future.set_exception(e)
+            raise
+
+        self._logger.debug(
+            "Described %d instances in %d batches of up to %d",
+            len(ids),
+            len(chunks),
+            self._batch_size,
+        )
+        with self._lock:
+            now = time.monotonic()
+            for instance_id, future in owned.items():
+                self._in_flight.pop(instance_id, None)
+                if self._coalesce_window > 0:
+                    self._recent[instance_id] = (now + self._coalesce_window, found[instance_id])
+                future.set_result(found[instance_id])
+        return found
+
+    def _describe_chunk(
+        self, instance_ids: list[str], retry: Optional[Callable[..., Any]]
+    ) -> list[dict[str, Any]]:
+        """Describe one batch of instance IDs, following NextToken."""
+        if retry is not None:
+            return retry(self._collect_pages, instance_ids, operation_type="read_only")
+        return self._collect_pages(instance_ids)
+
+    def _collect_pages(self, instance_ids: list[str]) -> list[dict[str, Any]]:
+        ec2_client = self._aws_client.ec2_client
+        instances: list[dict[str, Any]] = []
+        request: dict[str, Any] = {"InstanceIds": instance_ids}
+        while True:
+            response = ec2_client.describe_instances(**request)
+            for reservation in response.get("Reservations", []):
+                instances.extend(reservation.get("Instances", []))
+            next_token = response.get("NextToken")
+            if not next_token:
+                return instances
+            request["NextToken"] = next_token
+
+    def _prune_recent(self, now: float) -> None:
+        expired = [i for i, (expires, _) in self._recent.items() if expires <= now]
+        for instance_id in expired:
+            del self._recent[instance_id]
+
+
+_services: "weakref.WeakKeyDictionary[Any, AWSInstanceDescribeService]" = (
+    weakref.WeakKeyDictionary()
+)
+_services_lock = threading.Lock()
+
+
+def get_instance_describe_service(
+    aws_client: AWSClient, logger: LoggingPort
+) -> AWSInstanceDescribeService:
+    """
+    Return the describe service shared by every handler using ``aws_client``.
+
+    Args:
+        aws_client: AWS client the handlers describe instances with
+        logger: Logger used when the service is first created
+
+    Returns:
+        Shared AWSInstanceDescribeService for the client
+    """
+    with _services_lock:
+        service = _services.get(aws_client)
+        if service is None:
+            service = AWSInstanceDescribeService(aws_client, logger)
+            _services[aws_client] = service
+        return service
@@ -13,6 +13,9 @@ from orb.domain.template.extensions import TemplateExtensionRegistry
 from orb.domain.template.factory import TemplateFactory
 from orb.providers.aws.configuration.template_extension import AWSTemplateExtensionConfig
 
+# Registered by path so that registering the provider does not import botocore
+AWS_STRATEGY_CLASS = "orb.providers.aws.strategy.aws_provider_strategy:AWSProviderStrategy"
+
 
 def create_aws_strategy(provider_config: Any) -> Any:
     """
@@ -216,8 +219,6 @@ def register_aws_provider(
         registry = get_provider_registry()
 
     try:
-        from orb.providers.aws.strategy.aws_provider_strategy import AWSProviderStrategy
-
         if instance_name:
             # Register as named instance
             registry.register_provider_instance(
@@ -236,7 +237,7 @@ def register_aws_provider(
                 config_factory=create_aws_config,
                 resolver_factory=create_aws_resolver,
                 validator_factory=create_aws_validator,
-                strategy_class=AWSProviderStrategy,
+                strategy_class=AWS_STRATEGY_CLASS,
             )
 
         # Register AWS template store
@@ -313,15 +314,13 @@ def register_aws_provider_instance(provider_instance, logger=None) -> bool:
 
         # Register AWS as provider type if not already registered
         if not registry.is_provider_registered("aws"):
-            from orb.providers.aws.strategy.aws_provider_strategy import AWSProviderStrategy
-
             registry.register_provider(
                 provider_type="aws",
                 strategy_factory=create_aws_strategy,
                 config_factory=create_aws_config,
                 resolver_factory=create_aws_resolver,
                 validator_factory=create_aws_validator,
-                strategy_class=AWSProviderStrategy,
+                strategy_class=AWS_STRATEGY_CLASS,
             )
 
         # Register the specific provider instance
@@ -469,14 +468,17 @@ def register_aws_services_with_di(container) -> None:
     logger = container.get(LoggingPort)
 
     try:
-        # Register AWS Template Adapter
+        # Register AWS Template Adapter. Adapter modules are imported inside the
+        # factories so that commands which never resolve them skip botocore.
         from orb.domain.base.ports.template_adapter_port import TemplateAdapterPort
-        from orb.providers.aws.infrastructure.adapters.template_adapter import AWSTemplateAdapter
 
         def create_aws_template_adapter(c):
             from orb.infrastructure.template.configuration_manager import (
                 TemplateConfigurationManager,
             )
+            from orb.providers.aws.infrastructure.adapters.template_adapter import (
+                AWSTemplateAdapter,
+            )
             from orb.providers.aws.infrastructure.aws_client import AWSClient
 
             template_config_manager = c.get(TemplateConfigurationManager)
@@ -494,12 +496,13 @@ def register_aws_services_with_di(container) -> None:
         from orb.domain.base.ports.template_example_generator_port import (
             TemplateExampleGeneratorPort,
         )
-        from orb.providers.aws.adapters.template_example_generator_adapter import (
-            AWSTemplateExampleGeneratorAdapter,
-        )
-        from orb.providers.aws.infrastructure.aws_handler_factory import AWSHandlerFactory
 
         def create_template_example_generator(c):
+            from orb.providers.aws.adapters.template_example_generator_adapter import (
+                AWSTemplateExampleGeneratorAdapter,
+            )
+            from orb.providers.aws.infrastructure.aws_handler_factory import AWSHandlerFactory
+
             factory = AWSHandlerFactory(aws_client=None, logger=c.get(LoggingPort))  # type: ignore[arg-type]
             return AWSTemplateExampleGeneratorAdapter(aws_handler_factory=factory)
 
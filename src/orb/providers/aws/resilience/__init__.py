@@ -1,5 +1,10 @@
 """AWS resilience package."""
 
+from orb.providers.aws.resilience.aws_rate_limiter import (
+    AdaptiveTokenBucket,
+    AWSRateLimiter,
+    get_aws_rate_limiter,
+)
 from orb.providers.aws.resilience.aws_retry_config import (
     DEFAULT_AWS_RETRY_CONFIG,
     AWSRetryConfig,
@@ -15,9 +20,12 @@ from orb.providers.aws.resilience.aws_retry_strategy import AWSRetryStrategy
 __all__: list[str] = [
     "AWS_RETRYABLE_ERRORS",
     "COMMON_AWS_THROTTLING_ERRORS",
+    "AdaptiveTokenBucket",
     "DEFAULT_AWS_RETRY_CONFIG",
+    "AWSRateLimiter",
     "AWSRetryConfig",
     "AWSRetryStrategy",
     "get_aws_error_info",
+    "get_aws_rate_limiter",
     "is_retryable_aws_error",
 ]
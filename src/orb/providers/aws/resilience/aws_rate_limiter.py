@@ -0,0 +1,335 @@
+"""Adaptive client-side rate limiting of AWS API calls."""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from orb.domain.base.ports import LoggingPort
+from orb.providers.aws.configuration.rate_limit_config import (
+    AWSRateLimitConfig,
+    AWSTokenBucketConfig,
+)
+from orb.providers.aws.resilience.aws_retry_errors import COMMON_AWS_THROTTLING_ERRORS
+
+# EC2 request token buckets per action category (capacity, refill tokens/s)
+_EC2_MUTATING_BUCKET = AWSTokenBucketConfig(capacity=200, refill_rate=5)
+_EC2_NON_MUTATING_BUCKET = AWSTokenBucketConfig(capacity=100, refill_rate=20)
+_DEFAULT_SERVICE_BUCKET = AWSTokenBucketConfig(capacity=50, refill_rate=10)
+_NON_MUTATING_PREFIXES = ("Describe", "Get", "List")
+
+# EC2 resource token buckets: instances started/stopped per action
+_EC2_RESOURCE_BUCKETS: dict[str, AWSTokenBucketConfig] = {
+    "RunInstances": AWSTokenBucketConfig(capacity=1000, refill_rate=2),
+    "StartInstances": AWSTokenBucketConfig(capacity=1000, refill_rate=2),
+    "StopInstances": AWSTokenBucketConfig(capacity=1000, refill_rate=20),
+    "TerminateInstances": AWSTokenBucketConfig(capacity=1000, refill_rate=20),
+}
+
+# (account, region, service, action)
+BucketKey = tuple[str, str, str, str]
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket whose refill rate adapts by AIMD.
+
+    A throttling response halves the refill rate (down to a floor) and drains
+    the bucket; each successful call restores a fixed step of the configured
+    rate. Callers reserve tokens and sleep for the returned delay outside
+    the lock, so concurrent callers are spaced out rather than bunched.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_rate: float,
+        *,
+        min_refill_rate: float = 0.5,
+        decrease_factor: float = 0.5,
+        increase_fraction: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.max_refill_rate = refill_rate
+        self.refill_rate = refill_rate
+        self.min_refill_rate = min(min_refill_rate, refill_rate)
+        self._decrease_factor = decrease_factor
+        self._increase_step = refill_rate * increase_fraction
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+        self.throttle_count = 0
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        Take tokens, borrowing against future refills if the bucket is short.
+
+        Args:
+            amount: Tokens to take (capped at the bucket capacity)
+
+        Returns:
+            Seconds the caller must wait before proceeding
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= min(amount, self.capacity)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_rate
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease after AWS throttled a call."""
+        with self._lock:
+            self._refill()
+            self.refill_rate = max(self.min_refill_rate, self.refill_rate * self._decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+            self.throttle_count += 1
+
+    def on_success(self) -> None:
+        """Additive increase after a call AWS accepted."""
+        if self.refill_rate >= self.max_refill_rate:
+            return
+        with self._lock:
+            self._refill()
+            self.refill_rate = min(self.max_refill_rate, self.refill_rate + self._increase_step)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return the current rate and token level."""
+        with self._lock:
+            self._refill()
+            return {
+                "capacity": self.capacity,
+                "refill_rate": self.refill_rate,
+                "tokens": self._tokens,
+                "throttles": self.throttle_count,
+            }
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+
+
+class AWSRateLimiter:
+    """
+    Shapes AWS API calls with a token bucket per (account, region, service, action).
+
+    Buckets follow the EC2 request (and, for instance lifecycle actions,
+    resource) token buckets by default and adapt to throttling errors seen
+    on any client sharing the limiter. Clients are wired through botocore
+    events, so every call made with an attached client is shaped, retries
+    included.
+    """
+
+    def __init__(
+        self,
+        config: Optional[AWSRateLimitConfig] = None,
+        logger: Optional[LoggingPort] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.config = config or AWSRateLimitConfig()  # type: ignore[call-arg]
+        self._logger = logger
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[BucketKey, AdaptiveTokenBucket] = {}
+        self._resource_buckets: dict[BucketKey, AdaptiveTokenBucket] = {}
+        self._lock = threading.Lock()
+        self._throttling_errors = frozenset(COMMON_AWS_THROTTLING_ERRORS)
+
+    def acquire(self, key: BucketKey, resource_count: int = 0) -> float:
+        """
+        Wait until a call for ``key`` may be sent.
+
+        Args:
+            key: (account, region, service, action) of the call
+            resource_count: Instances affected, charged to the resource bucket
+
+        Returns:
+            Seconds waited
+        """
+        if not self.config.enabled:
+            return 0.0
+        wait = self._bucket(key).reserve()
+        if resource_count > 0:
+            wait = max(wait, self._reserve_resources(key, resource_count))
+        return self._wait(key, wait)
+
+    def acquire_resources(self, key: BucketKey, resource_count: int) -> float:
+        """
+        Wait until ``resource_count`` instances may be started or stopped.
+
+        Args:
+            key: (account, region, service, action) of the call
+            resource_count: Instances affected by the call
+
+        Returns:
+            Seconds waited
+        """
+        if not self.config.enabled or resource_count <= 0:
+            return 0.0
+        return self._wait(key, self._reserve_resources(key, resource_count))
+
+    def record_response(self, key: BucketKey, error_code: Optional[str]) -> None:
+        """Adapt the bucket of ``key`` to the outcome of a call."""
+        if not self.config.enabled:
+            return
+        bucket = self._bucket(key)
+        if error_code in self._throttling_errors:
+            bucket.on_throttle()
+            if self._logger:
+                self._logger.info(
+                    "AWS throttled %s:%s, reducing rate to %.2f/s",
+                    key[2],
+                    key[3],
+                    bucket.refill_rate,
+                )
+        elif error_code is None:
+            bucket.on_success()
+
+    def register_client(self, client: Any, account: str, region: str) -> None:
+        """
+        Shape every call made through a boto3 client.
+
+        Args:
+            client: boto3 client
+            account: Credential scope the client's calls are charged to
+            region: Region of the client
+        """
+        events = client.meta.events
+
+        def charge_resources(params: dict, event_name: str, **_: Any) -> None:
+            # Resource tokens are charged once per call, request tokens per attempt
+            service, action = _parse_event_name(event_name)
+            if action in _EC2_RESOURCE_BUCKETS:
+                key = (account, region, service, action)
+                self.acquire_resources(key, _resource_count(action, params))
+
+        def before_send(event_name: str, **_: Any) -> None:
+            service, action = _parse_event_name(event_name)
+            self.acquire((account, region, service, action))
+
+        def after_attempt(response: Any, event_name: str, **_: Any) -> None:
+            if not response:
+                return  # connection errors say nothing about throttling
+            service, action = _parse_event_name(event_name)
+            http_response, parsed = response
+            error_code = (parsed or {}).get("Error", {}).get("Code")
+            if error_code is None and getattr(http_response, "status_code", 200) >= 400:
+                error_code = "Unknown"
+            self.record_response((account, region, service, action), error_code)
+
+        events.register("before-parameter-build.ec2", charge_resources)
+        events.register("before-send", before_send)
+        events.register("needs-retry", after_attempt)
+
+    def register_events(self, session: Any, account: str, region: str) -> None:
+        """Attach the limiter to every client the session creates."""
+        original_client = session.client
+
+        def rate_limited_client(*args: Any, **kwargs: Any) -> Any:
+            client = original_client(*args, **kwargs)
+            self.register_client(client, account, client.meta.region_name or region)
+            return client
+
+        session.client = rate_limited_client
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the state of every request bucket."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            f"{account}/{region}/{service}:{action}": bucket.get_stats()
+            for (account, region, service, action), bucket in buckets.items()
+        }
+
+    def _bucket(self, key: BucketKey) -> AdaptiveTokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._new_bucket(self._request_bucket_config(key[2], key[3]))
+                    self._buckets[key] = bucket
+        return bucket
+
+    def _reserve_resources(self, key: BucketKey, resource_count: int) -> float:
+        bucket = self._resource_bucket(key)
+        return bucket.reserve(resource_count) if bucket is not None else 0.0
+
+    def _wait(self, key: BucketKey, wait: float) -> float:
+        if wait <= 0:
+            return 0.0
+        wait = min(wait, self.config.max_wait_seconds)
+        if self._logger:
+            self._logger.debug("Rate limiting %s:%s for %.2fs", key[2], key[3], wait)
+        self._sleep(wait)
+        return wait
+
+    def _resource_bucket(self, key: BucketKey) -> Optional[AdaptiveTokenBucket]:
+        spec = _EC2_RESOURCE_BUCKETS.get(key[3]) if key[2] == "ec2" else None
+        if spec is None:
+            return None
+        with self._lock:
+            bucket = self._resource_buckets.get(key)
+            if bucket is None:
+                bucket = self._new_bucket(spec)
+                self._resource_buckets[key] = bucket
+            return bucket
+
+    def _request_bucket_config(self, service: str, action: str) -> AWSTokenBucketConfig:
+        overrides = self.config.buckets
+        configured = overrides.get(f"{service}:{action}") or overrides.get(f"{service}:*")
+        if configured is not None:
+            return configured
+        if service != "ec2":
+            return _DEFAULT_SERVICE_BUCKET
+        if action.startswith(_NON_MUTATING_PREFIXES):
+            return _EC2_NON_MUTATING_BUCKET
+        return _EC2_MUTATING_BUCKET
+
+    def _new_bucket(self, spec: AWSTokenBucketConfig) -> AdaptiveTokenBucket:
+        return AdaptiveTokenBucket(
+            spec.capacity,
+            spec.refill_rate,
+            min_refill_rate=self.config.min_refill_rate,
+            decrease_factor=self.config.decrease_factor,
+            increase_fraction=self.config.increase_fraction,
+            clock=self._clock,
+        )
+
+
+def _parse_event_name(event_name: str) -> tuple[str, str]:
+    parts = event_name.split(".")
+    if len(parts) >= 3:
+        return parts[1], parts[2]
+    return "unknown", "unknown"
+
+
+def _resource_count(action: str, params: dict) -> int:
+    if action == "RunInstances":
+        return int(params.get("MaxCount") or params.get("MinCount") or 1)
+    return len(params.get("InstanceIds") or [])
+
+
+_limiter: Optional[AWSRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_aws_rate_limiter(
+    config: Optional[AWSRateLimitConfig] = None, logger: Optional[LoggingPort] = None
+) -> AWSRateLimiter:
+    """
+    Return the process-wide rate limiter shared by every AWS client.
+
+    The configuration of the first caller wins; later callers share its buckets
+    so that all providers using one account and region draw from the same budget.
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = AWSRateLimiter(config, logger)
+        return _limiter
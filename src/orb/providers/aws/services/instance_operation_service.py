@@ -4,6 +4,9 @@ from typing import TYPE_CHECKING, Optional
 
 from orb.domain.base.ports import LoggingPort
 from orb.providers.aws.infrastructure.adapters.machine_adapter import AWSMachineAdapter
+from orb.providers.aws.infrastructure.services.instance_describe_service import (
+    get_instance_describe_service,
+)
 from orb.providers.base.strategy import ProviderOperation, ProviderResult
 
 if TYPE_CHECKING:
@@ -198,19 +201,19 @@ class AWSInstanceOperationService:
                 )
 
             provider_api = operation.parameters.get("provider_api", "RunInstances")
-            response = self._aws_client.ec2_client.describe_instances(InstanceIds=instance_ids)
-
-            instances = []
-            for reservation in response["Reservations"]:
-                for aws_instance in reservation["Instances"]:
-                    instances.append(
-                        self._machine_adapter.create_machine_from_aws_instance(
-                            aws_instance,
-                            request_id="",
-                            provider_api=provider_api,
-                            resource_id="",
-                        )
-                    )
+            # Batched status queries pass the instances of many requests at once;
+            # the shared describe service chunks them and follows NextToken.
+            describer = get_instance_describe_service(self._aws_client, self._logger)
+
+            instances = [
+                self._machine_adapter.create_machine_from_aws_instance(
+                    aws_instance,
+                    request_id="",
+                    provider_api=provider_api,
+                    resource_id="",
+                )
+                for aws_instance in describer.describe_instances(instance_ids)
+            ]
 
             return ProviderResult.success_result(
                 {"instances": instances, "queried_count": len(instance_ids)},
@@ -1,7 +1,10 @@
 """DynamoDB client management components for AWS DynamoDB operations."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
+from boto3.dynamodb.conditions import ConditionBase
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
@@ -15,6 +18,9 @@ _DEFAULT_CONFIG = Config(
     retries={"max_attempts": 3},
 )
 
+# BatchGetItem accepts at most 100 keys per request
+_BATCH_GET_MAX_KEYS = 100
+
 
 class DynamoDBClientManager(ResourceManager):
     """
@@ -159,6 +165,7 @@ class DynamoDBClientManager(ResourceManager):
         key_schema: list,
         attribute_definitions: list,
         billing_mode: str = "PAY_PER_REQUEST",
+        global_secondary_indexes: Optional[list[dict[str, Any]]] = None,
     ) -> bool:
         """
         Create DynamoDB table.
@@ -166,8 +173,9 @@ class DynamoDBClientManager(ResourceManager):
         Args:
             table_name: Name of the table
             key_schema: Key schema definition
-            attribute_definitions: Attribute definitions
+            attribute_definitions: Attribute definitions (including GSI key attributes)
             billing_mode: Billing mode (PAY_PER_REQUEST or PROVISIONED)
+            global_secondary_indexes: Optional GlobalSecondaryIndexes definitions
 
         Returns:
             True if table created successfully, False otherwise
@@ -189,6 +197,13 @@ class DynamoDBClientManager(ResourceManager):
                     "ReadCapacityUnits": 5,
                     "WriteCapacityUnits": 5,
                 }
+                for index in global_secondary_indexes or []:
+                    index.setdefault(
+                        "ProvisionedThroughput", create_params["ProvisionedThroughput"]
+                    )
+
+            if global_secondary_indexes:
+                create_params["GlobalSecondaryIndexes"] = global_secondary_indexes
 
             self.dynamodb.create_table(**create_params)
 
@@ -206,6 +221,53 @@ class DynamoDBClientManager(ResourceManager):
             self.logger.error("Unexpected error creating table %s: %s", table_name, e)
             return False
 
+    def get_index_statuses(self, table_name: str) -> dict[str, str]:
+        """
+        Get the status of each global secondary index of a table.
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            Mapping of index name to IndexStatus (e.g. CREATING, ACTIVE)
+        """
+        description = self.dynamodb.describe_table(TableName=table_name)["Table"]
+        return {
+            index["IndexName"]: index.get("IndexStatus", "ACTIVE")
+            for index in description.get("GlobalSecondaryIndexes", [])
+        }
+
+    def create_global_secondary_index(
+        self, table_name: str, index: dict[str, Any], attribute_definitions: list
+    ) -> bool:
+        """
+        Add a global secondary index to an existing table.
+
+        The index is backfilled asynchronously; it can be queried once its
+        status becomes ACTIVE.
+
+        Args:
+            table_name: Name of the table
+            index: Index definition (IndexName, KeySchema, Projection)
+            attribute_definitions: Definitions of the index key attributes
+
+        Returns:
+            True if the index creation was started, False otherwise
+        """
+        try:
+            self.dynamodb.update_table(
+                TableName=table_name,
+                AttributeDefinitions=attribute_definitions,
+                GlobalSecondaryIndexUpdates=[{"Create": index}],
+            )
+            self.logger.info("Creating index %s on table %s", index["IndexName"], table_name)
+            return True
+        except ClientError as e:
+            self.logger.warning(
+                "Failed to create index %s on %s: %s", index["IndexName"], table_name, e
+            )
+            return False
+
     def put_item(self, table_name: str, item: dict[str, Any]) -> bool:
         """
         Put item to DynamoDB table.
@@ -268,6 +330,10 @@ class DynamoDBClientManager(ResourceManager):
         table_name: str,
         filter_expression=None,
         expression_attribute_values: Optional[dict[str, Any]] = None,
+        *,
+        projection_expression: Optional[str] = None,
+        expression_attribute_names: Optional[dict[str, str]] = None,
+        total_segments: int = 1,
     ) -> list:
         """
         Scan DynamoDB table.
@@ -276,34 +342,131 @@ class DynamoDBClientManager(ResourceManager):
             table_name: Name of the table
             filter_expression: Filter expression for scan
             expression_attribute_values: Expression attribute values
+            projection_expression: Attributes to return (all if None)
+            expression_attribute_names: Placeholders for attribute names
+            total_segments: Number of segments scanned in parallel (1 = sequential)
 
         Returns:
             List of items
         """
         try:
-            table = self.get_table(table_name)
-
-            scan_params = {}
+            scan_params: dict[str, Any] = {}
             if filter_expression:
                 scan_params["FilterExpression"] = filter_expression
             if expression_attribute_values:
                 scan_params["ExpressionAttributeValues"] = expression_attribute_values
+            if projection_expression:
+                scan_params["ProjectionExpression"] = projection_expression
+            if expression_attribute_names:
+                scan_params["ExpressionAttributeNames"] = expression_attribute_names
+
+            if total_segments <= 1:
+                return self._paginate(self.get_table(table_name).scan, scan_params)
 
-            response = table.scan(**scan_params)
-            items = response.get("Items", [])
+            def scan_segment(segment: int) -> list:
+                # One Table resource per worker; the underlying client is thread-safe
+                table = self.get_table(table_name)
+                return self._paginate(
+                    table.scan,
+                    {**scan_params, "Segment": segment, "TotalSegments": total_segments},
+                )
 
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                scan_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-                response = table.scan(**scan_params)
-                items.extend(response.get("Items", []))
+            with ThreadPoolExecutor(
+                max_workers=total_segments, thread_name_prefix="dynamodb-scan"
+            ) as executor:
+                segments = list(executor.map(scan_segment, range(total_segments)))
 
-            return items
+            return [item for segment_items in segments for item in segment_items]
 
         except Exception as e:
             self.logger.error("Failed to scan table %s: %s", table_name, e)
             return []
 
+    def query_index(
+        self,
+        table_name: str,
+        index_name: str,
+        key_condition: ConditionBase,
+        filter_expression: Optional[ConditionBase] = None,
+    ) -> list:
+        """
+        Query a global secondary index.
+
+        Args:
+            table_name: Name of the table
+            index_name: Name of the index
+            key_condition: Key condition on the index partition key
+            filter_expression: Optional filter applied to the matching items
+
+        Returns:
+            List of items
+        """
+        query_params: dict[str, Any] = {
+            "IndexName": index_name,
+            "KeyConditionExpression": key_condition,
+        }
+        if filter_expression is not None:
+            query_params["FilterExpression"] = filter_expression
+
+        return self._paginate(self.get_table(table_name).query, query_params)
+
+    def batch_get_items(
+        self,
+        table_name: str,
+        keys: list[dict[str, Any]],
+        max_retries: int = 5,
+        base_delay: float = 0.05,
+    ) -> list:
+        """
+        Get many items with BatchGetItem, retrying unprocessed keys.
+
+        Args:
+            table_name: Name of the table
+            keys: Primary keys of the items
+            max_retries: Attempts for unprocessed keys before giving up
+            base_delay: Initial backoff delay in seconds (doubled per retry)
+
+        Returns:
+            List of found items (order not preserved)
+
+        Raises:
+            ClientError: If the request fails
+            RuntimeError: If keys are still unprocessed after all retries
+        """
+        items: list = []
+        for start in range(0, len(keys), _BATCH_GET_MAX_KEYS):
+            pending: dict[str, Any] = {
+                table_name: {"Keys": keys[start : start + _BATCH_GET_MAX_KEYS]}
+            }
+            attempt = 0
+            while pending:
+                response = self.dynamodb_resource.batch_get_item(RequestItems=pending)
+                items.extend(response.get("Responses", {}).get(table_name, []))
+                pending = response.get("UnprocessedKeys") or {}
+                if not pending:
+                    break
+                attempt += 1
+                if attempt > max_retries:
+                    raise RuntimeError(
+                        f"BatchGetItem left keys unprocessed on {table_name} after "
+                        f"{max_retries} retries"
+                    )
+                time.sleep(base_delay * (2 ** (attempt - 1)))
+
+        return items
+
+    @staticmethod
+    def _paginate(operation, params: dict[str, Any]) -> list:
+        """Call a scan/query operation until all pages are read."""
+        response = operation(**params)
+        items = response.get("Items", [])
+
+        while "LastEvaluatedKey" in response:
+            response = operation(**params, ExclusiveStartKey=response["LastEvaluatedKey"])
+            items.extend(response.get("Items", []))
+
+        return items
+
     def batch_write_items(self, table_name: str, items: list) -> bool:
         """
         Batch write items to DynamoDB table.
@@ -8,6 +8,7 @@ from typing import Any, Optional
 from boto3.dynamodb.conditions import Attr
 
 from orb.infrastructure.logging.logger import get_logger
+from orb.infrastructure.storage.base.strategy import is_range_condition
 from orb.infrastructure.storage.components.resource_manager import DataConverter
 
 
@@ -18,16 +19,24 @@ class DynamoDBConverter(DataConverter):
     Handles type conversion, Decimal handling, and DynamoDB-specific data types.
     """
 
-    def __init__(self, partition_key: str = "id", sort_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        partition_key: str = "id",
+        sort_key: Optional[str] = None,
+        sparse_attributes: tuple[str, ...] = (),
+    ) -> None:
         """
         Initialize DynamoDB converter.
 
         Args:
             partition_key: Name of the partition key
             sort_key: Name of the sort key (optional)
+            sparse_attributes: Attributes omitted from items when None, such as
+                secondary index keys, which cannot hold NULL values
         """
         self.partition_key = partition_key
         self.sort_key = sort_key
+        self.sparse_attributes = frozenset(sparse_attributes)
         self.logger = get_logger(__name__)
 
     def to_storage_format(self, domain_data: dict[str, Any]) -> Any:  # type: ignore[override]
@@ -66,6 +75,8 @@ class DynamoDBConverter(DataConverter):
             for key, value in data.items():
                 if key in (self.partition_key, self.sort_key):
                     continue  # Already handled
+                if value is None and key in self.sparse_attributes:
+                    continue
 
                 item[key] = self._convert_to_dynamodb_type(value)
 
@@ -249,7 +260,9 @@ class DynamoDBConverter(DataConverter):
         expression_attribute_values = {}
 
         for key, value in criteria.items():
-            if isinstance(value, dict):
+            if is_range_condition(value):
+                filter_expressions.append(self._build_range_condition(key, value))
+            elif isinstance(value, dict):
                 # Handle special operators
                 if "$eq" in value:
                     filter_expressions.append(Attr(key).eq(value["$eq"]))
@@ -287,6 +300,59 @@ class DynamoDBConverter(DataConverter):
 
         return filter_expression, expression_attribute_values
 
+    def build_condition_expression(self, condition: Optional[dict[str, Any]]):
+        """
+        Build the ConditionExpression of a conditional write.
+
+        Args:
+            condition: Field conditions the stored item must match (None values
+                require the attribute to be missing or NULL), or None to
+                require that the item does not exist
+
+        Returns:
+            Condition for ``put_item``
+        """
+        if condition is None:
+            return Attr(self.partition_key).not_exists()
+
+        expression = Attr(self.partition_key).exists()
+        for key, value in condition.items():
+            if value is None:
+                expression = expression & (
+                    Attr(key).not_exists() | Attr(key).attribute_type("NULL")
+                )
+            elif is_range_condition(value):
+                bounds = {
+                    op: self._convert_to_dynamodb_type(self._range_bound(bound))
+                    for op, bound in value.items()
+                }
+                expression = expression & self._build_range_condition(key, bounds)
+            else:
+                expression = expression & Attr(key).eq(self._convert_to_dynamodb_type(value))
+        return expression
+
+    @staticmethod
+    def _range_bound(bound: Any) -> Any:
+        """Convert a datetime bound to the UTC ISO 8601 string timestamps are stored as."""
+        if not isinstance(bound, datetime):
+            return bound
+        if bound.tzinfo is None:
+            return bound.replace(tzinfo=timezone.utc).isoformat()
+        return bound.astimezone(timezone.utc).isoformat()
+
+    def _build_range_condition(self, key: str, condition: dict[str, Any]):
+        """Build a condition for a range criteria value, using BETWEEN when closed."""
+        condition = {op: self._range_bound(bound) for op, bound in condition.items()}
+        if set(condition) == {"$gte", "$lte"}:
+            return Attr(key).between(condition["$gte"], condition["$lte"])
+
+        operators = {"$gt": "gt", "$gte": "gte", "$lt": "lt", "$lte": "lte"}
+        expressions = [getattr(Attr(key), operators[op])(bound) for op, bound in condition.items()]
+        expression = expressions[0]
+        for extra in expressions[1:]:
+            expression = expression & extra
+        return expression
+
     def prepare_batch_items(self, entities: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Prepare multiple entities for batch operations.
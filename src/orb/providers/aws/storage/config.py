@@ -36,6 +36,9 @@ class DynamodbStrategyConfig(BaseModel):
     region: Optional[str] = Field(None, description="AWS region")
     profile: str = Field("default", description="AWS profile")
     table_prefix: str = Field("hostfactory", description="Table prefix")
+    scan_segments: int = Field(
+        4, ge=1, le=64, description="Segments scanned in parallel for full-table scans"
+    )
 
 
 class AWSStorageConfig(BaseModel):
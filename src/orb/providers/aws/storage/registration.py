@@ -46,6 +46,38 @@ def create_dynamodb_strategy(config: Any) -> Any:
         region=region,
         table_name=f"{table_prefix}-generic",
         profile=profile,
+        scan_segments=dynamodb_cfg.scan_segments,
+    )
+
+
+def create_dynamodb_collection_strategy(
+    config: Any, collection: str, columns: dict[str, str]
+) -> Any:
+    """
+    Create a DynamoDB strategy for a dedicated table.
+
+    Args:
+        config: ConfigurationManager holding the DynamoDB storage settings
+        collection: Table suffix; the table is ``<table_prefix>-<collection>``
+        columns: Unused; DynamoDB items are schemaless
+
+    Returns:
+        DynamoDBStorageStrategy instance
+    """
+    from orb.infrastructure.adapters.logging_adapter import LoggingAdapter
+    from orb.providers.aws.configuration.config import AWSProviderConfig
+    from orb.providers.aws.storage.config import DynamodbStrategyConfig
+    from orb.providers.aws.storage.strategy import DynamoDBStorageStrategy
+
+    aws_cfg = config.get_typed(AWSProviderConfig)
+    dynamodb_cfg = aws_cfg.storage.dynamodb or DynamodbStrategyConfig()  # type: ignore[call-arg]
+    return DynamoDBStorageStrategy(
+        logger=LoggingAdapter(__name__),
+        aws_client=None,  # Strategy will create its own client
+        region=dynamodb_cfg.region,
+        table_name=f"{dynamodb_cfg.table_prefix}-{collection}",
+        profile=dynamodb_cfg.profile,
+        scan_segments=dynamodb_cfg.scan_segments,
     )
 
 
@@ -113,6 +145,7 @@ def create_dynamodb_unit_of_work(config: Any) -> Any:
             machine_table=f"{dynamodb_config.table_prefix}-{machine_name}",
             request_table=f"{dynamodb_config.table_prefix}-{request_name}",
             template_table=f"{dynamodb_config.table_prefix}-{template_name}",
+            scan_segments=dynamodb_config.scan_segments,
         )
     else:
         # For testing or other scenarios - assume it's a dict with AWS config
@@ -133,6 +166,7 @@ def create_dynamodb_unit_of_work(config: Any) -> Any:
             machine_table=f"{table_prefix}-machines",
             request_table=f"{table_prefix}-requests",
             template_table=f"{table_prefix}-templates",
+            scan_segments=int(config.get("scan_segments", 4)),
         )
 
 
@@ -164,6 +198,7 @@ def register_dynamodb_storage(
             strategy_factory=create_dynamodb_strategy,
             config_factory=create_dynamodb_config,
             unit_of_work_factory=create_dynamodb_unit_of_work,
+            collection_strategy_factory=create_dynamodb_collection_strategy,
         )
 
         if logger:
@@ -246,8 +281,65 @@ def create_aurora_config(data: dict[str, Any]) -> Any:
     return AuroraSqlStrategyConfig(**data)
 
 
+def _aurora_engine_settings(config: Any) -> tuple[str, dict[str, Any]]:
+    """Build the Aurora connection string and engine options.
+
+    Args:
+        config: ConfigurationManager holding the AWS provider config
+
+    Returns:
+        Connection string and ``create_engine`` keyword arguments
+
+    Raises:
+        StorageError: If no Aurora config is present
+    """
+    from orb.infrastructure.storage.exceptions import StorageError
+    from orb.providers.aws.configuration.config import AWSProviderConfig
+
+    aws_cfg = config.get_typed(AWSProviderConfig)
+    if aws_cfg.storage.aurora is None:
+        raise StorageError("Aurora storage selected but no aurora config found in provider config")
+    aurora_cfg = aws_cfg.storage.aurora
+    engine_options = {
+        "pool_size": aurora_cfg.pool_size,
+        "max_overflow": aurora_cfg.max_overflow,
+        "pool_timeout": getattr(aurora_cfg, "pool_timeout", 30),
+        "pool_recycle": getattr(aurora_cfg, "pool_recycle", 3600),
+        "echo": getattr(aurora_cfg, "echo", False),
+    }
+    return _build_aurora_connection_string(aurora_cfg), engine_options
+
+
+def create_aurora_collection_strategy(config: Any, collection: str, columns: dict[str, str]) -> Any:
+    """Create a SQL strategy for a dedicated table in the Aurora database.
+
+    The strategy shares the engine and connection pool of the units of work.
+
+    Args:
+        config: ConfigurationManager holding the AWS provider config
+        collection: Table name
+        columns: Column definitions (name -> type)
+
+    Returns:
+        SQLStorageStrategy on the ``collection`` table
+    """
+    from orb.infrastructure.storage.sql.runtime import get_sql_runtime_pool
+    from orb.infrastructure.storage.sql.strategy import SQLStorageStrategy
+
+    connection_string, engine_options = _aurora_engine_settings(config)
+    runtime = get_sql_runtime_pool().acquire(connection_string, engine_options)
+    return SQLStorageStrategy(
+        config=runtime.connection_manager.config,
+        table_name=collection,
+        columns=columns,
+        connection_manager=runtime.connection_manager,
+    )
+
+
 def create_aurora_unit_of_work(config: Any) -> Any:
-    """Create SQLUnitOfWork with an Aurora-specific SQLAlchemy engine.
+    """Create SQLUnitOfWork backed by the shared Aurora storage runtime.
+
+    The engine and its pool are created once per process per Aurora config.
 
     Args:
         config: ConfigurationManager or dict with connection info
@@ -255,35 +347,18 @@ def create_aurora_unit_of_work(config: Any) -> Any:
     Returns:
         SQLUnitOfWork instance
     """
-    from sqlalchemy import create_engine
-
     from orb.config.manager import ConfigurationManager
-    from orb.infrastructure.storage.exceptions import StorageError
+    from orb.infrastructure.storage.sql.runtime import get_sql_runtime_pool
     from orb.infrastructure.storage.sql.unit_of_work import SQLUnitOfWork
 
     if isinstance(config, ConfigurationManager):
-        from orb.providers.aws.configuration.config import AWSProviderConfig
-
-        aws_cfg = config.get_typed(AWSProviderConfig)
-        if aws_cfg.storage.aurora is None:
-            raise StorageError(
-                "Aurora storage selected but no aurora config found in provider config"
-            )
-        aurora_cfg = aws_cfg.storage.aurora
-        connection_string = _build_aurora_connection_string(aurora_cfg)
-        engine = create_engine(
-            connection_string,
-            pool_size=aurora_cfg.pool_size,
-            max_overflow=aurora_cfg.max_overflow,
-            pool_timeout=getattr(aurora_cfg, "pool_timeout", 30),
-            pool_recycle=getattr(aurora_cfg, "pool_recycle", 3600),
-            echo=getattr(aurora_cfg, "echo", False),
-        )
+        connection_string, engine_options = _aurora_engine_settings(config)
     else:
         connection_string = config.get("connection_string", "mysql+pymysql://localhost/orb")
-        engine = create_engine(connection_string)
+        engine_options = {}
 
-    return SQLUnitOfWork(engine)  # type: ignore[abstract]
+    runtime = get_sql_runtime_pool().acquire(connection_string, engine_options)
+    return SQLUnitOfWork.from_runtime(runtime)
 
 
 def register_aurora_storage(
@@ -306,6 +381,7 @@ def register_aurora_storage(
             strategy_factory=create_aurora_strategy,
             config_factory=create_aurora_config,
             unit_of_work_factory=create_aurora_unit_of_work,
+            collection_strategy_factory=create_aurora_collection_strategy,
         )
 
         if logger:
@@ -1,7 +1,11 @@
 """DynamoDB storage strategy implementation using componentized architecture."""
 
+import threading
+import time
+from collections import Counter
 from typing import Any, Optional
 
+from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
 from orb.domain.base.dependency_injection import injectable
@@ -17,6 +21,28 @@ from orb.providers.aws.storage.components import (
     DynamoDBTransactionManager,
 )
 
+# Attributes backed by a global secondary index; equality criteria on them use Query
+INDEXED_ATTRIBUTES: tuple[str, ...] = ("request_id", "status", "template_id")
+
+# Seconds between checks for indexes that are still being created
+_INDEX_STATUS_REFRESH_INTERVAL = 60.0
+
+# Tables already seen with every secondary index ACTIVE, keyed by
+# (region, profile, table). Later strategies for such a table skip DescribeTable.
+_ready_tables: set[tuple[Optional[str], Optional[str], str]] = set()
+_ready_tables_lock = threading.Lock()
+
+
+def reset_dynamodb_table_cache() -> None:
+    """Forget which tables are known to be ready (for tests)."""
+    with _ready_tables_lock:
+        _ready_tables.clear()
+
+
+def index_name_for(attribute: str) -> str:
+    """Get the global secondary index name for an attribute."""
+    return f"{attribute}-index"
+
 
 @injectable
 class DynamoDBStorageStrategy(BaseStorageStrategy):
@@ -34,6 +60,8 @@ class DynamoDBStorageStrategy(BaseStorageStrategy):
         region: Optional[str],
         table_name: str,
         profile: Optional[str] = None,
+        *,
+        scan_segments: int = 4,
     ) -> None:
         """
         Initialize DynamoDB storage strategy with components.
@@ -43,48 +71,151 @@ class DynamoDBStorageStrategy(BaseStorageStrategy):
             region: AWS region
             table_name: DynamoDB table name
             profile: AWS profile name
+            scan_segments: Segments scanned in parallel for full-table scans
         """
         super().__init__()
 
         self.table_name = table_name
         self.region = region
         self.profile = profile
+        self.scan_segments = max(1, scan_segments)
         self._logger = logger
 
         # Initialize components
         self.client_manager = DynamoDBClientManager(aws_client, region, profile)
-        self.converter = DynamoDBConverter(partition_key="id")
+        # Index key attributes must be strings, so None values are left out of items
+        self.converter = DynamoDBConverter(partition_key="id", sparse_attributes=INDEXED_ATTRIBUTES)
         self.transaction_manager = DynamoDBTransactionManager(self.client_manager)
         self.lock_manager = LockManager("simple")  # Simple lock for DynamoDB
 
+        self._active_indexes: frozenset[str] = frozenset()
+        self._index_status_checked_at: Optional[float] = None
+        self._index_status_lock = threading.Lock()
+
         # Initialize table
         self._initialize_table()
 
         self._logger.debug("Initialized DynamoDB storage strategy for table %s", table_name)
 
     def _initialize_table(self) -> None:
-        """Initialize DynamoDB table if it doesn't exist."""
+        """Initialize DynamoDB table and its secondary indexes if they don't exist."""
+        with _ready_tables_lock:
+            ready = self._table_key in _ready_tables
+        if ready:
+            self._set_active_indexes({index_name_for(a): "ACTIVE" for a in INDEXED_ATTRIBUTES})
+            return
+
         try:
             if not self.client_manager.table_exists(self.table_name):
                 # Create table with basic schema
                 # Partition key
                 key_schema = [{"AttributeName": "id", "KeyType": "HASH"}]
 
-                attribute_definitions = [{"AttributeName": "id", "AttributeType": "S"}]  # String
+                attribute_definitions = [
+                    {"AttributeName": "id", "AttributeType": "S"},  # String
+                    *self._index_attribute_definitions(INDEXED_ATTRIBUTES),
+                ]
 
                 success = self.client_manager.create_table(
-                    self.table_name, key_schema, attribute_definitions
+                    self.table_name,
+                    key_schema,
+                    attribute_definitions,
+                    global_secondary_indexes=[
+                        self._index_definition(attribute) for attribute in INDEXED_ATTRIBUTES
+                    ],
                 )
 
                 if success:
                     self._logger.info("Created DynamoDB table: %s", self.table_name)
                 else:
                     self._logger.warning("Failed to create DynamoDB table: %s", self.table_name)
+            else:
+                self._ensure_indexes()
 
         except Exception as e:
             self._logger.error("Failed to initialize table %s: %s", self.table_name, e)
             raise
 
+    @staticmethod
+    def _index_attribute_definitions(attributes: tuple[str, ...]) -> list[dict[str, str]]:
+        return [{"AttributeName": attribute, "AttributeType": "S"} for attribute in attributes]
+
+    @staticmethod
+    def _index_definition(attribute: str) -> dict[str, Any]:
+        return {
+            "IndexName": index_name_for(attribute),
+            "KeySchema": [{"AttributeName": attribute, "KeyType": "HASH"}],
+            "Projection": {"ProjectionType": "ALL"},
+        }
+
+    @property
+    def _table_key(self) -> tuple[Optional[str], Optional[str], str]:
+        return (self.region, self.profile, self.table_name)
+
+    def _set_active_indexes(self, statuses: dict[str, str]) -> None:
+        """Record index statuses read from DescribeTable."""
+        self._active_indexes = frozenset(
+            name for name, status in statuses.items() if status == "ACTIVE"
+        )
+        self._index_status_checked_at = time.monotonic()
+        if len(self._active_indexes) == len(INDEXED_ATTRIBUTES):
+            with _ready_tables_lock:
+                _ready_tables.add(self._table_key)
+
+    def _ensure_indexes(self) -> None:
+        """Add missing secondary indexes to a table created before they existed."""
+        try:
+            existing = self.client_manager.get_index_statuses(self.table_name)
+        except Exception as e:
+            self._logger.warning("Could not describe indexes of %s: %s", self.table_name, e)
+            return
+        self._set_active_indexes(existing)
+
+        for attribute in INDEXED_ATTRIBUTES:
+            if index_name_for(attribute) in existing:
+                continue
+            # DynamoDB accepts one index creation per table at a time; the
+            # remaining indexes are added on later starts.
+            if self.client_manager.create_global_secondary_index(
+                self.table_name,
+                self._index_definition(attribute),
+                self._index_attribute_definitions((attribute,)),
+            ):
+                break
+
+    def _get_active_indexes(self) -> frozenset[str]:
+        """Get the names of queryable (ACTIVE) indexes, refreshing while any are missing."""
+        with self._index_status_lock:
+            now = time.monotonic()
+            all_active = len(self._active_indexes) == len(INDEXED_ATTRIBUTES)
+            if self._index_status_checked_at is not None and (
+                all_active or now - self._index_status_checked_at < _INDEX_STATUS_REFRESH_INTERVAL
+            ):
+                return self._active_indexes
+
+            self._index_status_checked_at = now
+            try:
+                self._set_active_indexes(self.client_manager.get_index_statuses(self.table_name))
+            except Exception as e:
+                self._logger.debug("Could not read index status of %s: %s", self.table_name, e)
+            return self._active_indexes
+
+    def _select_index(self, criteria: dict[str, Any]) -> Optional[str]:
+        """Pick an indexed attribute with an equality condition on a string value."""
+        candidates = [
+            attribute
+            for attribute in INDEXED_ATTRIBUTES
+            if isinstance(criteria.get(attribute), str)
+        ]
+        if not candidates:
+            return None
+
+        active = self._get_active_indexes()
+        for attribute in candidates:
+            if index_name_for(attribute) in active:
+                return attribute
+        return None
+
     def save(self, entity_id: str, data: dict[str, Any]) -> None:
         """
         Save entity data to DynamoDB table.
@@ -113,6 +244,35 @@ class DynamoDBStorageStrategy(BaseStorageStrategy):
                 self._logger.error("Failed to save entity %s: %s", entity_id, e)
                 raise StorageError(f"Failed to save entity {entity_id}: {e}")
 
+    def save_if(
+        self, entity_id: str, data: dict[str, Any], condition: Optional[dict[str, Any]]
+    ) -> bool:
+        """
+        Save entity data only if the stored item still matches ``condition``.
+
+        The condition is sent as the ConditionExpression of ``PutItem``, so
+        DynamoDB checks and writes the item in one request.
+        """
+        with self.lock_manager.write_lock():
+            try:
+                item = self.converter.to_dynamodb_item(entity_id, data)
+                table = self.client_manager.get_table(self.table_name)
+                table.put_item(
+                    Item=item,
+                    ConditionExpression=self.converter.build_condition_expression(condition),
+                )
+                self._logger.debug("Saved entity: %s", entity_id)
+                return True
+
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                    return False
+                self.client_manager.handle_client_error(e, "Conditional save")
+                raise StorageError(f"Failed to save entity {entity_id}: {e}")
+            except Exception as e:
+                self._logger.error("Failed to save entity %s: %s", entity_id, e)
+                raise StorageError(f"Failed to save entity {entity_id}: {e}")
+
     def find_by_id(self, entity_id: str) -> Optional[dict[str, Any]]:
         """
         Find entity by ID.
@@ -156,7 +316,9 @@ class DynamoDBStorageStrategy(BaseStorageStrategy):
         with self.lock_manager.read_lock():
             try:
                 # Scan table for all items
-                items = self.client_manager.scan_table(self.table_name)
+                items = self.client_manager.scan_table(
+                    self.table_name, total_segments=self.scan_segments
+                )
 
                 entities = {}
                 for item in items:
@@ -231,6 +393,9 @@ class DynamoDBStorageStrategy(BaseStorageStrategy):
         """
         Find entities matching criteria.
 
+        Equality on an indexed attribute is answered with a Query on its
+        global secondary index; other criteria use a (parallel) scan.
+
         Args:
             criteria: Search criteria
 
@@ -239,15 +404,30 @@ class DynamoDBStorageStrategy(BaseStorageStrategy):
         """
         with self.lock_manager.read_lock():
             try:
-                # Build filter expression
-                filter_expression, expression_attribute_values = (
-                    self.converter.build_filter_expression(criteria)
-                )
-
-                # Scan table with filter
-                items = self.client_manager.scan_table(
-                    self.table_name, filter_expression, expression_attribute_values
-                )
+                index_attribute = self._select_index(criteria)
+
+                if index_attribute is not None:
+                    remaining = {k: v for k, v in criteria.items() if k != index_attribute}
+                    filter_expression, _ = self.converter.build_filter_expression(remaining)
+                    items = self.client_manager.query_index(
+                        self.table_name,
+                        index_name_for(index_attribute),
+                        Key(index_attribute).eq(criteria[index_attribute]),
+                        filter_expression,
+                    )
+                else:
+                    # Build filter expression
+                    filter_expression, expression_attribute_values = (
+                        self.converter.build_filter_expression(criteria)
+                    )
+
+                    # Scan table with filter
+                    items = self.client_manager.scan_table(
+                        self.table_name,
+                        filter_expression,
+                        expression_attribute_values,
+                        total_segments=self.scan_segments,
+                    )
 
                 # Convert items to domain data
                 entities = self.converter.from_dynamodb_items(items)
@@ -262,6 +442,77 @@ class DynamoDBStorageStrategy(BaseStorageStrategy):
                 self._logger.error("Failed to search entities: %s", e)
                 return []
 
+    def find_by_ids(self, entity_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Find several entities with BatchGetItem.
+
+        Args:
+            entity_ids: Entity identifiers
+
+        Returns:
+            Found entities keyed by ID; missing IDs are omitted
+        """
+        with self.lock_manager.read_lock():
+            try:
+                keys = [
+                    self.converter.get_key(entity_id) for entity_id in dict.fromkeys(entity_ids)
+                ]
+                items = self.client_manager.batch_get_items(self.table_name, keys)
+
+                entities = {}
+                for item in items:
+                    entity_id = self.converter.extract_entity_id(item)
+                    if entity_id:
+                        entities[entity_id] = self.converter.from_dynamodb_item(item)
+
+                self._logger.debug("Found %s of %s entities by ID", len(entities), len(keys))
+                return entities
+
+            except ClientError as e:
+                self.client_manager.handle_client_error(e, "Find by IDs")
+                raise StorageError(f"Failed to find entities by IDs: {e}")
+            except Exception as e:
+                self._logger.error("Failed to find entities by IDs: %s", e)
+                raise StorageError(f"Failed to find entities by IDs: {e}")
+
+    def count_by_group(
+        self, group_by: str, criteria: Optional[dict[str, Any]] = None
+    ) -> dict[Any, int]:
+        """
+        Count entities per value of a field, projecting only that field.
+
+        Args:
+            group_by: Field to group by
+            criteria: Optional filter criteria
+
+        Returns:
+            Mapping of field value to entity count
+        """
+        with self.lock_manager.read_lock():
+            try:
+                filter_expression, expression_attribute_values = (
+                    self.converter.build_filter_expression(criteria or {})
+                )
+
+                # Placeholder avoids clashes with reserved words such as "status"
+                items = self.client_manager.scan_table(
+                    self.table_name,
+                    filter_expression,
+                    expression_attribute_values,
+                    projection_expression="#grp",
+                    expression_attribute_names={"#grp": group_by},
+                    total_segments=self.scan_segments,
+                )
+
+                return dict(Counter(item.get(group_by) for item in items))
+
+            except ClientError as e:
+                self.client_manager.handle_client_error(e, "Count by group")
+                raise StorageError(f"Failed to count entities by {group_by}: {e}")
+            except Exception as e:
+                self._logger.error("Failed to count entities by %s: %s", group_by, e)
+                raise StorageError(f"Failed to count entities by {group_by}: {e}")
+
     def save_batch(self, entities: dict[str, dict[str, Any]]) -> None:
         """
         Save multiple entities in batch.
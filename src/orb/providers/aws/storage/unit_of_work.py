@@ -33,6 +33,7 @@ class DynamoDBUnitOfWork(BaseUnitOfWork):
         machine_table: str = "machines",
         request_table: str = "requests",
         template_table: str = "templates",
+        scan_segments: int = 4,
     ) -> None:
         """
         Initialize DynamoDB unit of work with simplified repositories.
@@ -45,6 +46,7 @@ class DynamoDBUnitOfWork(BaseUnitOfWork):
             machine_table: DynamoDB table name for machines
             request_table: DynamoDB table name for requests
             template_table: DynamoDB table name for templates
+            scan_segments: Segments scanned in parallel for full-table scans
         """
         super().__init__()
 
@@ -60,6 +62,7 @@ class DynamoDBUnitOfWork(BaseUnitOfWork):
             region=region,
             table_name=machine_table,
             profile=profile,
+            scan_segments=scan_segments,
         )
 
         request_strategy = DynamoDBStorageStrategy(
@@ -68,6 +71,7 @@ class DynamoDBUnitOfWork(BaseUnitOfWork):
             region=region,
             table_name=request_table,
             profile=profile,
+            scan_segments=scan_segments,
         )
 
         template_strategy = DynamoDBStorageStrategy(
@@ -76,6 +80,7 @@ class DynamoDBUnitOfWork(BaseUnitOfWork):
             region=region,
             table_name=template_table,
             profile=profile,
+            scan_segments=scan_segments,
         )
 
         # Create repositories using simplified implementations
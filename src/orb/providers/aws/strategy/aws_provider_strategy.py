@@ -7,7 +7,9 @@ orchestrating operations through focused services while maintaining clean
 architecture and single responsibility principle.
 """
 
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from orb.domain.base.dependency_injection import injectable
@@ -18,6 +20,9 @@ from orb.domain.base.ports.configuration_port import ConfigurationPort
 from orb.providers.aws.configuration.config import AWSProviderConfig
 from orb.providers.aws.exceptions.aws_exceptions import AWSConfigurationError
 from orb.providers.aws.infrastructure.aws_client import AWSClient
+from orb.providers.aws.infrastructure.services.instance_describe_service import (
+    get_instance_describe_service,
+)
 from orb.providers.aws.services.capability_service import AWSCapabilityService
 from orb.providers.aws.services.handler_registry import AWSHandlerRegistry
 from orb.providers.aws.services.health_check_service import AWSHealthCheckService
@@ -46,6 +51,9 @@ from orb.providers.base.strategy import (
     ProviderStrategy,
 )
 
+# Fleets / Auto Scaling Groups per capacity describe call in batched status queries
+_CAPACITY_BATCH_SIZE = 50
+
 
 @injectable
 class AWSProviderStrategy(ProviderStrategy):
@@ -410,6 +418,8 @@ class AWSProviderStrategy(ProviderStrategy):
         correct handler's check_hosts_status method rather than using a generic
         service that lacks per-handler context.
         """
+        if operation.parameters.get("requests"):
+            return await self._handle_describe_resource_instances_batch(operation)
         try:
             resource_ids = operation.parameters.get("resource_ids", [])
             provider_api = operation.parameters.get("provider_api", "RunInstances")
@@ -423,34 +433,19 @@ class AWSProviderStrategy(ProviderStrategy):
                     "MISSING_RESOURCE_IDS",
                 )
 
-            handler = self.get_handler(provider_api_value)
+            handler = self._get_resource_handler(provider_api_value)
             if not handler:
-                handler = self.get_handler("RunInstances")
-                if not handler:
-                    return ProviderResult.error_result(
-                        f"No handler available for provider_api: {provider_api}",
-                        "HANDLER_NOT_FOUND",
-                    )
-                self._logger.warning(
-                    "Handler for %s not found, using RunInstances fallback", provider_api
+                return ProviderResult.error_result(
+                    f"No handler available for provider_api: {provider_api}",
+                    "HANDLER_NOT_FOUND",
                 )
 
-            from orb.domain.request.aggregate import Request
-            from orb.domain.request.value_objects import RequestType
-
             request_id = operation.parameters.get("request_id") or (
                 operation.context.get("request_id") if operation.context else None
             )
-
-            request = Request.create_new_request(
-                request_type=RequestType.ACQUIRE,
-                template_id=operation.parameters.get("template_id", "unknown"),
-                machine_count=1,
-                provider_type="aws",
-                provider_name="aws-default",
-                request_id=request_id,
+            request = self._build_resource_request(
+                request_id, operation.parameters.get("template_id"), resource_ids
             )
-            request.resource_ids = resource_ids
 
             instance_details = handler.check_hosts_status(request)
 
@@ -477,6 +472,129 @@ class AWSProviderStrategy(ProviderStrategy):
                 "DESCRIBE_RESOURCE_INSTANCES_ERROR",
             )
 
+    async def _handle_describe_resource_instances_batch(
+        self, operation: ProviderOperation
+    ) -> ProviderResult:
+        """Discover the instances of several requests' resources with shared AWS calls.
+
+        ``parameters["requests"]`` lists ``{"request_id", "resource_ids",
+        "template_id"}`` entries sharing one ``provider_api``. Capacity data for
+        all resources is fetched in chunked describe calls, and the handlers run
+        concurrently inside a describe-service batching block so that their
+        ``describe_instances`` lookups are merged. Results are returned per
+        request under ``results``; a request whose discovery failed carries an
+        ``error`` instead of ``instances``.
+        """
+        try:
+            entries = operation.parameters["requests"]
+            provider_api = operation.parameters.get("provider_api", "RunInstances")
+            provider_api_value = (
+                provider_api.value if hasattr(provider_api, "value") else provider_api
+            )
+
+            handler = self._get_resource_handler(provider_api_value)
+            if not handler:
+                return ProviderResult.error_result(
+                    f"No handler available for provider_api: {provider_api}",
+                    "HANDLER_NOT_FOUND",
+                )
+
+            capacities = self._fetch_capacities(
+                provider_api_value,
+                [entry["resource_ids"][0] for entry in entries if entry.get("resource_ids")],
+            )
+
+            def check_hosts(entry: dict[str, Any]) -> list[dict[str, Any]]:
+                if not entry.get("resource_ids"):
+                    raise ValueError("Resource IDs are required for instance discovery")
+                request = self._build_resource_request(
+                    entry.get("request_id"), entry.get("template_id"), entry["resource_ids"]
+                )
+                return handler.check_hosts_status(request)
+
+            describer = get_instance_describe_service(self.aws_client, self._logger)  # type: ignore[arg-type]
+            loop = asyncio.get_running_loop()
+            with (
+                describer.batching(),
+                ThreadPoolExecutor(
+                    max_workers=max(1, min(describer.max_workers, len(entries))),
+                    thread_name_prefix="describe-resources",
+                ) as executor,
+            ):
+                outcomes = await asyncio.gather(
+                    *(loop.run_in_executor(executor, check_hosts, entry) for entry in entries),
+                    return_exceptions=True,
+                )
+
+            results: dict[str, dict[str, Any]] = {}
+            for entry, outcome in zip(entries, outcomes):
+                resource_ids = entry.get("resource_ids") or []
+                if isinstance(outcome, BaseException):
+                    self._logger.warning(
+                        "Failed to describe resources %s of request %s: %s",
+                        resource_ids,
+                        entry.get("request_id"),
+                        outcome,
+                    )
+                    results[entry["request_id"]] = {"error": str(outcome)}
+                    continue
+                metadata: dict[str, Any] = {
+                    "operation": "describe_resource_instances",
+                    "resource_ids": resource_ids,
+                    "provider_api": provider_api_value,
+                    "instance_count": len(outcome),
+                }
+                capacity = capacities.get(resource_ids[0])
+                if capacity is not None:
+                    metadata["fleet_capacity_fulfilment"] = capacity
+                results[entry["request_id"]] = {"instances": outcome, "metadata": metadata}
+
+            return ProviderResult.success_result(
+                data={"results": results},
+                metadata={
+                    "operation": "describe_resource_instances",
+                    "provider_api": provider_api_value,
+                    "request_count": len(entries),
+                },
+            )
+
+        except Exception as e:
+            return ProviderResult.error_result(
+                f"Failed to describe resource instances: {e!s}",
+                "DESCRIBE_RESOURCE_INSTANCES_ERROR",
+            )
+
+    def _get_resource_handler(self, provider_api: str) -> Optional[Any]:
+        """Return the handler for a provider API, falling back to RunInstances."""
+        handler = self.get_handler(provider_api)
+        if handler:
+            return handler
+        handler = self.get_handler("RunInstances")
+        if handler:
+            self._logger.warning(
+                "Handler for %s not found, using RunInstances fallback", provider_api
+            )
+        return handler
+
+    @staticmethod
+    def _build_resource_request(
+        request_id: Optional[str], template_id: Optional[str], resource_ids: list[str]
+    ) -> Any:
+        """Build the request a handler's check_hosts_status expects for resource discovery."""
+        from orb.domain.request.aggregate import Request
+        from orb.domain.request.value_objects import RequestType
+
+        request = Request.create_new_request(
+            request_type=RequestType.ACQUIRE,
+            template_id=template_id or "unknown",
+            machine_count=1,
+            provider_type="aws",
+            provider_name="aws-default",
+            request_id=request_id,
+        )
+        request.resource_ids = resource_ids
+        return request
+
     # Infrastructure discovery methods (delegated to service)
     def discover_infrastructure(self, provider_config: dict[str, Any]) -> dict[str, Any]:
         """Discover AWS infrastructure for provider."""
@@ -500,6 +618,26 @@ class AWSProviderStrategy(ProviderStrategy):
         """Validate AWS infrastructure configuration."""
         return self._get_infrastructure_service().validate_infrastructure(provider_config)
 
+    def warm_caches(self, provider_config: dict[str, Any], force: bool = False) -> dict[str, Any]:
+        """Populate the on-disk caches shared by ORB processes for the provider's region."""
+        from botocore.config import Config
+
+        from orb.providers.aws.session_factory import AWSSessionFactory
+        from orb.providers.aws.utilities.ec2.instances import warm_instance_type_catalog
+
+        config = provider_config.get("config", {})
+        region = config.get("region", self._aws_config.region)
+        profile = config.get("profile", self._aws_config.profile) or None
+
+        session = AWSSessionFactory.create_session(profile=profile, region=region)
+        ec2_client = session.client(
+            "ec2", config=Config(connect_timeout=10, read_timeout=30, retries={"max_attempts": 3})
+        )
+        return {
+            "provider": provider_config.get("name", "unknown"),
+            "instance_type_catalog": warm_instance_type_catalog(ec2_client, region, force=force),
+        }
+
     # Credential methods (delegated to health service)
     def get_available_credential_sources(self) -> list[dict]:
         """Get available AWS credential sources."""
@@ -592,6 +730,41 @@ class AWSProviderStrategy(ProviderStrategy):
         except Exception as e:
             self._logger.warning("Failed to augment capacity metadata: %s", e)
 
+    def _fetch_capacities(
+        self, provider_api: str, resource_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch capacity fulfillment data of many fleet resources in chunked calls.
+
+        A chunk whose describe call fails (e.g. one unknown fleet ID) is
+        retried resource by resource, so one bad resource does not drop the
+        capacity data of the others.
+        """
+        batch_fetchers: dict[str, Callable[[list[str]], dict[str, dict[str, Any]]]] = {
+            "EC2Fleet": self._fetch_ec2_fleet_capacities,
+            "SpotFleet": self._fetch_spot_fleet_capacities,
+            "ASG": self._fetch_asg_capacities,
+        }
+        fetcher = batch_fetchers.get(provider_api)
+        unique_ids = list(dict.fromkeys(r for r in resource_ids if r))
+        if not fetcher or not unique_ids or not self.aws_client:
+            return {}
+
+        capacities: dict[str, dict[str, Any]] = {}
+        for i in range(0, len(unique_ids), _CAPACITY_BATCH_SIZE):
+            chunk = unique_ids[i : i + _CAPACITY_BATCH_SIZE]
+            try:
+                capacities.update(fetcher(chunk))
+            except Exception as e:
+                self._logger.warning(
+                    "Batched capacity lookup failed, fetching resources one by one: %s", e
+                )
+                for resource_id in chunk:
+                    metadata: dict[str, Any] = {}
+                    self._augment_capacity_metadata(metadata, provider_api, [resource_id])
+                    if "fleet_capacity_fulfilment" in metadata:
+                        capacities[resource_id] = metadata["fleet_capacity_fulfilment"]
+        return capacities
+
     def _fetch_ec2_fleet_capacity(self, resource_id: str) -> Optional[dict[str, Any]]:
         """Fetch capacity fulfillment data for an EC2Fleet resource."""
         if self.aws_client is None:
@@ -602,7 +775,19 @@ class AWSProviderStrategy(ProviderStrategy):
         fleets = response.get("Fleets", [])
         if not fleets:
             return None
-        fleet = fleets[0]
+        return self._ec2_fleet_capacity(fleets[0])
+
+    def _fetch_ec2_fleet_capacities(self, resource_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch capacity fulfillment data for several EC2Fleet resources in one call."""
+        response = self.aws_client.ec2_client.describe_fleets(FleetIds=resource_ids)  # type: ignore[union-attr]
+        return {
+            fleet["FleetId"]: self._ec2_fleet_capacity(fleet)
+            for fleet in response.get("Fleets", [])
+            if fleet.get("FleetId")
+        }
+
+    @staticmethod
+    def _ec2_fleet_capacity(fleet: dict[str, Any]) -> dict[str, Any]:
         spec = fleet.get("TargetCapacitySpecification") or {}
         target = spec.get("TotalTargetCapacity")
         fulfilled = fleet.get("FulfilledCapacity") or 0
@@ -628,13 +813,28 @@ class AWSProviderStrategy(ProviderStrategy):
         configs = response.get("SpotFleetRequestConfigs", [])
         if not configs:
             return None
-        cfg = configs[0].get("SpotFleetRequestConfig") or {}
+        return self._spot_fleet_capacity(configs[0])
+
+    def _fetch_spot_fleet_capacities(self, resource_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch capacity fulfillment data for several SpotFleet resources in one call."""
+        response = self.aws_client.ec2_client.describe_spot_fleet_requests(  # type: ignore[union-attr]
+            SpotFleetRequestIds=resource_ids
+        )
+        return {
+            config["SpotFleetRequestId"]: self._spot_fleet_capacity(config)
+            for config in response.get("SpotFleetRequestConfigs", [])
+            if config.get("SpotFleetRequestId")
+        }
+
+    @staticmethod
+    def _spot_fleet_capacity(config: dict[str, Any]) -> dict[str, Any]:
+        cfg = config.get("SpotFleetRequestConfig") or {}
         fulfilled = cfg.get("FulfilledCapacity") or 0
         return {
             "target_capacity_units": cfg.get("TargetCapacity"),
             "fulfilled_capacity_units": fulfilled,
             "provisioned_instance_count": int(fulfilled),
-            "state": configs[0].get("SpotFleetRequestState"),
+            "state": config.get("SpotFleetRequestState"),
             "fleet_type": (cfg.get("Type") or "request").lower(),
         }
 
@@ -650,7 +850,28 @@ class AWSProviderStrategy(ProviderStrategy):
         groups = response.get("AutoScalingGroups", [])
         if not groups:
             return None
-        group = groups[0]
+        return self._asg_capacity(groups[0])
+
+    def _fetch_asg_capacities(self, resource_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch capacity fulfillment data for several Auto Scaling Groups in one call."""
+        autoscaling = self.aws_client.autoscaling_client  # type: ignore[union-attr]
+        request: dict[str, Any] = {
+            "AutoScalingGroupNames": resource_ids,
+            "MaxRecords": _CAPACITY_BATCH_SIZE,
+        }
+        capacities: dict[str, dict[str, Any]] = {}
+        while True:
+            response = autoscaling.describe_auto_scaling_groups(**request)
+            for group in response.get("AutoScalingGroups", []):
+                if group.get("AutoScalingGroupName"):
+                    capacities[group["AutoScalingGroupName"]] = self._asg_capacity(group)
+            next_token = response.get("NextToken")
+            if not next_token:
+                return capacities
+            request["NextToken"] = next_token
+
+    @staticmethod
+    def _asg_capacity(group: dict[str, Any]) -> dict[str, Any]:
         instances = group.get("Instances") or []
         fulfilled = sum(
             int(inst.get("WeightedCapacity", 1))
@@ -679,8 +900,7 @@ class AWSProviderStrategy(ProviderStrategy):
 
             if needs_resolution:
                 service = self._create_image_resolution_service()
-                for spec in needs_resolution:
-                    resolved_images[spec] = service.resolve_image_id(spec)
+                resolved_images.update(service.resolve_image_ids(needs_resolution))
 
             return ProviderResult.success_result({"resolved_images": resolved_images})
 
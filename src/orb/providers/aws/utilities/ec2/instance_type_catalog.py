@@ -0,0 +1,220 @@
+"""Persistent, region-keyed catalog of EC2 instance type specs.
+
+HostFactory starts a fresh ``orb`` process for every call, so a process-local
+cache of ``describe_instance_types`` is rebuilt (several paginated API calls)
+on every invocation that needs vCPU or memory data. The catalog stores the
+result on disk, one JSON file per region, so every process on the host reads
+it with a single file load and only one of them pays for the API calls.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from orb.config.platform_dirs import get_cache_location
+from orb.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+CATALOG_FORMAT_VERSION = 1
+# Catalogs older than this are still served but refreshed in the background
+DEFAULT_REFRESH_AFTER_SECONDS = 24 * 3600
+# Catalogs older than this are ignored
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+_FILE_PREFIX = "ec2_instance_types_"
+
+InstanceSpecs = dict[str, tuple[int, int]]  # {type: (vcpus, memory_mib)}
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Instance type specs of one region as loaded from disk."""
+
+    region: str
+    fetched_at: float
+    specs: InstanceSpecs
+
+    def age(self, now: float) -> float:
+        """Seconds since the specs were fetched."""
+        return now - self.fetched_at
+
+
+class InstanceTypeCatalog:
+    """
+    On-disk store of ``describe_instance_types`` results shared by all processes.
+
+    Files are versioned and written atomically (temp file + ``os.replace``), so
+    readers never see a partial catalog and concurrent refreshes are safe.
+    Loaded files are memoized per process until their modification time changes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        refresh_after_seconds: float = DEFAULT_REFRESH_AFTER_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the catalog.
+
+        Args:
+            cache_dir: Directory holding the catalog files (default: ORB cache directory)
+            ttl_seconds: Age after which a catalog is no longer used
+            refresh_after_seconds: Age after which a catalog is refreshed in the background
+            clock: Wall-clock source, overridable in tests
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else get_cache_location()
+        self.ttl_seconds = ttl_seconds
+        self.refresh_after_seconds = refresh_after_seconds
+        self._clock = clock
+        self._memo: dict[Path, tuple[int, CatalogEntry]] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def path_for(self, region: str) -> Path:
+        """Return the catalog file of ``region``."""
+        return self.cache_dir / f"{_FILE_PREFIX}{region}.json"
+
+    def load(self, region: Optional[str] = None) -> Optional[CatalogEntry]:
+        """
+        Return the catalog of ``region`` if present and within its TTL.
+
+        Instance type specs do not differ between regions, so without a region
+        the most recently fetched catalog of any region is returned.
+        """
+        if region:
+            entry = self._read(self.path_for(region))
+        else:
+            entries = [self._read(path) for path in self._catalog_files()]
+            entry = max(
+                (e for e in entries if e is not None), key=lambda e: e.fetched_at, default=None
+            )
+        if entry is None or entry.age(self._clock()) > self.ttl_seconds:
+            return None
+        return entry
+
+    def is_stale(self, entry: CatalogEntry) -> bool:
+        """Whether ``entry`` is old enough to be refreshed."""
+        return entry.age(self._clock()) > self.refresh_after_seconds
+
+    def store(self, region: str, specs: InstanceSpecs) -> CatalogEntry:
+        """Atomically write the catalog of ``region``."""
+        entry = CatalogEntry(region=region, fetched_at=self._clock(), specs=dict(specs))
+        path = self.path_for(region)
+        data = {
+            "format_version": CATALOG_FORMAT_VERSION,
+            "region": region,
+            "fetched_at": entry.fetched_at,
+            "instance_types": {name: list(spec) for name, spec in sorted(specs.items())},
+        }
+        temp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_file, path)
+        except OSError as e:
+            logger.debug("Failed to write instance type catalog %s: %s", path, e)
+            with suppress(OSError):
+                os.remove(temp_file)
+        return entry
+
+    def refresh(
+        self, region: str, ec2_client: Any, loader: Callable[[Any], InstanceSpecs]
+    ) -> Optional[CatalogEntry]:
+        """
+        Load specs with ``loader`` and store them for ``region``.
+
+        An empty result (API failure) leaves the existing catalog untouched.
+        """
+        specs = loader(ec2_client)
+        if not specs:
+            return None
+        return self.store(region, specs)
+
+    def refresh_in_background(
+        self, region: str, ec2_client: Any, loader: Callable[[Any], InstanceSpecs]
+    ) -> bool:
+        """
+        Refresh ``region`` on a daemon thread unless a refresh is already running.
+
+        Returns:
+            True if a refresh was started
+        """
+        with self._lock:
+            if region in self._refreshing:
+                return False
+            self._refreshing.add(region)
+
+        def _run() -> None:
+            try:
+                self.refresh(region, ec2_client, loader)
+            except Exception as e:
+                logger.debug("Background instance type catalog refresh failed: %s", e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(region)
+
+        threading.Thread(target=_run, name=f"instance-type-catalog-{region}", daemon=True).start()
+        return True
+
+    def _catalog_files(self) -> list[Path]:
+        try:
+            return list(self.cache_dir.glob(f"{_FILE_PREFIX}*.json"))
+        except OSError:
+            return []
+
+    def _read(self, path: Path) -> Optional[CatalogEntry]:
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            memo = self._memo.get(path)
+        if memo is not None and memo[0] == mtime:
+            return memo[1]
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("format_version") != CATALOG_FORMAT_VERSION:
+                logger.debug("Ignoring instance type catalog %s with another format", path)
+                return None
+            entry = CatalogEntry(
+                region=str(data["region"]),
+                fetched_at=float(data["fetched_at"]),
+                specs={
+                    name: (int(vcpus), int(memory))
+                    for name, (vcpus, memory) in data["instance_types"].items()
+                },
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Ignoring unreadable instance type catalog %s: %s", path, e)
+            return None
+
+        with self._lock:
+            self._memo[path] = (mtime, entry)
+        return entry
+
+
+_catalog: Optional[InstanceTypeCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_instance_type_catalog() -> InstanceTypeCatalog:
+    """Return the process-wide catalog in the ORB cache directory."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = InstanceTypeCatalog()
+    return _catalog
@@ -8,6 +8,10 @@ from botocore.exceptions import ClientError
 from orb.domain.base.exceptions import InfrastructureError
 from orb.infrastructure.logging.logger import get_logger
 from orb.infrastructure.resilience import retry
+from orb.providers.aws.utilities.ec2.instance_type_catalog import (
+    InstanceSpecs,
+    get_instance_type_catalog,
+)
 
 # Logger
 logger = get_logger(__name__)
@@ -257,8 +261,11 @@ def terminate_instance(instance_id: str, aws_client: Any = None) -> dict[str, An
 
 # Instance type spec lookup — API cache with heuristic fallback
 
-_instance_spec_cache: dict[str, tuple[int, int]] | None = None  # {type: (vcpus, memory_mib)}
+_instance_spec_cache: InstanceSpecs | None = None  # {type: (vcpus, memory_mib)}
 _cache_lock = threading.Lock()
+# Set once the shared catalog has been found missing, so that client-less
+# lookups do not hit the disk again for every instance
+_catalog_checked = False
 
 _SIZE_TO_VCPUS: dict[str, int] = {
     "nano": 2,
@@ -367,24 +374,83 @@ def _heuristic_cpu_ram(instance_type: str) -> tuple[str, str]:
     return (str(vcpus), str(mem_mib))
 
 
+def _client_region(ec2_client: Any) -> Optional[str]:
+    region = getattr(getattr(ec2_client, "meta", None), "region_name", None)
+    return region if isinstance(region, str) and region else None
+
+
+def _resolve_instance_specs(ec2_client: Any | None) -> InstanceSpecs | None:
+    """Load specs from the shared on-disk catalog, or from the EC2 API when a client is given."""
+    catalog = get_instance_type_catalog()
+    region = _client_region(ec2_client) if ec2_client is not None else None
+    entry = catalog.load(region)
+    if entry is not None:
+        if region and catalog.is_stale(entry):
+            catalog.refresh_in_background(region, ec2_client, _load_instance_specs)
+        return entry.specs
+    if ec2_client is None:
+        return None
+
+    specs = _load_instance_specs(ec2_client)
+    if specs and region:
+        catalog.store(region, specs)
+    return specs
+
+
+def warm_instance_type_catalog(ec2_client: Any, region: str, force: bool = False) -> dict[str, Any]:
+    """
+    Populate the shared instance type catalog of ``region``.
+
+    Args:
+        ec2_client: EC2 client of the region
+        region: Region the catalog is stored under
+        force: Refresh even if the stored catalog is still fresh
+
+    Returns:
+        Summary with the catalog path, number of instance types and whether it was refreshed
+    """
+    global _instance_spec_cache
+
+    catalog = get_instance_type_catalog()
+    entry = None if force else catalog.load(region)
+    refreshed = False
+    if entry is None or catalog.is_stale(entry):
+        fetched = catalog.refresh(region, ec2_client, _load_instance_specs)
+        if fetched is not None:
+            entry, refreshed = fetched, True
+    if entry is not None:
+        with _cache_lock:
+            _instance_spec_cache = entry.specs
+
+    return {
+        "region": region,
+        "path": str(catalog.path_for(region)),
+        "instance_types": len(entry.specs) if entry else 0,
+        "fetched_at": entry.fetched_at if entry else None,
+        "refreshed": refreshed,
+    }
+
+
 def derive_cpu_ram_from_instance_type(
     instance_type: str,
     ec2_client: Any | None = None,
 ) -> tuple[str, str]:
     """Derive vCPU count and RAM (MiB) for an EC2 instance type.
 
-    Primary: looks up from ec2.describe_instance_types() cache.
+    Primary: looks up from the describe_instance_types() specs, read from the
+    shared on-disk catalog or, when ``ec2_client`` is given and no catalog is
+    stored yet, fetched from the API and persisted for other processes.
     Fallback: heuristic based on instance family and size.
 
     Returns: (vcpus_str, ram_mib_str)
     """
-    global _instance_spec_cache
+    global _instance_spec_cache, _catalog_checked
 
-    # Try API cache first
-    if ec2_client is not None and _instance_spec_cache is None:
+    if _instance_spec_cache is None and (ec2_client is not None or not _catalog_checked):
         with _cache_lock:
             if _instance_spec_cache is None:
-                _instance_spec_cache = _load_instance_specs(ec2_client)
+                _instance_spec_cache = _resolve_instance_specs(ec2_client)
+                _catalog_checked = True
 
     if _instance_spec_cache and instance_type in _instance_spec_cache:
         vcpus, mem_mib = _instance_spec_cache[instance_type]
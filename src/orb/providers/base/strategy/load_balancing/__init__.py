@@ -8,12 +8,14 @@ Components:
 - LoadBalancingAlgorithm: Available load balancing algorithms
 - HealthCheckMode: Health monitoring modes
 - LoadBalancingConfig: Configuration options
+- LoadBalancingSelector: Selection engine shared with the provider registry
 - StrategyStats: Performance statistics tracking
 - LoadBalancingProviderStrategy: Main load balancing implementation
 """
 
 from .algorithms import HealthCheckMode, LoadBalancingAlgorithm
 from .config import LoadBalancingConfig
+from .selection import LoadBalancingSelector
 from .stats import StrategyStats
 from .strategy import LoadBalancingProviderStrategy
 
@@ -22,5 +24,6 @@ __all__: list[str] = [
     "LoadBalancingAlgorithm",
     "LoadBalancingConfig",
     "LoadBalancingProviderStrategy",
+    "LoadBalancingSelector",
     "StrategyStats",
 ]
@@ -0,0 +1,225 @@
+"""Selection algorithms shared by provider load balancing."""
+
+import hashlib
+import random
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from typing import Generic, Optional, TypeVar
+
+DEFAULT_VIRTUAL_NODES = 100
+# Candidate sets whose selection state is kept; callers rarely use more than a few
+MAX_CANDIDATE_SETS = 32
+
+_Key = TypeVar("_Key", bound=Hashable)
+_State = TypeVar("_State")
+
+
+class SmoothWeightedRoundRobin(Generic[_Key]):
+    """
+    Smooth weighted round robin (as used by nginx).
+
+    Each pick adds every member's weight to its running score, selects the
+    highest score and subtracts the total weight from it. Over ``sum(weights)``
+    picks every member is chosen exactly ``weight`` times, interleaved rather
+    than in bursts. Members that leave the set lose their running score.
+    """
+
+    def __init__(self) -> None:
+        self._current: dict[_Key, float] = {}
+
+    def select(self, weights: Mapping[_Key, float]) -> _Key:
+        """
+        Pick the next member.
+
+        Args:
+            weights: Positive weight of each candidate
+
+        Returns:
+            The selected candidate key
+        """
+        if not weights:
+            raise ValueError("At least one candidate is required")
+        total = 0.0
+        best: Optional[_Key] = None
+        best_score = 0.0
+        for key, weight in weights.items():
+            score = self._current.get(key, 0.0) + weight
+            self._current[key] = score
+            total += weight
+            if best is None or score > best_score:
+                best, best_score = key, score
+        assert best is not None
+        self._current[best] = best_score - total
+        if len(self._current) > len(weights):
+            for key in [k for k in self._current if k not in weights]:
+                del self._current[key]
+        return best
+
+
+class AliasTable(Generic[_Key]):
+    """
+    Walker/Vose alias table for O(1) weighted random sampling.
+
+    Built once per weight set in O(n); each sample then costs one uniform
+    draw and one comparison regardless of the number of candidates.
+    """
+
+    def __init__(self, weights: Mapping[_Key, float]) -> None:
+        if not weights:
+            raise ValueError("At least one candidate is required")
+        total = sum(weights.values())
+        if total <= 0:
+            raise ValueError("Weights must sum to a positive value")
+
+        self.keys: list[_Key] = list(weights)
+        n = len(self.keys)
+        scaled = [weights[key] * n / total for key in self.keys]
+        self._probability = [1.0] * n
+        self._alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Leftovers are 1.0 up to rounding error and keep their defaults
+
+    def sample(self, rng: random.Random) -> _Key:
+        """Draw one key with probability proportional to its weight."""
+        column = rng.randrange(len(self.keys))
+        if rng.random() < self._probability[column]:
+            return self.keys[column]
+        return self.keys[self._alias[column]]
+
+
+class ConsistentHashRing(Generic[_Key]):
+    """
+    Consistent-hash ring with virtual nodes.
+
+    Members are placed on the ring ``virtual_nodes`` times using a stable
+    hash, so the mapping survives restarts and a membership change only
+    remaps the keys owned by the member that joined or left.
+    """
+
+    def __init__(self, members: Sequence[_Key], virtual_nodes: int = DEFAULT_VIRTUAL_NODES) -> None:
+        if not members:
+            raise ValueError("At least one member is required")
+        points = sorted(
+            (_stable_hash(f"{member}#{replica}"), member)
+            for member in members
+            for replica in range(virtual_nodes)
+        )
+        self.members = frozenset(members)
+        self._hashes = [point for point, _ in points]
+        self._owners = [member for _, member in points]
+
+    def get(self, routing_key: str) -> _Key:
+        """Return the member owning ``routing_key``."""
+        index = bisect_right(self._hashes, _stable_hash(routing_key)) % len(self._hashes)
+        return self._owners[index]
+
+
+class LoadBalancingSelector(Generic[_Key]):
+    """
+    Thread-safe selection engine for provider load balancing.
+
+    Keeps the state each algorithm needs between picks (round robin scores,
+    alias tables and hash rings) so callers only pass the current candidates.
+    State is kept per candidate set, up to ``max_candidate_sets`` of the most
+    recently used ones, so callers that alternate between different sets
+    (per-API compatible providers, all active providers) do not reset each
+    other's rotation. The selector is generic over the candidate key type,
+    so picks come back with the type of the keys passed in.
+    """
+
+    def __init__(
+        self,
+        virtual_nodes: int = DEFAULT_VIRTUAL_NODES,
+        rng: Optional[random.Random] = None,
+        max_candidate_sets: int = MAX_CANDIDATE_SETS,
+    ) -> None:
+        self._virtual_nodes = virtual_nodes
+        # Using standard random for load balancing is appropriate (not cryptographic)
+        self._rng = rng or random.Random()  # nosec B311
+        self._max_candidate_sets = max_candidate_sets
+        self._round_robins: OrderedDict[Hashable, SmoothWeightedRoundRobin[_Key]] = OrderedDict()
+        self._alias_tables: OrderedDict[Hashable, AliasTable[_Key]] = OrderedDict()
+        self._rings: OrderedDict[Hashable, ConsistentHashRing[_Key]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def weighted_round_robin(self, weights: Mapping[_Key, float], group: Hashable = None) -> _Key:
+        """
+        Pick by smooth weighted round robin.
+
+        Args:
+            weights: Weight of each candidate
+            group: Separates rotations over the same candidate set, e.g. plain
+                and weighted round robin
+
+        Returns:
+            The selected candidate key
+        """
+        weights = _positive(weights)
+        with self._lock:
+            round_robin = self._cached(
+                self._round_robins, (group, frozenset(weights)), SmoothWeightedRoundRobin
+            )
+            return round_robin.select(weights)
+
+    def weighted_random(self, weights: Mapping[_Key, float]) -> _Key:
+        """Pick at random with probability proportional to weight."""
+        weights = _positive(weights)
+        signature = frozenset(weights.items())
+        with self._lock:
+            alias_table = self._cached(self._alias_tables, signature, lambda: AliasTable(weights))
+            return alias_table.sample(self._rng)
+
+    def consistent_hash(self, members: Sequence[_Key], routing_key: str) -> _Key:
+        """Pick the member owning ``routing_key`` on a consistent-hash ring."""
+        with self._lock:
+            ring = self._cached(
+                self._rings,
+                frozenset(members),
+                lambda: ConsistentHashRing(members, self._virtual_nodes),
+            )
+            return ring.get(routing_key)
+
+    def power_of_two_choices(self, costs: Mapping[_Key, float]) -> _Key:
+        """Sample two candidates at random and pick the one with the lower cost."""
+        if not costs:
+            raise ValueError("At least one candidate is required")
+        keys = list(costs)
+        if len(keys) == 1:
+            return keys[0]
+        with self._lock:
+            first, second = self._rng.sample(keys, 2)
+        return first if costs[first] <= costs[second] else second
+
+    def _cached(
+        self, cache: "OrderedDict[Hashable, _State]", key: Hashable, build: Callable[[], _State]
+    ) -> _State:
+        """Return the state of ``key``, building it and evicting the least recently used."""
+        state = cache.get(key)
+        if state is None:
+            state = cache[key] = build()
+            if len(cache) > self._max_candidate_sets:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return state
+
+
+def _positive(weights: Mapping[_Key, float]) -> dict[_Key, float]:
+    """Drop non-positive weights, treating an all-zero set as equal weights."""
+    positive = {key: float(weight) for key, weight in weights.items() if weight > 0}
+    return positive or dict.fromkeys(weights, 1.0)
+
+
+def _stable_hash(value: str) -> int:
+    # Python's hash() is salted per process; the ring must be stable across restarts
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
@@ -2,7 +2,25 @@
 
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
+
+from orb.monitoring.histogram import Histogram
+
+# Response-time buckets in milliseconds
+RESPONSE_TIME_BUCKETS_MS: tuple[float, ...] = (
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+)
 
 
 @dataclass
@@ -18,8 +36,14 @@ class StrategyStats:
     is_healthy: bool = True
     last_health_check: Optional[float] = None
     response_times: deque = field(default_factory=lambda: deque(maxlen=10))  # Recent response times
-    average_response_time: float = 0.0
+    average_response_time: float = 0.0  # Average of the recent response times
     weight: float = 1.0
+    ewma_response_time: float = 0.0  # Peak-sensitive moving average of response times
+    ewma_alpha: float = 0.1  # Smoothing factor of ewma_response_time
+    response_time_histogram: Histogram = field(
+        default_factory=lambda: Histogram(RESPONSE_TIME_BUCKETS_MS)
+    )
+    _recent_total: float = field(default=0.0, repr=False)
 
     @property
     def success_rate(self) -> float:
@@ -33,6 +57,11 @@ class StrategyStats:
         """Calculate failure rate percentage."""
         return 100.0 - self.success_rate
 
+    @property
+    def load_score(self) -> float:
+        """Expected cost of sending one more request: EWMA latency times in-flight load."""
+        return self.ewma_response_time * (self.active_connections + 1)
+
     def record_request_start(self) -> None:
         """Record the start of a request."""
         self.active_connections += 1
@@ -51,10 +80,29 @@ class StrategyStats:
             self.consecutive_failures += 1
             self.consecutive_successes = 0
 
-        # Update response time statistics
+        # Update response time statistics; the recent window keeps a running total
+        if len(self.response_times) == self.response_times.maxlen:
+            self._recent_total -= self.response_times[0]
         self.response_times.append(response_time_ms)
-        if self.response_times:
-            self.average_response_time = sum(self.response_times) / len(self.response_times)
+        self._recent_total += response_time_ms
+        self.average_response_time = self._recent_total / len(self.response_times)
+        self.response_time_histogram.observe(response_time_ms)
+
+        # Peak EWMA: slowdowns take effect at once, recoveries decay in gradually
+        if response_time_ms >= self.ewma_response_time:
+            self.ewma_response_time = response_time_ms
+        else:
+            self.ewma_response_time += self.ewma_alpha * (
+                response_time_ms - self.ewma_response_time
+            )
+
+    def response_time_percentiles(self) -> dict[str, Any]:
+        """Return p50/p95/p99 response times (ms) over all recorded requests."""
+        return {
+            "p50": self.response_time_histogram.quantile(0.5),
+            "p95": self.response_time_histogram.quantile(0.95),
+            "p99": self.response_time_histogram.quantile(0.99),
+        }
 
     def reset_stats(self) -> None:
         """Reset all statistics."""
@@ -67,5 +115,8 @@ class StrategyStats:
         self.is_healthy = True
         self.last_health_check = None
         self.response_times.clear()
+        self._recent_total = 0.0
+        self.response_time_histogram.reset()
         self.average_response_time = 0.0
+        self.ewma_response_time = 0.0
         self.weight = 1.0
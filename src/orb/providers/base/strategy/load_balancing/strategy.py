@@ -1,5 +1,6 @@
 """Load balancing provider strategy implementation."""
 
+import json
 import threading
 import time
 from typing import Any, Optional
@@ -16,6 +17,7 @@ from orb.providers.base.strategy.provider_strategy import (
 
 from .algorithms import LoadBalancingAlgorithm
 from .config import LoadBalancingConfig
+from .selection import LoadBalancingSelector
 from .stats import StrategyStats
 
 
@@ -74,10 +76,13 @@ class LoadBalancingProviderStrategy(ProviderStrategy):
         self._stats: dict[str, StrategyStats] = {}
         for strategy_type in self._strategies:
             weight = weights.get(strategy_type, 1.0) if weights else 1.0
-            self._stats[strategy_type] = StrategyStats(weight=weight)
+            self._stats[strategy_type] = StrategyStats(
+                weight=weight, ewma_alpha=self._config.weight_adjustment_factor
+            )
 
         # Load balancing state
         self._round_robin_index = 0
+        self._selector: LoadBalancingSelector[str] = LoadBalancingSelector()
         self._lock = threading.RLock()
         self._sessions: dict[str, str] = {}  # session_id -> strategy_type
         self._session_timestamps: dict[str, float] = {}
@@ -238,10 +243,11 @@ class LoadBalancingProviderStrategy(ProviderStrategy):
     def _weighted_round_robin_selection(
         self, strategies: dict[str, ProviderStrategy]
     ) -> ProviderStrategy:
-        """Weighted round robin strategy selection."""
-        # Implementation would use weights from stats
-        # For now, fallback to regular round robin
-        return self._round_robin_selection(strategies)
+        """Smooth weighted round robin selection using the strategy weights."""
+        selected = self._selector.weighted_round_robin(
+            {strategy_type: self._stats[strategy_type].weight for strategy_type in strategies}
+        )
+        return strategies[selected]
 
     def _least_connections_selection(
         self, strategies: dict[str, ProviderStrategy]
@@ -283,24 +289,34 @@ class LoadBalancingProviderStrategy(ProviderStrategy):
     def _weighted_random_selection(
         self, strategies: dict[str, ProviderStrategy]
     ) -> ProviderStrategy:
-        """Weighted random strategy selection."""
-        # For now, fallback to regular random
-        return self._random_selection(strategies)
+        """Weighted random selection (alias method) using the strategy weights."""
+        selected = self._selector.weighted_random(
+            {strategy_type: self._stats[strategy_type].weight for strategy_type in strategies}
+        )
+        return strategies[selected]
 
     def _hash_based_selection(
         self, strategies: dict[str, ProviderStrategy], operation: ProviderOperation
     ) -> ProviderStrategy:
-        """Hash-based strategy selection for consistent routing."""
-        # Use operation hash for consistent selection
-        operation_hash = hash(str(operation.operation_type) + str(operation.parameters))
-        strategy_list = list(strategies.values())
-        index = operation_hash % len(strategy_list)
-        return strategy_list[index]
+        """Consistent-hash selection, stable across restarts and membership changes."""
+        selected = self._selector.consistent_hash(sorted(strategies), self._routing_key(operation))
+        return strategies[selected]
 
     def _adaptive_selection(self, strategies: dict[str, ProviderStrategy]) -> ProviderStrategy:
-        """Adaptive strategy selection based on performance metrics."""
-        # For now, use least response time as adaptive metric
-        return self._least_response_time_selection(strategies)
+        """Power-of-two-choices selection on peak-EWMA latency times in-flight requests."""
+        selected = self._selector.power_of_two_choices(
+            {strategy_type: self._stats[strategy_type].load_score for strategy_type in strategies}
+        )
+        return strategies[selected]
+
+    @staticmethod
+    def _routing_key(operation: ProviderOperation) -> str:
+        """Build a stable routing key, preferring an explicit session id."""
+        session_id = getattr(operation, "session_id", None)
+        if session_id is not None:
+            return str(session_id)
+        parameters = json.dumps(operation.parameters, sort_keys=True, default=str)
+        return f"{operation.operation_type}:{parameters}"
 
     def _update_health_status(self, strategy_type: str, success: bool) -> None:
         """Update health status based on operation result."""
@@ -339,6 +355,7 @@ class LoadBalancingProviderStrategy(ProviderStrategy):
                     "failed_requests": stats.failed_requests,
                     "success_rate": stats.success_rate,
                     "average_response_time": stats.average_response_time,
+                    "response_time_percentiles": stats.response_time_percentiles(),
                     "is_healthy": stats.is_healthy,
                     "weight": stats.weight,
                 }
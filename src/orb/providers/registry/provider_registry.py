@@ -1,8 +1,9 @@
 """Provider Registry - Registry pattern for provider strategy factories."""
 
+import copy
 import importlib
 import threading
-from typing import Any, Callable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
 
 from orb.domain.base.exceptions import ConfigurationError
 from orb.domain.base.ports.configuration_port import ConfigurationPort
@@ -10,8 +11,12 @@ from orb.domain.base.ports.provider_registry_port import ProviderRegistryPort
 from orb.domain.base.results import ProviderSelectionResult
 from orb.infrastructure.registry.base_registry import BaseRegistration, BaseRegistry, RegistryMode
 from orb.infrastructure.utilities.common.string_utils import extract_provider_type
+from orb.providers.base.strategy.load_balancing.selection import LoadBalancingSelector
 from orb.providers.registry.types import ProviderRegistration, UnsupportedProviderError
 
+if TYPE_CHECKING:
+    from orb.infrastructure.di.startup_snapshot import StartupSnapshot
+
 
 class ProviderRegistry(BaseRegistry, ProviderRegistryPort):
     """
@@ -28,6 +33,7 @@ class ProviderRegistry(BaseRegistry, ProviderRegistryPort):
         self._health_states: dict[str, dict] = {}
         self._config_port = config_port
         self._fallback_strategy: Optional[Any] = None
+        self._selector = LoadBalancingSelector()
         # Create logger directly since BaseRegistry no longer provides it
         from orb.infrastructure.logging.logger import get_logger
 
@@ -237,7 +243,7 @@ class ProviderRegistry(BaseRegistry, ProviderRegistryPort):
         config_factory: Callable,
         resolver_factory: Optional[Callable] = None,
         validator_factory: Optional[Callable] = None,
-        strategy_class: Optional[type] = None,
+        strategy_class: Optional[Union[type, str]] = None,
         **kwargs: Any,
     ) -> None:
         """Register provider type - implements abstract method."""
@@ -260,7 +266,7 @@ class ProviderRegistry(BaseRegistry, ProviderRegistryPort):
         config_factory: Callable,
         resolver_factory: Optional[Callable] = None,
         validator_factory: Optional[Callable] = None,
-        strategy_class: Optional[type] = None,
+        strategy_class: Optional[Union[type, str]] = None,
     ) -> None:
         """
         Register a provider with its factory functions - backward compatibility method.
@@ -271,6 +277,8 @@ class ProviderRegistry(BaseRegistry, ProviderRegistryPort):
             config_factory: Factory function to create provider configuration
             resolver_factory: Optional factory for template resolver
             validator_factory: Optional factory for template validator
+            strategy_class: Strategy class, or its ``"module:QualName"`` path
+                to defer importing the strategy module
 
         Raises:
             ValueError: If provider_type is already registered
@@ -747,6 +755,10 @@ class ProviderRegistry(BaseRegistry, ProviderRegistryPort):
 
         if selection_policy == "WEIGHTED_ROUND_ROBIN":
             return self._weighted_round_robin_selection(instances)
+        elif selection_policy == "ROUND_ROBIN":
+            return self._round_robin_selection(instances)
+        elif selection_policy == "RANDOM":
+            return self._weighted_random_selection(instances)
         elif selection_policy == "HEALTH_BASED":
             return self._health_based_selection(instances)
         elif selection_policy == "FIRST_AVAILABLE":
@@ -755,38 +767,64 @@ class ProviderRegistry(BaseRegistry, ProviderRegistryPort):
             return min(instances, key=lambda x: x.priority)
 
     def _weighted_round_robin_selection(self, instances: list[Any]) -> Any:
-        """Select instance using priority-first, then weighted selection."""
-        sorted_instances = sorted(instances, key=lambda x: x.priority)
-        highest_priority = sorted_instances[0].priority
-        highest_priority_instances = [
-            instance for instance in sorted_instances if instance.priority == highest_priority
-        ]
-
-        if len(highest_priority_instances) == 1:
-            selected = highest_priority_instances[0]
-            if self._logger:
-                self._logger.debug(
-                    "Selected provider %s (priority %s, weight %s)",
-                    selected.name,
-                    selected.priority,
-                    selected.weight,
-                )
-            return selected
-
-        selected = max(highest_priority_instances, key=lambda x: x.weight)
+        """Smooth weighted round robin across the highest-priority instances."""
+        candidates = self._highest_priority_instances(instances)
+        selected_name = self._selector.weighted_round_robin(
+            {instance.name: instance.weight for instance in candidates}
+        )
+        selected = next(instance for instance in candidates if instance.name == selected_name)
         if self._logger:
             self._logger.debug(
                 "Selected provider %s (priority %s, weight %s) from %s candidates",
                 selected.name,
                 selected.priority,
                 selected.weight,
-                len(highest_priority_instances),
+                len(candidates),
             )
         return selected
 
+    def _round_robin_selection(self, instances: list[Any]) -> Any:
+        """Round robin across the highest-priority instances, ignoring weights."""
+        candidates = self._highest_priority_instances(instances)
+        selected_name = self._selector.weighted_round_robin(
+            dict.fromkeys((instance.name for instance in candidates), 1.0), group="round_robin"
+        )
+        return next(instance for instance in candidates if instance.name == selected_name)
+
+    def _weighted_random_selection(self, instances: list[Any]) -> Any:
+        """Weighted random pick across the highest-priority instances."""
+        candidates = self._highest_priority_instances(instances)
+        selected_name = self._selector.weighted_random(
+            {instance.name: instance.weight for instance in candidates}
+        )
+        return next(instance for instance in candidates if instance.name == selected_name)
+
     def _health_based_selection(self, instances: list[Any]) -> Any:
-        """Select instance based on health status."""
-        return min(instances, key=lambda x: x.priority)
+        """Weighted round robin across healthy instances, falling back to all."""
+        healthy = [instance for instance in instances if self._is_instance_healthy(instance.name)]
+        if not healthy:
+            if self._logger:
+                self._logger.warning(
+                    "No healthy provider among %s, selecting from all instances",
+                    [instance.name for instance in instances],
+                )
+            healthy = instances
+        return self._weighted_round_robin_selection(healthy)
+
+    def _is_instance_healthy(self, provider_name: str) -> bool:
+        """Return the last reported health of a provider (healthy if never reported)."""
+        health = self._health_states.get(provider_name)
+        if not health:
+            return True
+        if "is_healthy" in health:
+            return bool(health["is_healthy"])
+        status = str(health.get("status", "")).lower()
+        return status not in ("unhealthy", "down", "failed", "error")
+
+    @staticmethod
+    def _highest_priority_instances(instances: list[Any]) -> list[Any]:
+        highest_priority = min(instance.priority for instance in instances)
+        return [instance for instance in instances if instance.priority == highest_priority]
 
     def _find_compatible_providers(self, provider_api: str) -> list[Any]:
         """Find provider instances that support the specified API."""
@@ -864,19 +902,48 @@ class ProviderRegistry(BaseRegistry, ProviderRegistryPort):
             else:
                 base[key] = value
 
-    def collect_defaults(self) -> dict:
-        """Collect and merge defaults contributed by all registered provider strategies."""
+    def collect_defaults(self, snapshot: Optional["StartupSnapshot"] = None) -> dict:
+        """
+        Collect and merge defaults contributed by all registered provider strategies.
+
+        Args:
+            snapshot: Startup snapshot holding the merged defaults from an
+                earlier run. On a hit no strategy module is imported.
+
+        Returns:
+            Merged defaults dictionary
+        """
+        registrations = [
+            reg
+            for reg in self._type_registrations.values()
+            if isinstance(reg, ProviderRegistration) and reg.strategy_class_path is not None
+        ]
+        strategies = [reg.strategy_class_path for reg in registrations]
+
+        if snapshot is not None:
+            cached = snapshot.get("provider_defaults")
+            if isinstance(cached, dict) and cached.get("strategies") == strategies:
+                return copy.deepcopy(cached.get("defaults", {}))
+
         merged: dict = {}
-        for reg in self._type_registrations.values():
-            if isinstance(reg, ProviderRegistration) and reg.strategy_class is not None:
-                try:
-                    defaults = reg.strategy_class.get_defaults_config()
-                    if defaults:
-                        self._deep_merge(merged, defaults)
-                except Exception as e:
-                    self._logger.warning(
-                        "Failed to collect defaults from %s: %s", reg.strategy_class, e
-                    )
+        complete = True
+        for reg in registrations:
+            try:
+                defaults = reg.strategy_class.get_defaults_config()  # type: ignore[union-attr]
+                if defaults:
+                    self._deep_merge(merged, defaults)
+            except Exception as e:
+                complete = False
+                self._logger.warning(
+                    "Failed to collect defaults from %s: %s", reg.strategy_class_path, e
+                )
+
+        # Never persist a partial result: a failing strategy must be retried next run
+        if snapshot is not None and complete:
+            snapshot.put(
+                "provider_defaults",
+                {"strategies": strategies, "defaults": copy.deepcopy(merged)},
+            )
         return merged
 
 
@@ -1,7 +1,8 @@
 """Provider registry types - interfaces and registration data classes."""
 
+import importlib
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Union
 
 from orb.infrastructure.registry.base_registry import BaseRegistration
 
@@ -23,7 +24,12 @@ class ProviderFactoryInterface(ABC):
 
 
 class ProviderRegistration(BaseRegistration):
-    """Provider-specific registration with resolver and validator factories."""
+    """Provider-specific registration with resolver and validator factories.
+
+    ``strategy_class`` may be given as a ``"module:QualName"`` path so that
+    registering a provider does not import its strategy module; the class is
+    imported the first time it is accessed.
+    """
 
     def __init__(
         self,
@@ -32,7 +38,7 @@ class ProviderRegistration(BaseRegistration):
         config_factory: Callable,
         resolver_factory: Optional[Callable] = None,
         validator_factory: Optional[Callable] = None,
-        strategy_class: Optional[type] = None,
+        strategy_class: Optional[Union[type, str]] = None,
     ) -> None:
         """Initialize the instance."""
         super().__init__(
@@ -44,4 +50,24 @@ class ProviderRegistration(BaseRegistration):
         )
         self.resolver_factory = resolver_factory
         self.validator_factory = validator_factory
-        self.strategy_class = strategy_class
+        self._strategy_class = strategy_class
+
+    @property
+    def strategy_class(self) -> Optional[type]:
+        """Strategy class, imported on first access when registered by path."""
+        if isinstance(self._strategy_class, str):
+            module_name, _, qualname = self._strategy_class.partition(":")
+            target: Any = importlib.import_module(module_name)
+            for attr in qualname.split("."):
+                target = getattr(target, attr)
+            self._strategy_class = target
+        return self._strategy_class
+
+    @property
+    def strategy_class_path(self) -> Optional[str]:
+        """``"module:QualName"`` of the strategy class, without importing it."""
+        if self._strategy_class is None:
+            return None
+        if isinstance(self._strategy_class, str):
+            return self._strategy_class
+        return f"{self._strategy_class.__module__}:{self._strategy_class.__qualname__}"
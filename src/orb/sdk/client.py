@@ -7,6 +7,7 @@ handler discovery for zero code duplication.
 """
 
 import asyncio
+from collections.abc import AsyncIterator
 from contextlib import suppress
 from typing import Any, Callable, Dict, Optional
 
@@ -423,6 +424,7 @@ class ORBClient:
         {
             "request_machines",
             "get_request_status",
+            "watch_request_status",
             "list_requests",
             "return_machines",
             "cancel_request",
@@ -502,6 +504,42 @@ class ORBClient:
             return scheduler.format_request_status_response(result.requests)
         return {"requests": result.requests}
 
+    async def watch_request_status(
+        self, request_ids: list, timeout: Optional[float] = None
+    ) -> AsyncIterator[list[dict]]:
+        """Yield status changes of requests until all are terminal.
+
+        Subscribes to the shared RequestStatusHub, so any number of watchers
+        of the same request cost one status poll. The first batch holds each
+        request's full status, later batches only the changed fields.
+
+        Usage:
+            async for updates in sdk.watch_request_status([request_id], timeout=600):
+                for update in updates:
+                    print(update["request_id"], update["changes"])
+        """
+        if not self._initialized:
+            raise SDKError("SDK not initialized. Use as async context manager.")
+        assert self._container is not None
+
+        from orb.application.services.request_status_hub import RequestStatusHub
+
+        hub = self._container.get(RequestStatusHub)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        async with hub.subscribe(list(request_ids)) as subscription:
+            while not subscription.done:
+                remaining: Optional[float] = None
+                if timeout is not None:
+                    remaining = timeout - (loop.time() - started)
+                    if remaining <= 0:
+                        raise RequestTimeoutError(
+                            request_id=", ".join(subscription.request_ids), timeout=timeout
+                        )
+                updates = await subscription.next(remaining)
+                if updates:
+                    yield [update.to_dict() for update in updates]
+
     async def list_requests(self, **kwargs) -> dict:
         """List requests via ListRequestsOrchestrator."""
         if not self._initialized:
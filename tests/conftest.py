@@ -80,7 +80,7 @@ from tests.utilities.reset_singletons import reset_all_singletons
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
+def setup_test_environment(tmp_path_factory):
     """Set up test environment variables."""
     # Set up PYTHONPATH first
     project_root = Path(__file__).parent.parent
@@ -104,6 +104,8 @@ def setup_test_environment():
             "PYTHONPATH": f"{src_path}:{os.environ.get('PYTHONPATH', '')}",
             "PYTHONWARNINGS": "ignore::DeprecationWarning",
             "MOTO_CALL_RESET_API": "false",
+            # Startup snapshots and other runtime caches stay out of the source tree
+            "ORB_CACHE_DIR": str(tmp_path_factory.mktemp("orb-cache")),
         }
     )
 
@@ -14,6 +14,7 @@ from fastapi.testclient import TestClient
 
 import orb.api.dependencies as deps
 from orb.api.server import create_fastapi_app
+from orb.application.services.request_status_hub import RequestStatusHub
 from orb.config.schemas.server_schema import AuthConfig, ServerConfig
 
 # ---------------------------------------------------------------------------
@@ -65,11 +66,16 @@ def machines_orchestrator(app):
 
 @pytest.fixture
 def status_orchestrator(app):
-    """Install a mock request-status orchestrator via dependency_overrides."""
+    """Install a mock request-status orchestrator (and a status hub using it)."""
     orchestrator = AsyncMock()
+    scheduler = MagicMock()
+    scheduler.format_request_status_response.side_effect = lambda reqs: {"requests": reqs}
+    hub = RequestStatusHub(orchestrator, scheduler, MagicMock(), poll_interval_seconds=0.5)
     app.dependency_overrides[deps.get_request_status_orchestrator] = lambda: orchestrator
+    app.dependency_overrides[deps.get_request_status_hub] = lambda: hub
     yield orchestrator
     app.dependency_overrides.pop(deps.get_request_status_orchestrator, None)
+    app.dependency_overrides.pop(deps.get_request_status_hub, None)
 
 
 # ---------------------------------------------------------------------------
@@ -247,8 +253,8 @@ class TestRequestStatusStream:
         raw = response.content.decode()
         assert "done" in raw or "complete" in raw
 
-    def test_stream_data_contains_requests_field(self, client, status_orchestrator):
-        """Each SSE data event must contain a 'requests' list."""
+    def test_stream_data_contains_status_changes(self, client, status_orchestrator):
+        """The first SSE data event carries the request's full status."""
         request_id = "req-00000000-0000-0000-0000-000000000023"
         status_orchestrator.execute.return_value = _make_status_result(request_id, "complete")
 
@@ -256,7 +262,8 @@ class TestRequestStatusStream:
 
         events = self._collect_sse_events(response.content)
         assert len(events) >= 1
-        assert "requests" in events[0]
+        assert events[0]["full"] is True
+        assert events[0]["changes"]["status"] == "complete"
 
     def test_stream_no_cache_header(self, client, status_orchestrator):
         """Stream response must include Cache-Control: no-cache."""
@@ -0,0 +1,74 @@
+"""Benchmark of the shared EC2 instance type catalog against a moto stand-in.
+
+Every HostFactory call runs in a fresh ``orb`` process. Without the on-disk
+catalog each of them pages through ``DescribeInstanceTypes`` before it can
+report vCPU and memory; with it they read one file.
+"""
+
+import time
+
+import boto3
+import pytest
+from moto import mock_aws
+
+import orb.providers.aws.utilities.ec2.instance_type_catalog as catalog_mod
+from orb.providers.aws.utilities.ec2 import instances
+
+REGION = "us-east-1"
+INVOCATIONS = 3
+
+
+@pytest.fixture
+def ec2_client(monkeypatch, tmp_path):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(catalog_mod, "_catalog", catalog_mod.InstanceTypeCatalog(str(tmp_path)))
+    with mock_aws():
+        client = boto3.client("ec2", region_name=REGION)
+        client.api_calls = 0
+
+        def _count(**_):
+            client.api_calls += 1
+
+        client.meta.events.register("before-call.ec2.DescribeInstanceTypes", _count)
+        yield client
+
+
+def _new_process(monkeypatch) -> None:
+    """Drop the in-memory state a fresh ``orb`` process would not have."""
+    monkeypatch.setattr(instances, "_instance_spec_cache", None)
+    monkeypatch.setattr(instances, "_catalog_checked", False)
+    monkeypatch.setattr(catalog_mod._catalog, "_memo", {})
+
+
+def _invoke(monkeypatch, ec2_client) -> float:
+    _new_process(monkeypatch)
+    start = time.perf_counter()
+    result = instances.derive_cpu_ram_from_instance_type("m5.large", ec2_client=ec2_client)
+    elapsed = time.perf_counter() - start
+    assert result == ("2", "8192")
+    return elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_catalog_removes_per_invocation_api_calls(monkeypatch, ec2_client):
+    # Baseline: nothing is persisted between invocations, as before the catalog
+    with monkeypatch.context() as m:
+        m.setattr(catalog_mod._catalog, "store", lambda region, specs: None)
+        uncached = [_invoke(monkeypatch, ec2_client) for _ in range(INVOCATIONS)]
+    calls_per_invocation = ec2_client.api_calls / INVOCATIONS
+
+    summary = instances.warm_instance_type_catalog(ec2_client, REGION)
+    ec2_client.api_calls = 0
+    cached = [_invoke(monkeypatch, ec2_client) for _ in range(INVOCATIONS)]
+
+    assert summary["refreshed"] and summary["instance_types"] > 0
+    assert calls_per_invocation >= 1
+    assert ec2_client.api_calls == 0
+    assert sum(cached) < sum(uncached)
+    print(
+        f"PASS: {calls_per_invocation:.0f} DescribeInstanceTypes calls and "
+        f"{sum(uncached) / INVOCATIONS * 1000:.1f}ms per invocation without the catalog, "
+        f"0 calls and {sum(cached) / INVOCATIONS * 1000:.2f}ms with it"
+    )
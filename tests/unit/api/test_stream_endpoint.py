@@ -7,10 +7,10 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from orb.api.dependencies import get_request_status_orchestrator, get_response_formatting_service
+from orb.api.dependencies import get_request_status_hub
 from orb.api.routers.requests import router as requests_router
-from orb.application.dto.interface_response import InterfaceResponse
 from orb.application.services.orchestration.dtos import GetRequestStatusOutput
+from orb.application.services.request_status_hub import RequestStatusHub
 
 
 @pytest.fixture()
@@ -31,13 +31,11 @@ def _make_orchestrator_returning(*statuses):
     return orchestrator
 
 
-def _make_formatter():
-    """Return a mock formatter that passes through the requests list."""
-    formatter = MagicMock()
-    formatter.format_request_status.side_effect = lambda reqs: InterfaceResponse(
-        data={"requests": reqs}
-    )
-    return formatter
+def _make_scheduler():
+    """Return a mock scheduler that passes through the requests list."""
+    scheduler = MagicMock()
+    scheduler.format_request_status_response.side_effect = lambda reqs: {"requests": reqs}
+    return scheduler
 
 
 def _collect_sse_lines(response) -> list[dict]:
@@ -62,8 +60,10 @@ class TestStreamEndpoint:
     """Tests for GET /{request_id}/stream SSE endpoint."""
 
     def _make_client(self, app, orchestrator):
-        app.dependency_overrides[get_request_status_orchestrator] = lambda: orchestrator
-        app.dependency_overrides[get_response_formatting_service] = _make_formatter
+        hub = RequestStatusHub(
+            orchestrator, _make_scheduler(), MagicMock(), poll_interval_seconds=0.2
+        )
+        app.dependency_overrides[get_request_status_hub] = lambda: hub
         return TestClient(app, raise_server_exceptions=False)
 
     def test_happy_path_sse_data_lines_format(self, requests_app):
@@ -95,7 +95,7 @@ class TestStreamEndpoint:
         with client.stream("GET", "/requests/req-stream-1/stream?interval=0.5&timeout=30") as resp:
             events = _collect_sse_lines(resp)
 
-        statuses = [e["requests"][0]["status"] for e in events if e.get("requests")]
+        statuses = [e["changes"]["status"] for e in events if "status" in e.get("changes", {})]
         assert "completed" in statuses
         # Orchestrator should not be called more times than needed
         assert orchestrator.execute.await_count <= 3
@@ -108,7 +108,7 @@ class TestStreamEndpoint:
         with client.stream("GET", "/requests/req-stream-1/stream?interval=0.5&timeout=30") as resp:
             events = _collect_sse_lines(resp)
 
-        statuses = [e["requests"][0]["status"] for e in events if e.get("requests")]
+        statuses = [e["changes"]["status"] for e in events if "status" in e.get("changes", {})]
         assert "failed" in statuses
 
     def test_stream_ends_on_cancelled_status(self, requests_app):
@@ -119,7 +119,7 @@ class TestStreamEndpoint:
         with client.stream("GET", "/requests/req-stream-1/stream?interval=0.5&timeout=30") as resp:
             events = _collect_sse_lines(resp)
 
-        statuses = [e["requests"][0]["status"] for e in events if e.get("requests")]
+        statuses = [e["changes"]["status"] for e in events if "status" in e.get("changes", {})]
         assert "cancelled" in statuses
 
     def test_stream_timeout_expiry(self, requests_app):
@@ -157,3 +157,36 @@ class TestStreamEndpoint:
         assert data_lines[0] == "data: {}"
         # Orchestrator called exactly once before the error
         orchestrator.execute.assert_awaited_once()
+
+    def test_unchanged_polls_push_no_events(self, requests_app):
+        """Only status changes are pushed; repeated identical polls stay silent."""
+        orchestrator = _make_orchestrator_returning("running", "running", "running", "completed")
+        client = self._make_client(requests_app, orchestrator)
+
+        with client.stream("GET", "/requests/req-stream-1/stream?interval=0.5&timeout=30") as resp:
+            events = _collect_sse_lines(resp)
+
+        assert [e["full"] for e in events] == [True, False]
+        assert events[1]["changes"] == {"status": "completed"}
+        assert events[1]["terminal"] is True
+
+    def test_multi_request_stream(self, requests_app):
+        """Several requests share one stream which ends when all are terminal."""
+        orchestrator = MagicMock()
+
+        async def execute(input):
+            request_id = input.request_ids[0]
+            status = "completed" if request_id == "req-a" else "failed"
+            return GetRequestStatusOutput(requests=[{"request_id": request_id, "status": status}])
+
+        orchestrator.execute = AsyncMock(side_effect=execute)
+        client = self._make_client(requests_app, orchestrator)
+
+        with client.stream("GET", "/requests/stream?request_ids=req-a,req-b&timeout=30") as resp:
+            assert resp.status_code == 200
+            events = _collect_sse_lines(resp)
+
+        assert {e["request_id"]: e["changes"]["status"] for e in events} == {
+            "req-a": "completed",
+            "req-b": "failed",
+        }
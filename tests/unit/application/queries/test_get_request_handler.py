@@ -6,9 +6,12 @@ from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
-from orb.application.dto.queries import GetRequestQuery
+from orb.application.dto.queries import GetRequestBatchQuery, GetRequestQuery
 from orb.application.dto.responses import RequestDTO
-from orb.application.queries.request_query_handlers import GetRequestHandler
+from orb.application.queries.request_query_handlers import (
+    GetRequestBatchHandler,
+    GetRequestHandler,
+)
 from orb.domain.base.exceptions import EntityNotFoundError
 from orb.domain.base.ports.container_port import ContainerPort
 from orb.domain.base.ports.error_handling_port import ErrorHandlingPort
@@ -175,3 +178,98 @@ async def test_get_request_raises_entity_not_found_when_missing():
     query = GetRequestQuery(request_id=_ID_MISSING)
     with pytest.raises(EntityNotFoundError):
         await handler.execute_query(query)
+
+
+@pytest.mark.asyncio
+async def test_get_request_skips_provider_sync_when_engine_reports_fresh():
+    """A request the background engine refreshed recently is served from storage."""
+    request = _make_request(_ID_SUCCESS)
+    handler, _, mock_cache_service = _make_handler(request)
+    handler._sync_engine = Mock()
+    handler._sync_engine.is_fresh = Mock(return_value=True)
+
+    result = await handler.execute_query(GetRequestQuery(request_id=_ID_SUCCESS))
+
+    assert result.request_id == _ID_SUCCESS
+    handler._machine_sync_service.fetch_provider_machines.assert_not_called()
+    mock_cache_service.cache_request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_request_read_through_is_recorded_with_engine():
+    """A stale request is synced inline and the engine is told so it does not repeat it."""
+    request = _make_request(_ID_SUCCESS)
+    handler, _, _ = _make_handler(request)
+    handler._sync_engine = Mock()
+    handler._sync_engine.is_fresh = Mock(return_value=False)
+
+    await handler.execute_query(GetRequestQuery(request_id=_ID_SUCCESS))
+
+    handler._machine_sync_service.fetch_provider_machines.assert_awaited_once()
+    handler._sync_engine.record_sync.assert_called_once_with(_ID_SUCCESS, changed=False)
+
+
+# ---------------------------------------------------------------------------
+# GetRequestBatchHandler
+# ---------------------------------------------------------------------------
+
+
+def _make_batch_handler(requests: list[Request]) -> GetRequestBatchHandler:
+    """Build a GetRequestBatchHandler whose storage holds ``requests``."""
+    uow = MagicMock()
+    uow.__enter__ = Mock(return_value=uow)
+    uow.__exit__ = Mock(return_value=False)
+    uow.requests.find_by_ids = Mock(
+        side_effect=lambda ids: [r for r in requests if str(r.request_id.value) in ids]
+    )
+    uow.machines.find_by_request_id = Mock(return_value=[])
+    uow_factory = Mock()
+    uow_factory.create_unit_of_work = Mock(return_value=uow)
+
+    machine_sync_service = Mock()
+    machine_sync_service.fetch_provider_machines_batch = AsyncMock(
+        side_effect=lambda items: {str(r.request_id): ([], {}) for r, _ in items}
+    )
+    machine_sync_service.sync_machines_with_provider = AsyncMock(return_value=([], []))
+
+    handler = GetRequestBatchHandler(
+        uow_factory=uow_factory,
+        logger=Mock(),
+        error_handler=Mock(spec=ErrorHandlingPort),
+        container=_FakeContainer(),
+        provider_registry_service=Mock(),
+        machine_sync_service=machine_sync_service,
+    )
+    handler._status_service = Mock()
+    handler._status_service.determine_status_from_machines = Mock(return_value=(None, None))
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_batch_syncs_all_requests_in_one_provider_fetch():
+    requests = [_make_request(_ID_FALLBACK), _make_request(_ID_SUCCESS)]
+    handler = _make_batch_handler(requests)
+
+    results = await handler.execute_query(
+        GetRequestBatchQuery(request_ids=[_ID_FALLBACK, _ID_SUCCESS, _ID_MISSING])
+    )
+
+    assert sorted(results) == sorted([_ID_FALLBACK, _ID_SUCCESS])
+    assert all(isinstance(dto, RequestDTO) for dto in results.values())
+    handler._machine_sync_service.fetch_provider_machines_batch.assert_awaited_once()
+    (items,) = handler._machine_sync_service.fetch_provider_machines_batch.await_args.args
+    assert len(items) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_skips_requests_the_engine_reports_fresh():
+    requests = [_make_request(_ID_FALLBACK), _make_request(_ID_SUCCESS)]
+    handler = _make_batch_handler(requests)
+    handler._sync_engine = Mock()
+    handler._sync_engine.is_fresh = Mock(side_effect=lambda request_id: request_id == _ID_SUCCESS)
+
+    await handler.execute_query(GetRequestBatchQuery(request_ids=[_ID_FALLBACK, _ID_SUCCESS]))
+
+    (items,) = handler._machine_sync_service.fetch_provider_machines_batch.await_args.args
+    assert [str(r.request_id.value) for r, _ in items] == [_ID_FALLBACK]
+    handler._sync_engine.record_sync.assert_called_once_with(_ID_FALLBACK, changed=False)
@@ -0,0 +1,217 @@
+"""Tests for the grouped live refresh of running machines when listing machines."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from orb.application.dto.queries import ListMachinesQuery
+from orb.application.queries.machine_query_handlers import ListMachinesHandler
+from orb.application.services.machine_sync_service import MachineSyncService
+from orb.domain.base.value_objects import InstanceType
+from orb.domain.machine.aggregate import Machine
+from orb.domain.machine.machine_identifiers import MachineId
+from orb.domain.machine.value_objects import MachineStatus
+from orb.domain.request.aggregate import Request
+from orb.domain.request.value_objects import RequestId, RequestStatus, RequestType
+from orb.domain.services.generic_filter_service import GenericFilterService
+from orb.infrastructure.storage.components.document_cache import reset_document_cache
+from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
+from orb.infrastructure.storage.repositories.machine_repository import MachineRepositoryImpl
+from orb.infrastructure.storage.repositories.request_repository import RequestRepositoryImpl
+
+BASE_TIME = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+REQ_A = "req-00000000-0000-0000-0000-00000000000a"
+REQ_B = "req-00000000-0000-0000-0000-00000000000b"
+
+
+def _machine(machine_id: str, request_id: str, minute: int, **overrides) -> Machine:
+    fields = {
+        "machine_id": MachineId(value=machine_id),
+        "name": machine_id,
+        "status": MachineStatus.RUNNING,
+        "instance_type": InstanceType(value="t3.micro"),
+        "request_id": request_id,
+        "template_id": "tpl-1",
+        "provider_name": "aws-default",
+        "provider_api": "EC2Fleet",
+        "image_id": "ami-123",
+        "created_at": BASE_TIME + timedelta(minutes=minute),
+    }
+    fields.update(overrides)
+    return Machine(**fields)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_document_cache():
+    reset_document_cache()
+    yield
+    reset_document_cache()
+
+
+@pytest.fixture
+def uow(tmp_path):
+    requests = RequestRepositoryImpl(
+        JSONStorageStrategy(file_path=str(tmp_path / "requests.json"), entity_type="requests")
+    )
+    machines = MachineRepositoryImpl(
+        JSONStorageStrategy(file_path=str(tmp_path / "machines.json"), entity_type="machines")
+    )
+    for request_id in (REQ_A, REQ_B):
+        requests.save(
+            Request(
+                request_id=RequestId(value=request_id),
+                request_type=RequestType.ACQUIRE,
+                provider_type="aws",
+                provider_name="aws-default",
+                provider_api="EC2Fleet",
+                template_id="tpl-1",
+                requested_count=2,
+                status=RequestStatus.COMPLETED,
+                resource_ids=[f"fleet-{request_id[-1]}"],
+                created_at=BASE_TIME,
+            )
+        )
+    machines.save_batch(
+        [
+            _machine("i-a1", REQ_A, 1),
+            _machine("i-b1", REQ_B, 2),
+            _machine("i-a2", REQ_A, 3),
+            _machine("i-x1", REQ_B, 4, status=MachineStatus.STOPPED),
+        ]
+    )
+
+    unit_of_work = MagicMock()
+    unit_of_work.requests = MagicMock(wraps=requests)
+    unit_of_work.machines = MagicMock(wraps=machines)
+    unit_of_work.__enter__ = MagicMock(return_value=unit_of_work)
+    unit_of_work.__exit__ = MagicMock(return_value=False)
+    return unit_of_work
+
+
+@pytest.fixture
+def sync_service():
+    service = MachineSyncService(
+        command_bus=MagicMock(),
+        uow_factory=MagicMock(),
+        config_port=MagicMock(),
+        logger=MagicMock(),
+        provider_registry_service=MagicMock(),
+    )
+    service.fetch_provider_machines_batch = AsyncMock()
+    return service
+
+
+def _handler(uow, sync_service, sync_engine=None) -> ListMachinesHandler:
+    factory = MagicMock()
+    factory.create_unit_of_work.return_value = uow
+    container = MagicMock()
+    if sync_engine is None:
+        container.get.side_effect = LookupError("not registered")
+    else:
+        container.get.return_value = sync_engine
+    return ListMachinesHandler(
+        uow_factory=factory,
+        logger=MagicMock(),
+        error_handler=MagicMock(),
+        container=container,
+        command_bus=MagicMock(),
+        generic_filter_service=GenericFilterService(),
+        machine_sync_service=sync_service,
+    )
+
+
+def _provider_results(stopped: set[str]):
+    async def fetch(items, max_concurrency=None):
+        return {
+            str(request.request_id): (
+                [
+                    m.model_copy(
+                        update={
+                            "status": MachineStatus.STOPPED
+                            if str(m.machine_id.value) in stopped
+                            else m.status
+                        }
+                    )
+                    for m in machines
+                ]
+                + [_machine("i-new", str(request.request_id), 9)],
+                {},
+            )
+            for request, machines in items
+        }
+
+    return fetch
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestListMachinesLiveRefresh:
+    async def test_running_machines_refresh_in_one_grouped_call(self, uow, sync_service):
+        sync_service.fetch_provider_machines_batch.side_effect = _provider_results({"i-b1"})
+
+        dtos = await _handler(uow, sync_service).execute_query(ListMachinesQuery())
+
+        sync_service.fetch_provider_machines_batch.assert_awaited_once()
+        items = sync_service.fetch_provider_machines_batch.await_args.args[0]
+        assert {
+            str(request.request_id): [m.machine_id.value for m in machines]
+            for request, machines in items
+        } == {REQ_A: ["i-a1", "i-a2"], REQ_B: ["i-b1"]}
+        assert sync_service.fetch_provider_machines_batch.await_args.kwargs == {
+            "max_concurrency": 8
+        }
+        assert [(dto.machine_id, dto.status) for dto in dtos] == [
+            ("i-a1", "running"),
+            ("i-b1", "stopped"),
+            ("i-a2", "running"),
+            ("i-x1", "stopped"),
+        ]
+
+    async def test_changes_are_saved_in_one_batch_without_discovered_instances(
+        self, uow, sync_service
+    ):
+        sync_service.fetch_provider_machines_batch.side_effect = _provider_results({"i-b1"})
+
+        await _handler(uow, sync_service).execute_query(ListMachinesQuery())
+
+        uow.machines.save_batch.assert_called_once()
+        saved = uow.machines.save_batch.call_args.args[0]
+        assert [m.machine_id.value for m in saved] == ["i-b1"]
+        assert uow.machines.get_by_id("i-new") is None
+        assert uow.requests.get_by_id(REQ_A).last_status_check is not None
+
+    async def test_recently_checked_requests_are_skipped(self, uow, sync_service):
+        checked = uow.requests.get_by_id(REQ_A).record_status_check(now=datetime.now(timezone.utc))
+        uow.requests.save(checked)
+        sync_service.fetch_provider_machines_batch.side_effect = _provider_results(set())
+
+        await _handler(uow, sync_service).execute_query(ListMachinesQuery())
+
+        items = sync_service.fetch_provider_machines_batch.await_args.args[0]
+        assert [str(request.request_id) for request, _ in items] == [REQ_B]
+
+    async def test_sync_engine_supplies_freshness_and_concurrency(self, uow, sync_service):
+        engine = MagicMock(max_staleness_seconds=30.0, max_concurrency=3)
+        engine.is_fresh.side_effect = lambda request_id: request_id == REQ_B
+        sync_service.fetch_provider_machines_batch.side_effect = _provider_results(set())
+
+        await _handler(uow, sync_service, engine).execute_query(ListMachinesQuery())
+
+        call = sync_service.fetch_provider_machines_batch.await_args
+        assert [str(request.request_id) for request, _ in call.args[0]] == [REQ_A]
+        assert call.kwargs == {"max_concurrency": 3}
+
+    async def test_failed_fetch_keeps_stored_state(self, uow, sync_service):
+        async def fetch(items, max_concurrency=None):
+            return {str(request.request_id): (machines, {}) for request, machines in items}
+
+        sync_service.fetch_provider_machines_batch.side_effect = fetch
+
+        dtos = await _handler(uow, sync_service).execute_query(ListMachinesQuery())
+
+        assert [dto.status for dto in dtos] == ["running", "running", "running", "stopped"]
+        uow.machines.save_batch.assert_not_called()
+        assert uow.requests.get_by_id(REQ_A).last_status_check is None
@@ -8,6 +8,7 @@ import pytest
 
 from orb.application.dto.queries import ListMachinesQuery
 from orb.application.queries.machine_query_handlers import ListMachinesHandler
+from orb.domain.base.query_spec import QueryResult
 from orb.domain.base.value_objects import InstanceType
 from orb.domain.machine.aggregate import Machine
 from orb.domain.machine.machine_identifiers import MachineId
@@ -39,15 +40,17 @@ async def test_list_machines_sync_preserves_unique_ids():
     m3 = _make_machine("i-ccc")
 
     mock_uow = MagicMock()
-    mock_uow.machines.find_active_machines.return_value = [m1, m2, m3]
-    mock_uow.requests.get_by_id.return_value = MagicMock(
+    mock_uow.machines.query.return_value = QueryResult(items=[m1, m2, m3], total_count=3)
+    request = MagicMock(
         request_id="req-001",
         resource_ids=["r-001"],
         provider_api="RunInstances",
         provider_name="aws_test",
         provider_type="aws",
         template_id="tmpl-001",
+        last_status_check=None,
     )
+    mock_uow.requests.find_by_ids.return_value = [request]
 
     mock_uow_factory = MagicMock()
     mock_uow_factory.create_unit_of_work.return_value.__enter__ = MagicMock(return_value=mock_uow)
@@ -55,14 +58,17 @@ async def test_list_machines_sync_preserves_unique_ids():
 
     # Sync service returns all 3 machines (simulating AWS returning full reservation)
     mock_sync = AsyncMock()
-    mock_sync.fetch_provider_machines.return_value = ([m1, m2, m3], {})
-    mock_sync.sync_machines_with_provider.return_value = ([m1, m2, m3], {})
+    mock_sync.fetch_provider_machines_batch.return_value = {"req-001": ([m1, m2, m3], {})}
+    mock_sync.merge_provider_machines = MagicMock(return_value=([m1, m2, m3], []))
+
+    container = MagicMock()
+    container.get.side_effect = LookupError("not registered")
 
     handler = ListMachinesHandler(
         logger=MagicMock(),
         error_handler=MagicMock(),
         uow_factory=mock_uow_factory,
-        container=MagicMock(),
+        container=container,
         command_bus=MagicMock(),
         generic_filter_service=MagicMock(),
         machine_sync_service=mock_sync,
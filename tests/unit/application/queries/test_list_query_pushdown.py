@@ -0,0 +1,154 @@
+"""Tests for list handlers filtering in storage before paginating."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from orb.application.dto.queries import ListMachinesQuery
+from orb.application.queries.machine_query_handlers import ListMachinesHandler
+from orb.application.queries.request_query_handlers import ListRequestsHandler
+from orb.application.request.queries import ListRequestsQuery
+from orb.domain.base.value_objects import InstanceType
+from orb.domain.machine.aggregate import Machine
+from orb.domain.machine.machine_identifiers import MachineId
+from orb.domain.machine.value_objects import MachineStatus
+from orb.domain.request.aggregate import Request
+from orb.domain.request.value_objects import RequestId, RequestStatus, RequestType
+from orb.domain.services.generic_filter_service import GenericFilterService
+from orb.infrastructure.storage.components.document_cache import reset_document_cache
+from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
+from orb.infrastructure.storage.repositories.machine_repository import MachineRepositoryImpl
+from orb.infrastructure.storage.repositories.request_repository import RequestRepositoryImpl
+
+BASE_TIME = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_document_cache():
+    reset_document_cache()
+    yield
+    reset_document_cache()
+
+
+@pytest.fixture
+def uow(tmp_path):
+    requests = RequestRepositoryImpl(
+        JSONStorageStrategy(file_path=str(tmp_path / "requests.json"), entity_type="requests")
+    )
+    machines = MachineRepositoryImpl(
+        JSONStorageStrategy(file_path=str(tmp_path / "machines.json"), entity_type="machines")
+    )
+    for n in range(10):
+        machine_ids = [f"i-{n}a", f"i-{n}b"]
+        requests.save(
+            Request(
+                request_id=RequestId(value=f"req-00000000-0000-0000-0000-00000000000{n}"),
+                request_type=RequestType.ACQUIRE,
+                provider_type="aws",
+                provider_api="EC2Fleet" if n % 2 else "RunInstances",
+                template_id=f"tpl-{n % 3}",
+                requested_count=2,
+                status=RequestStatus.COMPLETED,
+                machine_ids=machine_ids,
+                created_at=BASE_TIME + timedelta(minutes=n),
+            )
+        )
+        machines.save_batch(
+            [
+                Machine(
+                    machine_id=MachineId(value=machine_id),
+                    name=machine_id,
+                    status=MachineStatus.STOPPED if n < 5 else MachineStatus.TERMINATED,
+                    instance_type=InstanceType(value="t3.large" if n % 2 else "t3.micro"),
+                    request_id=f"req-00000000-0000-0000-0000-00000000000{n}",
+                    template_id=f"tpl-{n % 3}",
+                    provider_name="aws-default",
+                    image_id="ami-123",
+                    created_at=BASE_TIME + timedelta(minutes=n),
+                )
+                for machine_id in machine_ids
+            ]
+        )
+
+    unit_of_work = MagicMock()
+    unit_of_work.requests = requests
+    unit_of_work.machines = MagicMock(wraps=machines)
+    unit_of_work.__enter__ = MagicMock(return_value=unit_of_work)
+    unit_of_work.__exit__ = MagicMock(return_value=False)
+    return unit_of_work
+
+
+def _factory(uow) -> MagicMock:
+    factory = MagicMock()
+    factory.create_unit_of_work.return_value = uow
+    return factory
+
+
+async def _list_requests(uow, **kwargs):
+    handler = ListRequestsHandler(
+        uow_factory=_factory(uow),
+        logger=MagicMock(),
+        error_handler=MagicMock(),
+        generic_filter_service=GenericFilterService(),
+    )
+    return await handler.execute_query(ListRequestsQuery(**kwargs))
+
+
+async def _list_machines(uow, **kwargs):
+    handler = ListMachinesHandler(
+        uow_factory=_factory(uow),
+        logger=MagicMock(),
+        error_handler=MagicMock(),
+        container=MagicMock(),
+        command_bus=MagicMock(),
+        generic_filter_service=GenericFilterService(),
+        machine_sync_service=AsyncMock(),
+    )
+    return await handler.execute_query(ListMachinesQuery(**kwargs))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestListRequestsPushdown:
+    async def test_filter_expressions_apply_before_paginating(self, uow):
+        dtos = await _list_requests(
+            uow, filter_expressions=["provider_api=ec2fleet"], limit=2, offset=1
+        )
+
+        assert [dto.request_id[-1] for dto in dtos] == ["3", "5"]
+
+    async def test_machines_for_the_page_are_loaded_in_one_batch(self, uow):
+        dtos = await _list_requests(uow, template_id="tpl-0", limit=3)
+
+        assert [[ref.machine_id for ref in dto.machine_references] for dto in dtos] == [
+            ["i-0a", "i-0b"],
+            ["i-3a", "i-3b"],
+            ["i-6a", "i-6b"],
+        ]
+        uow.machines.find_by_ids.assert_called_once()
+
+    async def test_filters_on_derived_fields_still_page_correctly(self, uow):
+        dtos = await _list_requests(
+            uow, filter_expressions=["machine_references~i-4"], limit=5, offset=0
+        )
+
+        assert [dto.request_id[-1] for dto in dtos] == ["4"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestListMachinesPushdown:
+    async def test_filter_expressions_apply_before_paginating(self, uow):
+        dtos = await _list_machines(
+            uow, status="terminated", filter_expressions=["instance_type=t3.large"], limit=3
+        )
+
+        assert [dto.machine_id for dto in dtos] == ["i-5a", "i-5b", "i-7a"]
+
+    async def test_filters_on_derived_fields_still_page_correctly(self, uow):
+        dtos = await _list_machines(uow, filter_expressions=["result=fail"], limit=2, offset=1)
+
+        assert [dto.machine_id for dto in dtos] == ["i-5b", "i-6a"]
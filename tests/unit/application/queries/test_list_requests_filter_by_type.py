@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from orb.application.request.queries import ListRequestsQuery
+from orb.domain.base.query_spec import QueryResult
 from orb.domain.request.request_types import RequestType
 
 # ---------------------------------------------------------------------------
@@ -73,8 +74,16 @@ def _run_handler_with_requests(all_requests, query):
     mock_filter_service = MagicMock()
     mock_filter_service.apply_filters.side_effect = lambda items, _: items
 
+    def run_query(spec):
+        matching = [
+            r
+            for r in all_requests
+            if all(getattr(r, field).value == value for field, value in spec.criteria.items())
+        ]
+        return QueryResult(items=matching, total_count=len(matching))
+
     mock_uow = MagicMock()
-    mock_uow.requests.find_all.return_value = all_requests
+    mock_uow.requests.query.side_effect = run_query
     mock_uow.machines.find_by_ids.return_value = []
     mock_uow.__enter__ = lambda s: s
     mock_uow.__exit__ = MagicMock(return_value=False)
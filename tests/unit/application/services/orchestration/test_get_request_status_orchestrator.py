@@ -6,7 +6,11 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from orb.application.dto.queries import GetRequestQuery, ListActiveRequestsQuery
+from orb.application.dto.queries import (
+    GetRequestBatchQuery,
+    GetRequestQuery,
+    ListActiveRequestsQuery,
+)
 from orb.application.services.orchestration.dtos import (
     GetRequestStatusInput,
     GetRequestStatusOutput,
@@ -102,15 +106,31 @@ class TestGetRequestStatusOrchestrator:
         assert query.verbose is False
 
     @pytest.mark.asyncio
-    async def test_execute_multiple_ids_queries_each(self, orchestrator, mock_query_bus):
+    async def test_execute_multiple_ids_dispatches_one_batch_query(
+        self, orchestrator, mock_query_bus
+    ):
         r = MagicMock()
         r.model_dump = MagicMock(return_value={})
-        mock_query_bus.execute.return_value = r
+        mock_query_bus.execute.return_value = {"req-1": r, "req-2": r, "req-3": r}
         input = GetRequestStatusInput(request_ids=["req-1", "req-2", "req-3"])
         result = await orchestrator.execute(input)
-        assert mock_query_bus.execute.call_count == 3
+        mock_query_bus.execute.assert_called_once()
+        query = mock_query_bus.execute.call_args[0][0]
+        assert isinstance(query, GetRequestBatchQuery)
+        assert query.request_ids == ["req-1", "req-2", "req-3"]
         assert len(result.requests) == 3
 
+    @pytest.mark.asyncio
+    async def test_execute_batch_reports_missing_ids_in_order(self, orchestrator, mock_query_bus):
+        ok = MagicMock(spec=["model_dump"])
+        ok.model_dump.return_value = {"request_id": "req-2", "status": "running"}
+        mock_query_bus.execute.return_value = {"req-2": ok}
+        input = GetRequestStatusInput(request_ids=["req-1", "req-2"])
+        result = await orchestrator.execute(input)
+        assert result.requests[0]["request_id"] == "req-1"
+        assert "not found" in result.requests[0]["error"]
+        assert result.requests[1] == {"request_id": "req-2", "status": "running"}
+
     @pytest.mark.asyncio
     async def test_execute_query_error_returns_error_dict(self, orchestrator, mock_query_bus):
         mock_query_bus.execute.side_effect = Exception("not found")
@@ -208,8 +228,20 @@ class TestGetRequestStatusOrchestrator:
     ):
         ok = MagicMock(spec=["model_dump"])
         ok.model_dump = MagicMock(return_value={"request_id": "req-ok", "status": "running"})
-        mock_query_bus.execute.side_effect = [ok, Exception("fail")]
+        mock_query_bus.execute.return_value = {"req-ok": ok}
         input = GetRequestStatusInput(request_ids=["req-ok", "req-bad"])
         result = await orchestrator.execute(input)
         assert len(result.requests) == 2
         assert all(isinstance(e, dict) for e in result.requests)
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_query_error_returns_error_per_id(
+        self, orchestrator, mock_query_bus
+    ):
+        mock_query_bus.execute.side_effect = Exception("storage down")
+        input = GetRequestStatusInput(request_ids=["req-1", "req-2"])
+        result = await orchestrator.execute(input)
+        assert result.requests == [
+            {"request_id": "req-1", "error": "storage down"},
+            {"request_id": "req-2", "error": "storage down"},
+        ]
@@ -0,0 +1,200 @@
+"""Tests for MachineSyncService.fetch_provider_machines_batch — grouped provider calls."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from orb.application.services.machine_sync_service import MachineSyncService
+from orb.domain.base.operations import OperationType
+from orb.domain.request.aggregate import Request
+from orb.domain.request.request_types import RequestType
+from orb.providers.base.strategy import ProviderResult
+
+
+def _make_service(execute_operation) -> MachineSyncService:
+    registry = MagicMock()
+    registry.execute_operation = AsyncMock(side_effect=execute_operation)
+    return MachineSyncService(
+        command_bus=MagicMock(),
+        uow_factory=MagicMock(),
+        config_port=MagicMock(),
+        logger=MagicMock(),
+        provider_registry_service=registry,
+    )
+
+
+def _registry(service: MachineSyncService) -> MagicMock:
+    registry = service.provider_registry_service
+    assert isinstance(registry, MagicMock)
+    return registry
+
+
+def _acquire(fleet_id: str, provider_name: str = "aws-us-east-1") -> Request:
+    request = Request.create_new_request(
+        request_type=RequestType.ACQUIRE,
+        template_id="tpl-1",
+        machine_count=1,
+        provider_type="aws",
+        provider_name=provider_name,
+    )
+    request.provider_api = "EC2Fleet"
+    request.resource_ids = [fleet_id]
+    return request
+
+
+def _return(*instance_ids: str) -> Request:
+    request = Request.create_new_request(
+        request_type=RequestType.RETURN,
+        template_id="tpl-1",
+        machine_count=len(instance_ids),
+        provider_type="aws",
+        provider_name="aws-us-east-1",
+    )
+    request.machine_ids = list(instance_ids)
+    return request
+
+
+def _instance(instance_id: str, status: str = "running") -> dict:
+    return {
+        "instance_id": instance_id,
+        "status": status,
+        "instance_type": "m5.large",
+        "image_id": "ami-1",
+    }
+
+
+@pytest.mark.unit
+class TestFetchProviderMachinesBatch:
+    @pytest.mark.asyncio
+    async def test_resource_requests_share_one_operation(self):
+        requests = [_acquire("fleet-a"), _acquire("fleet-b"), _acquire("fleet-c")]
+
+        async def execute_operation(provider_name, operation):
+            return ProviderResult.success_result(
+                {
+                    "results": {
+                        entry["request_id"]: {
+                            "instances": [_instance(f"i-{entry['resource_ids'][0]}")],
+                            "metadata": {"resource_ids": entry["resource_ids"]},
+                        }
+                        for entry in operation.parameters["requests"]
+                    }
+                }
+            )
+
+        service = _make_service(execute_operation)
+
+        results = await service.fetch_provider_machines_batch([(r, []) for r in requests])
+
+        _registry(service).execute_operation.assert_awaited_once()
+        machines, metadata = results[str(requests[1].request_id)]
+        assert [m.machine_id.value for m in machines] == ["i-fleet-b"]
+        assert metadata == {"resource_ids": ["fleet-b"]}
+
+    @pytest.mark.asyncio
+    async def test_requests_on_the_same_fleet_share_one_lookup(self):
+        first, second, other = _acquire("fleet-a"), _acquire("fleet-a"), _acquire("fleet-b")
+        operations = []
+
+        async def execute_operation(provider_name, operation):
+            operations.append(operation)
+            return ProviderResult.success_result(
+                {
+                    "results": {
+                        entry["request_id"]: {
+                            "instances": [_instance(f"i-{entry['resource_ids'][0]}")],
+                            "metadata": {"resource_ids": entry["resource_ids"]},
+                        }
+                        for entry in operation.parameters["requests"]
+                    }
+                }
+            )
+
+        service = _make_service(execute_operation)
+
+        results = await service.fetch_provider_machines_batch(
+            [(first, []), (second, []), (other, [])]
+        )
+
+        assert len(operations) == 1
+        assert [entry["resource_ids"] for entry in operations[0].parameters["requests"]] == [
+            ["fleet-a"],
+            ["fleet-b"],
+        ]
+        for request in (first, second):
+            machines, metadata = results[str(request.request_id)]
+            assert [m.machine_id.value for m in machines] == ["i-fleet-a"]
+            assert machines[0].request_id == str(request.request_id)
+            assert metadata == {"resource_ids": ["fleet-a"]}
+
+    @pytest.mark.asyncio
+    async def test_instance_requests_share_one_status_lookup(self):
+        first, second = _return("i-1", "i-2"), _return("i-3")
+        operations = []
+
+        async def execute_operation(provider_name, operation):
+            operations.append(operation)
+            return ProviderResult.success_result(
+                {"instances": [_instance("i-1"), _instance("i-2"), _instance("i-3")]},
+                {"operation": "get_instance_status"},
+            )
+
+        service = _make_service(execute_operation)
+
+        results = await service.fetch_provider_machines_batch([(first, []), (second, [])])
+
+        assert len(operations) == 1
+        assert operations[0].operation_type == OperationType.GET_INSTANCE_STATUS
+        assert operations[0].parameters["instance_ids"] == ["i-1", "i-2", "i-3"]
+        assert [m.machine_id.value for m in results[str(first.request_id)][0]] == ["i-1", "i-2"]
+        assert [m.machine_id.value for m in results[str(second.request_id)][0]] == ["i-3"]
+
+    @pytest.mark.asyncio
+    async def test_provider_without_batch_support_falls_back_per_request(self):
+        requests = [_acquire("fleet-a"), _acquire("fleet-b")]
+
+        async def execute_operation(provider_name, operation):
+            if "requests" in operation.parameters:
+                return ProviderResult.success_result({"instances": []})
+            resource_id = operation.parameters["resource_ids"][0]
+            return ProviderResult.success_result({"instances": [_instance(f"i-{resource_id}")]})
+
+        service = _make_service(execute_operation)
+
+        results = await service.fetch_provider_machines_batch([(r, []) for r in requests])
+
+        assert _registry(service).execute_operation.await_count == 3
+        machines, _ = results[str(requests[0].request_id)]
+        assert [m.machine_id.value for m in machines] == ["i-fleet-a"]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_groups_in_flight(self):
+        requests = [_acquire(f"fleet-{n}", provider_name=f"aws-{n}") for n in range(4)]
+        in_flight = 0
+        peak = 0
+
+        async def execute_operation(provider_name, operation):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ProviderResult.success_result(
+                {
+                    "results": {
+                        entry["request_id"]: {"instances": [], "metadata": {}}
+                        for entry in operation.parameters["requests"]
+                    }
+                }
+            )
+
+        service = _make_service(execute_operation)
+
+        results = await service.fetch_provider_machines_batch(
+            [(r, []) for r in requests], max_concurrency=2
+        )
+
+        assert _registry(service).execute_operation.await_count == 4
+        assert peak == 2
+        assert set(results) == {str(r.request_id) for r in requests}
@@ -0,0 +1,264 @@
+"""Tests for concurrent batch dispatch in ProvisioningOrchestrationService."""
+
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from orb.application.services.provisioning_orchestration_service import (
+    ProvisioningOrchestrationService,
+)
+from orb.domain.base.results import ProviderSelectionResult
+from orb.domain.request.aggregate import Request
+from orb.domain.request.request_types import RequestType
+from orb.infrastructure.resilience.exceptions import CircuitBreakerOpenError
+from orb.providers.aws.infrastructure.adapters.aws_provisioning_adapter import (
+    AWSProvisioningAdapter,
+)
+from orb.providers.base.strategy.provider_strategy import ProviderResult
+
+
+class FakeProviderStrategy:
+    """Provider that answers each batch after a delay with a scripted outcome.
+
+    ``outcomes`` is consumed in dispatch order. Each entry is the fraction of
+    the batch fulfilled, ``"fail"``, ``"final"`` (half fulfilled, no retry) or
+    ``"open"`` (circuit breaker open). ``latencies`` overrides ``latency`` per
+    batch in the same order.
+    """
+
+    def __init__(self, outcomes=(), latency: float = 0.01, latencies=()):
+        self._outcomes = list(outcomes)
+        self._latency = latency
+        self._latencies = list(latencies)
+        self.counts: list[int] = []
+        self.completed = 0
+        self.attempts: list[int] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def execute_operation(self, provider_name, operation):
+        count = operation.parameters["count"]
+        self.counts.append(count)
+        self.attempts.append(operation.parameters["request_metadata"]["provisioning_attempt"])
+        outcome = self._outcomes.pop(0) if self._outcomes else 1.0
+        latency = self._latencies.pop(0) if self._latencies else self._latency
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            self.in_flight -= 1
+        self.completed += 1
+
+        if outcome == "open":
+            raise CircuitBreakerOpenError("provider:aws-test", 5, 0.0)
+        if outcome == "fail":
+            return ProviderResult.error_result("InsufficientInstanceCapacity", "CAPACITY")
+        fulfilled = count // 2 if outcome == "final" else int(count * outcome)
+        batch = len(self.counts)
+        instance_ids = [f"i-{batch}-{n}" for n in range(fulfilled)]
+        return ProviderResult.success_result(
+            {
+                "resource_ids": [f"fleet-{batch}"],
+                "instances": [{"instance_id": i} for i in instance_ids],
+                "instance_ids": instance_ids,
+            },
+            {
+                "provider_data": {
+                    "capacity_constrained": fulfilled < count,
+                    "fulfillment_final": outcome == "final",
+                }
+            },
+        )
+
+
+class BlockingAdapterProvider:
+    """Provider that provisions through the AWS adapter with a handler blocking the thread.
+
+    Mirrors the real path, where ``acquire_hosts`` makes blocking boto3 calls.
+    Each handler call waits on a barrier for ``parties`` calls, which only
+    completes if that many calls run at the same time.
+    """
+
+    def __init__(self, parties: int):
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.adapter = AWSProvisioningAdapter(
+            aws_client=MagicMock(), logger=MagicMock(), provider_strategy=MagicMock()
+        )
+        self.adapter._provision_via_handlers = self._acquire_hosts
+
+    def _acquire_hosts(self, request, template, dry_run=False):
+        self.barrier.wait()
+        instance_ids = [f"i-{request.request_id}-{n}" for n in range(request.requested_count)]
+        return {"resource_ids": [f"fleet-{request.request_id}"], "instance_ids": instance_ids}
+
+    async def execute_operation(self, provider_name, operation):
+        batch = MagicMock(
+            request_id=operation.parameters["request_metadata"]["provisioning_attempt"],
+            requested_count=operation.parameters["count"],
+            metadata={},
+        )
+        result = await self.adapter.provision_resources(batch, MagicMock())
+        return ProviderResult.success_result(
+            {
+                "resource_ids": result["resource_ids"],
+                "instances": [{"instance_id": i} for i in result["instance_ids"]],
+                "instance_ids": result["instance_ids"],
+            }
+        )
+
+
+def _make_service(provider: Any, **request_config) -> ProvisioningOrchestrationService:
+    container = MagicMock()
+    container.get.return_value.format_template_for_provider.return_value = {}
+    config_port = MagicMock()
+    config_port.get_request_config.return_value = request_config
+    breaker = MagicMock()
+    breaker.has_state.return_value = False
+    return ProvisioningOrchestrationService(
+        container=container,
+        logger=MagicMock(),
+        provider_selection_port=provider,
+        provider_config_port=MagicMock(),
+        config_port=config_port,
+        circuit_breaker_factory=MagicMock(return_value=breaker),
+    )
+
+
+def _request(count: int) -> Request:
+    return Request.create_new_request(
+        request_type=RequestType.ACQUIRE,
+        template_id="tpl-1",
+        machine_count=count,
+        provider_type="aws",
+        provider_name="aws-test",
+    )
+
+
+async def _provision(service: ProvisioningOrchestrationService, count: int):
+    selection = ProviderSelectionResult(
+        provider_name="aws-test", provider_type="aws", selection_reason="test", confidence=1.0
+    )
+    return await service.execute_provisioning(
+        MagicMock(template_id="tpl-1"), _request(count), selection
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestParallelBatchDispatch:
+    async def test_batches_run_concurrently_up_to_the_cap(self):
+        provider = FakeProviderStrategy(latency=0.02)
+        service = _make_service(
+            provider, fulfillment_batch_size=10, fulfillment_max_parallel_batches=3
+        )
+
+        result = await _provision(service, 45)
+
+        assert result.success
+        assert result.fulfilled_count == 45
+        assert sorted(provider.counts) == [5, 10, 10, 10, 10]
+        assert provider.peak_in_flight == 3
+        assert sorted(provider.attempts) == [1, 2, 3, 4, 5]
+
+    async def test_blocking_provider_calls_overlap(self):
+        provider = BlockingAdapterProvider(parties=3)
+        service = _make_service(
+            provider, fulfillment_batch_size=10, fulfillment_max_parallel_batches=3
+        )
+
+        result = await _provision(service, 30)
+
+        # Run in turn on the event loop, the first call would break the barrier
+        assert not provider.barrier.broken
+        assert result.fulfilled_count == 30
+
+    async def test_parallelism_of_one_dispatches_sequentially(self):
+        provider = FakeProviderStrategy()
+        service = _make_service(
+            provider, fulfillment_batch_size=10, fulfillment_max_parallel_batches=1
+        )
+
+        result = await _provision(service, 30)
+
+        assert result.fulfilled_count == 30
+        assert provider.peak_in_flight == 1
+        assert provider.counts == [10, 10, 10]
+
+    async def test_shortfall_is_topped_up_by_a_retry_batch(self):
+        provider = FakeProviderStrategy([1.0, 0.5, 1.0])
+        service = _make_service(
+            provider, fulfillment_batch_size=10, fulfillment_max_parallel_batches=2
+        )
+
+        result = await _provision(service, 20)
+
+        assert result.success
+        assert result.fulfilled_count == 20
+        assert provider.counts == [10, 10, 5]
+
+    async def test_failure_drops_queued_batches_and_reports_failure(self):
+        provider = FakeProviderStrategy(["fail", 1.0])
+        service = _make_service(
+            provider, fulfillment_batch_size=10, fulfillment_max_parallel_batches=2
+        )
+
+        result = await _provision(service, 50)
+
+        # The batch in flight alongside the failure completes; the other three never start
+        assert provider.counts == [10, 10]
+        assert not result.success
+        assert result.fulfilled_count == 10
+        assert result.error_message == "InsufficientInstanceCapacity"
+
+    async def test_final_shortfall_stops_dispatch(self):
+        provider = FakeProviderStrategy(["final"])
+        service = _make_service(
+            provider, fulfillment_batch_size=10, fulfillment_max_parallel_batches=1
+        )
+
+        result = await _provision(service, 30)
+
+        assert provider.counts == [10]
+        assert result.fulfilled_count == 5
+        assert result.is_final
+
+    async def test_open_circuit_stops_dispatch(self):
+        provider = FakeProviderStrategy(["open", 1.0])
+        service = _make_service(
+            provider, fulfillment_batch_size=10, fulfillment_max_parallel_batches=2
+        )
+
+        result = await _provision(service, 40)
+
+        assert provider.counts == [10, 10]
+        assert result.fulfilled_count == 10
+
+    async def test_failure_without_any_success_reports_failure(self):
+        provider = FakeProviderStrategy(["fail"])
+        service = _make_service(provider)
+
+        result = await _provision(service, 5)
+
+        assert not result.success
+        assert result.instances == []
+        assert result.error_message == "InsufficientInstanceCapacity"
+
+    async def test_unexpected_error_waits_for_batches_in_flight(self):
+        provider = FakeProviderStrategy([0.5, 1.0], latencies=[0.01, 0.05])
+        service = _make_service(
+            provider, fulfillment_batch_size=10, fulfillment_max_parallel_batches=2
+        )
+        logger = service._logger = MagicMock()
+        service._persist_acquiring = MagicMock(side_effect=RuntimeError("db down"))
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await _provision(service, 20)
+
+        # The second batch was still running when the first one's follow-up raised
+        assert provider.completed == 2
+        logged = [str(c.args) for c in logger.warning.call_args_list]
+        assert any("fleet-2" in line for line in logged)
@@ -0,0 +1,148 @@
+"""Tests for the shared request status hub."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from orb.application.events.handlers.request_status_hub_event_handler import (
+    RequestStatusHubEventHandler,
+)
+from orb.application.services.orchestration.dtos import GetRequestStatusOutput
+from orb.application.services.request_status_hub import RequestStatusHub, RequestStatusUpdate
+
+
+def _make_hub(statuses: dict[str, list[str]], **kwargs) -> RequestStatusHub:
+    """Hub whose orchestrator walks each request through the given statuses."""
+    remaining = {request_id: list(values) for request_id, values in statuses.items()}
+
+    async def execute(input):
+        request_id = input.request_ids[0]
+        values = remaining[request_id]
+        status = values.pop(0) if len(values) > 1 else values[0]
+        return GetRequestStatusOutput(requests=[{"request_id": request_id, "status": status}])
+
+    orchestrator = MagicMock()
+    orchestrator.execute = AsyncMock(side_effect=execute)
+    scheduler = MagicMock()
+    scheduler.format_request_status_response.side_effect = lambda reqs: {"requests": reqs}
+    kwargs.setdefault("poll_interval_seconds", 0.01)
+    kwargs.setdefault("coalesce_seconds", 0)
+    return RequestStatusHub(orchestrator, scheduler, Mock(), **kwargs)
+
+
+async def _drain(subscription, timeout: float = 2.0) -> list[RequestStatusUpdate]:
+    async def collect() -> list[RequestStatusUpdate]:
+        return [update async for batch in subscription for update in batch]
+
+    return await asyncio.wait_for(collect(), timeout)
+
+
+@pytest.mark.unit
+class TestRequestStatusHub:
+    """Watchers are shared per request and push only changes."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_watcher(self):
+        hub = _make_hub({"req-1": ["running", "running", "complete"]})
+
+        first = hub.subscribe(["req-1"])
+        second = hub.subscribe(["req-1"])
+        first_updates, second_updates = await asyncio.gather(_drain(first), _drain(second))
+
+        for updates in (first_updates, second_updates):
+            assert updates[-1].changes["status"] == "complete"
+            assert updates[-1].terminal
+        assert hub._orchestrator.execute.await_count == 3
+        assert hub.get_stats()["watched_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_only_changes_are_pushed(self):
+        hub = _make_hub({"req-1": ["pending", "pending", "running", "running", "complete"]})
+
+        async with hub.subscribe(["req-1"]) as subscription:
+            updates = await _drain(subscription)
+
+        assert [(u.full, u.changes.get("status"), u.version) for u in updates] == [
+            (True, "pending", 1),
+            (False, "running", 2),
+            (False, "complete", 3),
+        ]
+        assert updates[-1].terminal
+        assert updates[1].changes == {"status": "running"}
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_gets_current_snapshot(self):
+        hub = _make_hub({"req-1": ["pending", "running"]}, poll_interval_seconds=10)
+        first = hub.subscribe(["req-1"])
+        await first.next(timeout=1)
+
+        second = hub.subscribe(["req-1"])
+        updates = await second.next(timeout=0)
+
+        assert updates[0].full
+        assert updates[0].changes["status"] == "pending"
+        first.close()
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_notify_triggers_immediate_fetch(self):
+        hub = _make_hub({"req-1": ["pending", "running"]}, poll_interval_seconds=60)
+        subscription = hub.subscribe(["req-1"])
+        await subscription.next(timeout=1)
+
+        await RequestStatusHubEventHandler(hub).process_event(
+            Mock(request_id="req-1", aggregate_id="req-1")
+        )
+        updates = await subscription.next(timeout=1)
+
+        assert updates[0].changes == {"status": "running"}
+        subscription.close()
+
+    @pytest.mark.asyncio
+    async def test_watcher_stops_when_last_subscriber_leaves(self):
+        hub = _make_hub({"req-1": ["pending"]}, poll_interval_seconds=60)
+        subscription = hub.subscribe(["req-1"])
+        await subscription.next(timeout=1)
+        task = hub._watchers["req-1"].task
+
+        subscription.close()
+        await asyncio.wait_for(task, 1)
+
+        assert hub.get_stats()["watched_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_finishes_subscription(self):
+        hub = _make_hub({"req-1": ["pending"]})
+        hub._orchestrator.execute = AsyncMock(side_effect=RuntimeError("provider down"))
+
+        async with hub.subscribe(["req-1"]) as subscription:
+            updates = await _drain(subscription)
+
+        assert updates[0].error == "provider down"
+        assert subscription.done
+
+
+@pytest.mark.unit
+class TestRequestStatusUpdateMerge:
+    """Updates a slow subscriber has not consumed are coalesced."""
+
+    def test_merge_combines_changes(self):
+        older = RequestStatusUpdate("req-1", 2, changes={"status": "running", "a": 1})
+        newer = RequestStatusUpdate("req-1", 3, changes={"status": "complete"}, removed=["a"])
+
+        merged = older.merge(newer)
+
+        assert merged.version == 3
+        assert merged.changes == {"status": "complete"}
+        assert merged.removed == ["a"]
+
+    def test_merge_into_full_update_stays_full(self):
+        older = RequestStatusUpdate("req-1", 1, changes={"status": "pending", "a": 1}, full=True)
+        newer = RequestStatusUpdate("req-1", 2, changes={"status": "running"}, removed=["a"])
+
+        merged = older.merge(newer)
+
+        assert merged.full
+        assert merged.changes == {"status": "running"}
+        assert merged.removed == []
@@ -0,0 +1,203 @@
+"""Tests for the background request sync engine."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from orb.application.services.request_sync_engine import RequestSyncEngine
+from orb.domain.request.aggregate import Request
+from orb.domain.request.value_objects import RequestId, RequestStatus, RequestType
+
+
+def _make_request(
+    n: int, provider_api: str = "EC2Fleet", provider_name: str = "aws-default"
+) -> Request:
+    return Request(
+        request_id=RequestId(value=f"req-00000000-0000-0000-0000-00000000000{n}"),
+        request_type=RequestType.ACQUIRE,
+        provider_type="aws",
+        provider_name=provider_name,
+        provider_api=provider_api,
+        template_id="tmpl-1",
+        requested_count=1,
+        status=RequestStatus.IN_PROGRESS,
+        resource_ids=[f"fleet-{n}"],
+    )
+
+
+def _make_engine(active: list[Request], **kwargs) -> RequestSyncEngine:
+    uow = MagicMock()
+    uow.__enter__ = Mock(return_value=uow)
+    uow.__exit__ = Mock(return_value=False)
+    uow.requests.find_active_requests = Mock(side_effect=lambda: list(active))
+    uow_factory = Mock()
+    uow_factory.create_unit_of_work = Mock(return_value=uow)
+
+    machine_sync_service = Mock()
+    machine_sync_service.populate_missing_machine_ids = AsyncMock()
+    machine_sync_service.fetch_provider_machines_batch = AsyncMock(
+        side_effect=lambda items: {str(request.request_id): ([], {}) for request, _ in items}
+    )
+    machine_sync_service.sync_machines_with_provider = AsyncMock(return_value=([], {}))
+
+    engine = RequestSyncEngine(uow_factory, Mock(), machine_sync_service, **kwargs)
+    engine._query_service = Mock()
+    engine._query_service.get_request = AsyncMock(
+        side_effect=lambda request_id: next(
+            r for r in active if str(r.request_id.value) == request_id
+        )
+    )
+    engine._query_service.get_machines_for_request = AsyncMock(return_value=[])
+    engine._status_service = Mock()
+    engine._status_service.determine_status_from_machines = Mock(return_value=(None, None))
+    engine._status_service.update_request_status = AsyncMock()
+    return engine
+
+
+@pytest.mark.unit
+class TestRequestSyncEngineScheduling:
+    """Active requests are refreshed when due, with an adaptive interval."""
+
+    @pytest.mark.asyncio
+    async def test_cycle_syncs_due_requests_once(self):
+        engine = _make_engine([_make_request(1), _make_request(2)])
+
+        assert await engine.run_cycle() == 2
+        assert await engine.run_cycle() == 0
+        assert engine._machine_sync_service.fetch_provider_machines_batch.await_count == 1
+        assert engine.get_stats()["syncs"] == 2
+
+    def test_unchanged_syncs_back_off_and_changes_reset(self):
+        engine = _make_engine([], min_interval_seconds=5, max_interval_seconds=15)
+
+        intervals = []
+        for changed in (False, False, False, False, True):
+            engine.record_sync("req-1", changed=changed)
+            intervals.append(engine._states["req-1"].interval)
+
+        assert intervals == [5, 10, 15, 15, 5]
+
+    @pytest.mark.asyncio
+    async def test_status_change_counts_as_change(self):
+        active = [_make_request(1)]
+        engine = _make_engine(active, min_interval_seconds=5)
+        engine.record_sync(str(active[0].request_id.value))
+        engine._states[str(active[0].request_id.value)].interval = 40
+        engine._states[str(active[0].request_id.value)].next_due = 0
+        engine._status_service.determine_status_from_machines.return_value = ("complete", "done")
+
+        await engine.run_cycle()
+
+        assert engine._states[str(active[0].request_id.value)].interval == 5
+        engine._status_service.update_request_status.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_inactive_requests_are_forgotten(self):
+        active = [_make_request(1)]
+        engine = _make_engine(active)
+        await engine.run_cycle()
+
+        active.clear()
+        await engine.run_cycle()
+
+        assert engine.get_stats()["tracked_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted_and_retried_later(self):
+        engine = _make_engine([_make_request(1)])
+        engine._machine_sync_service.fetch_provider_machines_batch.side_effect = RuntimeError(
+            "throttled"
+        )
+
+        assert await engine.run_cycle() == 1
+        assert await engine.run_cycle() == 0
+        assert engine.get_stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_one_provider_fetch_per_group(self):
+        fleets = [_make_request(n) for n in (3, 1, 2)]
+        spot = [_make_request(n, provider_api="SpotFleet") for n in (4, 5)]
+        other = [_make_request(6, provider_name="aws-west")]
+        engine = _make_engine(fleets + spot + other)
+
+        assert await engine.run_cycle() == 6
+
+        fetch = engine._machine_sync_service.fetch_provider_machines_batch
+        assert fetch.await_count == 3
+        batches = sorted(
+            [str(request.request_id.value)[-1] for request, _ in call.args[0]]
+            for call in fetch.await_args_list
+        )
+        assert batches == [["1", "2", "3"], ["4", "5"], ["6"]]
+        assert engine.get_stats()["syncs"] == 6
+
+    @pytest.mark.asyncio
+    async def test_failed_apply_only_backs_off_its_request(self):
+        active = [_make_request(1), _make_request(2)]
+        engine = _make_engine(active)
+        engine._machine_sync_service.sync_machines_with_provider.side_effect = [
+            RuntimeError("conflict"),
+            ([], {}),
+        ]
+
+        await engine.run_cycle()
+
+        stats = engine.get_stats()
+        assert (stats["syncs"], stats["failures"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        engine = _make_engine(
+            [_make_request(n, provider_name=f"aws-{n}") for n in range(6)], max_concurrency=2
+        )
+        in_flight = 0
+        peak = 0
+
+        async def slow_fetch(items):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {str(request.request_id): ([], {}) for request, _ in items}
+
+        engine._machine_sync_service.fetch_provider_machines_batch.side_effect = slow_fetch
+
+        await engine.run_cycle()
+
+        assert peak == 2
+
+
+@pytest.mark.unit
+class TestRequestSyncEngineLifecycle:
+    """Freshness is only reported while the background thread runs."""
+
+    def test_not_fresh_when_stopped(self):
+        engine = _make_engine([])
+        engine.record_sync("req-1")
+
+        assert engine.is_fresh("req-1") is False
+
+    def test_background_thread_refreshes_requests(self):
+        request = _make_request(1)
+        engine = _make_engine([request], tick_seconds=0.01, max_staleness_seconds=30)
+
+        engine.start()
+        try:
+            deadline = time.monotonic() + 5
+            while engine.get_stats()["syncs"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert engine.is_fresh(str(request.request_id.value))
+        finally:
+            engine.stop()
+
+        assert not engine.is_running
+
+    def test_disabled_engine_does_not_start(self):
+        engine = _make_engine([], enabled=False)
+
+        engine.start()
+
+        assert not engine.is_running
@@ -0,0 +1,95 @@
+"""Tests for the JWKS key cache."""
+
+import asyncio
+import json
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from orb.infrastructure.auth.jwks_cache import JWKSKeyCache
+
+
+def _jwk(kid: str) -> dict:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+    return {**jwk, "kid": kid, "alg": "RS256", "use": "sig"}
+
+
+class _Endpoint:
+    """Fake JWKS endpoint recording fetches."""
+
+    def __init__(self, *kids: str) -> None:
+        self.keys = [_jwk(kid) for kid in kids]
+        self.calls = 0
+
+    def __call__(self, url: str, timeout: float) -> dict:
+        self.calls += 1
+        return {"keys": list(self.keys)}
+
+
+@pytest.mark.asyncio
+async def test_keys_are_fetched_once_and_reused():
+    """Known key IDs are served from the cache."""
+    endpoint = _Endpoint("k1", "k2")
+    cache = JWKSKeyCache("https://example/jwks", fetcher=endpoint)
+
+    first = await cache.get_key("k1")
+    second = await cache.get_key("k2")
+
+    assert first is not None and second is not None
+    assert endpoint.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refreshes_for_rotated_key():
+    """A key added by rotation is picked up on first use."""
+    endpoint = _Endpoint("k1")
+    cache = JWKSKeyCache("https://example/jwks", fetcher=endpoint, min_refresh_interval=0)
+    await cache.get_key("k1")
+
+    endpoint.keys.append(_jwk("k2"))
+
+    assert await cache.get_key("k2") is not None
+    assert endpoint.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refreshes_are_rate_limited():
+    """Bogus key IDs cannot trigger a fetch per token."""
+    endpoint = _Endpoint("k1")
+    cache = JWKSKeyCache("https://example/jwks", fetcher=endpoint, min_refresh_interval=60)
+    await cache.get_key("k1")
+
+    assert await cache.get_key("bogus-1") is None
+    assert await cache.get_key("bogus-2") is None
+    assert endpoint.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_lookups_share_one_fetch():
+    """Callers arriving before the first fetch completes wait on it together."""
+    endpoint = _Endpoint("k1")
+    cache = JWKSKeyCache("https://example/jwks", fetcher=endpoint)
+
+    keys = await asyncio.gather(*(cache.get_key("k1") for _ in range(5)))
+
+    assert all(key is not None for key in keys)
+    assert endpoint.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_keys_serve_while_refreshing_in_background():
+    """Expired keys keep verifying tokens and a failed refresh keeps them."""
+    endpoint = _Endpoint("k1")
+    cache = JWKSKeyCache("https://example/jwks", fetcher=endpoint, ttl_seconds=0)
+    await cache.get_key("k1")
+
+    def failing(url, timeout):
+        raise ConnectionError("endpoint down")
+
+    cache._fetcher = failing
+    assert await cache.get_key("k1") is not None
+    await cache._refresh_task
+
+    assert await cache.get_key("k1") is not None
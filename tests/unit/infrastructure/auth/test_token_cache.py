@@ -0,0 +1,139 @@
+"""Tests for the validated token cache and its use by the bearer strategies."""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import jwt
+import pytest
+
+from orb.infrastructure.adapters.ports.auth import AuthResult, AuthStatus
+from orb.infrastructure.auth.strategy.bearer_token_strategy_enhanced import (
+    EnhancedBearerTokenStrategy,
+)
+from orb.infrastructure.auth.token_blacklist import InMemoryTokenBlacklist
+from orb.infrastructure.auth.token_cache import ValidatedTokenCache
+
+_SECRET = "s" * 32
+
+
+def _success(expires_at=None) -> AuthResult:
+    return AuthResult(
+        status=AuthStatus.SUCCESS,
+        user_id="alice",
+        user_roles=["user"],
+        expires_at=expires_at,
+    )
+
+
+def _token(**claims) -> str:
+    now = int(time.time())
+    payload = {"sub": "alice", "iat": now, "exp": now + 3600, **claims}
+    return jwt.encode(payload, _SECRET, algorithm="HS256")
+
+
+def test_cache_entry_expires_with_token():
+    """Entries are dropped once the token's exp has passed."""
+    now = [1000.0]
+    cache = ValidatedTokenCache(clock=lambda: now[0])
+
+    cache.put("tok", _success(expires_at=1010))
+    assert cache.get("tok").user_id == "alice"
+
+    now[0] = 1010.0
+    assert cache.get("tok") is None
+    assert len(cache) == 0
+
+
+def test_cache_max_age_bounds_entry_lifetime():
+    """max_age_seconds expires entries before the token itself does."""
+    now = [1000.0]
+    cache = ValidatedTokenCache(max_age_seconds=5, clock=lambda: now[0])
+
+    cache.put("tok", _success(expires_at=5000))
+    now[0] = 1006.0
+
+    assert cache.get("tok") is None
+
+
+def test_cache_ignores_failures_and_tokens_without_expiry():
+    """Only successful, expiring validations are cached."""
+    cache = ValidatedTokenCache()
+
+    cache.put("bad", AuthResult(status=AuthStatus.INVALID))
+    cache.put("forever", _success())
+
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """The cache stays within max_size by evicting the oldest entry."""
+    cache = ValidatedTokenCache(max_size=2)
+    expires_at = int(time.time()) + 60
+
+    cache.put("a", _success(expires_at))
+    cache.put("b", _success(expires_at))
+    cache.get("a")
+    cache.put("c", _success(expires_at))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_cache_returns_independent_copies():
+    """Callers mutating a cached result do not affect later hits."""
+    cache = ValidatedTokenCache()
+    cache.put("tok", _success(int(time.time()) + 60))
+
+    cache.get("tok").user_roles.append("admin")
+
+    assert cache.get("tok").user_roles == ["user"]
+
+
+@pytest.mark.asyncio
+async def test_enhanced_strategy_serves_repeat_validations_from_cache():
+    """A cached token skips signature verification but not the blacklist lookup."""
+    blacklist = InMemoryTokenBlacklist()
+    blacklist.is_blacklisted = AsyncMock(return_value=False)
+    strategy = EnhancedBearerTokenStrategy(secret_key=_SECRET, blacklist=blacklist)
+    token = _token()
+
+    with patch(
+        "orb.infrastructure.auth.strategy.bearer_token_strategy_enhanced.jwt.decode",
+        wraps=jwt.decode,
+    ) as decode:
+        first = await strategy.validate_token(token)
+        second = await strategy.validate_token(token)
+
+    assert first.status == second.status == AuthStatus.SUCCESS
+    assert decode.call_count == 1
+    assert blacklist.is_blacklisted.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_enhanced_strategy_rejects_token_blacklisted_elsewhere():
+    """A token added to the blacklist outside the strategy is rejected despite the cache."""
+    blacklist = InMemoryTokenBlacklist()
+    strategy = EnhancedBearerTokenStrategy(secret_key=_SECRET, blacklist=blacklist)
+    token = _token()
+    assert (await strategy.validate_token(token)).is_authenticated
+
+    assert await blacklist.add_token(token)
+    result = await strategy.validate_token(token)
+
+    assert result.status == AuthStatus.INVALID
+    assert strategy.token_cache.get(token) is None
+
+
+@pytest.mark.asyncio
+async def test_enhanced_strategy_revocation_invalidates_cache():
+    """Revoking a token takes effect immediately despite the cache."""
+    strategy = EnhancedBearerTokenStrategy(secret_key=_SECRET, blacklist=InMemoryTokenBlacklist())
+    token = _token()
+    assert (await strategy.validate_token(token)).is_authenticated
+
+    assert await strategy.revoke_token(token)
+    result = await strategy.validate_token(token)
+
+    assert result.status == AuthStatus.INVALID
+    assert result.error_message == "Token has been revoked"
@@ -193,6 +193,27 @@ class TestDIContainer:
         assert query_handler.handle(TestQuery("search")) == "result: search"
         assert event_handlers[0].handle(TestEvent("data")) == "processed: data"
 
+    def test_cqrs_handlers_are_reused_across_dispatches(self):
+        """Stateless CQRS handlers are built once and reused."""
+
+        class TestQuery:
+            pass
+
+        class TestQueryHandler:
+            def handle(self, query: TestQuery):
+                return "result"
+
+        self.container.register_query_handler(TestQuery, TestQueryHandler)
+
+        first = self.container.get_query_handler(TestQuery)
+        second = self.container.get_query_handler(TestQuery)
+
+        assert first is second
+        assert self.container.get_registrations()[TestQueryHandler].scope == DIScope.SINGLETON
+        resolver_stats = self.container.get_stats()["resolver"]
+        assert resolver_stats["resolution_counts"]["TestQueryHandler"] == 2
+        assert resolver_stats["singleton_hits"] == 1
+
     def test_multiple_event_handlers(self):
         """Test multiple event handlers for the same event."""
 
@@ -1,6 +1,8 @@
 """Unit tests for DependencyResolver component."""
 
 import threading
+from typing import get_type_hints
+from unittest.mock import patch
 
 import pytest
 
@@ -532,3 +534,67 @@ class TestDependencyResolverIntegration:
         assert self.cqrs_registry.has_command_handler(TestCommand)
         handler_type = self.cqrs_registry.get_command_handler_type(TestCommand)
         assert handler_type == TestCommandHandler
+
+    def test_constructor_plan_compiled_once_per_type(self):
+        """Signatures are inspected once; later resolutions reuse the compiled plan."""
+
+        class Dependency:
+            pass
+
+        class Service:
+            def __init__(self, dep: Dependency, retries: int = 3):
+                self.dep = dep
+                self.retries = retries
+
+        with patch(
+            "orb.infrastructure.di.components.dependency_resolver.get_type_hints",
+            wraps=get_type_hints,
+        ) as mock_hints:
+            first = self.resolver.resolve(Service)
+            second = self.resolver.resolve(Service)
+
+        assert first is not second
+        assert isinstance(second.dep, Dependency)
+        assert second.retries == 3
+        # One compilation each for Service and Dependency
+        assert mock_hints.call_count == 2
+
+        plan = self.resolver._get_constructor_plan(Service)
+        assert [(p.name, p.dependency_type, p.required) for p in plan.parameters] == [
+            ("dep", Dependency, True)
+        ]
+
+    def test_clear_cache_drops_compiled_plans(self):
+        """Clearing the cache forces plans to be recompiled."""
+
+        class Service:
+            pass
+
+        self.resolver.resolve(Service)
+        assert self.resolver.get_stats()["compiled_plans"] == 1
+
+        self.resolver.clear_cache()
+
+        assert self.resolver.get_stats()["compiled_plans"] == 0
+
+    def test_stats_count_outermost_resolutions_only(self):
+        """Nested constructor dependencies are not counted as separate resolutions."""
+
+        class Dependency:
+            pass
+
+        class Service:
+            def __init__(self, dep: Dependency):
+                self.dep = dep
+
+        self.service_registry.register_singleton(Service)
+
+        self.resolver.resolve(Service)
+        self.resolver.resolve(Service)
+
+        stats = self.resolver.get_stats()
+        assert stats["resolutions"] == 2
+        assert stats["resolution_counts"] == {"Service": 2}
+        assert stats["singleton_hits"] == 1
+        assert stats["instances_created"] == 2  # Service and its Dependency
+        assert stats["total_resolution_time_ms"] >= 0
@@ -0,0 +1,294 @@
+"""Unit tests for the persistent startup snapshot and lazy handler loading."""
+
+import importlib
+import os
+import sys
+import textwrap
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+from orb.application import decorators
+from orb.application.interfaces.command_query import Query
+from orb.infrastructure.di import startup_snapshot
+from orb.infrastructure.di.handler_discovery import HandlerDiscoveryService
+from orb.infrastructure.di.startup_profile import (
+    get_startup_phases,
+    reset_startup_phases,
+    startup_phase,
+)
+from orb.infrastructure.di.startup_snapshot import StartupSnapshot, compute_config_fingerprint
+from orb.providers.registry import get_provider_registry
+from orb.providers.registry.types import ProviderRegistration
+
+
+@pytest.mark.unit
+class TestStartupSnapshot:
+    def test_sections_round_trip_with_same_fingerprint(self, tmp_path):
+        path = str(tmp_path / "snapshot.json")
+        StartupSnapshot(path, fingerprint="abc").put("handlers", {"total_handlers": 3})
+
+        snapshot = StartupSnapshot(path, fingerprint="abc")
+
+        assert snapshot.get("handlers") == {"total_handlers": 3}
+        assert snapshot.status == "hit"
+
+    def test_changed_fingerprint_invalidates_snapshot(self, tmp_path):
+        path = str(tmp_path / "snapshot.json")
+        StartupSnapshot(path, fingerprint="abc").put("handlers", {"total_handlers": 3})
+
+        snapshot = StartupSnapshot(path, fingerprint="def")
+
+        assert snapshot.get("handlers") is None
+        assert snapshot.status == "stale"
+
+    def test_corrupt_file_is_a_miss(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        path.write_text("{not json")
+
+        snapshot = StartupSnapshot(str(path), fingerprint="abc")
+
+        assert snapshot.get("handlers") is None
+        assert snapshot.status == "miss"
+
+    def test_fingerprint_tracks_distribution_version(self, tmp_path, monkeypatch):
+        config = tmp_path / "config.json"
+        config.write_text("{}")
+        monkeypatch.setattr(startup_snapshot, "get_distribution_version", lambda: "1.0.0")
+        before = StartupSnapshot(str(tmp_path / "s.json"), str(config)).fingerprint
+
+        monkeypatch.setattr(startup_snapshot, "get_distribution_version", lambda: "1.0.1")
+
+        assert StartupSnapshot(str(tmp_path / "s.json"), str(config)).fingerprint != before
+
+    def test_regular_install_does_not_walk_the_source_tree(self, tmp_path, monkeypatch):
+        walk = MagicMock(side_effect=AssertionError("source tree walked"))
+        monkeypatch.setattr(startup_snapshot.os, "walk", walk)
+        monkeypatch.setattr(startup_snapshot, "is_source_install", lambda: False)
+
+        assert StartupSnapshot(str(tmp_path / "s.json")).fingerprint
+
+    def test_source_install_fingerprint_tracks_source_files(self, tmp_path, monkeypatch):
+        package = tmp_path / "orb"
+        package.mkdir()
+        module = package / "module.py"
+        module.write_text("x = 1\n")
+        compute = startup_snapshot.compute_source_fingerprint
+        monkeypatch.setattr(startup_snapshot, "is_source_install", lambda: True)
+        monkeypatch.setattr(
+            startup_snapshot, "compute_source_fingerprint", lambda: compute(str(package))
+        )
+        before = StartupSnapshot(str(tmp_path / "s.json")).fingerprint
+
+        module.write_text("x = 22\n")
+
+        assert StartupSnapshot(str(tmp_path / "s.json")).fingerprint != before
+
+    def test_config_fingerprint_tracks_files_and_orb_env(self, tmp_path, monkeypatch):
+        config = tmp_path / "config.json"
+        config.write_text("{}")
+        templates = tmp_path / "templates.json"
+        templates.write_text("[]")
+        before = compute_config_fingerprint(str(config))
+
+        templates.write_text('[{"template_id": "t1"}]')
+        after_templates = compute_config_fingerprint(str(config))
+        monkeypatch.setenv("ORB_SNAPSHOT_TEST", "1")
+
+        assert after_templates != before
+        assert compute_config_fingerprint(str(config)) != after_templates
+
+
+@pytest.fixture
+def lazy_handler_module(tmp_path, monkeypatch):
+    """A handler module that is not imported until its query is dispatched."""
+    types_module = types.ModuleType("orb_snapshot_test_types")
+
+    class SnapshotTestQuery(Query):
+        pass
+
+    SnapshotTestQuery.__module__ = types_module.__name__
+    setattr(types_module, "SnapshotTestQuery", SnapshotTestQuery)
+    monkeypatch.setitem(sys.modules, types_module.__name__, types_module)
+
+    (tmp_path / "orb_snapshot_test_handlers.py").write_text(
+        textwrap.dedent(
+            """
+            from orb.application.decorators import query_handler
+            from orb_snapshot_test_types import SnapshotTestQuery
+
+            @query_handler(SnapshotTestQuery)
+            class SnapshotTestHandler:
+                pass
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield SnapshotTestQuery
+    decorators._query_handler_registry.pop(SnapshotTestQuery, None)
+    decorators._lazy_query_handler_modules.pop(decorators.handled_type_key(SnapshotTestQuery), None)
+    sys.modules.pop("orb_snapshot_test_handlers", None)
+
+
+@pytest.mark.unit
+class TestLazyHandlerRegistration:
+    def test_cached_handlers_are_imported_on_first_dispatch(self, lazy_handler_module):
+        key = decorators.handled_type_key(lazy_handler_module)
+        service = HandlerDiscoveryService.__new__(HandlerDiscoveryService)
+        service.container = MagicMock()
+
+        service._register_handlers_from_cache(
+            {
+                "query_handlers": {
+                    key: {
+                        "module": "orb_snapshot_test_handlers",
+                        "class_name": "SnapshotTestHandler",
+                    }
+                },
+                "command_handlers": {},
+            }
+        )
+
+        assert "orb_snapshot_test_handlers" not in sys.modules
+        handler_class = decorators.get_query_handler_for_type(lazy_handler_module)
+        assert handler_class.__name__ == "SnapshotTestHandler"
+        service.container.register_singleton.assert_not_called()
+
+    def test_stale_map_falls_back_to_full_discovery(self, lazy_handler_module, monkeypatch):
+        key = decorators.handled_type_key(lazy_handler_module)
+        discovered = []
+
+        def discover():
+            discovered.append(True)
+            # Importing the module registers the handler
+            importlib.import_module("orb_snapshot_test_handlers")
+
+        monkeypatch.setattr(decorators, "_handler_discovery_fallback", discover)
+        decorators.register_lazy_handler_modules({key: "orb_snapshot_moved_handlers"}, {})
+
+        handler_class = decorators.get_query_handler_for_type(lazy_handler_module)
+
+        assert handler_class.__name__ == "SnapshotTestHandler"
+        assert discovered == [True]
+        assert decorators._handler_discovery_fallback is None
+
+    def test_unmapped_query_still_raises_key_error(self, lazy_handler_module):
+        with pytest.raises(KeyError):
+            decorators.get_query_handler_for_type(lazy_handler_module)
+
+    def test_snapshot_round_trip_through_discovery_service(self, tmp_path, lazy_handler_module):
+        importlib.import_module("orb_snapshot_test_handlers")  # registers the handler
+
+        service = HandlerDiscoveryService.__new__(HandlerDiscoveryService)
+        service.container = MagicMock()
+        service.cache_enabled = True
+        service.snapshot = StartupSnapshot(
+            os.path.join(tmp_path, "snapshot.json"), fingerprint="abc"
+        )
+
+        service._save_to_cache("orb.application", {"total_handlers": 1}, 0.1)
+        reloaded = HandlerDiscoveryService.__new__(HandlerDiscoveryService)
+        reloaded.cache_enabled = True
+        reloaded.snapshot = StartupSnapshot(service.snapshot.path, fingerprint="abc")
+        cached = reloaded._try_load_from_cache("orb.application")
+
+        key = decorators.handled_type_key(lazy_handler_module)
+        assert cached is not None
+        assert cached["handlers"]["query_handlers"][key]["module"] == ("orb_snapshot_test_handlers")
+        assert reloaded._try_load_from_cache("other.package") is None
+
+
+@pytest.fixture
+def defaults_strategy_module(monkeypatch):
+    """A provider strategy module that contributes configuration defaults."""
+    module = types.ModuleType("orb_snapshot_test_strategy")
+
+    class SnapshotTestStrategy:
+        calls = 0
+
+        @classmethod
+        def get_defaults_config(cls):
+            cls.calls += 1
+            return {"provider": {"snapshot_test": True}}
+
+    setattr(module, "SnapshotTestStrategy", SnapshotTestStrategy)
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return SnapshotTestStrategy
+
+
+def _registry_with(monkeypatch, strategy_class):
+    registry = get_provider_registry()
+    registration = ProviderRegistration(
+        "snapshot_test", MagicMock(), MagicMock(), strategy_class=strategy_class
+    )
+    monkeypatch.setattr(registry, "_type_registrations", {"snapshot_test": registration})
+    return registry
+
+
+@pytest.mark.unit
+class TestProviderDefaultsSnapshot:
+    def test_strategy_class_path_is_imported_on_first_access(self, defaults_strategy_module):
+        registration = ProviderRegistration(
+            "snapshot_test",
+            MagicMock(),
+            MagicMock(),
+            strategy_class="orb_snapshot_test_strategy:SnapshotTestStrategy",
+        )
+
+        assert registration.strategy_class_path == (
+            "orb_snapshot_test_strategy:SnapshotTestStrategy"
+        )
+        assert registration.strategy_class is defaults_strategy_module
+
+    def test_snapshot_hit_skips_importing_strategies(
+        self, tmp_path, defaults_strategy_module, monkeypatch
+    ):
+        path = str(tmp_path / "provider_snapshot.json")
+        strategy_path = "orb_snapshot_test_strategy:SnapshotTestStrategy"
+        registry = _registry_with(monkeypatch, strategy_path)
+        registry.collect_defaults(StartupSnapshot(path, fingerprint="abc"))
+        # The module is not importable from disk, so a second import would fail
+        monkeypatch.delitem(sys.modules, "orb_snapshot_test_strategy")
+        registry = _registry_with(monkeypatch, strategy_path)
+
+        defaults = registry.collect_defaults(StartupSnapshot(path, fingerprint="abc"))
+
+        assert defaults == {"provider": {"snapshot_test": True}}
+        assert defaults_strategy_module.calls == 1
+        assert "orb_snapshot_test_strategy" not in sys.modules
+
+    def test_changed_strategies_recollect_defaults(
+        self, tmp_path, defaults_strategy_module, monkeypatch
+    ):
+        snapshot = StartupSnapshot(str(tmp_path / "provider_snapshot.json"), fingerprint="abc")
+        snapshot.put(
+            "provider_defaults", {"strategies": ["other:Strategy"], "defaults": {"stale": 1}}
+        )
+        registry = _registry_with(monkeypatch, defaults_strategy_module)
+
+        assert registry.collect_defaults(snapshot) == {"provider": {"snapshot_test": True}}
+        assert defaults_strategy_module.calls == 1
+
+    def test_failed_collection_is_not_persisted(self, tmp_path, monkeypatch):
+        snapshot = StartupSnapshot(str(tmp_path / "provider_snapshot.json"), fingerprint="abc")
+        registry = _registry_with(monkeypatch, "orb_snapshot_missing_module:Strategy")
+
+        assert registry.collect_defaults(snapshot) == {}
+        assert snapshot.get("provider_defaults") is None
+
+
+@pytest.mark.unit
+class TestStartupProfile:
+    def test_phases_record_nesting_and_imports(self):
+        reset_startup_phases()
+
+        with startup_phase("outer"):
+            with startup_phase("inner"):
+                pass
+
+        phases = {p["name"]: p for p in get_startup_phases()}
+        assert phases["outer"]["depth"] == 0
+        assert phases["inner"]["depth"] == 1
+        assert [p["name"] for p in get_startup_phases()] == ["outer", "inner"]
+        reset_startup_phases()
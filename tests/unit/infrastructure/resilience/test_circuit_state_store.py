@@ -0,0 +1,290 @@
+"""Tests for circuit breaker state shared through CircuitStateStore backends."""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from orb.bootstrap.infrastructure_services import _register_circuit_state_store
+from orb.config.managers.configuration_manager import ConfigurationManager
+from orb.config.schemas.performance_schema import CircuitBreakerConfig
+from orb.config.schemas.storage_schema import StorageConfig
+from orb.infrastructure.di.container import DIContainer
+from orb.infrastructure.resilience.exceptions import CircuitBreakerOpenError
+from orb.infrastructure.resilience.retry_decorator import retry
+from orb.infrastructure.resilience.state_store import (
+    CircuitStateStore,
+    FileCircuitStateStore,
+    InMemoryCircuitStateStore,
+    StorageCircuitStateStore,
+    create_circuit_state_store,
+)
+from orb.infrastructure.resilience.strategy.circuit_breaker import (
+    CircuitBreakerStrategy,
+    CircuitState,
+)
+from orb.infrastructure.storage.components.document_cache import reset_document_cache
+from orb.infrastructure.storage.json.registration import register_json_storage
+from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
+from orb.infrastructure.storage.sql.registration import register_sql_storage
+from orb.infrastructure.storage.sql.runtime import get_sql_runtime_pool
+
+
+def _stored(state: Optional[dict[str, Any]]) -> dict[str, Any]:
+    assert state is not None
+    return state
+
+
+def _claim_probe(state_dir: str, owner: str) -> bool:
+    return FileCircuitStateStore(state_dir).try_acquire_probe("svc", owner, 30.0, 1000.0)
+
+
+def _claim_probe_on_storage(file_path: str, owner: str) -> bool:
+    strategy = JSONStorageStrategy(file_path=file_path, entity_type="circuit_breakers")
+    return StorageCircuitStateStore(strategy).try_acquire_probe("svc", owner, 30.0, 1000.0)
+
+
+def _breaker(store, owner: str = "host:1", **kwargs) -> CircuitBreakerStrategy:
+    breaker = CircuitBreakerStrategy(
+        service_name="svc",
+        failure_threshold=2,
+        reset_timeout=60,
+        half_open_timeout=30,
+        jitter=False,
+        state_store=store,
+        **kwargs,
+    )
+    breaker._probe_owner = owner
+    return breaker
+
+
+def _open_with_elapsed_reset_timeout(store) -> None:
+    breaker = _breaker(store)
+    breaker.record_failure(1.0)
+    breaker.record_failure(1.0)
+    assert breaker._get_current_state(2.0) == CircuitState.OPEN
+
+
+@pytest.fixture
+def file_store(tmp_path):
+    return FileCircuitStateStore(str(tmp_path))
+
+
+@pytest.mark.unit
+class TestFileCircuitStateStore:
+    def test_updates_are_visible_to_other_instances(self, tmp_path):
+        writer = FileCircuitStateStore(str(tmp_path))
+        reader = FileCircuitStateStore(str(tmp_path))
+        assert reader.get("svc") is None
+
+        writer.update("svc", lambda state: state.update(failure_count=3))
+
+        assert _stored(reader.get("svc"))["failure_count"] == 3
+
+    def test_unchanged_state_is_not_written(self, file_store):
+        file_store.release_probe("svc", "host:1")
+
+        assert not file_store.path.exists()
+
+    def test_probe_lease_is_granted_to_one_process(self, tmp_path):
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(_claim_probe, [str(tmp_path)] * 8, [f"host:{n}" for n in range(8)])
+            )
+
+        assert results.count(True) == 1
+
+    def test_expired_lease_can_be_taken_over(self, file_store):
+        assert file_store.try_acquire_probe("svc", "host:1", 30.0, now=100.0)
+        assert not file_store.try_acquire_probe("svc", "host:2", 30.0, now=120.0)
+
+        assert file_store.try_acquire_probe("svc", "host:2", 30.0, now=131.0)
+
+    def test_unreadable_file_is_treated_as_empty(self, file_store):
+        file_store.path.write_text("{not json")
+
+        assert file_store.get("svc") is None
+        assert file_store.update("svc", lambda s: s.update(failure_count=1))["failure_count"] == 1
+
+
+@pytest.mark.unit
+class TestStorageCircuitStateStore:
+    def test_state_round_trips_through_the_storage_strategy(self, tmp_path):
+        reset_document_cache()
+        strategy = JSONStorageStrategy(
+            file_path=str(tmp_path / "circuits.json"), entity_type="circuit_breakers"
+        )
+        store = StorageCircuitStateStore(strategy)
+
+        assert store.try_acquire_probe("svc", "host:1", 30.0, now=100.0)
+        assert not store.try_acquire_probe("svc", "host:2", 30.0, now=110.0)
+        assert _stored(strategy.find_by_id("circuit_breaker:svc"))["probe_owner"] == "host:1"
+
+        store.clear()
+        assert store.get("svc") is None
+        reset_document_cache()
+
+    def test_probe_lease_is_granted_to_one_process(self, tmp_path):
+        file_path = str(tmp_path / "circuits.json")
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(_claim_probe_on_storage, [file_path] * 8, [f"host:{n}" for n in range(8)])
+            )
+
+        assert results.count(True) == 1
+
+    def test_claim_that_loses_the_race_is_retried_against_the_new_state(self, tmp_path):
+        reset_document_cache()
+        file_path = str(tmp_path / "circuits.json")
+        store = StorageCircuitStateStore(
+            JSONStorageStrategy(file_path=file_path, entity_type="circuit_breakers")
+        )
+        other = StorageCircuitStateStore(
+            JSONStorageStrategy(file_path=file_path, entity_type="circuit_breakers")
+        )
+        store.update("svc", lambda state: state.update(failure_count=1))
+        read = store._read
+        reads = []
+
+        def read_then_race(service_name):
+            stored = read(service_name)
+            reads.append(stored)
+            if len(reads) == 1:
+                # Another host claims the probe between this read and the write
+                other.try_acquire_probe("svc", "host:2", 30.0, now=100.0)
+            return stored
+
+        store._read = read_then_race
+
+        assert not store.try_acquire_probe("svc", "host:1", 30.0, now=100.0)
+        assert len(reads) == 2
+        assert reads[1][0]["probe_owner"] == "host:2"
+        assert _stored(store.get("svc"))["probe_owner"] == "host:2"
+        reset_document_cache()
+
+
+def _configured_store(storage_type: str, storage_config: StorageConfig) -> CircuitStateStore:
+    config_manager = MagicMock(spec=ConfigurationManager)
+    config_manager.app_config = SimpleNamespace(
+        circuit_breaker=CircuitBreakerConfig.model_validate({"state_backend": "storage"})
+    )
+    config_manager.get_storage_strategy.return_value = storage_type
+    config_manager.get_typed.return_value = storage_config
+    container = DIContainer()
+    container.register_instance(ConfigurationManager, config_manager)
+    _register_circuit_state_store(container)
+    return container.get(CircuitStateStore)
+
+
+@pytest.mark.unit
+class TestConfiguredStorageBackend:
+    def test_json_backend_uses_its_own_file_under_the_configured_base_path(self, tmp_path):
+        reset_document_cache()
+        register_json_storage()
+        base_path = tmp_path / "orb-data"
+        store = _configured_store(
+            "json", StorageConfig.model_validate({"json_strategy": {"base_path": str(base_path)}})
+        )
+
+        store.update("svc", lambda state: state.update(failure_count=2))
+
+        assert (base_path / "circuit_breakers.json").is_file()
+        assert not (base_path / "request_database.json").exists()
+        stored = JSONStorageStrategy(
+            file_path=str(base_path / "circuit_breakers.json"), entity_type="circuit_breakers"
+        ).find_by_id("circuit_breaker:svc")
+        assert _stored(stored)["failure_count"] == 2
+        reset_document_cache()
+
+    def test_sql_backend_uses_its_own_table_in_the_configured_database(self, tmp_path):
+        register_sql_storage()
+        database = tmp_path / "orb.db"
+        store = _configured_store(
+            "sql",
+            StorageConfig.model_validate(
+                {"sql_strategy": {"type": "sqlite", "name": str(database)}}
+            ),
+        )
+        try:
+            assert store.try_acquire_probe("svc", "host:1", 30.0, now=100.0)
+            assert _stored(store.get("svc"))["probe_owner"] == "host:1"
+
+            runtime = get_sql_runtime_pool().acquire(f"sqlite:///{database}")
+            assert runtime.connection_manager.table_exists("circuit_breakers")
+            assert not runtime.connection_manager.table_exists("generic_storage")
+        finally:
+            get_sql_runtime_pool().dispose_all()
+
+
+@pytest.mark.unit
+class TestSharedCircuitBreaker:
+    def test_open_circuit_is_seen_by_a_new_breaker(self, file_store):
+        now = time.time()
+        breaker = _breaker(file_store)
+        breaker.record_failure(now)
+        breaker.record_failure(now)
+
+        with pytest.raises(CircuitBreakerOpenError):
+            _breaker(FileCircuitStateStore(str(file_store.path.parent))).allow_request()
+
+    def test_only_the_lease_holder_probes_a_half_open_circuit(self, file_store, monkeypatch):
+        _open_with_elapsed_reset_timeout(file_store)
+        monkeypatch.setattr("time.time", lambda: 100.0)
+        prober = _breaker(file_store, owner="host:1")
+        other = _breaker(file_store, owner="host:2")
+
+        prober.allow_request()
+        with pytest.raises(CircuitBreakerOpenError):
+            other.allow_request()
+
+        prober.record_success()
+        other.allow_request()
+        assert file_store.get("svc")["state"] == CircuitState.CLOSED.value
+
+    def test_failed_probe_reopens_the_circuit(self, file_store, monkeypatch):
+        _open_with_elapsed_reset_timeout(file_store)
+        monkeypatch.setattr("time.time", lambda: 100.0)
+        prober = _breaker(file_store)
+        prober.allow_request()
+
+        prober.record_failure(100.0)
+
+        state = file_store.get("svc")
+        assert state["state"] == CircuitState.OPEN.value
+        assert state["probe_owner"] is None
+
+    def test_retry_decorator_fails_fast_while_open(self):
+        calls = []
+
+        @retry(
+            strategy="circuit_breaker",
+            service="flaky",
+            max_attempts=0,
+            failure_threshold=1,
+            reset_timeout=60,
+        )
+        def call_service():
+            calls.append(1)
+            raise RuntimeError("unavailable")
+
+        with pytest.raises(CircuitBreakerOpenError):
+            call_service()
+        with pytest.raises(CircuitBreakerOpenError):
+            call_service()
+
+        assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_create_circuit_state_store_backends(tmp_path):
+    assert isinstance(create_circuit_state_store("memory"), InMemoryCircuitStateStore)
+    assert isinstance(
+        create_circuit_state_store("file", state_dir=str(tmp_path)), FileCircuitStateStore
+    )
+    with pytest.raises(ValueError):
+        create_circuit_state_store("storage")
+    with pytest.raises(ValueError):
+        create_circuit_state_store("redis")
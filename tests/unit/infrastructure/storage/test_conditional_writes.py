@@ -0,0 +1,110 @@
+"""Tests for conditional writes (save_if) on the JSON and SQL strategies."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from orb.infrastructure.storage.base.strategy import BaseStorageStrategy, matches_condition
+from orb.infrastructure.storage.components.document_cache import reset_document_cache
+from orb.infrastructure.storage.components.sql_query_builder import SQLQueryBuilder
+from orb.infrastructure.storage.exceptions import StorageError
+from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
+from orb.infrastructure.storage.sql.runtime import SQLStorageRuntimePool, reset_sql_runtime_pool
+from orb.infrastructure.storage.sql.strategy import SQLStorageStrategy
+
+COLUMNS = {
+    "id": "VARCHAR(255) PRIMARY KEY",
+    "owner": "VARCHAR(255)",
+    "expires_at": "FLOAT",
+    "version": "INTEGER",
+}
+
+
+@pytest.fixture(params=["json", "sql"])
+def strategy(request, tmp_path):
+    reset_document_cache()
+    reset_sql_runtime_pool()
+    if request.param == "json":
+        yield JSONStorageStrategy(file_path=str(tmp_path / "leases.json"), entity_type="leases")
+    else:
+        runtime = SQLStorageRuntimePool().acquire(f"sqlite:///{tmp_path / 'orb.db'}")
+        yield SQLStorageStrategy(
+            runtime.connection_manager.config,
+            "leases",
+            COLUMNS,
+            connection_manager=runtime.connection_manager,
+        )
+        runtime.dispose()
+    reset_sql_runtime_pool()
+    reset_document_cache()
+
+
+def _lease(owner, version, expires_at=100.0):
+    return {"id": "svc", "owner": owner, "expires_at": expires_at, "version": version}
+
+
+@pytest.mark.unit
+class TestSaveIf:
+    def test_new_entity_is_written_only_once(self, strategy):
+        assert strategy.save_if("svc", _lease("host:1", 1), None)
+        assert not strategy.save_if("svc", _lease("host:2", 1), None)
+
+        assert strategy.find_by_id("svc")["owner"] == "host:1"
+
+    def test_update_requires_the_expected_version(self, strategy):
+        strategy.save_if("svc", _lease("host:1", 1), None)
+
+        assert strategy.save_if("svc", _lease("host:2", 2), {"version": 1})
+        assert not strategy.save_if("svc", _lease("host:3", 2), {"version": 1})
+
+        assert strategy.find_by_id("svc")["owner"] == "host:2"
+
+    def test_none_condition_value_requires_null(self, strategy):
+        strategy.save_if("svc", _lease(None, 1), None)
+
+        assert strategy.save_if("svc", _lease("host:1", 2), {"owner": None})
+        assert not strategy.save_if("svc", _lease("host:2", 3), {"owner": None})
+
+    def test_range_condition(self, strategy):
+        strategy.save_if("svc", _lease("host:1", 1, expires_at=100.0), None)
+
+        assert not strategy.save_if("svc", _lease("host:2", 2), {"expires_at": {"$lte": 90.0}})
+        assert strategy.save_if("svc", _lease("host:2", 2), {"expires_at": {"$lte": 110.0}})
+
+    def test_missing_entity_never_matches_a_condition(self, strategy):
+        assert not strategy.save_if("svc", _lease("host:1", 1), {"version": None})
+
+        assert strategy.find_by_id("svc") is None
+
+
+@pytest.mark.unit
+def test_conditional_update_query():
+    builder = SQLQueryBuilder("leases", COLUMNS)
+
+    query, params = builder.build_conditional_update(
+        {"owner": "host:1", "version": 2}, "id", "svc", {"version": 1, "owner": None}
+    )
+
+    assert query == (
+        "UPDATE leases SET owner = :owner, version = :version WHERE id = :entity_id "
+        "AND owner IS NULL AND version = :version_eq"
+    )
+    assert params == {"owner": "host:1", "version": 2, "entity_id": "svc", "version_eq": 1}
+
+
+@pytest.mark.unit
+def test_matches_condition():
+    entity = {"owner": "host:1", "expires_at": 100.0}
+
+    assert matches_condition(entity, {"owner": "host:1", "version": None})
+    assert matches_condition(entity, {"expires_at": {"$lte": 100.0}})
+    assert not matches_condition(entity, {"owner": None})
+    assert not matches_condition(None, {})
+
+
+@pytest.mark.unit
+def test_strategies_without_conditional_writes_raise():
+    strategy = MagicMock(spec=BaseStorageStrategy)
+
+    with pytest.raises(StorageError):
+        BaseStorageStrategy.save_if(strategy, "svc", {}, None)
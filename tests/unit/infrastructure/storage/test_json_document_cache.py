@@ -0,0 +1,184 @@
+"""Tests for the process-wide parsed-document cache used by JSON storage."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from orb.infrastructure.storage.components.document_cache import (
+    DocumentCache,
+    get_document_cache,
+    reset_document_cache,
+)
+from orb.infrastructure.storage.components.file_manager import FileManager
+from orb.infrastructure.storage.components.serialization_manager import JSONSerializer
+from orb.infrastructure.storage.exceptions import StorageError
+from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
+
+
+@pytest.fixture(autouse=True)
+def _isolated_document_cache():
+    reset_document_cache()
+    yield
+    reset_document_cache()
+
+
+def _make_strategy(tmp_path, entity_type="requests") -> JSONStorageStrategy:
+    return JSONStorageStrategy(file_path=str(tmp_path / "data.json"), entity_type=entity_type)
+
+
+@pytest.mark.unit
+class TestDocumentCache:
+    """Entries are served only while the file signature is unchanged."""
+
+    def test_hit_requires_matching_signature(self):
+        cache = DocumentCache()
+        cache.put("/data.json", (1, 10, 100), {"a": 1})
+
+        assert cache.get("/data.json", (1, 10, 100)) == {"a": 1}
+        assert cache.get("/data.json", (2, 10, 100)) is None
+        # Stale entry was dropped
+        assert cache.get("/data.json", (1, 10, 100)) is None
+
+    def test_missing_file_never_hits(self):
+        cache = DocumentCache()
+        cache.put("/data.json", (1, 10, 100), {"a": 1})
+
+        assert cache.get("/data.json", None) is None
+
+    def test_least_recently_used_entry_evicted(self):
+        cache = DocumentCache(max_entries=2)
+        cache.put("/a.json", (1, 1, 1), {})
+        cache.put("/b.json", (1, 1, 2), {})
+        cache.get("/a.json", (1, 1, 1))
+
+        cache.put("/c.json", (1, 1, 3), {})
+
+        assert cache.get("/a.json", (1, 1, 1)) == {}
+        assert cache.get("/b.json", (1, 1, 2)) is None
+
+    def test_stats(self):
+        cache = DocumentCache()
+        cache.put("/a.json", (1, 1, 1), {})
+        cache.get("/a.json", (1, 1, 1))
+        cache.get("/b.json", (1, 1, 2))
+
+        stats = cache.get_stats()
+
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_global_cache_is_singleton(self):
+        assert get_document_cache() is get_document_cache()
+
+
+@pytest.mark.unit
+class TestFileSignature:
+    """Atomic writes report the signature of the version they published."""
+
+    def test_write_returns_signature_of_published_file(self, tmp_path):
+        manager = FileManager(str(tmp_path / "data.json"), backup_enabled=False)
+
+        signature = manager.write_file("{}")
+
+        assert signature == manager.get_signature()
+        assert manager.read_file_with_signature() == ("{}", signature)
+
+    def test_missing_file_has_no_signature(self, tmp_path):
+        manager = FileManager(str(tmp_path / "data.json"), backup_enabled=False)
+
+        assert manager.get_signature() is None
+        assert manager.read_file_with_signature() == ("", None)
+
+
+@pytest.mark.unit
+class TestJSONStrategySharing:
+    """Strategies on the same file share one parsed document."""
+
+    def test_unchanged_file_parsed_once_across_instances(self, tmp_path):
+        (tmp_path / "data.json").write_text(json.dumps({"requests": {"req-1": {"id": 1}}}))
+
+        with patch.object(
+            FileManager,
+            "read_file_with_signature",
+            autospec=True,
+            side_effect=FileManager.read_file_with_signature,
+        ) as mock_read:
+            for _ in range(5):
+                assert _make_strategy(tmp_path).find_by_id("req-1") == {"id": 1}
+
+        assert mock_read.call_count == 1
+
+    def test_own_write_visible_without_reread(self, tmp_path):
+        writer = _make_strategy(tmp_path)
+        reader = _make_strategy(tmp_path)
+        writer.save("req-1", {"status": "pending"})
+
+        with patch.object(FileManager, "read_file_with_signature") as mock_read:
+            assert reader.find_by_id("req-1") == {"status": "pending"}
+
+        mock_read.assert_not_called()
+
+    def test_own_write_publishes_the_document_without_parsing_it(self, tmp_path):
+        writer = _make_strategy(tmp_path)
+
+        with patch.object(JSONSerializer, "deserialize") as mock_deserialize:
+            writer.save("req-1", {"status": "pending"})
+
+        mock_deserialize.assert_not_called()
+        assert writer.find_by_id("req-1") == {"status": "pending"}
+        assert json.loads((tmp_path / "data.json").read_text()) == {
+            "requests": {"req-1": {"status": "pending"}}
+        }
+
+    def test_external_write_invalidates_entry(self, tmp_path):
+        strategy = _make_strategy(tmp_path)
+        strategy.save("req-1", {"status": "pending"})
+
+        # Another process replaces the file atomically
+        other = tmp_path / "other.json"
+        other.write_text(json.dumps({"requests": {"req-1": {"status": "complete"}}}))
+        other.replace(tmp_path / "data.json")
+
+        assert strategy.find_by_id("req-1") == {"status": "complete"}
+
+    def test_sections_of_one_file_share_document(self, tmp_path):
+        requests = _make_strategy(tmp_path, "requests")
+        machines = _make_strategy(tmp_path, "machines")
+
+        requests.save("req-1", {"status": "pending"})
+        machines.save("i-1", {"status": "running"})
+
+        assert requests.find_by_id("req-1") == {"status": "pending"}
+        assert machines.find_by_id("i-1") == {"status": "running"}
+
+    def test_failed_write_leaves_cached_document_untouched(self, tmp_path):
+        strategy = _make_strategy(tmp_path)
+        strategy.save("req-1", {"status": "pending"})
+
+        with (
+            patch.object(FileManager, "write_file", side_effect=OSError("disk full")),
+            pytest.raises(StorageError),
+        ):
+            strategy.save("req-2", {"status": "pending"})
+
+        assert strategy.find_all() == {"req-1": {"status": "pending"}}
+
+    def test_find_by_ids_keeps_empty_records_and_has_its_own_metric(self, tmp_path):
+        metrics = MagicMock()
+        strategy = JSONStorageStrategy(
+            file_path=str(tmp_path / "data.json"), entity_type="requests", metrics=metrics
+        )
+        strategy.save_batch({"req-1": {}, "req-2": {"status": "pending"}})
+        metrics.reset_mock()
+
+        assert strategy.find_by_ids(["req-1", "req-2", "req-3"]) == {
+            "req-1": {},
+            "req-2": {"status": "pending"},
+        }
+        strategy.find_all()
+
+        counters = [c.args[0] for c in metrics.increment_counter.call_args_list]
+        assert counters == ["storage.json.find_by_ids_total", "storage.json.find_all_total"]
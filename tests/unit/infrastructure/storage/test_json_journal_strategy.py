@@ -0,0 +1,193 @@
+"""Tests for the append-only journal JSON storage strategy."""
+
+import json
+
+import pytest
+
+from orb.infrastructure.storage.json.journal_strategy import JSONJournalStorageStrategy
+from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
+
+
+def _make_strategy(tmp_path, **kwargs) -> JSONJournalStorageStrategy:
+    options = {"entity_type": "requests", "background_compaction": False}
+    options.update(kwargs)
+    return JSONJournalStorageStrategy(file_path=str(tmp_path / "requests.json"), **options)
+
+
+@pytest.mark.unit
+class TestJournalWrites:
+    """Writes append records instead of rewriting the snapshot."""
+
+    def test_save_appends_without_touching_snapshot(self, tmp_path):
+        strategy = _make_strategy(tmp_path)
+
+        strategy.save("req-1", {"request_id": "req-1", "status": "pending"})
+
+        assert not (tmp_path / "requests.json").exists()
+        lines = strategy.journal.journal_path.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0]) == {
+            "op": "put",
+            "id": "req-1",
+            "data": {"request_id": "req-1", "status": "pending"},
+        }
+
+    def test_reads_reflect_journaled_changes(self, tmp_path):
+        strategy = _make_strategy(tmp_path)
+
+        strategy.save("req-1", {"request_id": "req-1", "status": "pending"})
+        strategy.save("req-2", {"request_id": "req-2", "status": "running"})
+        strategy.save("req-1", {"request_id": "req-1", "status": "complete"})
+        strategy.delete("req-2")
+
+        assert strategy.find_by_id("req-1") == {"request_id": "req-1", "status": "complete"}
+        assert strategy.find_by_id("req-2") is None
+        assert strategy.count() == 1
+        assert strategy.find_by_criteria({"status": "complete"}) == [
+            {"request_id": "req-1", "status": "complete"}
+        ]
+
+    def test_batch_operations_append_one_record_per_entity(self, tmp_path):
+        strategy = _make_strategy(tmp_path)
+
+        strategy.save_batch({f"req-{i}": {"request_id": f"req-{i}"} for i in range(3)})
+        strategy.delete_batch(["req-0", "req-1"])
+
+        assert len(strategy.journal.journal_path.read_text().splitlines()) == 5
+        assert set(strategy.find_all()) == {"req-2"}
+
+    def test_delete_missing_entity_is_noop(self, tmp_path):
+        strategy = _make_strategy(tmp_path)
+
+        strategy.delete("missing")
+
+        assert strategy.journal.size() == 0
+
+
+@pytest.mark.unit
+class TestJournalReplay:
+    """State is rebuilt from snapshot plus journal, including other writers."""
+
+    def test_new_instance_replays_snapshot_and_journal(self, tmp_path):
+        (tmp_path / "requests.json").write_text(
+            json.dumps({"requests": {"req-0": {"request_id": "req-0"}}})
+        )
+        writer = _make_strategy(tmp_path)
+        writer.save("req-1", {"request_id": "req-1"})
+
+        reader = _make_strategy(tmp_path)
+
+        assert set(reader.find_all()) == {"req-0", "req-1"}
+
+    def test_reader_picks_up_records_from_other_writer(self, tmp_path):
+        writer = _make_strategy(tmp_path)
+        reader = _make_strategy(tmp_path)
+        writer.save("req-1", {"request_id": "req-1"})
+        assert reader.exists("req-1")
+
+        writer.save("req-2", {"request_id": "req-2"})
+
+        assert reader.exists("req-2")
+        assert reader._journal_offset == writer.journal.size()
+
+    def test_torn_trailing_record_is_ignored(self, tmp_path):
+        strategy = _make_strategy(tmp_path)
+        strategy.save("req-1", {"request_id": "req-1"})
+        with open(strategy.journal.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "put", "id": "req-2", "da')
+
+        reader = _make_strategy(tmp_path)
+
+        assert set(reader.find_all()) == {"req-1"}
+
+
+@pytest.mark.unit
+class TestJournalCompaction:
+    """Compaction folds the journal into a snapshot readable by the plain strategy."""
+
+    def test_compaction_triggered_by_threshold(self, tmp_path):
+        strategy = _make_strategy(tmp_path, compact_threshold=3)
+
+        for i in range(3):
+            strategy.save(f"req-{i}", {"request_id": f"req-{i}"})
+
+        assert strategy.journal.size() == 0
+        snapshot = json.loads((tmp_path / "requests.json").read_text())
+        assert set(snapshot["requests"]) == {"req-0", "req-1", "req-2"}
+
+    def test_snapshot_compatible_with_snapshot_mode(self, tmp_path):
+        strategy = _make_strategy(tmp_path)
+        strategy.save("req-1", {"request_id": "req-1", "status": "pending"})
+        strategy.compact()
+
+        plain = JSONStorageStrategy(
+            file_path=str(tmp_path / "requests.json"), entity_type="requests"
+        )
+
+        assert plain.find_by_id("req-1") == {"request_id": "req-1", "status": "pending"}
+
+    def test_compaction_preserves_other_sections(self, tmp_path):
+        (tmp_path / "requests.json").write_text(
+            json.dumps({"machines": {"i-1": {"machine_id": "i-1"}}})
+        )
+        strategy = _make_strategy(tmp_path)
+        strategy.save("req-1", {"request_id": "req-1"})
+
+        strategy.compact()
+
+        snapshot = json.loads((tmp_path / "requests.json").read_text())
+        assert snapshot["machines"] == {"i-1": {"machine_id": "i-1"}}
+        assert snapshot["requests"] == {"req-1": {"request_id": "req-1"}}
+
+    def test_other_instance_reloads_after_compaction(self, tmp_path):
+        writer = _make_strategy(tmp_path)
+        reader = _make_strategy(tmp_path)
+        writer.save("req-1", {"request_id": "req-1"})
+        assert reader.exists("req-1")
+
+        writer.compact()
+        writer.save("req-2", {"request_id": "req-2"})
+
+        assert set(reader.find_all()) == {"req-1", "req-2"}
+
+    def test_background_compaction(self, tmp_path):
+        strategy = _make_strategy(tmp_path, compact_threshold=2, background_compaction=True)
+
+        strategy.save("req-1", {"request_id": "req-1"})
+        strategy.save("req-2", {"request_id": "req-2"})
+        strategy.cleanup()  # waits for in-flight compaction
+
+        snapshot = json.loads((tmp_path / "requests.json").read_text())
+        assert set(snapshot["requests"]) == {"req-1", "req-2"}
+
+    def test_recovery_rolls_backup_forward_with_retired_journal(self, tmp_path):
+        strategy = _make_strategy(tmp_path)
+        strategy.save("req-1", {"request_id": "req-1"})
+        strategy.compact()  # backup: none yet; snapshot: req-1
+        strategy.save("req-2", {"request_id": "req-2"})
+        strategy.compact()  # backup: req-1; retired journal: req-2
+        strategy.save("req-3", {"request_id": "req-3"})
+
+        (tmp_path / "requests.json").write_text("{corrupt")
+        recovered = _make_strategy(tmp_path)
+
+        assert set(recovered.find_all()) == {"req-1", "req-2", "req-3"}
+
+
+@pytest.mark.unit
+def test_unit_of_work_uses_journal_strategy_when_configured(tmp_path):
+    from orb.infrastructure.storage.json.unit_of_work import JSONUnitOfWork
+
+    uow = JSONUnitOfWork(data_dir=str(tmp_path), write_mode="journal")
+
+    assert isinstance(uow.requests.storage_strategy, JSONJournalStorageStrategy)
+    assert isinstance(uow.machines.storage_strategy, JSONJournalStorageStrategy)
+
+
+@pytest.mark.unit
+def test_write_mode_validation():
+    from orb.config.schemas.storage_schema import JsonStrategyConfig
+
+    assert JsonStrategyConfig(write_mode="journal").write_mode == "journal"
+    with pytest.raises(ValueError):
+        JsonStrategyConfig(write_mode="append")
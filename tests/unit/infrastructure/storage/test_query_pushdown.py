@@ -0,0 +1,464 @@
+"""Tests for range criteria, query specs, SQL indexes and grouped counts pushed down to storage."""
+
+import logging
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text
+
+from orb.domain.base.query_spec import QuerySpec
+from orb.domain.request.aggregate import Request
+from orb.domain.request.value_objects import RequestId, RequestStatus, RequestType
+from orb.domain.services.filter_service import FilterOperator
+from orb.domain.services.generic_filter_service import GenericFilter
+from orb.infrastructure.storage.base.strategy import matches_range
+from orb.infrastructure.storage.components.document_cache import reset_document_cache
+from orb.infrastructure.storage.components.sql_query_builder import SQLQueryBuilder
+from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
+from orb.infrastructure.storage.repositories.request_repository import RequestRepositoryImpl
+from orb.infrastructure.storage.sql.runtime import SQLStorageRuntimePool, reset_sql_runtime_pool
+from orb.infrastructure.storage.sql.strategy import SQLStorageStrategy
+
+BASE_TIME = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_storage_state():
+    reset_document_cache()
+    reset_sql_runtime_pool()
+    yield
+    reset_document_cache()
+    reset_sql_runtime_pool()
+
+
+def _request_rows(count: int) -> dict[str, dict]:
+    statuses = ["pending", "in_progress", "complete", "failed"]
+    return {
+        f"req-{n}": {
+            "request_id": f"req-{n}",
+            "template_id": "tpl-1",
+            "status": statuses[n % len(statuses)],
+            "created_at": (BASE_TIME + timedelta(hours=n)).isoformat(),
+        }
+        for n in range(count)
+    }
+
+
+@pytest.mark.unit
+class TestSQLQueryBuilderPushdown:
+    """Range operators, grouped counts and index DDL are generated as SQL."""
+
+    def _builder(self) -> SQLQueryBuilder:
+        return SQLQueryBuilder(
+            "requests",
+            {"request_id": "TEXT PRIMARY KEY", "status": "TEXT", "created_at": "TIMESTAMP"},
+        )
+
+    def test_range_criteria_become_comparisons(self):
+        query, params = self._builder().build_select_by_criteria(
+            {"created_at": {"$gte": "2026-01-01", "$lt": "2026-02-01"}}
+        )
+
+        assert "created_at >= :created_at_gte AND created_at < :created_at_lt" in query
+        assert params == {"created_at_gte": "2026-01-01", "created_at_lt": "2026-02-01"}
+
+    def test_grouped_count(self):
+        query, params = self._builder().build_count_by_criteria(
+            {"status": "pending"}, group_by="status"
+        )
+
+        assert query == (
+            "SELECT status, COUNT(*) FROM requests WHERE status = :status_eq GROUP BY status"
+        )
+        assert params == {"status_eq": "pending"}
+
+    def test_grouped_count_rejects_unknown_column(self):
+        with pytest.raises(ValueError):
+            self._builder().build_count_by_criteria(group_by="owner")
+
+    def test_indexes_skip_primary_key_and_missing_columns(self):
+        statements = self._builder().build_create_indexes()
+
+        assert statements == [
+            "CREATE INDEX IF NOT EXISTS idx_requests_created_at ON requests (created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_requests_status ON requests (status)",
+        ]
+
+    def test_mysql_indexes_skip_existing_without_if_not_exists(self):
+        statements = self._builder().build_create_indexes(
+            dialect="mysql", existing={"idx_requests_status"}
+        )
+
+        assert statements == ["CREATE INDEX idx_requests_created_at ON requests (created_at)"]
+
+    def test_empty_in_matches_nothing(self):
+        query, _ = self._builder().build_select_by_criteria({"status": {"$in": []}})
+
+        assert query.endswith("WHERE 1 = 0")
+
+
+@pytest.mark.unit
+class TestSQLStrategyPushdown:
+    """SQLite-backed strategies create indexes and answer range and grouped queries."""
+
+    def _requests_strategy(self, tmp_path):
+        runtime = SQLStorageRuntimePool().acquire(f"sqlite:///{tmp_path / 'orb.db'}")
+        return runtime, runtime.get_strategy("requests")
+
+    def test_indexes_created_at_bootstrap(self, tmp_path):
+        runtime, _ = self._requests_strategy(tmp_path)
+
+        with runtime.engine.connect() as conn:
+            names = {
+                row[0]
+                for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))
+            }
+
+        assert {
+            "idx_requests_created_at",
+            "idx_requests_status",
+            "idx_machines_request_id",
+            "idx_machines_status",
+        } <= names
+
+    def test_mysql_bootstrap_creates_only_missing_indexes(self):
+        connection_manager = MagicMock()
+        connection_manager.engine.dialect.name = "mysql"
+        connection_manager.table_exists.return_value = True
+        connection_manager.execute_query.side_effect = lambda query, params=None: (
+            [("PRIMARY",), ("idx_requests_status",)] if query.startswith("SELECT") else None
+        )
+
+        SQLStorageStrategy(
+            {},
+            "requests",
+            {
+                "request_id": "VARCHAR(255) PRIMARY KEY",
+                "status": "VARCHAR(50)",
+                "created_at": "TIMESTAMP",
+            },
+            connection_manager=connection_manager,
+        )
+
+        executed = [call.args for call in connection_manager.execute_query.call_args_list]
+        assert executed == [
+            (
+                "SELECT DISTINCT index_name FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = :table_name",
+                {"table_name": "requests"},
+            ),
+            ("CREATE INDEX idx_requests_created_at ON requests (created_at)",),
+        ]
+
+    def test_range_query_and_grouped_count(self, tmp_path):
+        _, strategy = self._requests_strategy(tmp_path)
+        strategy.save_batch(_request_rows(8))
+        window = {
+            "created_at": {
+                "$gte": (BASE_TIME + timedelta(hours=2)).isoformat(),
+                "$lte": (BASE_TIME + timedelta(hours=5)).isoformat(),
+            }
+        }
+
+        found = strategy.find_by_criteria(window)
+
+        assert sorted(row["request_id"] for row in found) == ["req-2", "req-3", "req-4", "req-5"]
+        assert strategy.count_by_group("status", window) == {
+            "complete": 1,
+            "failed": 1,
+            "pending": 1,
+            "in_progress": 1,
+        }
+
+
+@pytest.mark.unit
+class TestJSONRangeCriteria:
+    """File-based strategies evaluate the same range criteria in memory."""
+
+    def test_range_and_grouped_count(self, tmp_path):
+        strategy = JSONStorageStrategy(
+            file_path=str(tmp_path / "requests.json"), entity_type="requests"
+        )
+        strategy.save_batch(_request_rows(8))
+        window = {"created_at": {"$gt": (BASE_TIME + timedelta(hours=5)).isoformat()}}
+
+        assert sorted(r["request_id"] for r in strategy.find_by_criteria(window)) == [
+            "req-6",
+            "req-7",
+        ]
+        assert strategy.count_by_group("status", window) == {"complete": 1, "failed": 1}
+
+    def test_mismatched_types_do_not_match(self, tmp_path):
+        strategy = JSONStorageStrategy(
+            file_path=str(tmp_path / "requests.json"), entity_type="requests"
+        )
+        strategy.save("req-1", {"request_id": "req-1", "created_at": None})
+
+        assert strategy.find_by_criteria({"created_at": {"$gte": "2026-01-01"}}) == []
+
+
+@pytest.mark.unit
+class TestRequestRepositoryDateRange:
+    """Date-range queries and metrics use storage criteria instead of loading everything."""
+
+    def _repository(self, tmp_path, backend: str = "json") -> RequestRepositoryImpl:
+        if backend == "sql":
+            runtime = SQLStorageRuntimePool().acquire(f"sqlite:///{tmp_path / 'orb.db'}")
+            strategy = runtime.get_strategy("requests")
+        else:
+            strategy = JSONStorageStrategy(
+                file_path=str(tmp_path / "requests.json"), entity_type="requests"
+            )
+        repository = RequestRepositoryImpl(strategy)
+        statuses = [RequestStatus.PENDING, RequestStatus.COMPLETED, RequestStatus.FAILED]
+        for n in range(6):
+            repository.save(
+                Request(
+                    request_id=RequestId(value=f"req-00000000-0000-0000-0000-00000000000{n}"),
+                    request_type=RequestType.ACQUIRE,
+                    provider_type="aws",
+                    template_id="tpl-1",
+                    requested_count=1,
+                    status=statuses[n % len(statuses)],
+                    created_at=BASE_TIME + timedelta(days=n),
+                )
+            )
+        return repository
+
+    def test_find_by_date_range_is_inclusive(self, tmp_path):
+        repository = self._repository(tmp_path)
+
+        found = repository.find_by_date_range(
+            BASE_TIME + timedelta(days=1), BASE_TIME + timedelta(days=3)
+        )
+
+        assert sorted(r.created_at for r in found) == [
+            BASE_TIME + timedelta(days=n) for n in (1, 2, 3)
+        ]
+
+    def test_find_by_date_range_normalizes_offsets(self, tmp_path):
+        repository = self._repository(tmp_path)
+        plus_two = timezone(timedelta(hours=2))
+
+        found = repository.find_by_date_range(
+            (BASE_TIME + timedelta(days=2)).astimezone(plus_two),
+            (BASE_TIME + timedelta(days=2)).astimezone(plus_two),
+        )
+
+        assert [r.created_at for r in found] == [BASE_TIME + timedelta(days=2)]
+
+    def test_metrics_and_counts(self, tmp_path):
+        repository = self._repository(tmp_path)
+        start, end = BASE_TIME, BASE_TIME + timedelta(days=4)
+
+        assert repository.get_metrics_by_date_range(start, end) == {
+            "total": 5,
+            "completed": 2,
+            "failed": 1,
+            "in_progress": 0,
+            "pending": 2,
+        }
+        assert repository.count_by_date_range(start, end) == 5
+        assert repository.count_by_status_and_date_range(RequestStatus.FAILED, start, end) == 1
+
+    @pytest.mark.parametrize("backend", ["json", "sql"])
+    def test_counts_match_find_by_date_range_for_offset_records(self, tmp_path, backend):
+        repository = self._repository(tmp_path, backend)
+        # 2026-03-02T01:30+05:00 is 2026-03-01T20:30Z: its string sorts after a UTC
+        # bound that its instant precedes
+        plus_five = timezone(timedelta(hours=5))
+        strategy = repository._get_storage()
+        strategy.save(
+            "req-00000000-0000-0000-0000-0000000000ff",
+            {
+                **strategy.find_by_id("req-00000000-0000-0000-0000-000000000000"),
+                "request_id": "req-00000000-0000-0000-0000-0000000000ff",
+                "status": "failed",
+                "created_at": datetime(2026, 3, 2, 1, 30, tzinfo=plus_five).isoformat(),
+            },
+        )
+
+        for start, end in (
+            (datetime(2026, 3, 1, 21, 0, tzinfo=timezone.utc), BASE_TIME + timedelta(days=10)),
+            (BASE_TIME - timedelta(days=10), datetime(2026, 3, 1, 20, 30, tzinfo=timezone.utc)),
+            (BASE_TIME - timedelta(days=10), BASE_TIME + timedelta(days=10)),
+        ):
+            found = repository.find_by_date_range(start, end)
+            failed = [r for r in found if r.status == RequestStatus.FAILED]
+            assert repository.count_by_date_range(start, end) == len(found)
+            assert repository.count_by_status_and_date_range(
+                RequestStatus.FAILED, start, end
+            ) == len(failed)
+            assert repository.get_metrics_by_date_range(start, end)["failed"] == len(failed)
+
+
+@pytest.mark.unit
+class TestRangeMatching:
+    """In-memory range criteria compare datetime bounds as instants."""
+
+    WINDOW = {"$gte": BASE_TIME, "$lte": BASE_TIME + timedelta(hours=1)}
+
+    def test_offset_strings_and_datetimes_compare_as_instants(self):
+        plus_five = timezone(timedelta(hours=5))
+
+        assert matches_range(BASE_TIME.astimezone(plus_five).isoformat(), self.WINDOW)
+        assert matches_range(BASE_TIME.replace(tzinfo=None), self.WINDOW)
+        assert matches_range("2026-03-01T12:30:00Z", self.WINDOW)
+        assert not matches_range((BASE_TIME - timedelta(seconds=1)).isoformat(), self.WINDOW)
+
+    def test_unparseable_timestamps_never_match_and_are_logged(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            assert not matches_range("yesterday", self.WINDOW)
+            assert not matches_range(None, self.WINDOW)
+
+        assert "yesterday" in caplog.text
+
+
+def _spec_rows(count: int) -> dict[str, dict]:
+    rows = _request_rows(count)
+    for n, row in enumerate(rows.values()):
+        row["template_id"] = f"tpl-{n % 3}"
+        row["request_type"] = "return" if n % 2 else "acquire"
+    return rows
+
+
+def _ids(rows: list[dict]) -> list[str]:
+    return [row["request_id"] for row in rows]
+
+
+@pytest.mark.unit
+class TestSQLQueryBuilderSpec:
+    """Query specs become WHERE, ORDER BY and LIMIT/OFFSET clauses."""
+
+    def _builder(self) -> SQLQueryBuilder:
+        return SQLQueryBuilder(
+            "requests",
+            {
+                "request_id": "VARCHAR(255) PRIMARY KEY",
+                "status": "VARCHAR(50)",
+                "metadata": "TEXT",
+                "created_at": "TIMESTAMP",
+            },
+        )
+
+    def test_filters_and_paging_are_pushed_down(self):
+        spec = QuerySpec(
+            criteria={"status": "pending"},
+            filters=(GenericFilter("request_id", FilterOperator.CONTAINS, "50%_!"),),
+            sort_by="created_at",
+            descending=True,
+            limit=10,
+            offset=20,
+        )
+
+        query, count_query, params = self._builder().build_select_by_spec(
+            spec, spec.criteria, "request_id"
+        )
+
+        assert query == (
+            "SELECT * FROM requests WHERE status = :status_eq"
+            " AND (LOWER(request_id) LIKE :qf_0 ESCAPE '!')"
+            " ORDER BY created_at IS NULL DESC, created_at DESC, request_id DESC"
+            " LIMIT :q_limit OFFSET :q_offset"
+        )
+        assert count_query == (
+            "SELECT COUNT(*) FROM requests WHERE status = :status_eq"
+            " AND (LOWER(request_id) LIKE :qf_0 ESCAPE '!')"
+        )
+        assert params["qf_0"] == "%50!%!_!!%"
+        assert params["q_limit"] == 11
+
+    def test_negated_wildcard_excludes_missing_values(self):
+        spec = QuerySpec(filters=(GenericFilter("status", FilterOperator.NOT_EQUAL, "Fail*"),))
+
+        query, _, params = self._builder().build_select_by_spec(spec, {}, "request_id")
+
+        assert "(status IS NOT NULL AND NOT (LOWER(status) LIKE :qf_0 ESCAPE '!'))" in query
+        assert params["qf_0"] == "fail%"
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            QuerySpec(filters=(GenericFilter("status", FilterOperator.REGEX, "^p"),)),
+            QuerySpec(filters=(GenericFilter("metadata", FilterOperator.CONTAINS, "x"),)),
+            QuerySpec(filters=(GenericFilter("status", FilterOperator.EXACT, "p?nding"),)),
+            QuerySpec(criteria={"owner": "me"}),
+            QuerySpec(sort_by="owner"),
+        ],
+    )
+    def test_specs_without_sql_equivalent_are_rejected(self, spec):
+        builder = self._builder()
+
+        assert not builder.supports_query_spec(spec)
+        with pytest.raises(ValueError):
+            builder.build_select_by_spec(spec, spec.criteria, "request_id")
+
+
+@pytest.mark.unit
+class TestQuerySpecExecution:
+    """SQL and JSON strategies return the same pages for the same spec."""
+
+    @pytest.fixture(params=["sql", "json"])
+    def strategy(self, request, tmp_path):
+        if request.param == "sql":
+            runtime = SQLStorageRuntimePool().acquire(f"sqlite:///{tmp_path / 'orb.db'}")
+            strategy = runtime.get_strategy("requests")
+        else:
+            strategy = JSONStorageStrategy(
+                file_path=str(tmp_path / "requests.json"), entity_type="requests"
+            )
+        strategy.save_batch(_spec_rows(12))
+        return strategy
+
+    def test_filters_apply_before_paginating(self, strategy):
+        spec = QuerySpec(
+            criteria={"request_type": "acquire"},
+            filters=(GenericFilter("template_id", FilterOperator.NOT_EQUAL, "TPL-0"),),
+            sort_by="created_at",
+            limit=2,
+            offset=1,
+        )
+
+        result = strategy.query(spec)
+
+        # Acquire requests are even; tpl-0 holds every third, leaving 2, 4, 8, 10
+        assert _ids(result.items) == ["req-4", "req-8"]
+        assert result.total_count == 4
+
+    def test_cursor_walks_every_match_once(self, strategy):
+        spec = QuerySpec(criteria={"status": {"$in": ["pending", "failed"]}}, limit=2)
+        seen: list[str] = []
+        cursor = None
+
+        while True:
+            result = strategy.query(replace(spec, after=cursor))
+            seen.extend(_ids(result.items))
+            cursor = result.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == sorted(f"req-{n}" for n in range(12) if n % 4 in (0, 3))
+        assert result.total_count == 6
+
+    def test_descending_cursor_on_sort_field(self, strategy):
+        spec = QuerySpec(sort_by="created_at", descending=True, limit=5)
+
+        first = strategy.query(spec)
+        second = strategy.query(replace(spec, after=first.next_cursor))
+
+        assert _ids(first.items + second.items) == [f"req-{n}" for n in range(11, 1, -1)]
+
+    def test_regex_filters_fall_back_to_memory(self, strategy):
+        spec = QuerySpec(
+            filters=(GenericFilter("request_id", FilterOperator.REGEX, r"req-1\d"),),
+            sort_by="created_at",
+            limit=1,
+        )
+
+        result = strategy.query(spec)
+
+        assert _ids(result.items) == ["req-10"]
+        assert result.total_count == 2
+        assert result.next_cursor is not None
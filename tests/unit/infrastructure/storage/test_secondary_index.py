@@ -0,0 +1,182 @@
+"""Tests for secondary indexes used by JSON criteria queries."""
+
+from unittest.mock import patch
+
+import pytest
+
+from orb.infrastructure.storage.components.document_cache import reset_document_cache
+from orb.infrastructure.storage.components.secondary_index import SecondaryIndex
+from orb.infrastructure.storage.json.journal_strategy import JSONJournalStorageStrategy
+from orb.infrastructure.storage.json.strategy import JSONStorageStrategy
+
+
+@pytest.fixture(autouse=True)
+def _isolated_document_cache():
+    reset_document_cache()
+    yield
+    reset_document_cache()
+
+
+def _machines(count: int) -> dict[str, dict]:
+    return {
+        f"i-{n}": {
+            "machine_id": f"i-{n}",
+            "request_id": f"req-{n % 10}",
+            "status": "running" if n % 2 else "pending",
+        }
+        for n in range(count)
+    }
+
+
+@pytest.mark.unit
+class TestSecondaryIndex:
+    """Hash lookups return candidates for equality and $in criteria."""
+
+    def test_equality_lookup(self):
+        index = SecondaryIndex.build(["status"], _machines(6))
+
+        assert index.candidates({"status": "running"}) == ["i-1", "i-3", "i-5"]
+
+    def test_in_lookup_unions_buckets(self):
+        index = SecondaryIndex.build(["request_id"], _machines(20))
+
+        assert sorted(index.candidates({"request_id": {"$in": ["req-1", "req-2"]}})) == [
+            "i-1",
+            "i-11",
+            "i-12",
+            "i-2",
+        ]
+
+    def test_multiple_indexed_fields_intersect(self):
+        index = SecondaryIndex.build(["status", "request_id"], _machines(20))
+
+        assert index.candidates({"status": "running", "request_id": "req-1"}) == [
+            "i-1",
+            "i-11",
+        ]
+
+    def test_unindexable_criteria_return_none(self):
+        index = SecondaryIndex.build(["status"], _machines(4))
+
+        assert index.candidates({"machine_id": "i-1"}) is None
+        assert index.candidates({"status": {"$regex": "run"}}) is None
+        assert index.candidates({"status": {"$in": [["running"]]}}) is None
+
+    def test_update_moves_entity_between_buckets(self):
+        index = SecondaryIndex.build(["status"], {"i-1": {"status": "pending"}})
+
+        index.update("i-1", {"status": "pending"}, {"status": "running"})
+
+        assert index.candidates({"status": "pending"}) == []
+        assert index.candidates({"status": "running"}) == ["i-1"]
+
+    def test_delete_removes_entity(self):
+        index = SecondaryIndex.build(["status"], {"i-1": {"status": "pending"}})
+
+        index.update("i-1", {"status": "pending"}, None)
+
+        assert index.candidates({"status": "pending"}) == []
+
+    def test_unhashable_values_always_candidates(self):
+        index = SecondaryIndex.build(["status"], {"i-1": {"status": ["odd"]}})
+
+        assert index.candidates({"status": "running"}) == ["i-1"]
+
+    def test_copy_is_independent(self):
+        index = SecondaryIndex.build(["status"], {"i-1": {"status": "pending"}})
+        clone = index.copy()
+
+        clone.update("i-1", {"status": "pending"}, None)
+
+        assert index.candidates({"status": "pending"}) == ["i-1"]
+
+
+@pytest.mark.unit
+class TestJSONStrategyIndexes:
+    """Criteria queries on indexed fields avoid scanning every entity."""
+
+    def _strategy(self, tmp_path) -> JSONStorageStrategy:
+        return JSONStorageStrategy(
+            file_path=str(tmp_path / "machines.json"), entity_type="machines"
+        )
+
+    def test_indexed_query_only_checks_matches(self, tmp_path):
+        strategy = self._strategy(tmp_path)
+        strategy.save_batch(_machines(100))
+
+        with patch.object(
+            JSONStorageStrategy,
+            "_matches_criteria",
+            autospec=True,
+            side_effect=JSONStorageStrategy._matches_criteria,
+        ) as mock_match:
+            results = strategy.find_by_criteria({"request_id": "req-3"})
+
+        assert {r["machine_id"] for r in results} == {f"i-{n}" for n in range(3, 100, 10)}
+        assert mock_match.call_count == 10
+
+    def test_index_follows_save_delete_and_batch(self, tmp_path):
+        strategy = self._strategy(tmp_path)
+        strategy.save_batch(_machines(4))
+        assert strategy.find_by_criteria({"status": "pending"})
+
+        strategy.save("i-0", {"machine_id": "i-0", "request_id": "req-0", "status": "running"})
+        strategy.delete("i-1")
+        strategy.delete_batch(["i-2"])
+
+        assert [r["machine_id"] for r in strategy.find_by_criteria({"status": "running"})] == [
+            "i-0",
+            "i-3",
+        ]
+        assert strategy.find_by_criteria({"status": "pending"}) == []
+
+    def test_index_shared_across_instances(self, tmp_path):
+        self._strategy(tmp_path).save_batch(_machines(10))
+
+        with patch.object(SecondaryIndex, "build", wraps=SecondaryIndex.build) as mock_build:
+            for _ in range(3):
+                self._strategy(tmp_path).find_by_criteria({"status": "running"})
+
+        assert mock_build.call_count == 1
+
+    def test_unindexed_criteria_fall_back_to_scan(self, tmp_path):
+        strategy = self._strategy(tmp_path)
+        strategy.save_batch(_machines(10))
+
+        results = strategy.find_by_criteria({"machine_id": {"$regex": "^i-[12]$"}})
+
+        assert {r["machine_id"] for r in results} == {"i-1", "i-2"}
+
+
+@pytest.mark.unit
+class TestJournalStrategyIndexes:
+    """Journal mode maintains its index incrementally with the in-memory state."""
+
+    def _strategy(self, tmp_path) -> JSONJournalStorageStrategy:
+        return JSONJournalStorageStrategy(
+            file_path=str(tmp_path / "machines.json"),
+            entity_type="machines",
+            background_compaction=False,
+        )
+
+    def test_index_tracks_own_writes(self, tmp_path):
+        strategy = self._strategy(tmp_path)
+        strategy.save_batch(_machines(4))
+
+        strategy.save("i-0", {"machine_id": "i-0", "status": "running"})
+        strategy.delete("i-1")
+
+        assert [r["machine_id"] for r in strategy.find_by_criteria({"status": "running"})] == [
+            "i-3",
+            "i-0",
+        ]
+
+    def test_index_tracks_other_writers(self, tmp_path):
+        writer = self._strategy(tmp_path)
+        reader = self._strategy(tmp_path)
+        writer.save_batch(_machines(4))
+        assert len(reader.find_by_criteria({"status": "running"})) == 2
+
+        writer.save("i-0", {"machine_id": "i-0", "status": "running"})
+
+        assert len(reader.find_by_criteria({"status": "running"})) == 3
@@ -0,0 +1,166 @@
+"""Tests for set-based SQL writes, deletes and multi-ID lookups."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import event
+
+from orb.infrastructure.storage.components.sql_query_builder import SQLQueryBuilder
+from orb.infrastructure.storage.repositories.machine_repository import MachineRepositoryImpl
+from orb.infrastructure.storage.sql import strategy as sql_strategy_module
+from orb.infrastructure.storage.sql.runtime import SQLStorageRuntimePool, reset_sql_runtime_pool
+
+
+@pytest.fixture(autouse=True)
+def _isolated_runtime_pool():
+    reset_sql_runtime_pool()
+    yield
+    reset_sql_runtime_pool()
+
+
+@pytest.fixture
+def runtime(tmp_path):
+    return SQLStorageRuntimePool().acquire(f"sqlite:///{tmp_path / 'orb.db'}")
+
+
+def _record_statements(engine) -> list[tuple[str, bool]]:
+    """Capture (statement, executemany) for every statement the engine runs."""
+    statements: list[tuple[str, bool]] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, *args):
+        # Remaining args are (parameters, context, executemany)
+        statements.append((statement, args[-1]))
+
+    return statements
+
+
+def _machines(count: int) -> dict[str, dict]:
+    return {
+        f"i-{n}": {"machine_id": f"i-{n}", "request_id": "req-1", "status": "pending"}
+        for n in range(count)
+    }
+
+
+@pytest.mark.unit
+class TestSQLQueryBuilderUpsert:
+    """UPSERT syntax follows the database dialect."""
+
+    def _builder(self) -> SQLQueryBuilder:
+        return SQLQueryBuilder("machines", {"machine_id": "TEXT PRIMARY KEY", "status": "TEXT"})
+
+    def test_sqlite_and_postgresql_use_on_conflict(self):
+        for dialect in ("sqlite", "postgresql"):
+            query = self._builder().build_upsert(["machine_id", "status"], "machine_id", dialect)
+
+            assert query == (
+                "INSERT INTO machines (machine_id, status) VALUES (:machine_id, :status) "
+                "ON CONFLICT (machine_id) DO UPDATE SET status = excluded.status"
+            )
+
+    def test_mysql_uses_on_duplicate_key(self):
+        query = self._builder().build_upsert(["machine_id", "status"], "machine_id", "mysql")
+
+        assert query.endswith("ON DUPLICATE KEY UPDATE status = VALUES(status)")
+
+    def test_unknown_dialect_has_no_upsert(self):
+        assert self._builder().build_upsert(["machine_id"], "machine_id", "oracle") is None
+
+    def test_select_by_ids(self):
+        query, params = self._builder().build_select_by_ids("machine_id", 2)
+
+        assert query == "SELECT * FROM machines WHERE machine_id IN (:id_0, :id_1)"
+        assert params == ["id_0", "id_1"]
+
+
+@pytest.mark.unit
+class TestSQLStrategyBatchOperations:
+    """Batches run as a handful of statements against a real SQLite database."""
+
+    def test_save_batch_is_one_executemany_upsert(self, runtime):
+        strategy = runtime.get_strategy("machines")
+        statements = _record_statements(runtime.engine)
+
+        strategy.save_batch(_machines(50))
+
+        writes = [(sql, many) for sql, many in statements if sql.startswith("INSERT")]
+        assert len(writes) == 1
+        assert writes[0][1] is True
+        assert "ON CONFLICT" in writes[0][0]
+        assert strategy.count() == 50
+
+    def test_save_updates_existing_row_and_keeps_created_at(self, runtime):
+        strategy = runtime.get_strategy("machines")
+        strategy.save("i-1", {"machine_id": "i-1", "status": "pending"})
+        created_at = strategy.find_by_id("i-1")["created_at"]
+        statements = _record_statements(runtime.engine)
+
+        strategy.save("i-1", {"machine_id": "i-1", "status": "running"})
+
+        assert not [sql for sql, _ in statements if sql.startswith("SELECT")]
+        saved = strategy.find_by_id("i-1")
+        assert saved["status"] == "running"
+        assert saved["created_at"] == created_at
+        assert strategy.count() == 1
+
+    def test_fallback_without_upsert_support(self, runtime):
+        strategy = runtime.get_strategy("machines")
+        strategy.save("i-1", {"machine_id": "i-1", "status": "pending"})
+
+        with patch.object(strategy, "_get_dialect", return_value="oracle"):
+            strategy.save_batch(
+                {
+                    "i-1": {"machine_id": "i-1", "status": "running"},
+                    "i-2": {"machine_id": "i-2", "status": "pending"},
+                }
+            )
+
+        assert strategy.find_by_id("i-1")["status"] == "running"
+        assert strategy.find_by_id("i-2")["status"] == "pending"
+
+    def test_delete_batch_chunks_in_clauses(self, runtime):
+        strategy = runtime.get_strategy("machines")
+        strategy.save_batch(_machines(7))
+        statements = _record_statements(runtime.engine)
+
+        with patch.object(sql_strategy_module, "BATCH_CHUNK_SIZE", 3):
+            strategy.delete_batch([f"i-{n}" for n in range(6)])
+
+        assert len([sql for sql, _ in statements if sql.startswith("DELETE")]) == 2
+        assert list(strategy.find_all()) == ["i-6"]
+
+    def test_find_by_ids_single_round_trip(self, runtime):
+        strategy = runtime.get_strategy("machines")
+        strategy.save_batch(_machines(5))
+        statements = _record_statements(runtime.engine)
+
+        found = strategy.find_by_ids(["i-3", "i-1", "i-missing", "i-3"])
+
+        assert set(found) == {"i-1", "i-3"}
+        assert len([sql for sql, _ in statements if sql.startswith("SELECT")]) == 1
+
+    def test_query_builder_executes_through_the_strategy_connection(self, runtime):
+        strategy = runtime.get_strategy("machines")
+        strategy.save_batch(_machines(2))
+        query = strategy.query_builder.build_select_all()
+
+        rows = strategy.query_builder.execute_query(query)
+
+        assert sorted(row.machine_id for row in rows) == ["i-0", "i-1"]
+
+
+@pytest.mark.unit
+class TestRepositoryFindByIds:
+    """Repositories fetch many IDs with one storage call and keep the requested order."""
+
+    def test_machine_repository_uses_bulk_lookup(self):
+        storage = MagicMock()
+        storage.find_by_ids.return_value = {"i-2": {"id": 2}, "i-1": {"id": 1}}
+        repository = MachineRepositoryImpl(storage)
+
+        with patch.object(repository, "_deserialize", side_effect=lambda data: data["id"]):
+            machines = repository.find_by_ids(["i-1", "i-missing", "i-2"])
+
+        assert machines == [1, 2]
+        storage.find_by_ids.assert_called_once_with(["i-1", "i-missing", "i-2"])
+        storage.find_by_id.assert_not_called()
@@ -0,0 +1,177 @@
+"""Tests for the process-wide SQL storage runtime pool."""
+
+from unittest.mock import patch
+
+import pytest
+
+from orb.infrastructure.storage.sql.runtime import (
+    SQLStorageRuntimePool,
+    get_sql_runtime_pool,
+    reset_sql_runtime_pool,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_runtime_pool():
+    reset_sql_runtime_pool()
+    yield
+    reset_sql_runtime_pool()
+
+
+@pytest.mark.unit
+class TestSQLStorageRuntimePool:
+    """Engines and strategies must be built once per storage config."""
+
+    def test_same_config_returns_same_runtime(self, tmp_path):
+        pool = SQLStorageRuntimePool()
+        url = f"sqlite:///{tmp_path / 'orb.db'}"
+
+        first = pool.acquire(url)
+        second = pool.acquire(url)
+
+        assert first is second
+        assert len(pool) == 1
+        assert first.get_strategy("machines") is second.get_strategy("machines")
+
+    def test_different_engine_options_get_separate_runtimes(self, tmp_path):
+        pool = SQLStorageRuntimePool()
+        url = f"sqlite:///{tmp_path / 'orb.db'}"
+
+        first = pool.acquire(url, {"pool_size": 2})
+        second = pool.acquire(url, {"pool_size": 3})
+
+        assert first is not second
+        assert len(pool) == 2
+
+    def test_engine_created_once_for_repeated_acquire(self, tmp_path):
+        import sqlalchemy
+
+        pool = SQLStorageRuntimePool()
+        url = f"sqlite:///{tmp_path / 'orb.db'}"
+
+        with patch(
+            "orb.infrastructure.storage.sql.runtime.create_engine",
+            side_effect=sqlalchemy.create_engine,
+        ) as mock_create_engine:
+            for _ in range(5):
+                pool.acquire(url)
+
+        assert mock_create_engine.call_count == 1
+
+    def test_schema_bootstrapped_once(self, tmp_path):
+        from orb.infrastructure.storage.components.sql_connection_manager import (
+            SQLConnectionManager,
+        )
+
+        pool = SQLStorageRuntimePool()
+        url = f"sqlite:///{tmp_path / 'orb.db'}"
+
+        with patch.object(
+            SQLConnectionManager, "table_exists", autospec=True, return_value=False
+        ) as mock_table_exists:
+            pool.acquire(url)
+            pool.acquire(url)
+
+        # One check per table, from the first acquire only
+        assert mock_table_exists.call_count == 3
+
+    def test_pool_stats_report_acquisitions_and_pool_counters(self, tmp_path):
+        pool = SQLStorageRuntimePool()
+        url = f"sqlite:///{tmp_path / 'orb.db'}"
+
+        pool.acquire(url)
+        pool.acquire(url)
+        stats = pool.get_pool_stats()
+
+        assert len(stats) == 1
+        runtime_stats = next(iter(stats.values()))
+        assert runtime_stats["acquisitions"] == 2
+        assert runtime_stats["tables"] == ["machines", "requests", "templates"]
+        assert "pool_class" in runtime_stats
+        assert "checked_out_connections" in runtime_stats
+
+    def test_stats_mask_password(self):
+        pool = SQLStorageRuntimePool()
+        runtime = pool.acquire("sqlite://")
+        runtime.engine.url = runtime.engine.url.set(password="s3cret", username="orb")
+
+        stats = pool.get_pool_stats()
+
+        assert "s3cret" not in str(stats)
+
+    def test_dispose_all_forgets_runtimes(self, tmp_path):
+        pool = SQLStorageRuntimePool()
+        url = f"sqlite:///{tmp_path / 'orb.db'}"
+        first = pool.acquire(url)
+
+        pool.dispose_all()
+        second = pool.acquire(url)
+
+        assert first is not second
+
+
+@pytest.mark.unit
+class TestSQLUnitOfWorkSharing:
+    """Units of work created through the registration share the runtime."""
+
+    def test_units_of_work_share_strategies(self, tmp_path):
+        from orb.infrastructure.storage.sql.registration import create_sql_unit_of_work
+
+        config = {"connection_string": f"sqlite:///{tmp_path / 'orb.db'}"}
+
+        first = create_sql_unit_of_work(config)
+        second = create_sql_unit_of_work(config)
+
+        assert first is not second
+        assert first.runtime is second.runtime
+        assert first.engine is second.engine
+        assert first._request_strategy is second._request_strategy
+
+    def test_data_visible_across_units_of_work(self, tmp_path):
+        from orb.infrastructure.storage.sql.registration import create_sql_unit_of_work
+
+        config = {"connection_string": f"sqlite:///{tmp_path / 'orb.db'}"}
+
+        writer = create_sql_unit_of_work(config)
+        writer._request_strategy.save("req-1", {"request_id": "req-1", "status": "pending"})
+
+        reader = create_sql_unit_of_work(config)
+        found = reader._request_strategy.find_by_id("req-1")
+
+        assert found is not None
+        assert found["status"] == "pending"
+
+    def test_strategy_cleanup_does_not_dispose_shared_engine(self, tmp_path):
+        from orb.infrastructure.storage.sql.registration import create_sql_unit_of_work
+
+        config = {"connection_string": f"sqlite:///{tmp_path / 'orb.db'}"}
+        uow = create_sql_unit_of_work(config)
+
+        with patch.object(uow.engine, "dispose") as mock_dispose:
+            uow._machine_strategy.cleanup()
+
+        mock_dispose.assert_not_called()
+
+    def test_global_pool_is_singleton(self):
+        assert get_sql_runtime_pool() is get_sql_runtime_pool()
+
+
+@pytest.mark.unit
+class TestSQLStorageHealthCheck:
+    """The storage_pool health check surfaces runtime statistics."""
+
+    def test_health_check_reports_runtimes(self, tmp_path):
+        from unittest.mock import MagicMock
+
+        from orb.infrastructure.storage.sql.health import register_sql_storage_health_checks
+
+        health_check = MagicMock()
+        register_sql_storage_health_checks(health_check)
+        name, check_fn = health_check.register_check.call_args[0]
+
+        get_sql_runtime_pool().acquire(f"sqlite:///{tmp_path / 'orb.db'}")
+        status = check_fn()
+
+        assert name == "storage_pool"
+        assert status.status == "healthy"
+        assert status.details["runtime_count"] == 1
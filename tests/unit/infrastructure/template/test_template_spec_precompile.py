@@ -0,0 +1,33 @@
+"""Tests for precompiling native spec templates when templates are loaded."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from orb.infrastructure.template.configuration_manager import TemplateConfigurationManager
+from orb.infrastructure.template.jinja_spec_renderer import JinjaSpecRenderer
+
+
+@pytest.mark.asyncio
+async def test_template_load_precompiles_inline_native_specs() -> None:
+    renderer = JinjaSpecRenderer(Mock())
+    scheduler = Mock()
+    scheduler.get_template_paths.return_value = ["templates.json"]
+    scheduler.load_templates_from_path.return_value = [
+        {
+            "template_id": "tpl-1",
+            "provider_api_spec": {"Name": "fleet-{{ request_id }}", "Count": 1},
+            "launch_template_spec": {"Tags": ["{{ template_id }}", "static"]},
+            "image_id": "ami-12345678",
+        }
+    ]
+    manager = TemplateConfigurationManager(
+        config_manager=Mock(),
+        scheduler_strategy=scheduler,
+        logger=Mock(),
+        spec_renderer=renderer,
+    )
+
+    await manager._load_templates_from_scheduler()
+
+    assert set(renderer._string_templates) == {"fleet-{{ request_id }}", "{{ template_id }}"}
@@ -124,3 +124,49 @@ class TestJinjaSpecRenderer:
         result = renderer.render_spec(spec, context)
 
         assert result == {}
+
+    def test_string_templates_are_compiled_once(self, renderer):
+        """Test repeated renders reuse the compiled string template."""
+        spec = {"name": "fleet-{{ request_id }}"}
+        renderer.jinja_env.from_string = Mock(wraps=renderer.jinja_env.from_string)
+
+        first = renderer.render_spec(spec, {"request_id": "req-1"})
+        second = renderer.render_spec(spec, {"request_id": "req-2"})
+
+        assert first == {"name": "fleet-req-1"}
+        assert second == {"name": "fleet-req-2"}
+        assert renderer.jinja_env.from_string.call_count == 1
+
+    def test_precompile_spec_counts_template_strings(self, renderer):
+        """Test precompiling compiles only templated values."""
+        spec = {"a": "{{ x }}", "b": ["{{ y }}", "static"], "c": 1}
+
+        assert renderer.precompile_spec(spec) == 2
+        assert len(renderer._string_templates) == 2
+
+    def test_file_template_reloads_when_modified(self, renderer, tmp_path):
+        """Test cached file templates are invalidated on mtime change."""
+        import os
+
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text('{"name": "{{ name }}"}')
+        renderer.precompile_file(str(spec_file))
+        assert renderer.render_spec_from_file(str(spec_file), {"name": "a"}) == {"name": "a"}
+
+        spec_file.write_text('{"label": "{{ name }}"}')
+        stat = spec_file.stat()
+        os.utime(spec_file, (stat.st_atime, stat.st_mtime + 10))
+
+        assert renderer.render_spec_from_file(str(spec_file), {"name": "b"}) == {"label": "b"}
+
+    def test_bytecode_cache_is_written(self, logger, tmp_path):
+        """Test compiled file templates are persisted to the bytecode cache."""
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text('{"name": "{{ name }}"}')
+        cache_dir = tmp_path / "jinja"
+
+        JinjaSpecRenderer(logger, bytecode_cache_dir=str(cache_dir)).render_spec_from_file(
+            str(spec_file), {"name": "a"}
+        )
+
+        assert list(cache_dir.iterdir())
@@ -151,6 +151,24 @@ class TestProviderDiscoveryAdapterDelegation:
         result = adapter.validate_infrastructure({"type": "aws"})
         assert result == {}
 
+    # --- warm_caches ---
+
+    def test_warm_caches_delegates_to_strategy(self):
+        strategy = MagicMock()
+        strategy.warm_caches.return_value = {"provider": "aws-a"}
+        adapter = self._make_adapter(strategy)
+
+        result = adapter.warm_caches({"type": "aws"}, force=True)
+
+        strategy.warm_caches.assert_called_once_with({"type": "aws"}, force=True)
+        assert result == {"provider": "aws-a"}
+
+    def test_warm_caches_returns_empty_when_strategy_lacks_method(self):
+        strategy = MagicMock(spec=[])
+        adapter = self._make_adapter(strategy)
+        result = adapter.warm_caches({"type": "aws"})
+        assert result == {}
+
     # --- non-aws provider works the same way ---
 
     def test_non_aws_provider_delegates_to_strategy(self):
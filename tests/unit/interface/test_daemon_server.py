@@ -0,0 +1,246 @@
+"""Tests for the resident command daemon and its thin client."""
+
+import asyncio
+import os
+import socket
+import stat
+import sys
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from orb.cli import daemon_client
+from orb.interface.daemon_server import CommandDaemon
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    # AF_UNIX paths are limited to ~100 bytes, pytest tmp paths can be longer
+    short_dir = f"/tmp/orb-daemon-test-{os.getpid()}-{id(tmp_path)}"
+    os.makedirs(short_dir, exist_ok=True)
+    yield os.path.join(short_dir, "orb.sock")
+    if os.path.exists(os.path.join(short_dir, "orb.sock")):
+        os.unlink(os.path.join(short_dir, "orb.sock"))
+    os.rmdir(short_dir)
+
+
+async def _wait_for_socket(socket_path: str) -> None:
+    for _ in range(100):
+        if os.path.exists(socket_path):
+            return
+        await asyncio.sleep(0.01)
+
+
+def _patch_execute(result):
+    return patch("orb.cli.router.execute_command", AsyncMock(return_value=result))
+
+
+@pytest.mark.unit
+class TestCommandDaemonRun:
+    """Invocations run in-process and return exactly what the CLI would print."""
+
+    @pytest.mark.asyncio
+    async def test_output_and_exit_code_are_captured(self, socket_path):
+        daemon = CommandDaemon(socket_path)
+
+        with _patch_execute(('{"requests": []}', 0)) as mock_execute:
+            response = await daemon.run(["requests", "status", "req-1"])
+
+        assert response == {"stdout": '{"requests": []}\n', "stderr": "", "exit_code": 0}
+        assert mock_execute.call_args.args[0].request_ids == ["req-1"]
+
+    @pytest.mark.asyncio
+    async def test_relative_input_file_resolved_against_caller_cwd(self, socket_path):
+        daemon = CommandDaemon(socket_path)
+
+        with _patch_execute(("{}", 0)) as mock_execute:
+            await daemon.run(["requests", "status", "-f", "input.json"], cwd="/hf/work")
+
+        assert mock_execute.call_args.args[0].hf_file == "/hf/work/input.json"
+
+    @pytest.mark.asyncio
+    async def test_command_errors_are_formatted(self, socket_path):
+        daemon = CommandDaemon(socket_path)
+
+        with patch("orb.cli.router.execute_command", AsyncMock(side_effect=RuntimeError("boom"))):
+            response = await daemon.run(["requests", "status", "req-1"])
+
+        assert response["exit_code"] != 0
+        assert "boom" in response["stderr"] + response["stdout"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["system", "serve"],
+            ["init"],
+            ["requests", "watch", "req-1"],
+            ["requests", "status", "req-1", "--provider", "aws-other"],
+            ["requests", "status", "req-1", "--dry-run"],
+            ["--config", "/other/config.json", "requests", "status", "req-1"],
+            ["requests", "no-such-action"],
+        ],
+    )
+    async def test_unserved_commands_fall_back(self, socket_path, argv):
+        daemon = CommandDaemon(socket_path)
+
+        with _patch_execute(("{}", 0)) as mock_execute:
+            response = await daemon.run(argv)
+
+        assert response == {"fallback": True}
+        mock_execute.assert_not_called()
+
+
+@pytest.mark.unit
+class TestDaemonSocket:
+    """The client talks to the daemon over its Unix socket."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_through_socket(self, socket_path):
+        daemon = CommandDaemon(socket_path)
+        server = asyncio.create_task(daemon.serve_forever())
+        try:
+            for _ in range(100):
+                if os.path.exists(socket_path):
+                    break
+                await asyncio.sleep(0.01)
+
+            with _patch_execute(('{"status": "complete"}', 0)):
+                response = await asyncio.to_thread(
+                    daemon_client.send, socket_path, ["requests", "status", "req-1"], "/tmp"
+                )
+        finally:
+            daemon.close()
+            await asyncio.wait_for(server, 5)
+
+        assert response == {"stdout": '{"status": "complete"}\n', "stderr": "", "exit_code": 0}
+        assert not os.path.exists(socket_path)
+
+    @pytest.mark.asyncio
+    async def test_declined_command_leaves_piped_stdin_for_fallback(self, socket_path, monkeypatch):
+        monkeypatch.setenv(daemon_client.DAEMON_SOCKET_ENV, socket_path)
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b'{"template": {"templateId": "tpl"}}')
+        os.close(write_fd)
+        daemon = CommandDaemon(socket_path)
+        server = asyncio.create_task(daemon.serve_forever())
+        try:
+            await _wait_for_socket(socket_path)
+            with os.fdopen(read_fd) as pipe:
+                monkeypatch.setattr(daemon_client.sys, "stdin", pipe)
+                exit_code = await asyncio.to_thread(daemon_client.main, ["init"])
+                remaining = pipe.read()
+        finally:
+            daemon.close()
+            await asyncio.wait_for(server, 5)
+
+        assert exit_code == daemon_client.FALLBACK_EXIT_CODE
+        assert remaining == '{"template": {"templateId": "tpl"}}'
+
+    @pytest.mark.asyncio
+    async def test_stdin_is_read_only_after_the_daemon_accepts(self, socket_path):
+        events = []
+
+        async def execute(args, *_):
+            events.append(("executed", sys.stdin.read()))
+            return "{}", 0
+
+        def read_stdin():
+            events.append(("stdin read", None))
+            return "payload"
+
+        daemon = CommandDaemon(socket_path)
+        server = asyncio.create_task(daemon.serve_forever())
+        try:
+            await _wait_for_socket(socket_path)
+            with patch("orb.cli.router.execute_command", execute):
+                response = await asyncio.to_thread(
+                    daemon_client.send, socket_path, ["requests", "status"], "/tmp", read_stdin
+                )
+                declined = await asyncio.to_thread(
+                    daemon_client.send, socket_path, ["init"], "/tmp", read_stdin
+                )
+        finally:
+            daemon.close()
+            await asyncio.wait_for(server, 5)
+
+        assert response["exit_code"] == 0
+        assert declined == {"fallback": True}
+        assert events == [("stdin read", None), ("executed", "payload")]
+
+    @pytest.mark.asyncio
+    async def test_socket_is_owner_only_when_bound(self, socket_path):
+        modes = []
+        start_unix_server = asyncio.start_unix_server
+
+        async def record_mode(*args, **kwargs):
+            server = await start_unix_server(*args, **kwargs)
+            modes.append(stat.S_IMODE(os.stat(socket_path).st_mode))
+            return server
+
+        daemon = CommandDaemon(socket_path)
+        with patch("orb.interface.daemon_server.asyncio.start_unix_server", record_mode):
+            server = asyncio.create_task(daemon.serve_forever())
+            for _ in range(100):
+                if modes:
+                    break
+                await asyncio.sleep(0.01)
+            daemon.close()
+            await asyncio.wait_for(server, 5)
+
+        assert modes and modes[0] & 0o077 == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_socket_is_replaced(self, socket_path):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+        daemon = CommandDaemon(socket_path)
+        server = asyncio.create_task(daemon.serve_forever())
+        await asyncio.sleep(0.05)
+        daemon.close()
+        await asyncio.wait_for(server, 5)
+
+        assert server.exception() is None
+
+    def test_client_falls_back_without_daemon(self, socket_path, monkeypatch, capsys):
+        monkeypatch.setenv(daemon_client.DAEMON_SOCKET_ENV, socket_path)
+
+        assert daemon_client.main(["requests", "status"]) == daemon_client.FALLBACK_EXIT_CODE
+        assert capsys.readouterr().out == ""
+
+    def test_client_reproduces_response(self, socket_path, monkeypatch, capsys):
+        monkeypatch.setenv(daemon_client.DAEMON_SOCKET_ENV, socket_path)
+        open(socket_path, "w").close()
+        response = {"stdout": "out\n", "stderr": "warn\n", "exit_code": 3}
+
+        with patch.object(daemon_client, "send", return_value=response):
+            exit_code = daemon_client.main(["requests", "status"])
+
+        assert exit_code == 3
+        assert capsys.readouterr() == ("out\n", "warn\n")
+
+    def test_client_reads_piped_stdin_that_arrives_late(self, monkeypatch):
+        read_fd, write_fd = os.pipe()
+
+        def write_later():
+            time.sleep(0.1)
+            os.write(write_fd, b"payload")
+            os.close(write_fd)
+
+        writer = threading.Thread(target=write_later)
+        writer.start()
+        with os.fdopen(read_fd) as pipe:
+            monkeypatch.setattr(daemon_client.sys, "stdin", pipe)
+            assert daemon_client._read_stdin() == "payload"
+        writer.join()
+
+    def test_client_does_not_fall_back_after_sending(self, socket_path, monkeypatch):
+        monkeypatch.setenv(daemon_client.DAEMON_SOCKET_ENV, socket_path)
+        open(socket_path, "w").close()
+
+        with patch.object(daemon_client, "send", side_effect=OSError("timed out")):
+            assert daemon_client.main(["machines", "request", "tpl", "1"]) == 1
@@ -0,0 +1,25 @@
+"""Tests for the debug command handlers."""
+
+import pytest
+
+from orb.interface.debug_command_handlers import parse_import_times
+
+_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   orb.small
+import time:      1500 |      90000 | orb.bootstrap
+import time:       800 |      20000 |   orb.config
+not an import line
+"""
+
+
+@pytest.mark.unit
+class TestParseImportTimes:
+    def test_slowest_imports_first(self):
+        imports = parse_import_times(_IMPORTTIME, top=2)
+
+        assert [i["module"] for i in imports] == ["orb.bootstrap", "orb.config"]
+        assert imports[0] == {"module": "orb.bootstrap", "cumulative_ms": 90.0, "self_ms": 1.5}
+
+    def test_zero_top_returns_nothing(self):
+        assert parse_import_times(_IMPORTTIME, top=0) == []
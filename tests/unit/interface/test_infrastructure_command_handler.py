@@ -279,3 +279,65 @@ class TestHandleInfrastructureValidate:
             result = await handle_infrastructure_validate(args)
 
         assert result["status"] == "error"
+
+
+# ---------------------------------------------------------------------------
+# handle_infrastructure_warm_cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestHandleInfrastructureWarmCache:
+    @pytest.mark.asyncio
+    async def test_warms_every_active_provider(self, tmp_path):
+        from orb.interface.infrastructure_command_handler import handle_infrastructure_warm_cache
+
+        _two_provider_config(tmp_path)
+        mock_container = _mock_container_with_provider_port()
+        provider_strategy = mock_container.get.return_value
+        provider_strategy.warm_caches.side_effect = lambda provider, force: {
+            "provider": provider["name"],
+            "force": force,
+        }
+
+        with (
+            patch(
+                "orb.interface.infrastructure_command_handler.get_config_location",
+                return_value=tmp_path,
+            ),
+            patch(
+                "orb.interface.infrastructure_command_handler.get_container",
+                return_value=mock_container,
+            ),
+        ):
+            result = await handle_infrastructure_warm_cache(_ns(provider=None, force=True))
+
+        assert result["status"] == "success"
+        assert result["providers"] == [
+            {"provider": "aws-a", "force": True},
+            {"provider": "aws-b", "force": True},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unsupported_provider_is_reported(self, tmp_path):
+        from orb.interface.infrastructure_command_handler import handle_infrastructure_warm_cache
+
+        _two_provider_config(tmp_path)
+        mock_container = _mock_container_with_provider_port()
+        mock_container.get.return_value.warm_caches.return_value = {}
+
+        with (
+            patch(
+                "orb.interface.infrastructure_command_handler.get_config_location",
+                return_value=tmp_path,
+            ),
+            patch(
+                "orb.interface.infrastructure_command_handler.get_container",
+                return_value=mock_container,
+            ),
+        ):
+            result = await handle_infrastructure_warm_cache(_ns(provider="aws-a"))
+
+        assert result["providers"] == [
+            {"provider": "aws-a", "error": "Cache warm-up not supported"}
+        ]
@@ -29,6 +29,7 @@ from orb.interface.request_command_handlers import (
     handle_list_requests,
     handle_request_machines,
     handle_request_return_machines,
+    handle_subscribe_request_status,
 )
 
 
@@ -641,3 +642,48 @@ class TestHandleListRequests:
 
         list_req_orch.execute.assert_awaited_once()
         assert isinstance(result, InterfaceResponse)
+
+
+# ---------------------------------------------------------------------------
+# handle_subscribe_request_status
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestHandleSubscribeRequestStatus:
+    @pytest.mark.asyncio
+    async def test_follow_up_calls_return_only_changes(self):
+        """First call returns full status; the subscription id then yields deltas."""
+        from orb.application.services.request_status_hub import RequestStatusHub
+
+        statuses = ["running", "complete"]
+        status_orch = AsyncMock(spec=GetRequestStatusOrchestrator)
+        status_orch.execute.side_effect = lambda _input: GetRequestStatusOutput(
+            requests=[{"request_id": "req-1", "status": statuses.pop(0)}]
+        )
+        scheduler = MagicMock()
+        scheduler.format_request_status_response.side_effect = lambda reqs: {"requests": reqs}
+        hub = RequestStatusHub(status_orch, scheduler, MagicMock(), poll_interval_seconds=0.01)
+        container = MagicMock()
+        container.get.return_value = hub
+
+        with patch("orb.interface.request_command_handlers.get_container", return_value=container):
+            first = await handle_subscribe_request_status(
+                _make_namespace(request_ids=["req-1"], timeout=5)
+            )
+            second = await handle_subscribe_request_status(
+                _make_namespace(subscription_id=first["subscription_id"], timeout=5)
+            )
+
+        assert first["updates"][0]["full"] is True
+        assert first["done"] is False
+        assert second["updates"][0]["changes"] == {"status": "complete"}
+        assert second["done"] is True
+
+    @pytest.mark.asyncio
+    async def test_unknown_subscription_returns_error(self):
+        result = await handle_subscribe_request_status(
+            _make_namespace(subscription_id="missing", timeout=0.1)
+        )
+
+        assert result["error"] == "Unknown subscription"
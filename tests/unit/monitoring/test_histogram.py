@@ -0,0 +1,86 @@
+"""Tests for streaming histograms and the quantile sketch."""
+
+import random
+
+import pytest
+
+from orb.monitoring.histogram import Histogram, QuantileSketch
+from orb.monitoring.metrics import MetricsCollector
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    """Sketch quantiles stay within the configured relative error."""
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0, 1.5) for _ in range(20000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+
+def test_sketch_memory_is_bounded():
+    """Bin count depends on the value range, not the sample count."""
+    sketch = QuantileSketch(max_bins=64)
+    for i in range(1, 100000):
+        sketch.add(float(i))
+
+    assert len(sketch._bins) <= 64
+    assert sketch.count == 99999
+
+
+def test_merged_histograms_match_combined_observations():
+    """Merging two histograms equals observing everything in one."""
+    first, second, combined = Histogram(), Histogram(), Histogram()
+    for i in range(1, 501):
+        value = i / 100
+        (first if i % 2 else second).observe(value)
+        combined.observe(value)
+
+    first.merge(second)
+
+    assert first.count == combined.count
+    assert first.sum == pytest.approx(combined.sum)
+    assert first.cumulative_buckets() == combined.cumulative_buckets()
+    assert first.quantile(0.95) == pytest.approx(combined.quantile(0.95))
+
+
+def test_merge_rejects_different_buckets():
+    with pytest.raises(ValueError):
+        Histogram(buckets=(1, 2)).merge(Histogram(buckets=(1, 3)))
+
+
+def test_prometheus_lines_are_cumulative():
+    """Buckets are cumulative with le labels and a final +Inf bucket."""
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value)
+
+    lines = histogram.to_prometheus_lines("op_duration", {"service": "ec2"})
+
+    assert lines == [
+        "# TYPE op_duration histogram",
+        'op_duration_bucket{service="ec2",le="0.1"} 1',
+        'op_duration_bucket{service="ec2",le="1.0"} 3',
+        'op_duration_bucket{service="ec2",le="+Inf"} 4',
+        'op_duration_sum{service="ec2"} 4.05',
+        'op_duration_count{service="ec2"} 4',
+    ]
+
+
+def test_collector_record_time_feeds_histogram(tmp_path):
+    """record_time keeps the average gauge and exports a histogram."""
+    collector = MetricsCollector({"metrics_dir": str(tmp_path)})
+    for duration in (0.1, 0.2, 0.3):
+        collector.record_time("op_duration", duration)
+
+    assert collector.get_metrics()["op_duration_seconds"]["value"] == pytest.approx(0.2)
+    summary = collector.get_histograms()["op_duration"]
+    assert summary["count"] == 3
+    assert summary["p50"] == pytest.approx(0.2, rel=0.02)
+    text = collector.to_prometheus_text()
+    assert 'op_duration_bucket{le="0.25"} 2' in text
+    assert "op_duration_count{} 3" in text
@@ -0,0 +1,116 @@
+"""Unit tests for the append-only AWS image cache."""
+
+import json
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from orb.providers.aws.infrastructure.caching import aws_image_cache
+from orb.providers.aws.infrastructure.caching.aws_image_cache import AWSImageCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(tmp_path, clock=None, ttl_seconds=60) -> AWSImageCache:
+    return AWSImageCache("aws-test", str(tmp_path), ttl_seconds, clock=clock or FakeClock())
+
+
+def _lines(tmp_path) -> list[dict]:
+    path = Path(tmp_path) / "image_cache_aws-test.jsonl"
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _writer(cache_dir: str, worker: int) -> None:
+    cache = AWSImageCache("aws-test", cache_dir, 3600)
+    for n in range(20):
+        cache.set(f"/param/{worker}/{n}", f"ami-{worker:02d}{n:04d}")
+
+
+@pytest.mark.unit
+class TestAWSImageCache:
+    def test_set_appends_instead_of_rewriting(self, tmp_path):
+        cache = _cache(tmp_path)
+
+        cache.set("/a", "ami-1")
+        cache.set_many({"/b": "ami-2", "/c": "ami-3"})
+
+        assert [line["spec"] for line in _lines(tmp_path)] == ["/a", "/b", "/c"]
+        assert cache.get("/b") == "ami-2"
+
+    def test_entries_written_by_another_instance_are_visible(self, tmp_path):
+        clock = FakeClock()
+        reader = _cache(tmp_path, clock)
+        writer = _cache(tmp_path, clock)
+
+        assert reader.get("/a") is None
+        writer.set("/a", "ami-1")
+
+        assert reader.get("/a") == "ami-1"
+
+    def test_entries_expire_individually(self, tmp_path):
+        clock = FakeClock()
+        cache = _cache(tmp_path, clock, ttl_seconds=60)
+        cache.set("/short", "ami-1")
+        cache.set_many({"/long": "ami-2"}, ttl_seconds=600)
+
+        clock.now += 61
+
+        assert cache.get("/short") is None
+        assert cache.get("/long") == "ami-2"
+
+    def test_clear_expired_compacts_the_log(self, tmp_path):
+        clock = FakeClock()
+        cache = _cache(tmp_path, clock)
+        cache.set("/old", "ami-1")
+        clock.now += 30
+        cache.set("/new", "ami-2")
+
+        clock.now += 40
+        cache.clear_expired()
+
+        assert [line["spec"] for line in _lines(tmp_path)] == ["/new"]
+        assert _cache(tmp_path, clock).get("/new") == "ami-2"
+
+    def test_superseded_entries_are_compacted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(aws_image_cache, "_COMPACT_MIN_LINES", 4)
+        cache = _cache(tmp_path)
+
+        for n in range(5):
+            cache.set("/a", f"ami-{n}")
+
+        assert len(_lines(tmp_path)) < 5
+        assert cache.get("/a") == "ami-4"
+
+    def test_torn_and_corrupt_lines_are_skipped(self, tmp_path):
+        cache = _cache(tmp_path)
+        cache.set("/a", "ami-1")
+        with open(tmp_path / "image_cache_aws-test.jsonl", "a") as f:
+            f.write("not json\n")
+            f.write('{"spec": "/b", "image_id": "ami-2"')
+
+        reloaded = _cache(tmp_path)
+
+        assert reloaded.get("/a") == "ami-1"
+        assert reloaded.get("/b") is None
+
+    def test_concurrent_processes_do_not_lose_entries(self, tmp_path):
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_writer, args=(str(tmp_path), n)) for n in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+
+        cache = AWSImageCache("aws-test", str(tmp_path), 3600)
+        assert all(
+            cache.get(f"/param/{worker}/{n}") == f"ami-{worker:02d}{n:04d}"
+            for worker in range(4)
+            for n in range(20)
+        )
@@ -0,0 +1,79 @@
+"""Unit tests for batched SSM image resolution."""
+
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from orb.domain.exceptions.image_resolution_error import ImageResolutionError
+from orb.providers.aws.infrastructure.caching.aws_image_cache import AWSImageCache
+from orb.providers.aws.infrastructure.services.aws_image_resolution_service import (
+    AWSImageResolutionService,
+)
+
+
+@pytest.fixture
+def ssm_client(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        client = boto3.client("ssm", region_name="us-east-1")
+        for n in range(25):
+            client.put_parameter(Name=f"/images/app-{n}", Value=f"ami-{n:08x}", Type="String")
+        client.put_parameter(Name="/images/broken", Value="not-an-ami", Type="String")
+        yield client
+
+
+def _service(ssm_client, tmp_path) -> tuple[AWSImageResolutionService, list[dict]]:
+    calls: list[dict] = []
+    ssm_client.meta.events.register(
+        "provide-client-params.ssm.*",
+        lambda params, model, **_: calls.append({"operation": model.name, **params}),
+    )
+    aws_client = MagicMock()
+    aws_client.ssm_client = ssm_client
+    cache = AWSImageCache("aws-test", str(tmp_path))
+    return AWSImageResolutionService(aws_client, cache, MagicMock()), calls
+
+
+@pytest.mark.unit
+class TestAWSImageResolutionService:
+    def test_cache_misses_are_fetched_ten_per_call(self, ssm_client, tmp_path):
+        service, calls = _service(ssm_client, tmp_path)
+        specs = [f"/images/app-{n}" for n in range(25)]
+
+        resolved = service.resolve_image_ids(specs + specs[:3])
+
+        assert resolved == {spec: f"ami-{n:08x}" for n, spec in enumerate(specs)}
+        assert [call["operation"] for call in calls] == ["GetParameters"] * 3
+        assert [len(call["Names"]) for call in calls] == [10, 10, 5]
+
+    def test_cached_specifications_are_not_fetched_again(self, ssm_client, tmp_path):
+        first, _ = _service(ssm_client, tmp_path)
+        first.resolve_image_ids(["/images/app-1", "/images/app-2"])
+
+        # A new process reads the shared cache file
+        second, calls = _service(ssm_client, tmp_path)
+        resolved = second.resolve_image_ids(["/images/app-1", "/images/app-2", "/images/app-3"])
+
+        assert resolved["/images/app-1"] == "ami-00000001"
+        assert [call["Names"] for call in calls] == [["/images/app-3"]]
+
+    def test_single_resolution_uses_the_batch_path(self, ssm_client, tmp_path):
+        service, calls = _service(ssm_client, tmp_path)
+
+        assert service.resolve_image_id("/images/app-7") == "ami-00000007"
+        assert calls[0]["operation"] == "GetParameters"
+
+    def test_missing_parameter_raises(self, ssm_client, tmp_path):
+        service, _ = _service(ssm_client, tmp_path)
+
+        with pytest.raises(ImageResolutionError, match="not found: /images/missing"):
+            service.resolve_image_ids(["/images/app-1", "/images/missing"])
+
+    def test_invalid_ami_raises(self, ssm_client, tmp_path):
+        service, _ = _service(ssm_client, tmp_path)
+
+        with pytest.raises(ImageResolutionError, match="invalid AMI ID"):
+            service.resolve_image_id("/images/broken")
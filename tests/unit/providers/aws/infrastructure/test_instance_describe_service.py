@@ -0,0 +1,183 @@
+"""Unit tests for the batched describe_instances service."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from orb.providers.aws.infrastructure.services.instance_describe_service import (
+    AWSInstanceDescribeService,
+    get_instance_describe_service,
+)
+
+
+def _reservation(*instance_ids: str) -> dict:
+    return {"Instances": [{"InstanceId": i, "State": {"Name": "running"}} for i in instance_ids]}
+
+
+def _echo_describe(**kwargs) -> dict:
+    return {"Reservations": [_reservation(*kwargs["InstanceIds"])]}
+
+
+def _make_service(describe=_echo_describe, **kwargs) -> AWSInstanceDescribeService:
+    aws_client = MagicMock()
+    aws_client.perf_config = {"batch_sizes": {"describe_instances": 2}, "max_workers": 4}
+    aws_client.ec2_client.describe_instances.side_effect = describe
+    return AWSInstanceDescribeService(aws_client, MagicMock(), **kwargs)
+
+
+@pytest.mark.unit
+class TestAWSInstanceDescribeService:
+    def test_ids_are_chunked_to_batch_size(self):
+        service = _make_service()
+
+        result = service.describe_instances(["i-1", "i-2", "i-3", "i-4", "i-5"])
+
+        calls = service._aws_client.ec2_client.describe_instances.call_args_list
+        assert sorted(len(c.kwargs["InstanceIds"]) for c in calls) == [1, 2, 2]
+        assert [i["InstanceId"] for i in result] == ["i-1", "i-2", "i-3", "i-4", "i-5"]
+
+    def test_next_token_is_followed(self):
+        pages = iter(
+            [
+                {"Reservations": [_reservation("i-1")], "NextToken": "page-2"},
+                {"Reservations": [_reservation("i-2")]},
+            ]
+        )
+        service = _make_service(describe=lambda **kwargs: next(pages))
+
+        result = service.describe_instances(["i-1", "i-2"])
+
+        calls = service._aws_client.ec2_client.describe_instances.call_args_list
+        assert calls[1].kwargs["NextToken"] == "page-2"
+        assert [i["InstanceId"] for i in result] == ["i-1", "i-2"]
+
+    def test_each_batch_runs_under_retry(self):
+        service = _make_service()
+        retry = MagicMock(side_effect=lambda func, *args, **kwargs: func(*args))
+
+        service.describe_instances(["i-1", "i-2", "i-3"], retry=retry)
+
+        assert retry.call_count == 2
+        assert all(c.kwargs["operation_type"] == "read_only" for c in retry.call_args_list)
+
+    def test_duplicate_ids_are_described_once(self):
+        service = _make_service()
+
+        result = service.describe_instances(["i-1", "i-1", "i-2"])
+
+        assert service._aws_client.ec2_client.describe_instances.call_count == 1
+        assert [i["InstanceId"] for i in result] == ["i-1", "i-2"]
+
+    def test_recent_results_are_reused_within_window(self):
+        service = _make_service()
+
+        service.describe_instances(["i-1", "i-2"])
+        service.describe_instances(["i-2"])
+
+        assert service._aws_client.ec2_client.describe_instances.call_count == 1
+
+    def test_recent_results_expire(self):
+        service = _make_service(coalesce_window=0)
+
+        service.describe_instances(["i-1"])
+        service.describe_instances(["i-1"])
+
+        assert service._aws_client.ec2_client.describe_instances.call_count == 2
+
+    def test_concurrent_callers_share_in_flight_lookup(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_describe(**kwargs):
+            started.set()
+            release.wait(5)
+            return _echo_describe(**kwargs)
+
+        service = _make_service(describe=slow_describe)
+        results: dict[str, list] = {}
+        first = threading.Thread(
+            target=lambda: results.setdefault("first", service.describe_instances(["i-1"]))
+        )
+        first.start()
+        started.wait(5)
+        second = threading.Thread(
+            target=lambda: results.setdefault("second", service.describe_instances(["i-1"]))
+        )
+        second.start()
+        time.sleep(0.05)
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        assert service._aws_client.ec2_client.describe_instances.call_count == 1
+        assert results["first"] == results["second"]
+
+    def test_failure_is_raised_and_not_cached(self):
+        calls = {"count": 0}
+
+        def flaky_describe(**kwargs):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise RuntimeError("throttled")
+            return _echo_describe(**kwargs)
+
+        service = _make_service(describe=flaky_describe)
+
+        with pytest.raises(RuntimeError):
+            service.describe_instances(["i-1"])
+        assert [i["InstanceId"] for i in service.describe_instances(["i-1"])] == ["i-1"]
+
+    def test_service_is_shared_per_client(self):
+        aws_client = MagicMock()
+
+        first = get_instance_describe_service(aws_client, MagicMock())
+        second = get_instance_describe_service(aws_client, MagicMock())
+
+        assert first is second
+        assert get_instance_describe_service(MagicMock(), MagicMock()) is not first
+
+    def test_batching_merges_concurrent_callers(self):
+        service = _make_service(gather_window=0.2)
+        results: dict[str, list] = {}
+
+        def describe(name: str, instance_id: str) -> None:
+            results[name] = service.describe_instances([instance_id])
+
+        with service.batching():
+            threads = [
+                threading.Thread(target=describe, args=("first", "i-1")),
+                threading.Thread(target=describe, args=("second", "i-2")),
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+        calls = service._aws_client.ec2_client.describe_instances.call_args_list
+        assert len(calls) == 1
+        assert sorted(calls[0].kwargs["InstanceIds"]) == ["i-1", "i-2"]
+        assert [i["InstanceId"] for i in results["first"]] == ["i-1"]
+        assert [i["InstanceId"] for i in results["second"]] == ["i-2"]
+
+    def test_batching_failure_reaches_every_caller(self):
+        service = _make_service(
+            describe=MagicMock(side_effect=RuntimeError("throttled")), gather_window=0.2
+        )
+        errors: list[Exception] = []
+
+        def describe(instance_id: str) -> None:
+            try:
+                service.describe_instances([instance_id])
+            except RuntimeError as e:
+                errors.append(e)
+
+        with service.batching():
+            threads = [threading.Thread(target=describe, args=(i,)) for i in ("i-1", "i-2")]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+        assert len(errors) == 2
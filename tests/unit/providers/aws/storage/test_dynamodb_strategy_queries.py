@@ -0,0 +1,284 @@
+"""Tests for DynamoDB index queries, parallel scans, batched reads and conditional writes."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from orb.infrastructure.storage.exceptions import StorageError
+from orb.providers.aws.storage.components.dynamodb_client_manager import DynamoDBClientManager
+from orb.providers.aws.storage.strategy import (
+    INDEXED_ATTRIBUTES,
+    DynamoDBStorageStrategy,
+    index_name_for,
+    reset_dynamodb_table_cache,
+)
+
+REGION = "us-east-1"
+BASE_TIME = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class _AWSClient:
+    """Minimal stand-in for the provider AWS client wrapper."""
+
+    def get_client(self, service_name: str):
+        return boto3.client(service_name, region_name=REGION)
+
+    def get_resource(self, service_name: str):
+        return boto3.resource(service_name, region_name=REGION)
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", REGION)
+
+
+def _strategy() -> DynamoDBStorageStrategy:
+    return DynamoDBStorageStrategy(
+        logger=MagicMock(),
+        aws_client=_AWSClient(),
+        region=REGION,
+        table_name="machines",
+    )
+
+
+@pytest.fixture
+def strategy(aws_credentials):
+    reset_dynamodb_table_cache()
+    with mock_aws():
+        yield _strategy()
+    reset_dynamodb_table_cache()
+
+
+def _machines(count: int) -> dict[str, dict]:
+    return {
+        f"i-{n}": {
+            "machine_id": f"i-{n}",
+            "request_id": f"req-{n % 3}",
+            "status": "running" if n % 2 else "pending",
+            "return_request_id": None,
+        }
+        for n in range(count)
+    }
+
+
+@pytest.mark.unit
+class TestDynamoDBIndexes:
+    """New tables get secondary indexes that equality criteria are routed to."""
+
+    def test_table_created_with_indexes(self, strategy):
+        statuses = strategy.client_manager.get_index_statuses("machines")
+
+        assert set(statuses) == {index_name_for(a) for a in INDEXED_ATTRIBUTES}
+
+    def test_indexed_equality_uses_query(self, strategy):
+        strategy.save_batch(_machines(9))
+
+        with (
+            patch.object(
+                DynamoDBClientManager, "query_index", wraps=strategy.client_manager.query_index
+            ) as mock_query,
+            patch.object(DynamoDBClientManager, "scan_table") as mock_scan,
+        ):
+            results = strategy.find_by_criteria({"request_id": "req-1", "status": "running"})
+
+        assert sorted(r["machine_id"] for r in results) == ["i-1", "i-7"]
+        assert mock_query.call_args.args[1] == "request_id-index"
+        mock_scan.assert_not_called()
+
+    def test_unindexed_criteria_scan(self, strategy):
+        strategy.save_batch(_machines(4))
+
+        with patch.object(DynamoDBClientManager, "query_index") as mock_query:
+            results = strategy.find_by_criteria({"machine_id": "i-2"})
+
+        assert [r["machine_id"] for r in results] == ["i-2"]
+        mock_query.assert_not_called()
+
+    def test_inactive_index_falls_back_to_scan(self, strategy):
+        strategy.save_batch(_machines(4))
+
+        with (
+            patch.object(
+                DynamoDBClientManager,
+                "get_index_statuses",
+                return_value={"request_id-index": "CREATING"},
+            ),
+            patch.object(DynamoDBClientManager, "query_index") as mock_query,
+        ):
+            strategy._index_status_checked_at = None
+            results = strategy.find_by_criteria({"request_id": "req-0"})
+
+        assert sorted(r["machine_id"] for r in results) == ["i-0", "i-3"]
+        mock_query.assert_not_called()
+
+    def test_ready_table_is_described_once_per_process(self, strategy):
+        _strategy()  # existing table: describes it and finds every index ACTIVE
+
+        with (
+            patch.object(DynamoDBClientManager, "table_exists") as mock_exists,
+            patch.object(DynamoDBClientManager, "get_index_statuses") as mock_statuses,
+        ):
+            again = _strategy()
+
+        mock_exists.assert_not_called()
+        mock_statuses.assert_not_called()
+        assert again._select_index({"status": "running"}) == "status"
+
+    def test_none_index_keys_are_omitted(self, strategy):
+        strategy.save("i-1", {"machine_id": "i-1", "request_id": None, "status": "running"})
+
+        assert "request_id" not in strategy.find_by_id("i-1")
+
+
+@pytest.mark.unit
+class TestDynamoDBScansAndBatchReads:
+    """Full scans are segmented and multi-ID reads use BatchGetItem."""
+
+    def test_find_all_uses_parallel_segments(self, strategy):
+        strategy.save_batch(_machines(20))
+        segments = []
+        original_paginate = DynamoDBClientManager._paginate
+
+        def recording_paginate(operation, params):
+            segments.append((params.get("Segment"), params.get("TotalSegments")))
+            return original_paginate(operation, params)
+
+        with patch.object(DynamoDBClientManager, "_paginate", side_effect=recording_paginate):
+            entities = strategy.find_all()
+
+        assert len(entities) == 20
+        assert sorted(segments) == [(n, 4) for n in range(4)]
+
+    def test_find_by_ids_uses_batch_get(self, strategy):
+        strategy.save_batch(_machines(5))
+
+        with patch.object(DynamoDBClientManager, "get_item") as mock_get_item:
+            found = strategy.find_by_ids(["i-1", "i-4", "i-missing"])
+
+        assert set(found) == {"i-1", "i-4"}
+        mock_get_item.assert_not_called()
+
+    def test_grouped_count_with_datetime_bounds(self, strategy):
+        machines = _machines(6)
+        for n, machine in enumerate(machines.values()):
+            machine["created_at"] = (BASE_TIME + timedelta(hours=n)).isoformat()
+        strategy.save_batch(machines)
+        # Bounds given in another offset compare against the stored UTC strings
+        plus_two = timezone(timedelta(hours=2))
+
+        counts = strategy.count_by_group(
+            "status",
+            {
+                "created_at": {
+                    "$gte": (BASE_TIME + timedelta(hours=1)).astimezone(plus_two),
+                    "$lte": BASE_TIME + timedelta(hours=3),
+                }
+            },
+        )
+
+        assert counts == {"running": 2, "pending": 1}
+
+    def test_grouped_count_failure_raises(self, strategy):
+        error = ClientError({"Error": {"Code": "InternalServerError", "Message": "boom"}}, "Scan")
+
+        with (
+            patch.object(DynamoDBClientManager, "scan_table", side_effect=error),
+            pytest.raises(StorageError),
+        ):
+            strategy.count_by_group("status")
+
+
+@pytest.mark.unit
+class TestDynamoDBConditionalWrites:
+    """save_if sends its condition as the ConditionExpression of PutItem."""
+
+    def test_new_item_is_written_only_once(self, strategy):
+        assert strategy.save_if("i-1", {"status": "pending", "version": 1}, None)
+        assert not strategy.save_if("i-1", {"status": "running", "version": 1}, None)
+
+        assert strategy.find_by_id("i-1")["status"] == "pending"
+
+    def test_update_requires_the_expected_values(self, strategy):
+        strategy.save_if("i-1", {"status": "pending", "version": 1, "owner": None}, None)
+
+        assert strategy.save_if("i-1", {"version": 2, "owner": "a"}, {"version": 1, "owner": None})
+        assert not strategy.save_if("i-1", {"version": 2, "owner": "b"}, {"version": 1})
+        assert not strategy.save_if("i-1", {"version": 3, "owner": "b"}, {"owner": None})
+
+        assert strategy.find_by_id("i-1")["owner"] == "a"
+
+    def test_range_condition_on_numbers(self, strategy):
+        strategy.save_if("i-1", {"expires_at": 100.5}, None)
+
+        assert not strategy.save_if("i-1", {"expires_at": 1.0}, {"expires_at": {"$lte": 99.0}})
+        assert strategy.save_if("i-1", {"expires_at": 1.0}, {"expires_at": {"$lte": 100.5}})
+
+    def test_other_errors_raise(self, strategy):
+        error = ClientError({"Error": {"Code": "InternalServerError", "Message": "boom"}}, "Put")
+        table = MagicMock()
+        table.put_item.side_effect = error
+
+        with (
+            patch.object(DynamoDBClientManager, "get_table", return_value=table),
+            pytest.raises(StorageError),
+        ):
+            strategy.save_if("i-1", {"status": "pending"}, None)
+
+
+@pytest.mark.unit
+class TestBatchGetRetry:
+    """Unprocessed keys are retried with backoff."""
+
+    def _manager(self, responses):
+        resource = MagicMock()
+        resource.batch_get_item.side_effect = responses
+        aws_client = MagicMock()
+        aws_client.get_resource.return_value = resource
+        return DynamoDBClientManager(aws_client), resource
+
+    def test_unprocessed_keys_retried(self):
+        manager, resource = self._manager(
+            [
+                {
+                    "Responses": {"t": [{"id": "a"}]},
+                    "UnprocessedKeys": {"t": {"Keys": [{"id": "b"}]}},
+                },
+                {"Responses": {"t": [{"id": "b"}]}, "UnprocessedKeys": {}},
+            ]
+        )
+
+        with patch("orb.providers.aws.storage.components.dynamodb_client_manager.time.sleep"):
+            items = manager.batch_get_items("t", [{"id": "a"}, {"id": "b"}])
+
+        assert items == [{"id": "a"}, {"id": "b"}]
+        assert resource.batch_get_item.call_args_list[1].kwargs == {
+            "RequestItems": {"t": {"Keys": [{"id": "b"}]}}
+        }
+
+    def test_gives_up_after_max_retries(self):
+        unprocessed = {"Responses": {}, "UnprocessedKeys": {"t": {"Keys": [{"id": "a"}]}}}
+        manager, _ = self._manager([unprocessed] * 3)
+
+        with (
+            patch("orb.providers.aws.storage.components.dynamodb_client_manager.time.sleep"),
+            pytest.raises(RuntimeError),
+        ):
+            manager.batch_get_items("t", [{"id": "a"}], max_retries=2)
+
+    def test_keys_chunked_by_hundred(self):
+        manager, resource = self._manager(
+            [{"Responses": {"t": []}}, {"Responses": {"t": []}}, {"Responses": {"t": []}}]
+        )
+
+        manager.batch_get_items("t", [{"id": str(n)} for n in range(250)])
+
+        assert [
+            len(call.kwargs["RequestItems"]["t"]["Keys"])
+            for call in resource.batch_get_item.call_args_list
+        ] == [100, 100, 50]
@@ -0,0 +1,113 @@
+"""Unit tests for batched DESCRIBE_RESOURCE_INSTANCES in AWSProviderStrategy."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from orb.providers.base.strategy import ProviderOperation, ProviderOperationType
+
+_REQ_1 = "req-00000000-0000-0000-0000-000000000001"
+_REQ_2 = "req-00000000-0000-0000-0000-000000000002"
+_REQ_3 = "req-00000000-0000-0000-0000-000000000003"
+
+
+def _make_aws_strategy(handler):
+    """Create a minimal AWSProviderStrategy whose EC2Fleet handler is ``handler``."""
+    from orb.infrastructure.adapters.logging_adapter import LoggingAdapter
+    from orb.providers.aws.strategy.aws_provider_strategy import AWSProviderStrategy
+
+    aws_client = MagicMock()
+    aws_client.perf_config = {"max_workers": 4}
+    aws_client.ec2_client.describe_fleets.side_effect = lambda **kwargs: {
+        "Fleets": [
+            {
+                "FleetId": fleet_id,
+                "TargetCapacitySpecification": {"TotalTargetCapacity": 2},
+                "FulfilledCapacity": 1.0,
+                "FleetState": "active",
+                "Type": "maintain",
+            }
+            for fleet_id in kwargs["FleetIds"]
+        ]
+    }
+
+    strategy = AWSProviderStrategy.__new__(AWSProviderStrategy)
+    strategy._logger = LoggingAdapter()
+    strategy._aws_client = aws_client
+    strategy._aws_client_resolver = None
+    strategy.get_handler = MagicMock(return_value=handler)
+    return strategy
+
+
+def _operation(*entries: tuple[str, str]) -> ProviderOperation:
+    return ProviderOperation(
+        operation_type=ProviderOperationType.DESCRIBE_RESOURCE_INSTANCES,
+        parameters={
+            "provider_api": "EC2Fleet",
+            "requests": [
+                {"request_id": request_id, "resource_ids": [fleet_id], "template_id": "tpl-1"}
+                for request_id, fleet_id in entries
+            ],
+        },
+    )
+
+
+@pytest.mark.unit
+class TestDescribeResourceInstancesBatch:
+    @pytest.mark.asyncio
+    async def test_results_are_returned_per_request_with_one_capacity_call(self):
+        handler = MagicMock()
+        handler.check_hosts_status.side_effect = lambda request: [
+            {"instance_id": f"i-{request.resource_ids[0]}", "status": "running"}
+        ]
+        strategy = _make_aws_strategy(handler)
+
+        result = await strategy._execute_operation_internal(
+            _operation((_REQ_1, "fleet-a"), (_REQ_2, "fleet-b"), (_REQ_3, "fleet-c"))
+        )
+
+        assert result.success
+        results = result.data["results"]
+        assert results[_REQ_2]["instances"] == [{"instance_id": "i-fleet-b", "status": "running"}]
+        capacity = results[_REQ_3]["metadata"]["fleet_capacity_fulfilment"]
+        assert capacity["provisioned_instance_count"] == 1
+        strategy.aws_client.ec2_client.describe_fleets.assert_called_once()
+        assert handler.check_hosts_status.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_request_carries_error_without_failing_batch(self):
+        def check_hosts_status(request):
+            if request.resource_ids == ["fleet-bad"]:
+                raise RuntimeError("fleet not found")
+            return []
+
+        handler = MagicMock()
+        handler.check_hosts_status.side_effect = check_hosts_status
+        strategy = _make_aws_strategy(handler)
+
+        result = await strategy._execute_operation_internal(
+            _operation((_REQ_1, "fleet-a"), (_REQ_2, "fleet-bad"))
+        )
+
+        assert result.success
+        assert result.data["results"][_REQ_1]["instances"] == []
+        assert result.data["results"][_REQ_2] == {"error": "fleet not found"}
+
+    def test_failed_capacity_chunk_is_fetched_one_by_one(self):
+        strategy = _make_aws_strategy(MagicMock())
+        describe_fleets = strategy.aws_client.ec2_client.describe_fleets
+        single = describe_fleets.side_effect
+
+        def describe(**kwargs):
+            if len(kwargs["FleetIds"]) > 1:
+                raise RuntimeError("InvalidFleetId.NotFound")
+            if kwargs["FleetIds"] == ["fleet-bad"]:
+                return {"Fleets": []}
+            return single(**kwargs)
+
+        describe_fleets.side_effect = describe
+
+        capacities = strategy._fetch_capacities("EC2Fleet", ["fleet-a", "fleet-bad"])
+
+        assert list(capacities) == ["fleet-a"]
+        assert describe_fleets.call_count == 3
@@ -0,0 +1,257 @@
+"""Unit tests for the adaptive AWS rate limiter."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+
+from orb.application.services.deprovisioning_orchestrator import DeprovisioningOrchestrator
+from orb.providers.aws.configuration import AWSRateLimitConfig, AWSTokenBucketConfig
+from orb.providers.aws.resilience.aws_rate_limiter import AdaptiveTokenBucket, AWSRateLimiter
+
+KEY = ("default", "us-east-1", "ec2", "RunInstances")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _RawBody:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def stream(self, **_):
+        yield self._body
+
+
+def _ec2_response(status: int, body: bytes = b"<Response/>") -> AWSResponse:
+    return AWSResponse("https://ec2.us-east-1.amazonaws.com/", status, {}, _RawBody(body))
+
+
+def _make_limiter(clock: FakeClock, **config) -> AWSRateLimiter:
+    return AWSRateLimiter(AWSRateLimitConfig(**config), clock=clock, sleep=clock.sleep)
+
+
+@pytest.mark.unit
+class TestAdaptiveTokenBucket:
+    def test_burst_within_capacity_does_not_wait(self):
+        clock = FakeClock()
+        bucket = AdaptiveTokenBucket(3, 1, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_reservations_beyond_capacity_are_spaced_by_refill_rate(self):
+        clock = FakeClock()
+        bucket = AdaptiveTokenBucket(1, 2, clock=clock)
+        bucket.reserve()
+
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_tokens_refill_over_time(self):
+        clock = FakeClock()
+        bucket = AdaptiveTokenBucket(2, 1, clock=clock)
+        bucket.reserve(2)
+
+        clock.now += 2
+        assert bucket.reserve(2) == 0.0
+
+    def test_throttle_halves_rate_and_drains_bucket(self):
+        clock = FakeClock()
+        bucket = AdaptiveTokenBucket(10, 4, clock=clock)
+
+        bucket.on_throttle()
+
+        assert bucket.refill_rate == 2
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.get_stats()["throttles"] == 1
+
+    def test_rate_never_drops_below_floor(self):
+        bucket = AdaptiveTokenBucket(10, 4, min_refill_rate=1, clock=FakeClock())
+
+        for _ in range(10):
+            bucket.on_throttle()
+
+        assert bucket.refill_rate == 1
+
+    def test_success_restores_rate_additively_up_to_configured_rate(self):
+        bucket = AdaptiveTokenBucket(10, 10, increase_fraction=0.1, clock=FakeClock())
+        bucket.on_throttle()
+
+        bucket.on_success()
+        assert bucket.refill_rate == pytest.approx(6)
+
+        for _ in range(20):
+            bucket.on_success()
+        assert bucket.refill_rate == 10
+
+
+@pytest.mark.unit
+class TestAWSRateLimiter:
+    def test_ec2_defaults_follow_action_category(self):
+        limiter = _make_limiter(FakeClock())
+
+        limiter.acquire(("a", "r", "ec2", "DescribeInstances"))
+        limiter.acquire(("a", "r", "ec2", "CreateFleet"))
+        limiter.acquire(("a", "r", "auto-scaling", "CreateAutoScalingGroup"))
+
+        stats = limiter.get_stats()
+        assert stats["a/r/ec2:DescribeInstances"]["refill_rate"] == 20
+        assert stats["a/r/ec2:CreateFleet"]["refill_rate"] == 5
+        assert stats["a/r/auto-scaling:CreateAutoScalingGroup"]["capacity"] == 50
+
+    def test_configured_buckets_override_defaults(self):
+        limiter = _make_limiter(
+            FakeClock(),
+            buckets={
+                "ec2:RunInstances": AWSTokenBucketConfig(capacity=1, refill_rate=1),
+                "auto-scaling:*": AWSTokenBucketConfig(capacity=2, refill_rate=3),
+            },
+        )
+
+        limiter.acquire(KEY)
+        limiter.acquire(("default", "us-east-1", "auto-scaling", "UpdateAutoScalingGroup"))
+
+        stats = limiter.get_stats()
+        assert stats["default/us-east-1/ec2:RunInstances"]["capacity"] == 1
+        assert stats["default/us-east-1/auto-scaling:UpdateAutoScalingGroup"]["refill_rate"] == 3
+
+    def test_invalid_bucket_key_is_rejected(self):
+        with pytest.raises(ValueError):
+            AWSRateLimitConfig(buckets={"RunInstances": {"capacity": 1, "refill_rate": 1}})
+
+    def test_acquire_sleeps_when_bucket_is_empty(self):
+        clock = FakeClock()
+        limiter = _make_limiter(
+            clock, buckets={"ec2:RunInstances": AWSTokenBucketConfig(capacity=1, refill_rate=4)}
+        )
+
+        limiter.acquire(KEY)
+        waited = limiter.acquire(KEY)
+
+        assert waited == pytest.approx(0.25)
+        assert clock.sleeps == [pytest.approx(0.25)]
+
+    def test_wait_is_capped(self):
+        clock = FakeClock()
+        limiter = _make_limiter(
+            clock,
+            max_wait_seconds=1,
+            buckets={"ec2:RunInstances": AWSTokenBucketConfig(capacity=1, refill_rate=0.5)},
+        )
+
+        limiter.acquire(KEY)
+        assert limiter.acquire(KEY) == 1
+
+    def test_resource_bucket_limits_instance_launches(self):
+        clock = FakeClock()
+        limiter = _make_limiter(clock)
+
+        assert limiter.acquire(KEY, resource_count=1000) == 0.0
+        # RunInstances resource bucket refills 2 instances per second
+        assert limiter.acquire(KEY, resource_count=10) == pytest.approx(5)
+
+    def test_throttling_error_slows_only_that_bucket(self):
+        limiter = _make_limiter(FakeClock())
+        other = ("default", "us-west-2", "ec2", "RunInstances")
+        limiter.acquire(other)
+
+        limiter.record_response(KEY, "RequestLimitExceeded")
+        limiter.record_response(KEY, "InvalidParameterValue")
+
+        stats = limiter.get_stats()
+        assert stats["default/us-east-1/ec2:RunInstances"]["refill_rate"] == 2.5
+        assert stats["default/us-west-2/ec2:RunInstances"]["refill_rate"] == 5
+
+    def test_disabled_limiter_never_waits(self):
+        clock = FakeClock()
+        limiter = _make_limiter(
+            clock,
+            enabled=False,
+            buckets={"ec2:RunInstances": AWSTokenBucketConfig(capacity=1, refill_rate=0.1)},
+        )
+
+        for _ in range(5):
+            limiter.acquire(KEY)
+        limiter.record_response(KEY, "Throttling")
+
+        assert clock.sleeps == []
+        assert limiter.get_stats() == {}
+
+
+@pytest.mark.unit
+class TestAWSRateLimiterClientWiring:
+    def _client(self, limiter: AWSRateLimiter, response: AWSResponse):
+        session = boto3.Session(
+            aws_access_key_id="testing", aws_secret_access_key="testing", region_name="us-east-1"
+        )
+        limiter.register_events(session, "test-profile", "us-east-1")
+        client = session.client("ec2", config=Config(retries={"total_max_attempts": 1}))
+        client.meta.events.register("before-send", lambda **_: response)
+        return client
+
+    def test_calls_are_shaped_per_action_and_resources(self):
+        clock = FakeClock()
+        limiter = _make_limiter(clock)
+        body = b"<TerminateInstancesResponse><instancesSet/></TerminateInstancesResponse>"
+        client = self._client(limiter, _ec2_response(200, body))
+
+        client.terminate_instances(InstanceIds=[f"i-{n:08x}" for n in range(1000)])
+        client.terminate_instances(InstanceIds=[f"i-{n:08x}" for n in range(10)])
+
+        stats = limiter.get_stats()["test-profile/us-east-1/ec2:TerminateInstances"]
+        assert stats["tokens"] == 199
+        # The 1000-instance resource bucket is empty; 10 more refill at 20/s
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_throttled_response_reduces_rate(self):
+        limiter = _make_limiter(FakeClock())
+        body = (
+            b"<Response><Errors><Error><Code>RequestLimitExceeded</Code>"
+            b"<Message>Request limit exceeded.</Message></Error></Errors></Response>"
+        )
+        client = self._client(limiter, _ec2_response(503, body))
+
+        with pytest.raises(client.exceptions.ClientError):
+            client.describe_instances()
+
+        stats = limiter.get_stats()["test-profile/us-east-1/ec2:DescribeInstances"]
+        assert stats["throttles"] == 1
+        assert stats["refill_rate"] == 10
+
+
+@pytest.mark.unit
+def test_deprovisioning_fan_out_is_bounded():
+    orchestrator = DeprovisioningOrchestrator(
+        MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), max_concurrency=2
+    )
+    running = 0
+    peak = 0
+
+    async def process(*_args):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"success": True}
+
+    orchestrator._process_resource_group = process  # type: ignore[method-assign]
+    groups = {("aws", "EC2Fleet", f"fleet-{n}"): [MagicMock()] for n in range(6)}
+
+    result = asyncio.run(orchestrator.execute_deprovisioning(groups, MagicMock()))
+
+    assert result["successful_operations"] == 6
+    assert peak == 2
@@ -0,0 +1,71 @@
+"""Tests for CognitoAuthStrategy token validation with cached JWKS keys."""
+
+import json
+import time
+from unittest.mock import Mock
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from orb.infrastructure.adapters.ports.auth import AuthStatus
+from orb.providers.aws.auth.cognito_strategy import CognitoAuthStrategy
+
+_POOL = "us-east-1_test"
+_CLIENT = "client-1"
+
+
+@pytest.fixture
+def signing_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def strategy(signing_key):
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(signing_key.public_key()))
+    fetcher = Mock(return_value={"keys": [{**jwk, "kid": "k1", "alg": "RS256"}]})
+    strategy = CognitoAuthStrategy(Mock(), _POOL, _CLIENT, region="us-east-1")
+    strategy.jwks_cache._fetcher = fetcher
+    return strategy
+
+
+def _token(signing_key) -> str:
+    now = int(time.time())
+    payload = {
+        "sub": "user-1",
+        "aud": _CLIENT,
+        "iss": f"https://cognito-idp.us-east-1.amazonaws.com/{_POOL}",
+        "iat": now,
+        "exp": now + 3600,
+        "cognito:groups": ["operators"],
+    }
+    return jwt.encode(payload, signing_key, algorithm="RS256", headers={"kid": "k1"})
+
+
+@pytest.mark.unit
+class TestCognitoTokenValidation:
+    @pytest.mark.asyncio
+    async def test_token_signed_by_jwks_key_is_accepted(self, strategy, signing_key):
+        result = await strategy.validate_token(_token(signing_key))
+
+        assert result.status == AuthStatus.SUCCESS
+        assert "operator" in result.user_roles
+
+    @pytest.mark.asyncio
+    async def test_repeat_validation_uses_caches(self, strategy, signing_key):
+        token = _token(signing_key)
+
+        await strategy.validate_token(token)
+        await strategy.validate_token(token)
+
+        assert strategy.jwks_cache._fetcher.call_count == 1
+        assert strategy.token_cache.get_stats()["hits"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_is_dropped_from_cache(self, strategy, signing_key):
+        token = _token(signing_key)
+        await strategy.validate_token(token)
+
+        await strategy.revoke_token(token)
+
+        assert strategy.token_cache.get(token) is None
@@ -0,0 +1,120 @@
+"""Tests for the persistent EC2 instance type catalog."""
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from orb.providers.aws.utilities.ec2.instance_type_catalog import (
+    CATALOG_FORMAT_VERSION,
+    InstanceTypeCatalog,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def catalog(tmp_path, clock):
+    return InstanceTypeCatalog(
+        str(tmp_path), ttl_seconds=100, refresh_after_seconds=10, clock=clock
+    )
+
+
+@pytest.mark.unit
+class TestInstanceTypeCatalog:
+    def test_store_and_load_round_trip(self, catalog):
+        catalog.store("us-east-1", {"m5.large": (2, 8192)})
+
+        entry = catalog.load("us-east-1")
+
+        assert entry.region == "us-east-1"
+        assert entry.specs == {"m5.large": (2, 8192)}
+        assert [p.name for p in catalog.cache_dir.iterdir()] == [
+            "ec2_instance_types_us-east-1.json"
+        ]
+
+    def test_catalog_is_shared_between_instances(self, catalog, tmp_path, clock):
+        catalog.store("us-east-1", {"m5.large": (2, 8192)})
+
+        other = InstanceTypeCatalog(str(tmp_path), clock=clock)
+
+        assert other.load("us-east-1").specs == {"m5.large": (2, 8192)}
+
+    def test_without_region_the_newest_catalog_is_used(self, catalog, clock):
+        catalog.store("us-east-1", {"m5.large": (2, 1)})
+        clock.now += 5
+        catalog.store("eu-west-1", {"m5.large": (2, 2)})
+
+        assert catalog.load().region == "eu-west-1"
+        assert catalog.load("us-east-1").specs == {"m5.large": (2, 1)}
+
+    def test_expired_catalog_is_ignored(self, catalog, clock):
+        catalog.store("us-east-1", {"m5.large": (2, 8192)})
+
+        clock.now += 50
+        entry = catalog.load("us-east-1")
+        assert entry is not None and catalog.is_stale(entry)
+
+        clock.now += 100
+        assert catalog.load("us-east-1") is None
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "{not json",
+            json.dumps({"format_version": CATALOG_FORMAT_VERSION + 1}),
+            json.dumps({"format_version": CATALOG_FORMAT_VERSION, "region": "us-east-1"}),
+        ],
+    )
+    def test_unreadable_or_other_format_is_a_miss(self, catalog, content):
+        catalog.cache_dir.mkdir(exist_ok=True)
+        catalog.path_for("us-east-1").write_text(content)
+
+        assert catalog.load("us-east-1") is None
+
+    def test_rewritten_file_is_reloaded(self, catalog, tmp_path, clock):
+        reader = InstanceTypeCatalog(str(tmp_path), clock=clock)
+        catalog.store("us-east-1", {"m5.large": (2, 1)})
+        assert reader.load("us-east-1").specs["m5.large"] == (2, 1)
+
+        clock.now += 1
+        catalog.store("us-east-1", {"m5.large": (2, 2), "c5.large": (2, 4096)})
+
+        assert reader.load("us-east-1").specs["m5.large"] == (2, 2)
+
+    def test_failed_refresh_keeps_existing_catalog(self, catalog):
+        catalog.store("us-east-1", {"m5.large": (2, 8192)})
+
+        assert catalog.refresh("us-east-1", MagicMock(), lambda _: {}) is None
+        assert catalog.load("us-east-1").specs == {"m5.large": (2, 8192)}
+
+    def test_background_refresh_runs_once_per_region(self, catalog):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_loader(_client):
+            started.set()
+            release.wait(5)
+            return {"m5.large": (2, 8192)}
+
+        assert catalog.refresh_in_background("us-east-1", MagicMock(), slow_loader)
+        started.wait(5)
+        assert not catalog.refresh_in_background("us-east-1", MagicMock(), slow_loader)
+
+        release.set()
+        for thread in threading.enumerate():
+            if thread.name == "instance-type-catalog-us-east-1":
+                thread.join(5)
+        assert catalog.load("us-east-1").specs == {"m5.large": (2, 8192)}
@@ -4,12 +4,15 @@ from unittest.mock import MagicMock
 
 import pytest
 
+import orb.providers.aws.utilities.ec2.instance_type_catalog as catalog_mod
 import orb.providers.aws.utilities.ec2.instances as mod
 
 
 @pytest.fixture(autouse=True)
-def reset_cache(monkeypatch):
+def reset_cache(monkeypatch, tmp_path):
     monkeypatch.setattr(mod, "_instance_spec_cache", None)
+    monkeypatch.setattr(mod, "_catalog_checked", False)
+    monkeypatch.setattr(catalog_mod, "_catalog", catalog_mod.InstanceTypeCatalog(str(tmp_path)))
 
 
 # ---------------------------------------------------------------------------
@@ -133,3 +136,69 @@ def test_api_failure_no_second_api_call(monkeypatch):
     mod.derive_cpu_ram_from_instance_type("m5.large", ec2_client=ec2_client)
     # cache was populated (as empty dict) after first call — no second load
     assert len(load_calls) == 1
+
+
+# ---------------------------------------------------------------------------
+# C. Shared on-disk catalog
+# ---------------------------------------------------------------------------
+
+
+def _m5_client(region="us-east-1"):
+    client = _make_ec2_client(
+        [
+            {
+                "InstanceType": "m5.large",
+                "VCpuInfo": {"DefaultVCpus": 2},
+                "MemoryInfo": {"SizeInMiB": 8192},
+            },
+        ]
+    )
+    client.meta.region_name = region
+    return client
+
+
+def test_api_result_is_shared_with_later_processes(monkeypatch):
+    mod.derive_cpu_ram_from_instance_type("m5.large", ec2_client=_m5_client())
+
+    # A new process starts with an empty in-memory cache and no client
+    monkeypatch.setattr(mod, "_instance_spec_cache", None)
+    monkeypatch.setattr(mod, "_catalog_checked", False)
+    monkeypatch.setattr(mod, "_load_instance_specs", MagicMock(side_effect=AssertionError))
+
+    assert mod.derive_cpu_ram_from_instance_type("m5.large") == ("2", "8192")
+
+
+def test_missing_catalog_is_checked_once_without_client(monkeypatch):
+    load = MagicMock(return_value=None)
+    monkeypatch.setattr(catalog_mod._catalog, "load", load)
+
+    mod.derive_cpu_ram_from_instance_type("m5.large")
+    mod.derive_cpu_ram_from_instance_type("c5.large")
+
+    assert load.call_count == 1
+
+
+def test_stale_catalog_is_served_and_refreshed_in_background(monkeypatch):
+    catalog = catalog_mod._catalog
+    catalog.store("us-east-1", {"m5.large": (2, 9999)})
+    monkeypatch.setattr(catalog, "refresh_after_seconds", -1)
+    refresh = MagicMock(return_value=True)
+    monkeypatch.setattr(catalog, "refresh_in_background", refresh)
+    client = _m5_client()
+
+    assert mod.derive_cpu_ram_from_instance_type("m5.large", ec2_client=client) == ("2", "9999")
+    refresh.assert_called_once_with("us-east-1", client, mod._load_instance_specs)
+    client.get_paginator.assert_not_called()
+
+
+def test_warm_up_writes_catalog_and_skips_fresh_one():
+    client = _m5_client("eu-west-1")
+
+    first = mod.warm_instance_type_catalog(client, "eu-west-1")
+    second = mod.warm_instance_type_catalog(client, "eu-west-1")
+
+    assert first["refreshed"] is True
+    assert first["instance_types"] == 1
+    assert second["refreshed"] is False
+    assert client.get_paginator.call_count == 1
+    assert mod.derive_cpu_ram_from_instance_type("m5.large") == ("2", "8192")
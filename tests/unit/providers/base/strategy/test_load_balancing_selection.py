@@ -0,0 +1,206 @@
+"""Unit tests for load balancing selection algorithms."""
+
+import random
+from collections import Counter
+from unittest.mock import MagicMock
+
+import pytest
+
+from orb.providers.base.strategy.load_balancing import (
+    LoadBalancingAlgorithm,
+    LoadBalancingConfig,
+    LoadBalancingProviderStrategy,
+    StrategyStats,
+)
+from orb.providers.base.strategy.load_balancing.selection import (
+    AliasTable,
+    ConsistentHashRing,
+    LoadBalancingSelector,
+    SmoothWeightedRoundRobin,
+)
+from orb.providers.base.strategy.provider_strategy import (
+    ProviderOperation,
+    ProviderOperationType,
+)
+
+
+def _make_strategy(provider_type: str) -> MagicMock:
+    strategy = MagicMock()
+    strategy.provider_type = provider_type
+    return strategy
+
+
+def _make_balancer(algorithm, types=("a", "b", "c"), weights=None):
+    return LoadBalancingProviderStrategy(
+        logger=MagicMock(),
+        strategies=[_make_strategy(t) for t in types],
+        weights=weights,
+        config=LoadBalancingConfig(algorithm=algorithm),
+    )
+
+
+def _operation(**parameters) -> ProviderOperation:
+    return ProviderOperation(
+        operation_type=ProviderOperationType.CREATE_INSTANCES, parameters=parameters
+    )
+
+
+@pytest.mark.unit
+class TestSmoothWeightedRoundRobin:
+    def test_sequence_is_interleaved_and_proportional(self):
+        wrr = SmoothWeightedRoundRobin()
+
+        picks = [wrr.select({"a": 5, "b": 1, "c": 1}) for _ in range(7)]
+
+        assert picks == ["a", "a", "b", "a", "c", "a", "a"]
+
+    def test_departed_members_are_forgotten(self):
+        wrr = SmoothWeightedRoundRobin()
+        wrr.select({"a": 1, "b": 1})
+
+        assert wrr.select({"b": 1}) == "b"
+        assert set(wrr._current) == {"b"}
+
+
+@pytest.mark.unit
+class TestAliasTable:
+    def test_samples_follow_weights(self):
+        table = AliasTable({"a": 1, "b": 3, "c": 6})
+        rng = random.Random(42)
+
+        counts = Counter(table.sample(rng) for _ in range(20000))
+
+        assert counts["a"] / 20000 == pytest.approx(0.1, abs=0.015)
+        assert counts["b"] / 20000 == pytest.approx(0.3, abs=0.015)
+        assert counts["c"] / 20000 == pytest.approx(0.6, abs=0.015)
+
+    def test_rejects_non_positive_total(self):
+        with pytest.raises(ValueError):
+            AliasTable({"a": 0})
+
+
+@pytest.mark.unit
+class TestConsistentHashRing:
+    def test_mapping_is_stable_across_instances(self):
+        keys = [f"request-{n}" for n in range(50)]
+        first = ConsistentHashRing(["a", "b", "c"])
+        second = ConsistentHashRing(["c", "a", "b"])
+
+        assert [first.get(k) for k in keys] == [second.get(k) for k in keys]
+
+    def test_removing_a_member_only_moves_its_keys(self):
+        keys = [f"request-{n}" for n in range(2000)]
+        before = ConsistentHashRing(["a", "b", "c", "d"])
+        after = ConsistentHashRing(["a", "b", "c"])
+
+        moved = [k for k in keys if before.get(k) != after.get(k)]
+
+        assert all(before.get(k) == "d" for k in moved)
+        assert len(moved) == sum(1 for k in keys if before.get(k) == "d")
+
+
+@pytest.mark.unit
+class TestLoadBalancingSelector:
+    def test_weighted_random_ignores_non_positive_weights(self):
+        selector = LoadBalancingSelector(rng=random.Random(1))
+
+        picks = {selector.weighted_random({"a": 0, "b": 2}) for _ in range(50)}
+
+        assert picks == {"b"}
+
+    def test_interleaved_candidate_sets_keep_their_own_rotation(self):
+        selector = LoadBalancingSelector()
+        compatible = {"p1": 1.0, "p2": 1.0}
+        active = {"p1": 1.0, "p2": 1.0, "p3": 1.0}
+
+        picks = [
+            (selector.weighted_round_robin(compatible), selector.weighted_round_robin(active))
+            for _ in range(6)
+        ]
+
+        assert [first for first, _ in picks] == ["p1", "p2"] * 3
+        assert [second for _, second in picks] == ["p1", "p2", "p3"] * 2
+
+    def test_groups_separate_rotations_over_the_same_set(self):
+        selector = LoadBalancingSelector()
+        weights = {"a": 3.0, "b": 1.0}
+
+        weighted = []
+        for _ in range(4):
+            weighted.append(selector.weighted_round_robin(weights))
+            selector.weighted_round_robin(dict.fromkeys(weights, 1.0), group="round_robin")
+
+        assert Counter(weighted) == {"a": 3, "b": 1}
+
+    def test_state_is_bounded_to_recent_candidate_sets(self):
+        selector = LoadBalancingSelector(max_candidate_sets=2)
+        for members in (["a", "b"], ["a", "c"], ["b", "c"]):
+            selector.consistent_hash(members, "key")
+            selector.weighted_random(dict.fromkeys(members, 1.0))
+
+        assert len(selector._rings) == 2
+        assert len(selector._alias_tables) == 2
+        assert frozenset(["a", "b"]) not in selector._rings
+
+    def test_power_of_two_choices_never_picks_the_costliest(self):
+        selector = LoadBalancingSelector(rng=random.Random(7))
+        costs = {"a": 10.0, "b": 20.0, "c": 30.0}
+
+        picks = Counter(selector.power_of_two_choices(costs) for _ in range(300))
+
+        assert "c" not in picks
+        assert picks["a"] > picks["b"]
+
+
+@pytest.mark.unit
+class TestStrategyStatsPeakEwma:
+    def test_spikes_apply_at_once_and_recoveries_decay(self):
+        stats = StrategyStats(ewma_alpha=0.5)
+        stats.record_request_start()
+        stats.record_request_end(True, 100.0)
+        stats.record_request_start()
+        stats.record_request_end(True, 20.0)
+
+        assert stats.ewma_response_time == 60.0
+
+        stats.record_request_start()
+        stats.record_request_end(True, 500.0)
+        assert stats.ewma_response_time == 500.0
+
+    def test_load_score_scales_with_in_flight_requests(self):
+        stats = StrategyStats(ewma_response_time=50.0)
+        stats.record_request_start()
+
+        assert stats.load_score == 100.0
+
+
+@pytest.mark.unit
+class TestLoadBalancingProviderStrategySelection:
+    def test_weighted_round_robin_uses_weights(self):
+        balancer = _make_balancer(
+            LoadBalancingAlgorithm.WEIGHTED_ROUND_ROBIN, weights={"a": 2, "b": 1, "c": 1}
+        )
+
+        picks = Counter(balancer._select_strategy(_operation()).provider_type for _ in range(8))
+
+        assert picks == {"a": 4, "b": 2, "c": 2}
+
+    def test_hash_based_routes_equal_operations_together(self):
+        balancer = _make_balancer(LoadBalancingAlgorithm.HASH_BASED)
+
+        first = balancer._select_strategy(_operation(template_id="t1", count=2))
+        again = balancer._select_strategy(_operation(count=2, template_id="t1"))
+
+        assert first is again
+
+    def test_adaptive_avoids_slow_and_busy_strategies(self):
+        balancer = _make_balancer(LoadBalancingAlgorithm.ADAPTIVE)
+        balancer._stats["a"].ewma_response_time = 10.0
+        balancer._stats["b"].ewma_response_time = 1000.0
+        balancer._stats["c"].ewma_response_time = 10.0
+        balancer._stats["c"].active_connections = 500
+
+        picks = Counter(balancer._select_strategy(_operation()).provider_type for _ in range(200))
+
+        assert picks["c"] == 0
+        assert picks["a"] > picks["b"]
@@ -12,6 +12,7 @@ import pytest
 
 from orb.domain.base.ports.configuration_port import ConfigurationPort
 from orb.domain.base.results import ProviderSelectionResult
+from orb.providers.base.strategy.load_balancing.selection import LoadBalancingSelector
 from orb.providers.registry.provider_registry import ProviderRegistry
 
 # ---------------------------------------------------------------------------
@@ -59,6 +60,7 @@ def _make_registry(
     registry._type_registrations = {}
     registry._instance_registrations = {}
     registry._logger = MagicMock()
+    registry._selector = LoadBalancingSelector()
 
     if config_port is not None:
         registry._config_port = config_port
@@ -249,3 +251,49 @@ class TestSelectProviderForTemplate:
 
         with pytest.raises(ValueError, match="No provider configuration available"):
             registry.select_provider_for_template(template)
+
+
+# ---------------------------------------------------------------------------
+# Load balancing policies
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestLoadBalancingPolicies:
+    def _pick_names(self, registry, count):
+        return [registry.select_active_provider().provider_name for _ in range(count)]
+
+    def test_weighted_round_robin_follows_weights_within_top_priority(self):
+        providers = [
+            _make_provider_instance("aws-a", weight=3),
+            _make_provider_instance("aws-b", weight=1),
+            _make_provider_instance("aws-backup", priority=2, weight=100),
+        ]
+        registry = _make_registry(providers=providers, selection_policy="WEIGHTED_ROUND_ROBIN")
+
+        names = self._pick_names(registry, 8)
+
+        assert names.count("aws-a") == 6
+        assert names.count("aws-b") == 2
+        assert "aws-backup" not in names
+
+    def test_round_robin_alternates_instances(self):
+        providers = [_make_provider_instance("aws-a", weight=5), _make_provider_instance("aws-b")]
+        registry = _make_registry(providers=providers, selection_policy="ROUND_ROBIN")
+
+        assert self._pick_names(registry, 4) == ["aws-a", "aws-b", "aws-a", "aws-b"]
+
+    def test_health_based_skips_unhealthy_instances(self):
+        providers = [_make_provider_instance("aws-a"), _make_provider_instance("aws-b")]
+        registry = _make_registry(providers=providers, selection_policy="HEALTH_BASED")
+        registry.update_provider_health("aws-a", {"is_healthy": False, "status_message": "down"})
+
+        assert set(self._pick_names(registry, 4)) == {"aws-b"}
+
+    def test_health_based_falls_back_when_all_unhealthy(self):
+        providers = [_make_provider_instance("aws-a"), _make_provider_instance("aws-b")]
+        registry = _make_registry(providers=providers, selection_policy="HEALTH_BASED")
+        registry.update_provider_health("aws-a", {"status": "unhealthy"})
+        registry.update_provider_health("aws-b", {"is_healthy": False})
+
+        assert set(self._pick_names(registry, 4)) == {"aws-a", "aws-b"}
@@ -195,3 +195,46 @@ class TestListMachines:
         sdk = ORBClient(config={"provider": "aws"})
         with pytest.raises(SDKError):
             await sdk.list_machines()
+
+
+# ---------------------------------------------------------------------------
+# watch_request_status
+# ---------------------------------------------------------------------------
+
+
+class TestWatchRequestStatus:
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_watch_yields_changes_until_terminal(self):
+        from orb.application.services.orchestration.dtos import GetRequestStatusOutput
+        from orb.application.services.request_status_hub import RequestStatusHub
+
+        statuses = ["running", "complete"]
+        orchestrator = MagicMock()
+        orchestrator.execute = AsyncMock(
+            side_effect=lambda _input: GetRequestStatusOutput(
+                requests=[{"request_id": "req-1", "status": statuses.pop(0)}]
+            )
+        )
+        scheduler = MagicMock()
+        scheduler.format_request_status_response.side_effect = lambda reqs: {"requests": reqs}
+        hub = RequestStatusHub(orchestrator, scheduler, MagicMock(), poll_interval_seconds=0.01)
+
+        sdk = _initialized_sdk()
+        _mock_container(sdk, RequestStatusHub, hub)
+
+        batches = [batch async for batch in sdk.watch_request_status(["req-1"], timeout=5)]
+
+        updates = [update for batch in batches for update in batch]
+        assert updates[0]["full"] is True
+        assert updates[-1]["changes"] == {"status": "complete"}
+        assert updates[-1]["terminal"] is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_watch_raises_when_not_initialized(self):
+        sdk = ORBClient(config={"provider": "aws"})
+
+        with pytest.raises(SDKError):
+            async for _ in sdk.watch_request_status(["req-1"]):
+                pass
@@ -66,9 +66,15 @@ def _safe_reset_global_variable(module_name: str, variable_name: str) -> None:
 def _reset_circuit_breaker_states() -> None:
     """Clear class-level circuit breaker state so tests start with closed circuits."""
     try:
+        from orb.infrastructure.resilience.state_store import (
+            InMemoryCircuitStateStore,
+            set_circuit_state_store,
+        )
         from orb.infrastructure.resilience.strategy.circuit_breaker import CircuitBreakerStrategy
 
-        CircuitBreakerStrategy._circuit_states.clear()
+        CircuitBreakerStrategy._known_services.clear()
+        # Keep breaker state out of the shared cache directory during tests
+        set_circuit_state_store(InMemoryCircuitStateStore())
     except ImportError:
         pass
 
@@ -116,6 +122,8 @@ def reset_all_singletons() -> None:
     _safe_reset_global_variable(
         "orb.infrastructure.aws.aws_client_singleton", "_aws_client_singleton_instance"
     )
+    _safe_reset_global_variable("orb.providers.aws.resilience.aws_rate_limiter", "_limiter")
+    _safe_reset_global_variable("orb.providers.aws.utilities.ec2.instance_type_catalog", "_catalog")
     reset_provider_registry()
     _safe_reset_class_instance("orb.infrastructure.config.manager", "ConfigurationManager")
     _safe_reset_class_instance("orb.infrastructure.logging.logger_singleton", "LoggerSingleton")